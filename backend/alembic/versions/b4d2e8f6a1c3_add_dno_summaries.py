@@ -0,0 +1,63 @@
+"""add dno summaries
+
+Revision ID: b4d2e8f6a1c3
+Revises: a3b9c7d1e5f2
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4d2e8f6a1c3"
+down_revision: str | Sequence[str] | None = "a3b9c7d1e5f2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create dno_summaries read model (backfilled at API startup)."""
+    op.create_table(
+        "dno_summaries",
+        sa.Column(
+            "dno_id",
+            sa.Integer(),
+            sa.ForeignKey("dnos.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("netzentgelte_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("hlzf_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("data_points_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("score", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("live_status", sa.String(20), nullable=False, server_default="uncrawled"),
+        sa.Column("running_jobs", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("pending_jobs", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completeness_score", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("importance_score", sa.Float(), nullable=True),
+        sa.Column("importance_confidence", sa.Float(), nullable=True),
+        sa.Column("importance_version", sa.String(32), nullable=True),
+        sa.Column(
+            "refreshed_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "idx_dno_summaries_status_importance",
+        "dno_summaries",
+        ["live_status", "importance_score"],
+    )
+    op.create_index("idx_dno_summaries_importance", "dno_summaries", ["importance_score"])
+    op.create_index("idx_dno_summaries_score", "dno_summaries", ["score"])
+
+
+def downgrade() -> None:
+    """Drop dno_summaries table."""
+    op.drop_index("idx_dno_summaries_score", table_name="dno_summaries")
+    op.drop_index("idx_dno_summaries_importance", table_name="dno_summaries")
+    op.drop_index("idx_dno_summaries_status_importance", table_name="dno_summaries")
+    op.drop_table("dno_summaries")
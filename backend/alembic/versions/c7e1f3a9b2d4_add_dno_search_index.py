@@ -0,0 +1,81 @@
+"""add dno search index
+
+Revision ID: c7e1f3a9b2d4
+Revises: b4d2e8f6a1c3
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e1f3a9b2d4"
+down_revision: str | Sequence[str] | None = "b4d2e8f6a1c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add trigram-indexed search_text to dno_summaries and a name/id index on dnos."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "dno_summaries",
+        sa.Column("search_text", sa.Text(), nullable=False, server_default=""),
+    )
+    op.create_index(
+        "ix_dno_summaries_search_trgm",
+        "dno_summaries",
+        ["search_text"],
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+    # Keyset pagination compares sort keys; importance is always computed
+    op.execute("UPDATE dno_summaries SET importance_score = 0 WHERE importance_score IS NULL")
+    op.alter_column(
+        "dno_summaries", "importance_score", nullable=False, server_default=sa.text("0")
+    )
+    op.create_index("ix_dnos_name_id", "dnos", ["name", "id"])
+    # Backfill search_text from the same parts as build_search_text(); duplicate
+    # parts are dropped the next time a row is refreshed
+    op.execute(
+        """
+        UPDATE dno_summaries s
+        SET search_text = sub.text
+        FROM (
+            SELECT d.id, lower(concat_ws(' ',
+                nullif(btrim(d.name), ''),
+                nullif(btrim(d.official_name), ''),
+                nullif(btrim(d.region), ''),
+                nullif(btrim(d.slug), ''),
+                nullif(btrim(d.mastr_nr), ''),
+                nullif(btrim(d.vnb_id), ''),
+                nullif(btrim(d.primary_bdew_code), ''),
+                nullif(btrim(v.name), ''),
+                nullif(btrim(v.official_name), ''),
+                (
+                    SELECT string_agg(concat_ws(' ',
+                        nullif(btrim(b.bdew_code), ''),
+                        nullif(btrim(b.company_name), '')
+                    ), ' ')
+                    FROM dno_bdew_data b
+                    WHERE b.dno_id = d.id
+                )
+            )) AS text
+            FROM dnos d
+            LEFT JOIN dno_vnb_data v ON v.dno_id = d.id
+        ) sub
+        WHERE s.dno_id = sub.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the search index columns."""
+    op.drop_index("ix_dnos_name_id", table_name="dnos")
+    op.alter_column("dno_summaries", "importance_score", nullable=True, server_default=None)
+    op.drop_index("ix_dno_summaries_search_trgm", table_name="dno_summaries")
+    op.drop_column("dno_summaries", "search_text")
@@ -0,0 +1,39 @@
+"""add seed state
+
+Revision ID: d5a8e2c4f6b1
+Revises: c7e1f3a9b2d4
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5a8e2c4f6b1"
+down_revision: str | Sequence[str] | None = "c7e1f3a9b2d4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create seed_state (checksum of the last applied seed file)."""
+    op.create_table(
+        "seed_state",
+        sa.Column("name", sa.String(50), primary_key=True),
+        sa.Column("checksum", sa.String(64), nullable=False),
+        sa.Column("record_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "seeded_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop seed_state table."""
+    op.drop_table("seed_state")
@@ -0,0 +1,77 @@
+"""add dno sitemap urls
+
+Revision ID: e9b3f7a2c5d8
+Revises: d5a8e2c4f6b1
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e9b3f7a2c5d8"
+down_revision: str | Sequence[str] | None = "d5a8e2c4f6b1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Move dnos.sitemap_parsed_urls into a trigram-indexed dno_sitemap_urls table."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_table(
+        "dno_sitemap_urls",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "dno_id",
+            sa.Integer(),
+            sa.ForeignKey("dnos.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("url", sa.Text(), nullable=False),
+    )
+    op.execute(
+        """
+        INSERT INTO dno_sitemap_urls (dno_id, url)
+        SELECT d.id, u.url
+        FROM dnos d
+        CROSS JOIN LATERAL json_array_elements_text(d.sitemap_parsed_urls)
+            WITH ORDINALITY AS u(url, position)
+        WHERE json_typeof(d.sitemap_parsed_urls) = 'array'
+        ORDER BY d.id, u.position
+        """
+    )
+    # Indexes after the copy: one bulk build instead of per-row maintenance
+    op.create_index("idx_sitemap_urls_dno", "dno_sitemap_urls", ["dno_id"])
+    op.create_index(
+        "ix_sitemap_urls_url_trgm",
+        "dno_sitemap_urls",
+        ["url"],
+        postgresql_using="gin",
+        postgresql_ops={"url": "gin_trgm_ops"},
+    )
+    op.drop_column("dnos", "sitemap_parsed_urls")
+
+
+def downgrade() -> None:
+    """Restore dnos.sitemap_parsed_urls from dno_sitemap_urls and drop the table."""
+    op.add_column("dnos", sa.Column("sitemap_parsed_urls", postgresql.JSON(), nullable=True))
+    op.execute(
+        """
+        UPDATE dnos
+        SET sitemap_parsed_urls = s.urls
+        FROM (
+            SELECT dno_id, json_agg(url ORDER BY id) AS urls
+            FROM dno_sitemap_urls
+            GROUP BY dno_id
+        ) s
+        WHERE dnos.id = s.dno_id
+        """
+    )
+    op.drop_index("ix_sitemap_urls_url_trgm", table_name="dno_sitemap_urls")
+    op.drop_index("idx_sitemap_urls_dno", table_name="dno_sitemap_urls")
+    op.drop_table("dno_sitemap_urls")
@@ -2,6 +2,7 @@
 FastAPI application factory and main entry point.
 """
 
+import math
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -36,6 +37,7 @@ from app.core.exceptions import (
 )
 from app.core.logging import configure_logging
 from app.db import DatabaseError, close_db, init_db
+from app.services.vnb import VNBQuotaExceededError
 
 # Configure structured logging with wide events support
 configure_logging(
@@ -83,6 +85,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning("Failed to seed AI config", error=str(e))
 
+    # Backfill DNO list summaries for DNOs that predate the read model
+    try:
+        from app.db import get_db_session
+        from app.services.dno_summary import fill_missing_dno_summaries
+
+        async with get_db_session() as db:
+            await fill_missing_dno_summaries(db)
+    except Exception as e:
+        logger.warning("Failed to backfill DNO summaries", error=str(e))
+
     # Initialize rate limiter if Redis available
     try:
         from redis.asyncio import Redis
@@ -90,10 +102,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         from app.core.rate_limiter import init_rate_limiter
         from app.db import get_db_session
         from app.services.crawl_recovery import recover_stuck_crawl_jobs
+        from app.services.search_cache import init_search_cache
+        from app.services.single_flight import init_single_flight
+        from app.services.vnb import init_vnb_client
 
         redis = Redis.from_url(str(settings.redis_url))
-        init_rate_limiter(redis)
+        rate_limiter = init_rate_limiter(redis)
         logger.info("Rate limiter initialized")
+        init_vnb_client(redis, before_request=rate_limiter.before_vnb_call)
+        if init_search_cache(redis):
+            logger.info("Search cache initialized")
+        init_single_flight(redis)
 
         # Warn if CONTACT_EMAIL not configured (important for crawler politeness)
         if not settings.has_contact_email:
@@ -122,6 +141,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # Shutdown
     logger.info("Shutting down DNO Crawler API")
+    from app.services.vnb import close_vnb_client
+
+    await close_vnb_client()
     await close_db()
     logger.info("Database connections closed")
 
@@ -186,6 +208,16 @@ def create_app() -> FastAPI:
         logger.error("Database error", url=str(request.url), error=exc.message, exc_info=True)
         return JSONResponse(status_code=503, content={"detail": "Database operation failed"})
 
+    @app.exception_handler(VNBQuotaExceededError)
+    async def vnb_quota_exception_handler(request: Request, exc: VNBQuotaExceededError):
+        """Handle VNB Digital lookups refused by the shared request pace"""
+        logger.warning("VNB Digital busy", url=str(request.url), retry_after=exc.retry_after)
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "External API busy. Please retry later."},
+            headers={"Retry-After": str(math.ceil(exc.retry_after))},
+        )
+
     @app.exception_handler(AuthenticationError)
     async def authentication_exception_handler(request: Request, exc: AuthenticationError):
         """Handle authentication errors"""
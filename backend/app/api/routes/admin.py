@@ -10,12 +10,13 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Annotated, Literal
 
+import numpy as np
+import pandas as pd
 import structlog
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.core.auth import User as AuthUser
 from app.core.auth import require_admin
@@ -37,7 +38,14 @@ from app.services.bulk_extraction import (
     enqueue_extract_jobs,
     scan_bulk_candidates,
 )
-from app.services.importance import compute_importance_for_dno
+from app.services.dno_summary import refresh_dno_summaries
+from app.services.importance import DEFAULT_CALIBRATION
+from app.services.importance_batch import (
+    calibrate,
+    load_importance_frame,
+    score_distribution,
+    score_frame,
+)
 
 logger = structlog.get_logger()
 
@@ -136,17 +144,48 @@ async def admin_dashboard(
 async def get_importance_distribution(
     db: Annotated[AsyncSession, Depends(get_db)],
     admin: Annotated[AuthUser, Depends(require_admin)],
+    quantile: float | None = Query(
+        None, ge=0.5, le=0.99, description="What-if: calibrate anchors at this data quantile"
+    ),
+    area_km2_p90: float | None = Query(None, gt=0, description="What-if area anchor"),
+    connection_points_p90: float | None = Query(
+        None, gt=0, description="What-if connection points anchor"
+    ),
+    customer_count_p90: float | None = Query(None, gt=0, description="What-if customer anchor"),
 ) -> APIResponse:
-    """Get distribution and diagnostics for DNO importance scoring."""
-    query = (
-        select(DNOModel)
-        .options(selectinload(DNOModel.mastr_data))
-        .order_by(DNOModel.importance_score.desc().nullslast(), DNOModel.name)
-    )
-    result = await db.execute(query)
-    dnos = result.scalars().all()
+    """Get distribution and diagnostics for DNO importance scoring.
 
-    if not dnos:
+    With any what-if parameter, all DNOs are rescored in memory with the
+    resulting calibration and the response gains a "what_if" section
+    (nothing is persisted; use scripts/recompute_importance.py for that).
+    """
+    result = await db.execute(
+        select(
+            DNOModel.id,
+            DNOModel.slug,
+            DNOModel.name,
+            DNOModel.connection_points_count,
+            DNOModel.importance_score,
+            DNOModel.importance_confidence,
+            DNOModel.importance_factors["fallbacks"]["customers"].as_boolean(),
+            DNOModel.importance_factors["fallbacks"]["area"].as_boolean(),
+        ).order_by(DNOModel.id)
+    )
+    dnos = pd.DataFrame(
+        result.all(),
+        columns=[
+            "id",
+            "slug",
+            "name",
+            "connection_points_count",
+            "stored_score",
+            "stored_confidence",
+            "fallback_customers",
+            "fallback_area",
+        ],
+    ).set_index("id", drop=False)
+
+    if dnos.empty:
         return APIResponse(
             success=True,
             data={
@@ -160,97 +199,70 @@ async def get_importance_distribution(
             },
         )
 
-    persisted_scores: list[float] = []
-    fallback_customers = 0
-    fallback_area = 0
-    top_candidates: list[dict] = []
-
-    for dno in dnos:
-        if dno.importance_score is None:
-            # YAGNI: keep this endpoint read-only. We compute transient values for visibility
-            # instead of writing to DB from admin HTTP paths. Persist via recompute script.
-            computed = compute_importance_for_dno(dno)
-            score = computed.score
-            factors = computed.factors
-            confidence = computed.confidence
-            is_persisted = False
-        else:
-            score = dno.importance_score
-            factors = dno.importance_factors or {}
-            confidence = dno.importance_confidence
-            is_persisted = True
-
-        if score is not None:
-            score_value = float(score)
-            if is_persisted:
-                persisted_scores.append(score_value)
-            top_candidates.append(
-                {
-                    "id": dno.id,
-                    "slug": dno.slug,
-                    "name": dno.name,
-                    "importance_score": round(score_value, 2),
-                    "importance_confidence": confidence,
-                    "connection_points_count": dno.connection_points_count,
-                    "score_value": score_value,
-                }
-            )
-
-        fallback_map = factors.get("fallbacks") if isinstance(factors, dict) else None
-        if isinstance(fallback_map, dict):
-            if fallback_map.get("customers"):
-                fallback_customers += 1
-            if fallback_map.get("area"):
-                fallback_area += 1
-
-    histogram_buckets = [0] * 10
-    for value in persisted_scores:
-        idx = min(int(value // 10), 9)
-        histogram_buckets[idx] += 1
+    # YAGNI: keep this endpoint read-only. Unscored DNOs get transient values for
+    # visibility instead of writes from admin HTTP paths. Persist via recompute script.
+    inputs = (await load_importance_frame(db)).set_index("id", drop=False).reindex(dnos.index)
+    computed = score_frame(inputs)
+    persisted = dnos["stored_score"].notna().to_numpy()
+    dnos["score"] = np.where(persisted, dnos["stored_score"], computed["score"])
+    dnos["confidence"] = dnos["stored_confidence"].where(persisted, computed["confidence"])
+    fallback_customers = np.where(
+        persisted, dnos["fallback_customers"].eq(True), computed["customers_fallback"]
+    )
+    fallback_area = np.where(persisted, dnos["fallback_area"].eq(True), computed["area_fallback"])
+
+    data = {
+        "total": len(dnos),
+        "scored": int(persisted.sum()),
+        **score_distribution(dnos.loc[persisted, "score"]),
+        "top": _importance_top(dnos),
+        "quality": {
+            "missing_score": int((~persisted).sum()),
+            "fallback_customers": int(fallback_customers.sum()),
+            "fallback_area": int(fallback_area.sum()),
+        },
+    }
 
-    histogram = [
-        {
-            "range": f"{i * 10}-{i * 10 + 9}",
-            "count": histogram_buckets[i],
+    overrides = {
+        "area_km2_p90": area_km2_p90,
+        "connection_points_p90": connection_points_p90,
+        "customer_count_p90": customer_count_p90,
+    }
+    if quantile is not None or any(value is not None for value in overrides.values()):
+        calibration = calibrate(inputs, quantile) if quantile is not None else {}
+        calibration.update({key: value for key, value in overrides.items() if value is not None})
+        what_if = score_frame(inputs, calibration)
+        delta = what_if["score"] - dnos["score"]
+        dnos["score"] = what_if["score"]
+        dnos["confidence"] = what_if["confidence"]
+        # Covers all DNOs, scored or not
+        data["what_if"] = {
+            "calibration": {**DEFAULT_CALIBRATION, **calibration},
+            **score_distribution(what_if["score"]),
+            "top": _importance_top(dnos),
+            "changed": int((delta.abs() >= 0.01).sum()),
+            "mean_delta": round(float(delta.mean()), 2),
         }
-        for i in range(10)
-    ]
 
-    sorted_scores = sorted(persisted_scores)
-    total = len(sorted_scores)
-    p50 = sorted_scores[int((total - 1) * 0.5)] if total else 0.0
-    p90 = sorted_scores[int((total - 1) * 0.9)] if total else 0.0
+    return APIResponse(success=True, data=data)
 
-    top_candidates.sort(key=lambda item: item["score_value"], reverse=True)
-    top_items = [
+
+def _importance_top(dnos: pd.DataFrame, limit: int = 20) -> list[dict]:
+    top = dnos.sort_values(["score", "name"], ascending=[False, True]).head(limit)
+    return [
         {
-            "id": item["id"],
-            "slug": item["slug"],
-            "name": item["name"],
-            "importance_score": item["importance_score"],
-            "importance_confidence": item["importance_confidence"],
-            "connection_points_count": item["connection_points_count"],
+            "id": int(row.id),
+            "slug": row.slug,
+            "name": row.name,
+            "importance_score": round(float(row.score), 2),
+            "importance_confidence": None if pd.isna(row.confidence) else row.confidence,
+            "connection_points_count": (
+                None if pd.isna(row.connection_points_count) else int(row.connection_points_count)
+            ),
         }
-        for item in top_candidates[:20]
+        for row in top.itertuples(index=False)
     ]
 
-    return APIResponse(
-        success=True,
-        data={
-            "total": len(dnos),
-            "scored": len(persisted_scores),
-            "p50": round(p50, 2),
-            "p90": round(p90, 2),
-            "histogram": histogram,
-            "top": top_items,
-            "quality": {
-                "missing_score": len(dnos) - len(persisted_scores),
-                "fallback_customers": fallback_customers,
-                "fallback_area": fallback_area,
-            },
-        },
-    )
-
 
 @router.get("/flagged")
 async def list_flagged_items(
@@ -742,10 +754,13 @@ async def trigger_bulk_extract(
         if failed_ids:
             failed_query = select(CrawlJobModel).where(CrawlJobModel.id.in_(failed_ids))
             failed_result = await db.execute(failed_query)
+            failed_dno_ids = set()
             for job in failed_result.scalars():
                 job.status = "failed"
                 job.error_message = f"Enqueue failed: {exc}"
                 job.completed_at = datetime.now(UTC)
+                failed_dno_ids.add(job.dno_id)
+            await refresh_dno_summaries(db, failed_dno_ids)
             await db.commit()
 
         logger.error(
@@ -871,6 +886,7 @@ async def cancel_bulk_extract(
         job.completed_at = datetime.now(UTC)
         cancelled_count += 1
 
+    await refresh_dno_summaries(db, {job.dno_id for job in pending_jobs})
     await db.commit()
 
     logger.info(
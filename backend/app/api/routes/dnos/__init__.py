@@ -17,6 +17,7 @@ from .crawl import router as crawl_router
 from .crud import router as crud_router
 from .data import router as data_router
 from .files import router as files_router
+from .import_export import bulk_router as bulk_export_router
 from .import_export import router as import_export_router
 
 # Create main router that combines all sub-routers
@@ -24,6 +25,7 @@ router = APIRouter()
 
 # Include all sub-routers
 # Note: Order matters for route matching - more specific routes first
+router.include_router(bulk_export_router)  # Dataset export (before /{dno_id})
 router.include_router(crud_router)  # Basic CRUD operations
 router.include_router(crawl_router)  # Crawl/job operations
 router.include_router(data_router)  # Data operations
@@ -15,11 +15,17 @@ from app.core.auth import get_current_user
 from app.core.models import APIResponse
 from app.core.rate_limiter import get_client_ip
 from app.db import CrawlJobModel, DNOModel, get_db
+from app.jobs.common import resume_context
+from app.services.dno_summary import refresh_dno_summary
+from app.services.search_cache import invalidate_search_cache
 
 from .schemas import TriggerCrawlRequest
 
 router = APIRouter()
 
+# Failed full jobs younger than this are resumed from their checkpoints
+RESUME_WINDOW = timedelta(hours=24)
+
 
 @router.post("/{dno_id}/crawl")
 async def trigger_crawl(
@@ -163,6 +169,19 @@ async def trigger_crawl(
     initiator_ip = get_client_ip(http_request)
     job_context = {"initiator_ip": initiator_ip}
 
+    # Continue where a recently failed run for the same year stopped
+    if job_type == "full" and request.resume:
+        previous_job = await _latest_failed_crawl_job(db, dno.id, request.year)
+        resumed = resume_context(previous_job.context) if previous_job else {}
+        if resumed:
+            job_context.update(resumed)
+            job_context["resumed_from_job_id"] = previous_job.id
+            logger.info(
+                "Resuming from failed job checkpoints",
+                previous_job_id=previous_job.id,
+                completed_steps=resumed["checkpoint"]["completed_steps"],
+            )
+
     # For extract jobs, create a coordinator parent + child extract jobs per data type
     if job_type == "extract":
         # Create coordinator parent job
@@ -232,7 +251,8 @@ async def trigger_crawl(
         if child_job_ids:
             job.child_job_id = child_job_ids[0]
             job.context = {**(job.context or {}), "child_job_ids": child_job_ids}
-            await db.commit()
+        await refresh_dno_summary(db, dno.id)
+        await db.commit()
 
         return APIResponse(
             success=True,
@@ -262,8 +282,12 @@ async def trigger_crawl(
         context=job_context,
     )
     db.add(job)
+    await db.flush()
+    await refresh_dno_summary(db, dno.id)
     await db.commit()
     await db.refresh(job)
+    if job_type == "full":
+        await invalidate_search_cache(dno.id)  # Public search shows the DNO status
 
     # Enqueue to crawl worker
     try:
@@ -296,6 +320,25 @@ async def trigger_crawl(
     )
 
 
+async def _latest_failed_crawl_job(
+    db: AsyncSession, dno_id: int, year: int
+) -> CrawlJobModel | None:
+    """Most recent failed full job for the DNO/year within the resume window."""
+    result = await db.execute(
+        select(CrawlJobModel)
+        .where(
+            CrawlJobModel.dno_id == dno_id,
+            CrawlJobModel.year == year,
+            CrawlJobModel.job_type == "full",
+            CrawlJobModel.status == "failed",
+            CrawlJobModel.created_at >= datetime.now(UTC) - RESUME_WINDOW,
+        )
+        .order_by(CrawlJobModel.created_at.desc())
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
 @router.get("/{dno_id}/jobs")
 async def get_dno_crawl_jobs(
     dno_id: int,
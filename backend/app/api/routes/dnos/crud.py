@@ -2,26 +2,43 @@
 CRUD operations for DNO management.
 """
 
+import base64
+import json
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import case, delete, exists, func, or_, select, text
+from sqlalchemy import and_, case, delete, func, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer_group
 
 from app.core.auth import User as AuthUser
 from app.core.auth import get_current_user
 from app.core.config import settings
 from app.core.models import APIResponse
-from app.db import CrawlJobModel, DNOModel, HLZFModel, NetzentgelteModel, get_db
+from app.db import CrawlJobModel, DNOModel, DNOSummaryModel, HLZFModel, NetzentgelteModel, get_db
 from app.services.completeness import build_completeness_payload, connection_points_from_mastr
+from app.services.dno_summary import (
+    calculate_live_status,
+    refresh_dno_summary,
+)
 from app.services.importance import apply_importance_to_dno, compute_importance_for_dno
+from app.services.search_cache import invalidate_search_cache
+from app.services.sitemap_store import count_sitemap_urls
 
 from .schemas import CreateDNORequest, UpdateDNORequest
 from .utils import slugify
 
 router = APIRouter()
 
+# List values of DNOs without a summary row yet (a creation path that skipped
+# refresh_dno_summary); the row is written on the next refresh or API start-up
+_list_status = func.coalesce(
+    DNOSummaryModel.live_status,
+    case((DNOModel.crawlable.is_(False), "protected"), else_="uncrawled"),
+)
+_list_importance = func.coalesce(DNOSummaryModel.importance_score, DNOModel.importance_score, 0.0)
+_list_data_score = func.coalesce(DNOSummaryModel.score, 0)
+
 
 def _build_mastr_stats_payload(dno: DNOModel) -> dict | None:
     """Build MaStR statistics payload for API responses."""
@@ -130,66 +147,50 @@ def _compute_similarity_threshold(query_length: int) -> float:
     return 0.2
 
 
-def _calculate_dno_live_status(
-    *,
-    crawlable: bool,
-    data_points_count: int,
-    running_jobs: int,
-    pending_jobs: int,
-) -> str:
-    """Calculate DNO live status from preloaded counters."""
-    if running_jobs > 0:
-        return "running"
-    if pending_jobs > 0:
-        return "pending"
-    if not crawlable:
-        return "protected"
-    if data_points_count > 0:
-        return "crawled"
-    return "uncrawled"
-
-
 def _serialize_dno_list_item(
     *,
     dno: DNOModel,
-    netzentgelte_count: int,
-    hlzf_count: int,
+    summary: DNOSummaryModel | None,
     include_stats: bool,
-    live_status: str,
 ) -> dict:
-    """Serialize one DNO list item payload."""
-    data_points_count = netzentgelte_count + hlzf_count
-    score = min(round((data_points_count / 50) * 100), 100) if data_points_count > 0 else 0
-
-    importance_result = None
-    if dno.importance_score is None:
-        importance_result = compute_importance_for_dno(dno)
-
-    importance_score = importance_result.score if importance_result else dno.importance_score
-    importance_confidence = (
-        importance_result.confidence if importance_result else dno.importance_confidence
-    )
-    importance_version = importance_result.version if importance_result else dno.importance_version
+    """Serialize one DNO list item payload from its precomputed summary.
 
+    A DNO without a summary row yet gets the same defaults the list sorts
+    and filters it by (_list_status, _list_importance, _list_data_score).
+    """
+    if summary is None:
+        summary = DNOSummaryModel(
+            dno_id=dno.id,
+            netzentgelte_count=0,
+            hlzf_count=0,
+            data_points_count=0,
+            score=0,
+            live_status="uncrawled" if dno.crawlable is not False else "protected",
+            completeness_score=0,
+            importance_score=dno.importance_score or 0.0,
+            importance_confidence=dno.importance_confidence,
+            importance_version=dno.importance_version,
+        )
     dno_data = {
         "id": str(dno.id),
         "slug": dno.slug,
         "name": dno.name,
         "official_name": dno.official_name,
         "vnb_id": dno.vnb_id,
-        "status": live_status,
+        "status": summary.live_status,
         "description": dno.description,
         "region": dno.region,
         "website": dno.website,
         "crawlable": dno.crawlable,
         "crawl_blocked_reason": dno.crawl_blocked_reason,
-        "data_points_count": data_points_count,
-        "netzentgelte_count": netzentgelte_count,
-        "hlzf_count": hlzf_count,
-        "score": score,
-        "importance_score": importance_score,
-        "importance_confidence": importance_confidence,
-        "importance_version": importance_version,
+        "data_points_count": summary.data_points_count,
+        "netzentgelte_count": summary.netzentgelte_count,
+        "hlzf_count": summary.hlzf_count,
+        "score": summary.score,
+        "completeness_score": summary.completeness_score,
+        "importance_score": summary.importance_score,
+        "importance_confidence": summary.importance_confidence,
+        "importance_version": summary.importance_version,
         "created_at": dno.created_at.isoformat() if dno.created_at else None,
         "updated_at": dno.updated_at.isoformat() if dno.updated_at else None,
     }
@@ -316,41 +317,37 @@ async def search_vnb(
 
     Returns matching VNBs with indicator if they already exist in our database.
     """
-    from app.services.vnb import VNBDigitalClient
+    from app.services.vnb import get_vnb_client
 
-    vnb_client = VNBDigitalClient(request_delay=0.5)
-    try:
-        vnb_results = await vnb_client.search_vnb(q)
-
-        # Check which VNBs already exist in our database
-        suggestions = []
-        for vnb in vnb_results:
-            # Check if this VNB already exists by vnb_id
-            existing_query = select(DNOModel).where(DNOModel.vnb_id == vnb.vnb_id)
-            result = await db.execute(existing_query)
-            existing_dno = result.scalar_one_or_none()
-
-            suggestions.append(
-                {
-                    "vnb_id": vnb.vnb_id,
-                    "name": vnb.name,
-                    "subtitle": vnb.subtitle,
-                    "logo_url": vnb.logo_url,
-                    "exists": existing_dno is not None,
-                    "existing_dno_id": str(existing_dno.id) if existing_dno else None,
-                    "existing_dno_slug": existing_dno.slug if existing_dno else None,
-                }
-            )
+    vnb_results = await get_vnb_client(public_quota=False).search_vnb(q)
 
-        return APIResponse(
-            success=True,
-            data={
-                "suggestions": suggestions,
-                "count": len(suggestions),
-            },
+    # Check which VNBs already exist in our database
+    suggestions = []
+    for vnb in vnb_results:
+        # Check if this VNB already exists by vnb_id
+        existing_query = select(DNOModel).where(DNOModel.vnb_id == vnb.vnb_id)
+        result = await db.execute(existing_query)
+        existing_dno = result.scalar_one_or_none()
+
+        suggestions.append(
+            {
+                "vnb_id": vnb.vnb_id,
+                "name": vnb.name,
+                "subtitle": vnb.subtitle,
+                "logo_url": vnb.logo_url,
+                "exists": existing_dno is not None,
+                "existing_dno_id": str(existing_dno.id) if existing_dno else None,
+                "existing_dno_slug": existing_dno.slug if existing_dno else None,
+            }
         )
-    finally:
-        await vnb_client.close()
+
+    return APIResponse(
+        success=True,
+        data={
+            "suggestions": suggestions,
+            "count": len(suggestions),
+        },
+    )
 
 
 @router.get("/search-vnb/{vnb_id}/details")
@@ -363,13 +360,9 @@ async def get_vnb_details(
 
     Used when user selects a suggestion to auto-fill the form.
     """
-    from app.services.vnb import VNBDigitalClient
+    from app.services.vnb import get_vnb_client
 
-    vnb_client = VNBDigitalClient(request_delay=0.5)
-    try:
-        details = await vnb_client.get_vnb_details(vnb_id)
-    finally:
-        await vnb_client.close()
+    details = await get_vnb_client(public_quota=False).get_vnb_details(vnb_id)
 
     if not details:
         raise HTTPException(
@@ -472,6 +465,8 @@ async def create_dno(
     )
     apply_importance_to_dno(dno)
     db.add(dno)
+    await db.flush()
+    await refresh_dno_summary(db, dno.id)
     await db.commit()
     await db.refresh(dno)
 
@@ -534,6 +529,61 @@ async def get_stats(
     )
 
 
+@router.get("/autocomplete")
+async def autocomplete_dnos(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[AuthUser, Depends(get_current_user)],
+    q: str = Query(..., min_length=1, max_length=100, description="Typed prefix/term"),
+    limit: int = Query(10, ge=1, le=25, description="Max suggestions"),
+) -> APIResponse:
+    """
+    Top DNO suggestions for a search box.
+
+    Matches names, official names, VNB/BDEW names, BDEW codes and the MaStR
+    number through the trigram index on dno_summaries.search_text. Name
+    prefixes rank first, then substring and fuzzy matches.
+    """
+    q = q.strip()
+    if not q:
+        return APIResponse(success=True, data=[])
+
+    combined_filter = await _search_filter(db, q)
+    name_prefix = DNOModel.name.ilike(f"{_escape_like(q)}%")
+    rank = (
+        func.similarity(DNOModel.name, q)
+        + case((name_prefix, 2.0), else_=0.0)
+        + case((DNOModel.name.ilike(_contains_pattern(q)), 1.0), else_=0.0)
+    )
+
+    result = await db.execute(
+        select(
+            DNOModel.id,
+            DNOModel.slug,
+            DNOModel.name,
+            DNOModel.region,
+            _list_status.label("live_status"),
+        )
+        .outerjoin(DNOSummaryModel, DNOSummaryModel.dno_id == DNOModel.id)
+        .where(combined_filter)
+        .order_by(rank.desc(), DNOModel.name, DNOModel.id)
+        .limit(limit)
+    )
+
+    return APIResponse(
+        success=True,
+        data=[
+            {
+                "id": str(row.id),
+                "slug": row.slug,
+                "name": row.name,
+                "region": row.region,
+                "status": row.live_status,
+            }
+            for row in result.all()
+        ],
+    )
+
+
 @router.get("/")
 async def list_dnos_detailed(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -541,6 +591,9 @@ async def list_dnos_detailed(
     include_stats: bool = Query(False),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(50, description="Items per page (25, 50, 100, 250)"),
+    cursor: str | None = Query(
+        None, description="Keyset cursor from meta.next_cursor (replaces page)"
+    ),
     q: str | None = Query(None, description="Search term"),
     status_filter: str | None = Query(
         None,
@@ -549,256 +602,210 @@ async def list_dnos_detailed(
     ),
     sort_by: str = Query(
         "name_asc",
-        description="Sort by: name_asc, name_desc, importance_asc, importance_desc, score_asc, score_desc, region_asc, region_desc",
+        description="Sort by: name_asc, name_desc, importance_asc, importance_desc, score_asc, score_desc (aliases of importance), data_score_asc, data_score_desc, region_asc, region_desc",
     ),
 ) -> APIResponse:
     """
     List all DNOs with detailed information (paginated).
 
-    Status is computed dynamically from active jobs:
+    Counts, status, scores and importance come from the precomputed
+    dno_summaries read model (app.services.dno_summary), so a page is one
+    indexed query. Status is derived from active jobs:
     - running: at least one running job
     - pending: at least one pending job (none running)
     - crawled: has data points and no active jobs
     - uncrawled: no data points and no active jobs
     - protected: crawlable=False (blocked by robots.txt, Cloudflare, etc.)
+
+    Pagination: every page returns meta.next_cursor. Passing it back as
+    `cursor` continues after the last row (keyset) without OFFSET or a
+    total count; `page` keeps working for jumping to a page.
     """
     # Validate per_page
     allowed_per_page = [25, 50, 100, 250]
     if per_page not in allowed_per_page:
         per_page = 50  # Default to 50 if invalid
 
-    # Base query
-    query = select(DNOModel).options(selectinload(DNOModel.mastr_data))
+    # Base query: DNO columns + precomputed list values
+    query = select(DNOModel, DNOSummaryModel).outerjoin(
+        DNOSummaryModel, DNOSummaryModel.dno_id == DNOModel.id
+    )
+    if include_stats:
+        query = query.options(selectinload(DNOModel.mastr_data))
 
     # Apply search filter if provided
+    relevance = None
+    q = q.strip() if q else None
     if q:
         # =======================================================================
         # HYBRID SEARCH: Combines multiple strategies for robust matching
         # =======================================================================
-        # Strategy 1: ILIKE contains - catches exact substrings like "Ulm"
-        # Strategy 2: Trigram similarity - fuzzy matching for typos
-        # Strategy 3: Region matching - search in region field too
+        # Strategy 1: Substring match on names, aliases, codes - catches "Ulm"
+        # Strategy 2: Trigram similarity on the name - fuzzy matching for typos
+        # Both are served by GIN trigram indexes (BitmapOr, no table scan)
         # =======================================================================
-
-        q_normalized = q.strip().lower()
-        q_len = len(q_normalized)
-
-        similarity_threshold = _compute_similarity_threshold(q_len)
-
-        # Trigram similarity score
-        similarity = func.similarity(DNOModel.name, q)
-
-        # ILIKE pattern for contains matching (case-insensitive)
-        # Escape ILIKE wildcards to prevent wildcard injection
-        q_escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-        ilike_pattern = f"%{q_escaped}%"
-        contains_match = DNOModel.name.ilike(ilike_pattern)
-        region_match = DNOModel.region.ilike(ilike_pattern)
-
-        # Combined filter: Match if ANY strategy succeeds
-        # This ensures short queries like "Ulm" work via ILIKE even if trigram fails
-        combined_filter = or_(
-            similarity > similarity_threshold,  # Fuzzy match
-            contains_match,  # Exact substring in name
-            region_match,  # Match in region
-        )
+        query = query.filter(await _search_filter(db, q))
 
         # Scoring: Prioritize exact matches, then fuzzy matches
-        # CASE expression to boost exact substring matches
+        contains_pattern = _contains_pattern(q)
         exact_boost = case(
-            (contains_match, 2.0),  # Boost for exact substring match
+            (DNOModel.name.ilike(contains_pattern), 2.0),  # Exact substring in name
             else_=0.0,
         )
         region_boost = case(
-            (region_match, 0.5),  # Small boost for region match
+            (DNOModel.region.ilike(contains_pattern), 0.5),  # Small boost for region match
             else_=0.0,
         )
 
         # Combined score: trigram similarity + bonuses for exact matches
-        combined_score = similarity + exact_boost + region_boost
+        relevance = func.similarity(DNOModel.name, q) + exact_boost + region_boost
 
-        # Don't apply default sort for search - use relevance
-        query = query.filter(combined_filter)
-        search_order = combined_score.desc()
+    # Status filter on the precomputed live status
+    if status_filter in {"protected", "running", "pending", "crawled", "uncrawled"}:
+        query = query.filter(_list_status == status_filter)
 
-        # Count with combined filter
-        count_query = select(func.count()).select_from(DNOModel).where(combined_filter)
-    else:
-        search_order = None
-        # Total count without filter
-        count_query = select(func.count()).select_from(DNOModel)
-
-    # Apply status filter at SQL level using EXISTS subqueries
-    if status_filter:
-        _running_exists = exists(
-            select(CrawlJobModel.id).where(
-                CrawlJobModel.dno_id == DNOModel.id,
-                CrawlJobModel.status == "running",
-            )
-        )
-        _pending_exists = exists(
-            select(CrawlJobModel.id).where(
-                CrawlJobModel.dno_id == DNOModel.id,
-                CrawlJobModel.status == "pending",
-            )
-        )
-        _netz_exists = exists(
-            select(NetzentgelteModel.id).where(
-                NetzentgelteModel.dno_id == DNOModel.id,
-            )
+    # Sorting (relevance first when searching); keys double as the keyset
+    sort_keys = _list_sort_keys(sort_by, relevance)
+    cursor_sort = "relevance" if relevance is not None else sort_by
+    query = query.order_by(*(key.desc() if desc else key.asc() for key, desc in sort_keys))
+    query = query.add_columns(*(key for key, _ in sort_keys))
+
+    if cursor:
+        query = query.where(
+            _keyset_after(sort_keys, _decode_cursor(cursor, cursor_sort, sort_keys))
         )
-        _hlzf_exists = exists(
-            select(HLZFModel.id).where(
-                HLZFModel.dno_id == DNOModel.id,
-            )
+        meta: dict = {"per_page": per_page}
+    else:
+        # Count over the same filters (before ordering/pagination)
+        count_query = select(func.count()).select_from(
+            query.order_by(None).with_only_columns(DNOModel.id).subquery()
         )
+        total = (await db.execute(count_query)).scalar() or 0
+        total_pages = (total + per_page - 1) // per_page  # Ceiling division
+
+        # Clamp page to valid range
+        if page > total_pages > 0:
+            page = total_pages
+        elif total_pages == 0:
+            page = 1
+
+        query = query.offset((page - 1) * per_page)
+        meta = {"total": total, "page": page, "per_page": per_page, "total_pages": total_pages}
+
+    # One extra row tells whether there is a next page
+    rows = (await db.execute(query.limit(per_page + 1))).all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    data = [
+        _serialize_dno_list_item(dno=row[0], summary=row[1], include_stats=include_stats)
+        for row in rows
+    ]
+    meta["next_cursor"] = _encode_cursor(cursor_sort, list(rows[-1][2:])) if has_more else None
 
-        if status_filter == "protected":
-            status_clause = DNOModel.crawlable == False  # noqa: E712
-        elif status_filter == "running":
-            status_clause = _running_exists
-        elif status_filter == "pending":
-            status_clause = ~_running_exists & _pending_exists
-        elif status_filter == "crawled":
-            status_clause = ~_running_exists & ~_pending_exists & (_netz_exists | _hlzf_exists)
-        elif status_filter == "uncrawled":
-            status_clause = (
-                ~_running_exists
-                & ~_pending_exists
-                & ~_netz_exists
-                & ~_hlzf_exists
-                & (DNOModel.crawlable == True)  # noqa: E712
-            )
-        else:
-            status_clause = None
-
-        if status_clause is not None:
-            query = query.filter(status_clause)
-            count_query = count_query.where(status_clause)
-
-    # Apply sorting (unless searching - then relevance takes priority)
-    if q and search_order is not None:
-        # For search, use relevance score as primary sort
-        query = query.order_by(search_order, DNOModel.name)
-    # Apply explicit sort
-    elif sort_by == "name_desc":
-        query = query.order_by(DNOModel.name.desc())
-    elif sort_by == "region_asc":
-        query = query.order_by(DNOModel.region.asc().nullslast(), DNOModel.name)
-    elif sort_by == "region_desc":
-        query = query.order_by(DNOModel.region.desc().nullslast(), DNOModel.name)
-    elif sort_by in {"importance_desc", "score_desc"}:
-        query = query.order_by(DNOModel.importance_score.desc().nullslast(), DNOModel.name)
-    elif sort_by in {"importance_asc", "score_asc"}:
-        query = query.order_by(DNOModel.importance_score.asc().nullsfirst(), DNOModel.name)
-    else:  # Default: name_asc
-        query = query.order_by(DNOModel.name)
-
-    total_count_result = await db.execute(count_query)
-    total = total_count_result.scalar() or 0
-    total_pages = (total + per_page - 1) // per_page  # Ceiling division
-
-    # Clamp page to valid range
-    if page > total_pages > 0:
-        page = total_pages
-    elif total_pages == 0:
-        page = 1
-
-    # Calculate offset
-    offset = (page - 1) * per_page
-
-    # Paginated query
-    query = query.offset(offset).limit(per_page)
-    result = await db.execute(query)
-    dnos = result.scalars().all()
-
-    if not dnos:
-        return APIResponse(
-            success=True,
-            data=[],
-            meta={"total": total, "page": page, "per_page": per_page, "total_pages": total_pages},
-        )
+    return APIResponse(success=True, data=data, meta=meta)
 
-    # Get DNO IDs for batch queries
-    dno_ids = [dno.id for dno in dnos]
-
-    # Batch query for netzentgelte counts
-    netz_counts_result = await db.execute(
-        text(
-            """
-            SELECT dno_id, COUNT(*) as count
-            FROM netzentgelte
-            WHERE dno_id = ANY(:dno_ids)
-            GROUP BY dno_id
-        """
-        ),
-        {"dno_ids": dno_ids},
-    )
-    netz_counts = {row[0]: row[1] for row in netz_counts_result.fetchall()}
-
-    # Batch query for HLZF counts
-    hlzf_counts_result = await db.execute(
-        text(
-            """
-            SELECT dno_id, COUNT(*) as count
-            FROM hlzf
-            WHERE dno_id = ANY(:dno_ids)
-            GROUP BY dno_id
-        """
-        ),
-        {"dno_ids": dno_ids},
-    )
-    hlzf_counts = {row[0]: row[1] for row in hlzf_counts_result.fetchall()}
-
-    # Batch query for job statuses
-    job_status_result = await db.execute(
-        text(
-            """
-            SELECT dno_id, status, COUNT(*) as count
-            FROM crawl_jobs
-            WHERE dno_id = ANY(:dno_ids) AND status IN ('running', 'pending')
-            GROUP BY dno_id, status
-        """
-        ),
-        {"dno_ids": dno_ids},
+
+def _escape_like(value: str) -> str:
+    """Escape ILIKE wildcards to prevent wildcard injection."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _contains_pattern(q: str) -> str:
+    return f"%{_escape_like(q)}%"
+
+
+async def _search_filter(db: AsyncSession, q: str):
+    """Index-backed DNO search condition: substring on search_text OR fuzzy name.
+
+    The `%` operator (unlike similarity() > x) can use the trigram index; its
+    threshold is set per transaction from the query length.
+    """
+    threshold = _compute_similarity_threshold(len(q.lower()))
+    await db.execute(select(func.set_config("pg_trgm.similarity_threshold", str(threshold), True)))
+    return or_(
+        DNOModel.name.op("%")(q),
+        DNOSummaryModel.search_text.ilike(_contains_pattern(q.lower())),
     )
-    job_statuses = {}
-    for row in job_status_result.fetchall():
-        dno_id, job_status_val, count = row
-        if dno_id not in job_statuses:
-            job_statuses[dno_id] = {"running": 0, "pending": 0}
-        job_statuses[dno_id][job_status_val] = count
-
-    data = []
-    for dno in dnos:
-        netzentgelte_count = netz_counts.get(dno.id, 0)
-        hlzf_count = hlzf_counts.get(dno.id, 0)
-        data_points_count = netzentgelte_count + hlzf_count
-
-        # Compute live status from batch-loaded job data
-        job_status = job_statuses.get(dno.id, {"running": 0, "pending": 0})
-        live_status = _calculate_dno_live_status(
-            crawlable=dno.crawlable,
-            data_points_count=data_points_count,
-            running_jobs=job_status["running"],
-            pending_jobs=job_status["pending"],
-        )
 
-        dno_data = _serialize_dno_list_item(
-            dno=dno,
-            netzentgelte_count=netzentgelte_count,
-            hlzf_count=hlzf_count,
-            include_stats=include_stats,
-            live_status=live_status,
+
+def _list_sort_keys(sort_by: str, relevance=None) -> list[tuple]:
+    """(expression, descending) sort keys of the DNO list, ending in a unique id.
+
+    Keys are non-null so they can be compared in keyset conditions; NULL
+    regions sort last via an explicit 0/1 key.
+    """
+    name = (DNOModel.name, False)
+    tie = (DNOModel.id, False)
+    if relevance is not None:
+        return [(relevance, True), name, tie]
+    if sort_by == "name_desc":
+        return [(DNOModel.name, True), (DNOModel.id, True)]
+    if sort_by in {"region_asc", "region_desc"}:
+        region = func.coalesce(DNOModel.region, "")
+        return [
+            (case((DNOModel.region.is_(None), 1), else_=0), False),
+            (region, sort_by == "region_desc"),
+            name,
+            tie,
+        ]
+    if sort_by in {"importance_desc", "importance_asc", "score_desc", "score_asc"}:
+        # score_* has always meant importance; data_score_* sorts by data points
+        return [(_list_importance, sort_by.endswith("_desc")), name, tie]
+    if sort_by in {"data_score_desc", "data_score_asc"}:
+        return [(_list_data_score, sort_by == "data_score_desc"), name, tie]
+    return [name, tie]  # Default: name_asc
+
+
+def _keyset_after(sort_keys: list[tuple], values: list):
+    """Condition selecting the rows strictly after `values` in sort_keys order."""
+    branches = []
+    for i, (key, desc) in enumerate(sort_keys):
+        equal = [sort_keys[j][0] == values[j] for j in range(i)]
+        beyond = key < values[i] if desc else key > values[i]
+        branches.append(and_(*equal, beyond))
+    return or_(*branches)
+
+
+def _encode_cursor(sort: str, values: list) -> str:
+    """Keyset cursor: the sort it belongs to and the last row's sort key values."""
+    return base64.urlsafe_b64encode(json.dumps({"sort": sort, "values": values}).encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort: str, sort_keys: list[tuple]) -> list:
+    """Sort key values of a cursor, checked against the sort and key types of this query.
+
+    Raises:
+        HTTPException: 400 for malformed cursors and cursors of another sort
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        payload = None
+    values = payload.get("values") if isinstance(payload, dict) else None
+    if (
+        payload is None
+        or payload.get("sort") != sort
+        or not isinstance(values, list)
+        or len(values) != len(sort_keys)
+        or not all(
+            _cursor_value_matches(value, key)
+            for value, (key, _) in zip(values, sort_keys, strict=True)
         )
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor for this query",
+        )
+    return values
 
-        data.append(dno_data)
 
-    return APIResponse(
-        success=True,
-        data=data,
-        meta={"total": total, "page": page, "per_page": per_page, "total_pages": total_pages},
-    )
+def _cursor_value_matches(value, key) -> bool:
+    """Whether a decoded JSON value fits the Python type of a sort key."""
+    python_type = key.type.python_type
+    if python_type is float:
+        return isinstance(value, int | float) and not isinstance(value, bool)
+    return type(value) is python_type
 
 
 @router.get("/{dno_id}")
@@ -820,6 +827,7 @@ async def get_dno_details(
                 selectinload(DNOModel.mastr_data),
                 selectinload(DNOModel.vnb_data),
                 selectinload(DNOModel.bdew_data),
+                undefer_group("crawl_details"),
             )
             .where(DNOModel.id == int(dno_id))
         )
@@ -833,6 +841,7 @@ async def get_dno_details(
                 selectinload(DNOModel.mastr_data),
                 selectinload(DNOModel.vnb_data),
                 selectinload(DNOModel.bdew_data),
+                undefer_group("crawl_details"),
             )
             .where(DNOModel.slug == dno_id.lower())
         )
@@ -870,7 +879,7 @@ async def get_dno_details(
     vnb_data = _serialize_vnb_data(dno)
     bdew_data = _serialize_bdew_data_list(dno)
 
-    live_status = _calculate_dno_live_status(
+    live_status = calculate_live_status(
         crawlable=dno.crawlable,
         data_points_count=(netz_c + hlzf_c),
         running_jobs=running_j,
@@ -921,6 +930,7 @@ async def get_dno_details(
             "has_local_files": has_local_files,
             "robots_txt": dno.robots_txt,
             "sitemap_urls": dno.sitemap_urls,
+            "sitemap_url_count": await count_sitemap_urls(db, dno.id),
             "cms_system": dno.cms_system,
             "tech_stack_details": dno.tech_stack_details,
             "has_mastr": dno.has_mastr,
@@ -985,9 +995,11 @@ async def update_dno(
         dno.customer_count = request.customer_count
 
     apply_importance_to_dno(dno)
+    await refresh_dno_summary(db, dno.id)
 
     await db.commit()
     await db.refresh(dno)
+    await invalidate_search_cache(dno_id)
 
     return APIResponse(
         success=True,
@@ -1030,6 +1042,7 @@ async def delete_dno(
     # Delete the DNO itself
     await db.delete(dno)
     await db.commit()
+    await invalidate_search_cache(dno_id)
 
     return APIResponse(
         success=True,
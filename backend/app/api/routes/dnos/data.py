@@ -13,6 +13,8 @@ from app.core.auth import User as AuthUser
 from app.core.auth import get_current_user, require_admin
 from app.core.models import APIResponse
 from app.db import DNOModel, get_db
+from app.services.dno_summary import refresh_dno_summary
+from app.services.search_cache import invalidate_search_cache
 
 from .schemas import UpdateHLZFRequest, UpdateNetzentgelteRequest
 
@@ -173,6 +175,7 @@ async def update_netzentgelte(
     record.last_edited_at = datetime.now(UTC)
 
     await db.commit()
+    await invalidate_search_cache(dno_id)
 
     return APIResponse(
         success=True,
@@ -206,7 +209,9 @@ async def delete_netzentgelte(
         )
 
     await db.delete(record)
+    await refresh_dno_summary(db, dno_id)
     await db.commit()
+    await invalidate_search_cache(dno_id)
 
     return APIResponse(
         success=True,
@@ -258,6 +263,7 @@ async def update_hlzf(
     record.last_edited_at = datetime.now(UTC)
 
     await db.commit()
+    await invalidate_search_cache(dno_id)
 
     return APIResponse(
         success=True,
@@ -291,7 +297,9 @@ async def delete_hlzf(
         )
 
     await db.delete(record)
+    await refresh_dno_summary(db, dno_id)
     await db.commit()
+    await invalidate_search_cache(dno_id)
 
     return APIResponse(
         success=True,
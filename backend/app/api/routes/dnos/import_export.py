@@ -6,21 +6,86 @@ import json
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import Response
-from sqlalchemy import and_, delete, select
+import structlog
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import delete, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import User as AuthUser
-from app.core.auth import get_current_user
-from app.core.constants import VERIFICATION_STATUSES
+from app.core.auth import get_current_user, require_admin
 from app.core.models import APIResponse
+from app.core.sanitize import SanitizationError, sanitize_string
 from app.db import DNOModel, get_db
-
-from .schemas import ImportRequest
+from app.db.models import HLZFModel, NetzentgelteModel
+from app.services.bulk_import import delete_for_replace, read_import_file, upsert_rows
+from app.services.data_export import (
+    EXPORT_FORMATS,
+    HLZF_FIELDS,
+    NETZENTGELTE_FIELDS,
+    hlzf_record,
+    netzentgelte_record,
+    stream_export,
+)
+from app.services.dno_summary import refresh_dno_summaries, refresh_dno_summary
+from app.services.search_cache import invalidate_search_cache
+
+from .schemas import HLZFImport, ImportRequest, NetzentgelteImport
+
+logger = structlog.get_logger()
 
 router = APIRouter()
 
+# Static paths that would otherwise be captured by GET /{dno_id}; included first
+bulk_router = APIRouter()
+
+EXPORT_FORMAT_PATTERN = "^(json|ndjson|csv|parquet)$"
+
+# Dataset import limits
+MAX_DATASET_UPLOAD_SIZE = 100 * 1024 * 1024  # 100MB
+MAX_REPORTED_IMPORT_ERRORS = 1000
+
+
+def _streaming_export(
+    export_format: str,
+    filename_stem: str,
+    data_types: list[str],
+    dno_ids: list[int] | None,
+    years: list[int] | None,
+) -> StreamingResponse:
+    media_type, extension = EXPORT_FORMATS[export_format]
+    filename = f"{filename_stem}-export-{datetime.now().strftime('%Y%m%d')}.{extension}"
+    return StreamingResponse(
+        stream_export(export_format, data_types, dno_ids=dno_ids, years=years),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@bulk_router.get("/export")
+async def export_all_dno_data(
+    current_user: Annotated[AuthUser, Depends(get_current_user)],
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv|parquet)$"),
+    data_types: list[str] = Query(["netzentgelte", "hlzf"]),
+    years: list[int] | None = Query(None),
+) -> StreamingResponse:
+    """
+    Export the Netzentgelte/HLZF data of all DNOs as one streamed file.
+
+    Available to all authenticated users. Rows are streamed from
+    server-side cursors, so memory use stays flat for any dataset size.
+
+    Args:
+        export_format: ndjson, csv or parquet
+        data_types: Data types to export (netzentgelte, hlzf)
+        years: Optional year filter
+
+    Returns:
+        File download with one row per record (see app.services.data_export)
+    """
+    return _streaming_export(export_format, "dno-dataset", data_types, None, years)
+
 
 @router.get("/{dno_id}/export")
 async def export_dno_data(
@@ -30,28 +95,32 @@ async def export_dno_data(
     data_types: list[str] = Query(["netzentgelte", "hlzf"]),
     years: list[int] | None = Query(None),
     include_metadata: bool = Query(True),
+    export_format: str = Query("json", alias="format", pattern=EXPORT_FORMAT_PATTERN),
 ) -> Response:
     """
-    Export DNO data as downloadable JSON file.
+    Export DNO data as downloadable file.
 
-    Available to all authenticated users.
+    Available to all authenticated users. "json" is the import-compatible
+    document; ndjson, csv and parquet stream flat rows (without metadata).
 
     Args:
         dno_id: DNO ID
         data_types: Data types to export (netzentgelte, hlzf)
         years: Optional year filter
-        include_metadata: Include DNO metadata in export
+        include_metadata: Include DNO metadata in export (json only)
+        export_format: json, ndjson, csv or parquet
 
     Returns:
-        JSON file download
+        File download
     """
-    from app.db.models import HLZFModel, NetzentgelteModel
-
     # Get DNO
     dno = await db.get(DNOModel, dno_id)
     if not dno:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="DNO not found")
 
+    if export_format != "json":
+        return _streaming_export(export_format, dno.slug, data_types, [dno_id], years)
+
     export_data = {
         "export_version": "1.0",
         "exported_at": datetime.now().isoformat(),
@@ -75,27 +144,7 @@ async def export_dno_data(
         if years:
             query = query.where(NetzentgelteModel.year.in_(years))
         result = await db.execute(query)
-        netz_records = result.scalars().all()
-
-        export_data["netzentgelte"] = [
-            {
-                "year": r.year,
-                "voltage_level": r.voltage_level,
-                "leistung": float(r.leistung) if r.leistung else None,
-                "arbeit": float(r.arbeit) if r.arbeit else None,
-                "leistung_unter_2500h": (
-                    float(r.leistung_unter_2500h) if r.leistung_unter_2500h else None
-                ),
-                "arbeit_unter_2500h": float(r.arbeit_unter_2500h) if r.arbeit_unter_2500h else None,
-                "verification_status": (
-                    r.verification_status
-                    if r.verification_status in VERIFICATION_STATUSES
-                    else "unverified"
-                ),
-                "extraction_source": r.extraction_source,
-            }
-            for r in netz_records
-        ]
+        export_data["netzentgelte"] = [netzentgelte_record(r) for r in result.scalars()]
 
     # Export HLZF
     if "hlzf" in data_types:
@@ -103,25 +152,7 @@ async def export_dno_data(
         if years:
             query = query.where(HLZFModel.year.in_(years))
         result = await db.execute(query)
-        hlzf_records = result.scalars().all()
-
-        export_data["hlzf"] = [
-            {
-                "year": r.year,
-                "voltage_level": r.voltage_level,
-                "winter": r.winter,
-                "fruehling": r.fruehling,
-                "sommer": r.sommer,
-                "herbst": r.herbst,
-                "verification_status": (
-                    r.verification_status
-                    if r.verification_status in VERIFICATION_STATUSES
-                    else "unverified"
-                ),
-                "extraction_source": r.extraction_source,
-            }
-            for r in hlzf_records
-        ]
+        export_data["hlzf"] = [hlzf_record(r) for r in result.scalars()]
 
     # Generate filename
     filename = f"{dno.slug}-export-{datetime.now().strftime('%Y%m%d')}.json"
@@ -133,6 +164,49 @@ async def export_dno_data(
     )
 
 
+def _import_row(dno_id: int, record: NetzentgelteImport | HLZFImport) -> dict:
+    """Upsert row of a validated import record (see app.services.bulk_import).
+
+    Raises:
+        SanitizationError: extraction_source contains dangerous content
+    """
+    row = {
+        "dno_id": dno_id,
+        "year": record.year,
+        "voltage_level": record.voltage_level,
+        "verification_status": record.verification_status or None,
+        "extraction_source": (
+            sanitize_string(record.extraction_source, "extraction_source", max_length=100)
+            if record.extraction_source
+            else None
+        ),
+    }
+    if isinstance(record, HLZFImport):
+        # Plain dicts for JSON storage; an empty season counts as not provided
+        for season in HLZF_FIELDS:
+            ranges = getattr(record, season)
+            row[season] = [r.model_dump() for r in ranges] if ranges else None
+    else:
+        for price in NETZENTGELTE_FIELDS:
+            row[price] = getattr(record, price)
+    return row
+
+
+async def _apply_import(
+    db: AsyncSession,
+    mode: str,
+    rows: dict[str, list[dict]],
+) -> dict[str, dict[str, int]]:
+    """Write import rows per data type; replace first deletes the imported DNO years."""
+    counts = {}
+    for data_type, data_rows in rows.items():
+        if mode == "replace":
+            await delete_for_replace(db, data_type, {(r["dno_id"], r["year"]) for r in data_rows})
+        created, updated = await upsert_rows(db, data_type, data_rows)
+        counts[data_type] = {"created": created, "updated": updated}
+    return counts
+
+
 @router.post("/{dno_id}/import")
 async def import_dno_data(
     dno_id: int,
@@ -143,11 +217,13 @@ async def import_dno_data(
     """
     Import JSON data with validation and sanitization.
 
-    Available to all authenticated users.
+    Available to all authenticated users. Both data types are written in one
+    transaction with multi-row upserts.
 
     Modes:
     - merge: Add/update records, keep existing data
-    - replace: Delete existing data, then insert new
+    - replace: Delete existing data of the imported years (all data of a
+      type if its list is empty), then insert new
 
     Security:
     - Pydantic schema validation
@@ -155,13 +231,6 @@ async def import_dno_data(
     - Numeric bounds checking
     - Record count limits
     """
-    import structlog
-
-    from app.core.sanitize import SanitizationError, sanitize_string
-    from app.db.models import HLZFModel, NetzentgelteModel
-
-    logger = structlog.get_logger()
-
     # Get DNO
     dno = await db.get(DNOModel, dno_id)
     if not dno:
@@ -177,198 +246,219 @@ async def import_dno_data(
         user=current_user.email,
     )
 
-    # Track changes
-    netz_created = 0
-    netz_updated = 0
-    hlzf_created = 0
-    hlzf_updated = 0
-
-    def _netz_replace_years() -> set[int]:
-        return {r.year for r in request.netzentgelte}
-
-    def _hlzf_replace_years() -> set[int]:
-        return {r.year for r in request.hlzf}
+    try:
+        rows = {
+            "netzentgelte": [_import_row(dno_id, r) for r in request.netzentgelte],
+            "hlzf": [_import_row(dno_id, r) for r in request.hlzf],
+        }
+    except SanitizationError as e:
+        logger.warning("import_sanitization_failed", error=str(e), dno_id=dno_id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Content sanitization failed: {e!s}",
+        ) from e
 
     try:
-        # ------------------------
-        # Phase 1: Netzentgelte
-        # ------------------------
         if request.mode == "replace":
-            if len(request.netzentgelte) == 0:
-                await db.execute(
-                    delete(NetzentgelteModel).where(NetzentgelteModel.dno_id == dno_id)
-                )
-                logger.info("import_deleted_all_netzentgelte", dno_id=dno_id)
-            else:
-                netz_years = _netz_replace_years()
-                if netz_years:
-                    await db.execute(
-                        delete(NetzentgelteModel).where(
-                            and_(
-                                NetzentgelteModel.dno_id == dno_id,
-                                NetzentgelteModel.year.in_(netz_years),
-                            )
-                        )
-                    )
-
-        for record in request.netzentgelte:
-            # Check for existing record
-            existing = await db.execute(
-                select(NetzentgelteModel).where(
-                    and_(
-                        NetzentgelteModel.dno_id == dno_id,
-                        NetzentgelteModel.year == record.year,
-                        NetzentgelteModel.voltage_level == record.voltage_level,
-                    )
-                )
-            )
-            existing_record = existing.scalar_one_or_none()
-
-            if existing_record:
-                # Update existing
-                if record.leistung is not None:
-                    existing_record.leistung = record.leistung
-                if record.arbeit is not None:
-                    existing_record.arbeit = record.arbeit
-                if record.leistung_unter_2500h is not None:
-                    existing_record.leistung_unter_2500h = record.leistung_unter_2500h
-                if record.arbeit_unter_2500h is not None:
-                    existing_record.arbeit_unter_2500h = record.arbeit_unter_2500h
-                if record.verification_status:
-                    existing_record.verification_status = record.verification_status
-                if record.extraction_source:
-                    existing_record.extraction_source = sanitize_string(
-                        record.extraction_source, "extraction_source", max_length=100
-                    )
-                netz_updated += 1
-            else:
-                # Create new
-                new_record = NetzentgelteModel(
-                    dno_id=dno_id,
-                    year=record.year,
-                    voltage_level=record.voltage_level,
-                    leistung=record.leistung,
-                    arbeit=record.arbeit,
-                    leistung_unter_2500h=record.leistung_unter_2500h,
-                    arbeit_unter_2500h=record.arbeit_unter_2500h,
-                    verification_status=record.verification_status or "unverified",
-                    extraction_source=sanitize_string(
-                        record.extraction_source or "import", "extraction_source", max_length=100
-                    ),
-                )
-                db.add(new_record)
-                netz_created += 1
+            for data_type, model in (("netzentgelte", NetzentgelteModel), ("hlzf", HLZFModel)):
+                if not rows[data_type]:
+                    await db.execute(delete(model).where(model.dno_id == dno_id))
+                    logger.info(f"import_deleted_all_{data_type}", dno_id=dno_id)
 
+        counts = await _apply_import(db, request.mode, rows)
+        await refresh_dno_summary(db, dno_id)
         await db.commit()
+    except Exception as e:
+        logger.error("import_failed", error=str(e), dno_id=dno_id)
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Import failed due to an internal error. Please try again.",
+        ) from e
 
-        # ------------------------
-        # Phase 2: HLZF
-        # ------------------------
-        if request.mode == "replace":
-            if len(request.hlzf) == 0:
-                await db.execute(delete(HLZFModel).where(HLZFModel.dno_id == dno_id))
-                logger.info("import_deleted_all_hlzf", dno_id=dno_id)
-            else:
-                hlzf_years = _hlzf_replace_years()
-                if hlzf_years:
-                    await db.execute(
-                        delete(HLZFModel).where(
-                            and_(
-                                HLZFModel.dno_id == dno_id,
-                                HLZFModel.year.in_(hlzf_years),
-                            )
-                        )
-                    )
-
-        def _to_dicts(ranges):
-            return [r.model_dump() for r in ranges] if ranges else None
-
-        for record in request.hlzf:
-            # Convert Pydantic models to plain dicts for JSON storage
-            winter = _to_dicts(record.winter)
-            fruehling = _to_dicts(record.fruehling)
-            sommer = _to_dicts(record.sommer)
-            herbst = _to_dicts(record.herbst)
-
-            # Check for existing record
-            existing = await db.execute(
-                select(HLZFModel).where(
-                    and_(
-                        HLZFModel.dno_id == dno_id,
-                        HLZFModel.year == record.year,
-                        HLZFModel.voltage_level == record.voltage_level,
-                    )
-                )
+    await invalidate_search_cache(dno_id)
+
+    created = sum(c["created"] for c in counts.values())
+    updated = sum(c["updated"] for c in counts.values())
+    logger.info(
+        "import_completed",
+        dno_id=dno_id,
+        netz_created=counts["netzentgelte"]["created"],
+        netz_updated=counts["netzentgelte"]["updated"],
+        hlzf_created=counts["hlzf"]["created"],
+        hlzf_updated=counts["hlzf"]["updated"],
+    )
+
+    return APIResponse(
+        success=True,
+        message=f"Import completed: {created} created, {updated} updated",
+        data={**counts, "mode": request.mode},
+    )
+
+
+async def _parse_dataset_records(db: AsyncSession, records: list) -> tuple[dict, list[dict], int]:
+    """Validate flat dataset records (export format) into upsert rows.
+
+    DNOs are resolved by dno_id, else dno_slug, with one query. Invalid
+    records are left out and reported with their 1-based row number; at
+    most MAX_REPORTED_IMPORT_ERRORS are returned.
+
+    Returns:
+        (rows per data type, reported errors, total error count)
+    """
+    rows: dict[str, list[dict]] = {"netzentgelte": [], "hlzf": []}
+    errors: list[dict] = []
+    error_count = 0
+
+    def add_error(row: int, error: str) -> None:
+        nonlocal error_count
+        error_count += 1
+        if len(errors) < MAX_REPORTED_IMPORT_ERRORS:
+            errors.append({"row": row, "error": error})
+
+    objects = [r for r in records if isinstance(r, dict)]
+    ids = {int(r["dno_id"]) for r in objects if str(r.get("dno_id") or "").isdigit()}
+    slugs = {str(r["dno_slug"]) for r in objects if r.get("dno_slug")}
+    known_ids: set[int] = set()
+    id_by_slug: dict[str, int] = {}
+    if ids or slugs:
+        result = await db.execute(
+            select(DNOModel.id, DNOModel.slug).where(
+                or_(DNOModel.id.in_(ids), DNOModel.slug.in_(slugs))
+            )
+        )
+        for found_id, slug in result:
+            known_ids.add(found_id)
+            id_by_slug[slug] = found_id
+
+    schemas = {"netzentgelte": NetzentgelteImport, "hlzf": HLZFImport}
+    for number, record in enumerate(records, 1):
+        if not isinstance(record, dict):
+            add_error(number, "Record must be an object")
+            continue
+        data_type = record.get("data_type")
+        if data_type not in schemas:
+            add_error(number, "data_type must be 'netzentgelte' or 'hlzf'")
+            continue
+
+        raw_id = str(record.get("dno_id") or "")
+        if raw_id.isdigit() and int(raw_id) in known_ids:
+            dno_id = int(raw_id)
+        elif record.get("dno_slug") in id_by_slug:
+            dno_id = id_by_slug[record["dno_slug"]]
+        else:
+            add_error(number, "Unknown DNO (dno_id/dno_slug)")
+            continue
+
+        try:
+            rows[data_type].append(_import_row(dno_id, schemas[data_type].model_validate(record)))
+        except ValidationError as e:
+            add_error(
+                number,
+                "; ".join(
+                    f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+                ),
             )
-            existing_record = existing.scalar_one_or_none()
-
-            if existing_record:
-                # Update existing
-                if winter:
-                    existing_record.winter = winter
-                if fruehling:
-                    existing_record.fruehling = fruehling
-                if sommer:
-                    existing_record.sommer = sommer
-                if herbst:
-                    existing_record.herbst = herbst
-                if record.verification_status:
-                    existing_record.verification_status = record.verification_status
-                if record.extraction_source:
-                    existing_record.extraction_source = sanitize_string(
-                        record.extraction_source, "extraction_source", max_length=100
-                    )
-                hlzf_updated += 1
-            else:
-                # Create new
-                new_record = HLZFModel(
-                    dno_id=dno_id,
-                    year=record.year,
-                    voltage_level=record.voltage_level,
-                    winter=winter,
-                    fruehling=fruehling,
-                    sommer=sommer,
-                    herbst=herbst,
-                    verification_status=record.verification_status or "unverified",
-                    extraction_source=sanitize_string(
-                        record.extraction_source or "import", "extraction_source", max_length=100
-                    ),
-                )
-                db.add(new_record)
-                hlzf_created += 1
+        except SanitizationError as e:
+            add_error(number, str(e))
 
-        await db.commit()
+    return rows, errors, error_count
+
+
+@bulk_router.post("/import")
+async def import_dataset(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    admin: Annotated[AuthUser, Depends(require_admin)],
+    file: UploadFile = File(...),
+    mode: str = Query("merge", pattern="^(merge|replace)$"),
+    dry_run: bool = Query(False),
+    skip_invalid: bool = Query(False),
+) -> APIResponse:
+    """
+    Import Netzentgelte/HLZF data of many DNOs and years from one file (admin only).
+
+    Accepts the flat rows of GET /dnos/export (.ndjson, .csv or .parquet);
+    DNOs are matched by dno_id, else dno_slug. All rows are validated first
+    and written in one transaction with multi-row upserts.
+
+    Args:
+        file: Dataset file
+        mode: merge (update provided values) or replace (delete the imported
+            DNO years first)
+        dry_run: Only validate, write nothing
+        skip_invalid: Write the valid rows even if some rows are invalid;
+            otherwise any invalid row rejects the whole file (422)
 
-        logger.info(
-            "import_completed",
-            dno_id=dno_id,
-            netz_created=netz_created,
-            netz_updated=netz_updated,
-            hlzf_created=hlzf_created,
-            hlzf_updated=hlzf_updated,
+    Returns:
+        Created/updated counts per data type and the per-row errors
+    """
+    content = await file.read(MAX_DATASET_UPLOAD_SIZE + 1)
+    if len(content) > MAX_DATASET_UPLOAD_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum size is {MAX_DATASET_UPLOAD_SIZE // (1024 * 1024)}MB.",
         )
+    try:
+        records = read_import_file(content, file.filename or "")
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Could not read file: {e!s}"
+        ) from e
+
+    rows, errors, error_count = await _parse_dataset_records(db, records)
+    valid = sum(len(r) for r in rows.values())
 
-        return APIResponse(
-            success=True,
-            message=f"Import completed: {netz_created + hlzf_created} created, {netz_updated + hlzf_updated} updated",
-            data={
-                "netzentgelte": {"created": netz_created, "updated": netz_updated},
-                "hlzf": {"created": hlzf_created, "updated": hlzf_updated},
-                "mode": request.mode,
+    logger.info(
+        "dataset_import_started",
+        filename=file.filename,
+        mode=mode,
+        records=len(records),
+        valid=valid,
+        errors=error_count,
+        dry_run=dry_run,
+        user=admin.email,
+    )
+
+    if error_count and not skip_invalid:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "message": f"{error_count} invalid rows, nothing was imported",
+                "error_count": error_count,
+                "errors": errors,
             },
         )
 
-    except SanitizationError as e:
-        logger.warning("import_sanitization_failed", error=str(e), dno_id=dno_id)
-        await db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Content sanitization failed: {e!s}",
-        ) from e
+    result = {
+        "mode": mode,
+        "dry_run": dry_run,
+        "records": len(records),
+        "valid": valid,
+        "error_count": error_count,
+        "errors": errors,
+    }
+    if dry_run:
+        return APIResponse(success=True, message=f"Validated {valid} rows", data=result)
+
+    dno_ids = {r["dno_id"] for data_rows in rows.values() for r in data_rows}
+    try:
+        result.update(await _apply_import(db, mode, rows))
+        await refresh_dno_summaries(db, dno_ids)
+        await db.commit()
     except Exception as e:
-        logger.error("import_failed", error=str(e), dno_id=dno_id)
+        logger.error("dataset_import_failed", error=str(e))
         await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Import failed due to an internal error. Please try again.",
         ) from e
+
+    for dno_id in dno_ids:
+        await invalidate_search_cache(dno_id)
+
+    logger.info("dataset_import_completed", dnos=len(dno_ids), valid=valid)
+    return APIResponse(
+        success=True,
+        message=f"Imported {valid} rows for {len(dno_ids)} DNOs",
+        data=result,
+    )
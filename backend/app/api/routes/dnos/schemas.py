@@ -22,6 +22,7 @@ class TriggerCrawlRequest(BaseModel):
     year: int
     priority: int = 5
     job_type: JobType = JobType.FULL
+    resume: bool = True  # Continue from the checkpoints of a recently failed full job
 
 
 class CreateDNORequest(BaseModel):
@@ -5,29 +5,56 @@ Decoupled from heavy crawl jobs. Returns existing data or registers
 skeleton DNO/Location records via VNB Digital API.
 
 Rate limited: 60 req/min per IP, 50 req/min global VNB quota.
+
+Responses for known addresses and DNOs are served from a Redis cache
+(app.services.search_cache) that is invalidated whenever the DNO's data changes.
+Concurrent searches for the same new address or coordinate share one VNB
+Digital lookup (app.services.single_flight).
+
+POST /search/batch resolves many addresses/coordinates per request: known
+locations are loaded with bulk IN (...) queries, misses go through the
+throttled VNB waterfall, and results stream back as NDJSON.
 """
 
+import asyncio
+import hashlib
+import json
+import math
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+
 import structlog
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, model_validator
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.routes.dnos.schemas import HLZFTimeRange
-from app.core.rate_limiter import RateLimiter, get_client_ip, get_rate_limiter
-from app.db import DNOModel, HLZFModel, LocationModel, NetzentgelteModel, get_db
+from app.core.auth import User, get_current_user
+from app.core.rate_limiter import get_client_ip, get_rate_limiter
+from app.db import DNOModel, HLZFModel, LocationModel, NetzentgelteModel, get_db, get_db_session
 from app.services.completeness import build_completeness_payload, connection_points_from_mastr
+from app.services.search_cache import SearchCache, get_search_cache
+from app.services.single_flight import get_single_flight
 from app.services.vnb import (
     NormalizedAddress,
-    VNBDigitalClient,
+    VNBQuotaExceededError,
+    get_vnb_client,
     normalize_address,
     skeleton_service,
+    snap_coordinate,
 )
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Batch search limits
+BATCH_MAX_ITEMS = 10_000
+BATCH_QUERY_CHUNK = 1_000  # keys per IN (...) query
+BATCH_MISS_CONCURRENCY = 4  # misses resolved at once (VNB pace is set by the shared throttle)
+BATCH_MAX_MISS_LOOKUPS = 25  # misses resolved per batch (half the global VNB quota per minute)
+
 
 # =============================================================================
 # Request/Response Models
@@ -158,6 +185,30 @@ class PublicSearchResponse(BaseModel):
     message: str | None = None
 
 
+class BatchSearchItem(BaseModel):
+    """One address or coordinate of a batch search."""
+
+    ref: str | None = Field(None, max_length=100, description="Caller reference, echoed back")
+    address: AddressSearchInput | None = None
+    coordinates: CoordinatesSearchInput | None = None
+
+    @model_validator(mode="after")
+    def _exactly_one_input(self) -> "BatchSearchItem":
+        if (self.address is None) == (self.coordinates is None):
+            raise ValueError("Exactly one of 'address' or 'coordinates' must be provided.")
+        return self
+
+
+class BatchSearchRequest(BaseModel):
+    """Batch search request: many addresses/coordinates, one year filter."""
+
+    items: list[BatchSearchItem] = Field(..., min_length=1, max_length=BATCH_MAX_ITEMS)
+    years: list[int] | None = Field(None, description="Multiple years filter")
+    resolve_misses: bool = Field(
+        True, description="Resolve unknown addresses via VNB Digital (otherwise report not found)"
+    )
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -187,7 +238,7 @@ async def public_search(
 
     **Rate Limits:**
     - 60 requests/minute per IP
-    - 50 VNB API calls/minute globally
+    - 50 VNB API calls/minute globally (cached VNB lookups do not count)
     """
     log = logger.bind(endpoint="public_search")
 
@@ -202,8 +253,6 @@ async def public_search(
             "rate_limiter_unavailable",
             detail="Redis down or not configured, rate limiting bypassed",
         )
-        rate_limiter = None
-        client_ip = "unknown"
 
     # Validate exactly one input type provided
     inputs_provided = sum(
@@ -224,13 +273,57 @@ async def public_search(
 
     # Route to appropriate handler
     if request.address:
-        return await _search_by_address(db, rate_limiter, request.address, filter_years, log)
+        return await _search_by_address(db, request.address, filter_years, log)
     elif request.coordinates:
-        return await _search_by_coordinates(
-            db, rate_limiter, request.coordinates, filter_years, log
-        )
+        return await _search_by_coordinates(db, request.coordinates, filter_years, log)
     else:
-        return await _search_by_dno(db, request.dno, filter_years, log, rate_limiter)
+        return await _search_by_dno(db, request.dno, filter_years, log)
+
+
+@router.post(
+    "/batch",
+    summary="Batch Search (NDJSON stream)",
+    responses={
+        200: {
+            "description": "One JSON line per item: {index, ref, result} or {index, ref, error}",
+            "content": {"application/x-ndjson": {}},
+        },
+        429: {"description": "Rate limit exceeded"},
+    },
+)
+async def batch_search(
+    request: BatchSearchRequest,
+    http_request: Request,
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """
+    Resolve many addresses or coordinates to DNOs and their data.
+
+    Known locations are answered first, in bulk (one IN (...) query per
+    chunk of address hashes, DNOs and data rows). Unknown addresses are then
+    resolved through VNB Digital with the same throttling, quota and
+    request coalescing as the single search, and streamed as they complete.
+    Lines carry the item's index and ref, so their order does not matter.
+
+    **Rate Limits:**
+    - A batch counts as one request against the per-IP limit
+    - Misses share the global VNB quota; once it is exhausted the remaining
+      misses report "vnb_quota_exhausted" and can be resubmitted later
+    - At most 25 misses are resolved per batch; the others report
+      "batch_miss_limit_exceeded" and can be resubmitted later
+    """
+    log = logger.bind(endpoint="batch_search", items=len(request.items), user=current_user.email)
+
+    try:
+        rate_limiter = get_rate_limiter()
+        await rate_limiter.check_ip_limit(get_client_ip(http_request), authenticated=True)
+    except RuntimeError:
+        log.error(
+            "rate_limiter_unavailable",
+            detail="Redis down or not configured, rate limiting bypassed",
+        )
+
+    return StreamingResponse(_stream_batch(request, log), media_type="application/x-ndjson")
 
 
 # =============================================================================
@@ -240,14 +333,13 @@ async def public_search(
 
 async def _search_by_address(
     db: AsyncSession,
-    rate_limiter: RateLimiter | None,
     address_input: AddressSearchInput,
     years: list[int] | None,
     log,
-) -> PublicSearchResponse:
+) -> PublicSearchResponse | Response:
     """
     Waterfall logic for address search:
-    1. Normalize address → hash
+    1. Normalize address → hash (→ cached response, if any)
     2. Check DB for existing hash → Location
     3. If found → get DNO → evaluate data
     4. If not found → call VNB API → create skeleton → evaluate data
@@ -262,21 +354,53 @@ async def _search_by_address(
     )
     log.debug("Address normalized", hash=normalized.address_hash[:16])
 
+    cache_key = SearchCache.response_key("addr", normalized.address_hash, years)
+    cached = await _cached_response(cache_key)
+    if cached:
+        return cached
+
     # Step 2: Check DB for existing location by hash
     location = await skeleton_service.find_location_by_hash(db, normalized.address_hash)
 
     if location:
         log.debug("Location found in cache", location_id=location.id)
         dno = await db.get(DNOModel, location.dno_id)
-        return await _build_response(db, dno, location, years)
+        return await _build_response(db, dno, location, years, cache_key)
+
+    # Step 3: Not in DB - one request per address calls VNB Digital, identical
+    # concurrent searches wait for it and then read the registered location
+    async def _reload() -> PublicSearchResponse | None:
+        location = await skeleton_service.find_location_by_hash(db, normalized.address_hash)
+        if not location:
+            return None
+        dno = await db.get(DNOModel, location.dno_id)
+        return await _build_response(db, dno, location, years, cache_key)
+
+    return await _coalesce_vnb_lookup(
+        f"addr:{normalized.address_hash}",
+        lambda: _register_by_address(db, address_input, normalized, years, log, cache_key),
+        _reload,
+        cache_key,
+    )
 
-    # Step 3: Not in cache - call VNB Digital API
-    log.info("Cache miss, calling VNB Digital API")
 
-    if rate_limiter:
-        await rate_limiter.before_vnb_call()
+async def _register_by_address(
+    db: AsyncSession,
+    address_input: AddressSearchInput,
+    normalized: NormalizedAddress,
+    years: list[int] | None,
+    log,
+    cache_key: str,
+) -> PublicSearchResponse:
+    """
+    Resolve an address that is not in the DB via VNB Digital:
+    3. Geocode the address → coordinates
+    4. Known location at these coordinates → add an alias for this address
+    5. Otherwise look up the DNO, enrich it and create DNO + location skeletons
+    """
+    log.info("Cache miss, calling VNB Digital API")
 
-    vnb_client = VNBDigitalClient(request_delay=0.5)
+    vnb_client = get_vnb_client()
 
     # Get coordinates
     full_address = f"{address_input.street}, {address_input.zip_code} {address_input.city}"
@@ -294,9 +418,6 @@ async def _search_by_address(
     lat, lon = map(float, location_result.coordinates.split(","))
 
     # Step 4: Check if we have a location for these coordinates
-    if rate_limiter:
-        await rate_limiter.before_vnb_call()
-
     existing_location = await skeleton_service.find_location_by_geocoord(db, lat, lon)
 
     if existing_location:
@@ -308,7 +429,7 @@ async def _search_by_address(
             db, existing_location.dno_id, normalized, lat, lon
         )
 
-        return await _build_response(db, dno, existing_location, years)
+        return await _build_response(db, dno, existing_location, years, cache_key)
 
     # Step 5: Get DNO from VNB Digital
     vnbs = await vnb_client.lookup_by_coordinates(location_result.coordinates)
@@ -325,9 +446,6 @@ async def _search_by_address(
     vnb = next((v for v in vnbs if v.is_electricity), vnbs[0])
 
     # Step 6: Fetch extended details (homepage URL, contact info)
-    if rate_limiter:
-        await rate_limiter.before_vnb_call()
-
     dno_details = await vnb_client.get_vnb_details(vnb.vnb_id)
 
     # Step 7: Enrich address + fetch robots.txt
@@ -372,19 +490,26 @@ async def _search_by_address(
         has_website=bool(dno.website),
     )
 
-    return await _build_response(db, dno, location, years)
+    return await _build_response(db, dno, location, years, cache_key)
 
 
 async def _search_by_coordinates(
     db: AsyncSession,
-    rate_limiter: RateLimiter | None,
     coords_input: CoordinatesSearchInput,
     years: list[int] | None,
     log,
-) -> PublicSearchResponse:
+) -> PublicSearchResponse | Response:
     """Search by coordinates - similar to address but skips geocoding."""
     log = log.bind(lat=coords_input.latitude, lon=coords_input.longitude)
 
+    coords_str = f"{coords_input.latitude},{coords_input.longitude}"
+    coords_hash = hashlib.sha256(coords_str.encode()).hexdigest()
+
+    cache_key = SearchCache.response_key("addr", coords_hash, years)
+    cached = await _cached_response(cache_key)
+    if cached:
+        return cached
+
     # Check DB first
     location = await skeleton_service.find_location_by_geocoord(
         db, coords_input.latitude, coords_input.longitude
@@ -392,16 +517,43 @@ async def _search_by_coordinates(
 
     if location:
         dno = await db.get(DNOModel, location.dno_id)
-        return await _build_response(db, dno, location, years)
+        return await _build_response(db, dno, location, years, cache_key)
 
-    # Call VNB Digital
-    log.info("Calling VNB Digital for coordinates")
+    # One request per coordinate calls VNB Digital, identical concurrent
+    # searches wait for it and then read the registered location
+    async def _reload() -> PublicSearchResponse | None:
+        location = await skeleton_service.find_location_by_geocoord(
+            db, coords_input.latitude, coords_input.longitude
+        )
+        if not location:
+            return None
+        dno = await db.get(DNOModel, location.dno_id)
+        return await _build_response(db, dno, location, years, cache_key)
+
+    snapped = f"{snap_coordinate(coords_input.latitude)},{snap_coordinate(coords_input.longitude)}"
+    return await _coalesce_vnb_lookup(
+        f"coord:{snapped}",
+        lambda: _register_by_coordinates(
+            db, coords_input, coords_str, coords_hash, years, log, cache_key
+        ),
+        _reload,
+        cache_key,
+    )
 
-    if rate_limiter:
-        await rate_limiter.before_vnb_call()
 
-    vnb_client = VNBDigitalClient(request_delay=0.5)
-    coords_str = f"{coords_input.latitude},{coords_input.longitude}"
+async def _register_by_coordinates(
+    db: AsyncSession,
+    coords_input: CoordinatesSearchInput,
+    coords_str: str,
+    coords_hash: str,
+    years: list[int] | None,
+    log,
+    cache_key: str,
+) -> PublicSearchResponse:
+    """Resolve coordinates that are not in the DB via VNB Digital and register skeletons."""
+    log.info("Calling VNB Digital for coordinates")
+
+    vnb_client = get_vnb_client()
     vnbs = await vnb_client.lookup_by_coordinates(coords_str)
 
     if not vnbs:
@@ -414,9 +566,6 @@ async def _search_by_coordinates(
     vnb = next((v for v in vnbs if v.is_electricity), vnbs[0])
 
     # Fetch extended details
-    if rate_limiter:
-        await rate_limiter.before_vnb_call()
-
     dno_details = await vnb_client.get_vnb_details(vnb.vnb_id)
 
     # Enrich address + fetch robots.txt
@@ -447,9 +596,6 @@ async def _search_by_coordinates(
     )
 
     # Create simple location without full address
-    import hashlib
-
-    coords_hash = hashlib.sha256(coords_str.encode()).hexdigest()
     simple_address = NormalizedAddress(
         street_clean=f"Coordinates ({coords_input.latitude:.4f}, {coords_input.longitude:.4f})",
         number_clean=None,
@@ -462,7 +608,7 @@ async def _search_by_coordinates(
         db, dno.id, simple_address, coords_input.latitude, coords_input.longitude
     )
 
-    return await _build_response(db, dno, location, years)
+    return await _build_response(db, dno, location, years, cache_key)
 
 
 async def _search_by_dno(
@@ -470,8 +616,7 @@ async def _search_by_dno(
     dno_input: DNOSearchInput,
     years: list[int] | None,
     log,
-    rate_limiter: "RateLimiter | None" = None,
-) -> PublicSearchResponse:
+) -> PublicSearchResponse | Response:
     """
     Search by DNO name or ID directly.
 
@@ -488,12 +633,15 @@ async def _search_by_dno(
 
     # Build query for local DB search
     if dno_input.mastr_nr:
+        cache_key = SearchCache.response_key("mastr", dno_input.mastr_nr, years)
         query = select(DNOModel).where(DNOModel.mastr_nr == dno_input.mastr_nr)
     elif dno_input.dno_id:
+        cache_key = SearchCache.response_key("vnb", dno_input.dno_id, years)
         query = select(DNOModel).where(DNOModel.vnb_id == dno_input.dno_id)
     elif dno_input.dno_name:
         # Fuzzy search: match name, official_name, or slug
         search_term = dno_input.dno_name.strip()
+        cache_key = SearchCache.response_key("name", search_term.lower(), years)
         # Escape ILIKE wildcards to prevent wildcard injection
         safe_term = search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
         query = select(DNOModel).where(
@@ -504,12 +652,16 @@ async def _search_by_dno(
     else:
         raise HTTPException(400, "One of 'dno_id', 'dno_name', or 'mastr_nr' must be provided")
 
+    cached = await _cached_response(cache_key)
+    if cached:
+        return cached
+
     result = await db.execute(query)
     dno = result.scalars().first()
 
     if dno:
         log.info("Found DNO in local database", dno_id=dno.id, dno_name=dno.name)
-        return await _build_response(db, dno, None, years)
+        return await _build_response(db, dno, None, years, cache_key)
 
     # Not found in DB - try VNB Digital API for fuzzy search
     log.info("DNO not in local DB, searching VNB Digital API")
@@ -522,10 +674,7 @@ async def _search_by_dno(
             message="DNO not found. Try searching by address instead.",
         )
 
-    if rate_limiter:
-        await rate_limiter.before_vnb_call()
-
-    vnb_client = VNBDigitalClient(request_delay=0.5)
+    vnb_client = get_vnb_client()
     vnb_results = await vnb_client.search_vnb(search_name)
 
     if not vnb_results:
@@ -541,9 +690,6 @@ async def _search_by_dno(
     log.info("Found VNB via API", vnb_id=vnb.vnb_id, vnb_name=vnb.name)
 
     # Fetch extended details (website, contact info)
-    if rate_limiter:
-        await rate_limiter.before_vnb_call()
-
     dno_details = await vnb_client.get_vnb_details(vnb.vnb_id)
 
     # Enrich address + fetch robots.txt
@@ -582,7 +728,266 @@ async def _search_by_dno(
         has_website=bool(dno.website),
     )
 
-    return await _build_response(db, dno, None, years)
+    return await _build_response(db, dno, None, years, cache_key)
+
+
+async def _coalesce_vnb_lookup(
+    flight_key: str,
+    resolve: Callable[[], Awaitable[PublicSearchResponse]],
+    reload: Callable[[], Awaitable[PublicSearchResponse | None]],
+    cache_key: str,
+) -> PublicSearchResponse | Response:
+    """
+    Run a VNB Digital lookup once for all concurrent identical searches.
+
+    Args:
+        flight_key: Address hash or snapped coordinate of the lookup
+        resolve: Calls VNB Digital and registers skeletons (runs in one request only)
+        reload: Answers from the DB once another request registered the location
+        cache_key: Search cache key of this request (its year filter may differ)
+    """
+    single_flight = get_single_flight()
+    if single_flight is None:
+        return await resolve()
+
+    leader_response: PublicSearchResponse | None = None
+
+    async def _run() -> str:
+        nonlocal leader_response
+        leader_response = await resolve()
+        return leader_response.model_dump_json()
+
+    payload, shared = await single_flight.do(flight_key, _run)
+    if not shared and leader_response is not None:
+        return leader_response
+
+    # Another request did the lookup; "not found" answers are reused as-is
+    cached = await _cached_response(cache_key)
+    if cached:
+        return cached
+    response = await reload()
+    return response or Response(content=payload, media_type="application/json")
+
+
+# =============================================================================
+# Batch Search
+# =============================================================================
+
+
+def _batch_line(
+    index: int,
+    item: BatchSearchItem,
+    result: PublicSearchResponse | Response | None = None,
+    error: str | None = None,
+    **extra,
+) -> str:
+    """One NDJSON line of a batch search response."""
+    entry: dict = {"index": index, "ref": item.ref}
+    if isinstance(result, Response):
+        entry["result"] = json.loads(result.body)
+    elif result is not None:
+        entry["result"] = result.model_dump(mode="json")
+    if error:
+        entry["error"] = error
+    entry.update(extra)
+    return json.dumps(entry) + "\n"
+
+
+def _item_hash(item: BatchSearchItem) -> str:
+    """Location address_hash an item would be stored under."""
+    if item.address:
+        return normalize_address(
+            item.address.street, item.address.zip_code, item.address.city
+        ).address_hash
+    coords_str = f"{item.coordinates.latitude},{item.coordinates.longitude}"
+    return hashlib.sha256(coords_str.encode()).hexdigest()
+
+
+def _chunks(values: list, size: int = BATCH_QUERY_CHUNK):
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
+
+
+async def _stream_batch(request: BatchSearchRequest, log) -> AsyncIterator[str]:
+    """Stream known locations first, then resolve and stream the misses."""
+    years = request.years or None
+
+    # The request's session is closed before the body streams; use our own
+    async with get_db_session() as db:
+        hits = await _load_batch_hits(db, request.items, years)
+
+    for index, response in hits.items():
+        yield _batch_line(index, request.items[index], response)
+
+    misses = [(i, item) for i, item in enumerate(request.items) if i not in hits]
+    log.info("batch_search_hits", hits=len(hits), misses=len(misses))
+
+    if not request.resolve_misses:
+        for index, item in misses:
+            yield _batch_line(
+                index,
+                item,
+                PublicSearchResponse(
+                    found=False, has_data=False, message="Location not known yet."
+                ),
+            )
+        return
+
+    async for line in _resolve_batch_misses(misses, years, log):
+        yield line
+
+
+async def _load_batch_hits(
+    db: AsyncSession,
+    items: list[BatchSearchItem],
+    years: list[int] | None,
+) -> dict[int, PublicSearchResponse]:
+    """Answer all items with a known location using bulk IN (...) queries.
+
+    Returns:
+        Dict of item index -> response (items without a known location are missing)
+    """
+    indexes_by_hash: dict[str, list[int]] = {}
+    for index, item in enumerate(items):
+        indexes_by_hash.setdefault(_item_hash(item), []).append(index)
+
+    # 1. Locations by address hash
+    locations: dict[int, LocationModel] = {}
+    for chunk in _chunks(list(indexes_by_hash)):
+        result = await db.execute(
+            select(LocationModel).where(LocationModel.address_hash.in_(chunk))
+        )
+        for location in result.scalars():
+            for index in indexes_by_hash[location.address_hash]:
+                locations[index] = location
+
+    # 2. Remaining coordinates: nearest known location, bounding boxes in bulk
+    points = {
+        index: (item.coordinates.latitude, item.coordinates.longitude)
+        for index, item in enumerate(items)
+        if index not in locations and item.coordinates is not None
+    }
+    if points:
+        nearest = await skeleton_service.find_locations_by_geocoords(db, list(points.values()))
+        for index, point in points.items():
+            if point in nearest:
+                locations[index] = nearest[point]
+
+    # 3. DNOs (with MaStR data for completeness) and their data rows
+    dno_ids = list({location.dno_id for location in locations.values()})
+    dnos: dict[int, DNOModel] = {}
+    netzentgelte: dict[int, list[NetzentgelteModel]] = {}
+    hlzf: dict[int, list[HLZFModel]] = {}
+    for chunk in _chunks(dno_ids):
+        result = await db.execute(
+            select(DNOModel)
+            .options(selectinload(DNOModel.mastr_data))
+            .where(DNOModel.id.in_(chunk))
+        )
+        dnos.update((dno.id, dno) for dno in result.scalars())
+
+        netz_query = select(NetzentgelteModel).where(NetzentgelteModel.dno_id.in_(chunk))
+        hlzf_query = select(HLZFModel).where(HLZFModel.dno_id.in_(chunk))
+        if years:
+            netz_query = netz_query.where(NetzentgelteModel.year.in_(years))
+            hlzf_query = hlzf_query.where(HLZFModel.year.in_(years))
+        for row in (await db.execute(netz_query)).scalars():
+            netzentgelte.setdefault(row.dno_id, []).append(row)
+        for row in (await db.execute(hlzf_query)).scalars():
+            hlzf.setdefault(row.dno_id, []).append(row)
+
+    return {
+        index: _assemble_response(
+            dnos[location.dno_id],
+            location,
+            netzentgelte.get(location.dno_id, []),
+            hlzf.get(location.dno_id, []),
+        )
+        for index, location in sorted(locations.items())
+        if location.dno_id in dnos
+    }
+
+
+async def _resolve_batch_misses(
+    misses: list[tuple[int, BatchSearchItem]],
+    years: list[int] | None,
+    log,
+) -> AsyncIterator[str]:
+    """Resolve unknown items via the single-search waterfall, streaming as they finish.
+
+    At most BATCH_MAX_MISS_LOOKUPS misses are looked up, by BATCH_MISS_CONCURRENCY
+    workers; the rest report "batch_miss_limit_exceeded". Workers still running
+    when the stream is closed (client disconnect) are cancelled, so no lookups
+    are left spending the shared VNB quota.
+    """
+    lookups, over_limit = misses[:BATCH_MAX_MISS_LOOKUPS], misses[BATCH_MAX_MISS_LOOKUPS:]
+    for index, item in over_limit:
+        yield _batch_line(index, item, error="batch_miss_limit_exceeded")
+    if not lookups:
+        return
+
+    pending: asyncio.Queue[tuple[int, BatchSearchItem]] = asyncio.Queue()
+    for miss in lookups:
+        pending.put_nowait(miss)
+    lines: asyncio.Queue[str] = asyncio.Queue()
+    # Seconds until VNB lookups are accepted again, once the quota or pace refused one
+    quota_retry_after: int | None = None
+
+    def _quota_line(index: int, item: BatchSearchItem) -> str:
+        return _batch_line(index, item, error="vnb_quota_exhausted", retry_after=quota_retry_after)
+
+    async def _resolve(index: int, item: BatchSearchItem) -> str:
+        nonlocal quota_retry_after
+        if quota_retry_after is not None:
+            return _quota_line(index, item)
+        try:
+            # Sessions are not safe for concurrent use; one per lookup
+            async with get_db_session() as db:
+                if item.address:
+                    result = await _search_by_address(db, item.address, years, log)
+                else:
+                    result = await _search_by_coordinates(db, item.coordinates, years, log)
+        except VNBQuotaExceededError as e:
+            quota_retry_after = math.ceil(e.retry_after)
+            return _quota_line(index, item)
+        except HTTPException as e:
+            if e.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
+                # Global VNB quota of the rate limiter
+                quota_retry_after = int((e.headers or {}).get("Retry-After", 60))
+                return _quota_line(index, item)
+            return _batch_line(index, item, error=str(e.detail))
+        except Exception as e:
+            log.error("batch_search_item_failed", index=index, error=str(e))
+            return _batch_line(index, item, error="lookup_failed")
+        return _batch_line(index, item, result)
+
+    async def _worker() -> None:
+        while not pending.empty():
+            index, item = pending.get_nowait()
+            lines.put_nowait(await _resolve(index, item))
+
+    workers = [
+        asyncio.create_task(_worker()) for _ in range(min(BATCH_MISS_CONCURRENCY, len(lookups)))
+    ]
+    try:
+        for _ in lookups:
+            yield await lines.get()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def _cached_response(cache_key: str) -> Response | None:
+    """Serve a cached search response as-is (no model round trip)."""
+    cache = get_search_cache()
+    if cache is None:
+        return None
+    payload = await cache.get(cache_key)
+    if payload is None:
+        return None
+    logger.debug("search_cache_hit", key=cache_key)
+    return Response(content=payload, media_type="application/json")
 
 
 async def _build_response(
@@ -590,8 +995,16 @@ async def _build_response(
     dno: DNOModel,
     location: LocationModel | None,
     years: list[int] | None,
+    cache_key: str | None = None,
 ) -> PublicSearchResponse:
-    """Build response with data evaluation."""
+    """Build response with data evaluation.
+
+    With a cache_key the response is stored in the search cache, unless the
+    DNO's data was invalidated while it was being built.
+    """
+    cache = get_search_cache() if cache_key else None
+    # Read before the data queries so a concurrent invalidation wins
+    generation = await cache.generation(dno.id) if cache else None
 
     # Eagerly load MaStR data for completeness scoring (if not already loaded)
     if not hasattr(dno, "_sa_instance_state") or "mastr_data" not in dno.__dict__:
@@ -600,6 +1013,40 @@ async def _build_response(
         )
         dno = result.scalar_one()
 
+    # Check for data
+    netzentgelte_query = select(NetzentgelteModel).where(NetzentgelteModel.dno_id == dno.id)
+    hlzf_query = select(HLZFModel).where(HLZFModel.dno_id == dno.id)
+
+    if years:
+        netzentgelte_query = netzentgelte_query.where(NetzentgelteModel.year.in_(years))
+        hlzf_query = hlzf_query.where(HLZFModel.year.in_(years))
+
+    netzentgelte_result = await db.execute(netzentgelte_query)
+    hlzf_result = await db.execute(hlzf_query)
+
+    response = _assemble_response(
+        dno,
+        location,
+        netzentgelte_result.scalars().all(),
+        hlzf_result.scalars().all(),
+    )
+
+    if cache and generation is not None:
+        await cache.set(cache_key, dno.id, response.model_dump_json(), generation)
+
+    return response
+
+
+def _assemble_response(
+    dno: DNOModel,
+    location: LocationModel | None,
+    netzentgelte_rows: Sequence[NetzentgelteModel],
+    hlzf_rows: Sequence[HLZFModel],
+) -> PublicSearchResponse:
+    """Turn loaded DNO, location and data rows into a search response.
+
+    The DNO's mastr_data relationship must already be loaded.
+    """
     # Build DNO metadata
     dno_meta = DNOMetadata(
         id=dno.id,
@@ -623,17 +1070,6 @@ async def _build_response(
             longitude=float(location.longitude),
         )
 
-    # Check for data
-    netzentgelte_query = select(NetzentgelteModel).where(NetzentgelteModel.dno_id == dno.id)
-    hlzf_query = select(HLZFModel).where(HLZFModel.dno_id == dno.id)
-
-    if years:
-        netzentgelte_query = netzentgelte_query.where(NetzentgelteModel.year.in_(years))
-        hlzf_query = hlzf_query.where(HLZFModel.year.in_(years))
-
-    netzentgelte_result = await db.execute(netzentgelte_query)
-    hlzf_result = await db.execute(hlzf_query)
-
     netzentgelte = [
         NetzentgelteData(
             year=n.year,
@@ -644,7 +1080,7 @@ async def _build_response(
             arbeit_unter_2500h=getattr(n, "arbeit_unter_2500h", None),
             verification_status=getattr(n, "verification_status", None),
         )
-        for n in netzentgelte_result.scalars().all()
+        for n in netzentgelte_rows
     ]
 
     hlzf = [
@@ -657,7 +1093,7 @@ async def _build_response(
             herbst=h.herbst,
             verification_status=getattr(h, "verification_status", None),
         )
-        for h in hlzf_result.scalars().all()
+        for h in hlzf_rows
     ]
 
     has_data = len(netzentgelte) > 0 or len(hlzf) > 0
@@ -13,6 +13,7 @@ from app.core.auth import User, get_current_user, require_maintainer_or_admin
 from app.core.models import VerificationStatus
 from app.db import get_db
 from app.db.models import HLZFModel, NetzentgelteModel
+from app.services.search_cache import invalidate_search_cache
 
 logger = structlog.get_logger()
 router = APIRouter()
@@ -97,6 +98,7 @@ async def _verify_record(
     record.flag_reason = None
 
     await db.commit()
+    await invalidate_search_cache(record.dno_id)
 
     logger.info(
         "verification.record_verified",
@@ -125,6 +127,7 @@ async def _flag_record(
     record.flag_reason = request.reason
 
     await db.commit()
+    await invalidate_search_cache(record.dno_id)
 
     logger.info(
         "verification.record_flagged",
@@ -156,6 +159,7 @@ async def _unflag_record(
     record.flag_reason = None
 
     await db.commit()
+    await invalidate_search_cache(record.dno_id)
 
     logger.info(
         "verification.record_unflagged",
@@ -56,6 +56,12 @@ class Settings(BaseSettings):
     rate_limit_authenticated: int = 100  # requests per minute for authenticated
     trusted_proxy_count: int = Field(default=1, validation_alias="TRUSTED_PROXY_COUNT")
 
+    # Public search response cache (Redis)
+    search_cache_ttl_seconds: int = 3600  # cached /search responses expire after this (0 = disable)
+    vnb_single_flight_timeout: int = 60  # seconds a search waits for an identical VNB lookup
+    vnb_request_rate: float = 2.0  # VNB Digital requests per second across all API workers
+    vnb_request_burst: int = 4  # VNB Digital requests allowed back-to-back
+
     # Note: AI configuration has been moved to database.
     # Configure AI providers via Admin UI → AI Configuration.
     # Legacy env vars (AI_API_URL, AI_API_KEY, AI_MODEL) are no longer used.
@@ -69,16 +75,36 @@ class Settings(BaseSettings):
         return bool(self.contact_email)
 
     # Crawler
-    crawler_max_concurrent: int = 5
-    crawler_request_delay: float = 1.0  # seconds between requests
+    crawler_max_concurrent: int = 5  # concurrent crawl jobs per worker (distinct domains)
+    crawler_request_delay: float = 1.0  # seconds between requests to the same host
+    crawler_host_burst: int = 2  # requests allowed back-to-back per host
+    crawler_lease_retry_seconds: int = 30  # defer when the DNO's domain is already being crawled
+    crawler_frontier_concurrency: int = 4  # BFS fetches in flight across hosts (1 = sequential)
     crawler_timeout: int = 30
     crawler_user_agent: str = (
         "Mozilla/5.0 (compatible; DNOCrawler/1.0; +https://github.com/KyleDerZweite/dno-crawler)"
     )
 
+    # Document parsing (process pool in workers)
+    extract_max_concurrent: int = 4  # concurrent extract jobs per extract worker
+    parse_pool_workers: int = 0  # parser processes per worker (0 = one per CPU)
+    parse_task_timeout: int = 120  # seconds before a single PDF/Excel parse is killed
+    parse_memory_limit_mb: int = 2048  # address-space cap per parser process (0 = unlimited)
+
     # AI (Optional Auto-Config)
     openrouter_key: str | None = Field(default=None, validation_alias="OPENROUTER_KEY")
 
+    # HTTP conditional-request cache
+    http_cache_ttl_days: int = 180  # entries unused for this long are removed (0 = keep)
+    http_cache_max_entries: int = 50000  # least recently used entries are evicted beyond this
+
+    # AI response cache and batching
+    ai_cache_ttl_days: int = 90  # cached AI responses expire after this (0 = disable cache)
+    ai_cache_max_entries: int = 5000  # least recently used responses are evicted beyond this
+    ai_batch_max_items: int = 1  # small text extractions per provider call (1 = no batching)
+    ai_batch_window_seconds: float = 2.0  # how long a batch waits for more requests
+    ai_batch_max_chars: int = 20000  # only texts up to this size are batched
+
     # Storage (STORAGE_PATH env var maps to storage_path)
     storage_path: str = Field(default="/data", validation_alias="STORAGE_PATH")
 
@@ -96,6 +122,27 @@ class Settings(BaseSettings):
 
         return str(Path(self.storage_path) / "downloads")
 
+    @property
+    def blobs_path(self) -> str:
+        """Path to the content-addressed document store, derived from storage_path."""
+        from pathlib import Path
+
+        return str(Path(self.storage_path) / "blobs")
+
+    @property
+    def http_cache_path(self) -> str:
+        """Path to the HTTP validator cache, derived from storage_path."""
+        from pathlib import Path
+
+        return str(Path(self.storage_path) / "http-cache")
+
+    @property
+    def ai_cache_path(self) -> str:
+        """Path to the AI response cache, derived from storage_path."""
+        from pathlib import Path
+
+        return str(Path(self.storage_path) / "ai-cache")
+
     # Zitadel auth helper properties
     @property
     def zitadel_issuer(self) -> str:
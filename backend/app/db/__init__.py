@@ -19,11 +19,14 @@ from app.db.models import (
     CrawlJobStepModel,
     DataSourceModel,
     DNOModel,
+    DNOSitemapURLModel,
     DNOSourceProfile,
+    DNOSummaryModel,
     HLZFModel,
     LocationModel,
     NetzentgelteModel,
     QueryLogModel,
+    SeedStateModel,
     SystemLogModel,
 )
 from app.db.source_models import (
@@ -46,7 +49,9 @@ __all__ = [
     "DNOMastrData",
     # Models - Core
     "DNOModel",
+    "DNOSitemapURLModel",
     "DNOSourceProfile",
+    "DNOSummaryModel",
     "DNOVnbData",
     "DataSourceModel",
     "DatabaseError",
@@ -54,6 +59,7 @@ __all__ = [
     "LocationModel",
     "NetzentgelteModel",
     "QueryLogModel",
+    "SeedStateModel",
     "SystemLogModel",
     "async_session_maker",
     "close_db",
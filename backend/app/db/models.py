@@ -122,6 +122,8 @@ class DNOModel(Base, TimestampMixin):
             postgresql_using="gin",
             postgresql_ops={"name": "gin_trgm_ops"},
         ),
+        # Name sort and keyset pagination of the DNO list
+        Index("ix_dnos_name_id", "name", "id"),
     )
 
     # -------------------------------------------------------------------------
@@ -174,14 +176,16 @@ class DNOModel(Base, TimestampMixin):
     # Crawlability Info (from skeleton creation/robots.txt analysis)
     # TTL: robots_txt = 150 days, sitemap = 120 days
     # -------------------------------------------------------------------------
-    robots_txt: Mapped[str | None] = mapped_column(Text)
+    # Heavy columns are deferred: list/detail queries that need them use
+    # undefer_group("crawl_details"); lazy access raises instead of blocking
+    robots_txt: Mapped[str | None] = mapped_column(
+        Text, deferred=True, deferred_group="crawl_details", deferred_raiseload=True
+    )
     robots_fetched_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True)
     )  # TTL: 150 days
     sitemap_urls: Mapped[list | None] = mapped_column(JSON)  # URLs declared in robots.txt
-    sitemap_parsed_urls: Mapped[list | None] = mapped_column(
-        JSON
-    )  # All URLs extracted from sitemaps (recursively)
+    # URLs extracted from the sitemaps live in dno_sitemap_urls (DNOSitemapURLModel)
     sitemap_fetched_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True)
     )  # TTL: 120 days
@@ -193,7 +197,9 @@ class DNOModel(Base, TimestampMixin):
     # Technical Stack Info
     # -------------------------------------------------------------------------
     cms_system: Mapped[str | None] = mapped_column(String(100))  # e.g. "Typo3", "WordPress"
-    tech_stack_details: Mapped[dict | None] = mapped_column(JSON)  # Full detected stack info
+    tech_stack_details: Mapped[dict | None] = mapped_column(
+        JSON, deferred=True, deferred_group="crawl_details", deferred_raiseload=True
+    )  # Full detected stack info
 
     # -------------------------------------------------------------------------
     # Source Data Relationships (One-to-One/Many)
@@ -361,6 +367,96 @@ class DNOModel(Base, TimestampMixin):
         }
 
 
+class DNOSummaryModel(Base):
+    """Precomputed list row per DNO (read model of the admin DNO list).
+
+    Holds everything the list sorts, filters and displays that would otherwise
+    be aggregated per request: data point counts, live status from active
+    jobs, completeness and the importance sort keys. Kept current by
+    app.services.dno_summary whenever jobs, data or DNO fields change.
+    """
+
+    __tablename__ = "dno_summaries"
+    __table_args__ = (
+        Index("idx_dno_summaries_status_importance", "live_status", "importance_score"),
+        Index("idx_dno_summaries_importance", "importance_score"),
+        Index("idx_dno_summaries_score", "score"),
+        Index(
+            "ix_dno_summaries_search_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+    )
+
+    dno_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("dnos.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Data points
+    netzentgelte_count: Mapped[int] = mapped_column(Integer, default=0)
+    hlzf_count: Mapped[int] = mapped_column(Integer, default=0)
+    data_points_count: Mapped[int] = mapped_column(Integer, default=0)
+    score: Mapped[int] = mapped_column(Integer, default=0)  # 0-100, data points / 50
+
+    # Live status: running | pending | protected | crawled | uncrawled
+    live_status: Mapped[str] = mapped_column(String(20), default="uncrawled")
+    running_jobs: Mapped[int] = mapped_column(Integer, default=0)
+    pending_jobs: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Completeness against MaStR-expected voltage levels (0-100)
+    completeness_score: Mapped[int] = mapped_column(Integer, default=0)
+
+    # Importance (stored values, or computed on the fly for unscored DNOs)
+    importance_score: Mapped[float] = mapped_column(Float, default=0.0)
+    importance_confidence: Mapped[float | None] = mapped_column(Float)
+    importance_version: Mapped[str | None] = mapped_column(String(32))
+
+    # Lowercased names, aliases, codes and MaStR number (trigram search/autocomplete)
+    search_text: Mapped[str] = mapped_column(Text, default="")
+
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class DNOSitemapURLModel(Base):
+    """One URL extracted from a DNO's sitemaps (recursively).
+
+    Replaces the inline JSON list on dnos: discovery selects candidates with
+    a trigram-indexed keyword query instead of scanning every URL in Python.
+    A DNO's rows are replaced as a whole when its sitemaps are re-parsed.
+    """
+
+    __tablename__ = "dno_sitemap_urls"
+    __table_args__ = (
+        Index("idx_sitemap_urls_dno", "dno_id"),
+        Index(
+            "ix_sitemap_urls_url_trgm",
+            "url",
+            postgresql_using="gin",
+            postgresql_ops={"url": "gin_trgm_ops"},
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    dno_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("dnos.id", ondelete="CASCADE"), nullable=False
+    )
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+
+
+class SeedStateModel(Base):
+    """Checksum of the last applied seed file, so unchanged seeds are skipped on startup."""
+
+    __tablename__ = "seed_state"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)  # e.g. "dnos"
+    checksum: Mapped[str] = mapped_column(String(64), nullable=False)  # SHA-256 hex
+    record_count: Mapped[int] = mapped_column(Integer, default=0)
+    seeded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
 # ==============================================================================
 # Location Tables
 # ==============================================================================
@@ -4,23 +4,33 @@ Database seeder for DNO data.
 Loads seed data from parquet and upserts into the database
 using the hub-and-spoke model structure.
 
-This runs on application/worker startup.
+This runs on application/worker startup. The seed is set-based: one bulk
+read of the existing DNO keys, then multi-row upserts per table, and no
+work at all when the parquet file is unchanged since the last seed.
 """
 
+import hashlib
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from decimal import Decimal
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 import pandas as pd
 import structlog
-from sqlalchemy import select
+from sqlalchemy import Row, func, null, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.db.models import DNOModel
+from app.db.database import Base
+from app.db.models import DNOModel, SeedStateModel
 from app.db.source_models import DNOBdewData, DNOMastrData, DNOVnbData
+from app.services.dno_summary import refresh_dno_summaries
 from app.services.importance import apply_importance_to_dno
+from app.services.sitemap_store import replace_sitemap_urls
 
 logger = structlog.get_logger()
 
@@ -31,6 +41,30 @@ SEED_PARQUET_CANDIDATES = [
     SEED_DATA_DIR / "dnos_enriched.parquet",
 ]
 
+# seed_state row of the DNO seed (checksum of the last applied parquet file)
+SEED_STATE_NAME = "dnos"
+
+# Rows per INSERT statement (asyncpg allows 32767 bind parameters)
+SEED_CHUNK_SIZE = 500
+
+# Same rule as DNOModel.validate_slug (Core inserts bypass ORM validators)
+SLUG_PATTERN = re.compile(r"[a-z0-9][a-z0-9\-]*")
+
+# DNO columns a seed record only sets when it has a value
+SEED_COALESCE_COLUMNS = (
+    "vnb_id",
+    "website",
+    "phone",
+    "email",
+    "primary_bdew_code",
+    "crawl_blocked_reason",
+    "robots_txt",
+    "robots_fetched_at",
+    "sitemap_urls",
+    "sitemap_fetched_at",
+    "disallow_paths",
+)
+
 
 def get_seed_parquet_path() -> Path | None:
     """Get preferred existing seed parquet path (with-stats first)."""
@@ -153,7 +187,43 @@ def load_seed_data() -> list[dict[str, Any]] | None:
     return records
 
 
-async def seed_dnos(db: AsyncSession) -> tuple[int, int, int]:
+@dataclass
+class SeedSnapshot:
+    """Database state the seed is diffed against (read in bulk).
+
+    DNOs are identified by an owner key: their mastr_nr, or "#<id>" for DNOs
+    without one (e.g. user discoveries).
+    """
+
+    dnos: dict[str, Any] = field(default_factory=dict)  # mastr_nr -> existing DNO row
+    ids: dict[str, int] = field(default_factory=dict)  # owner key -> dno id
+    slug_owners: dict[str, str] = field(default_factory=dict)
+    vnb_owners: dict[str, str] = field(default_factory=dict)
+    bdew_owners: dict[str, str] = field(default_factory=dict)
+    bdew_functions: set[tuple[str, str]] = field(default_factory=set)
+
+
+@dataclass
+class SeedPlan:
+    """Rows to upsert per table, keyed by owner key until DNO ids are known."""
+
+    dnos: list[dict[str, Any]] = field(default_factory=list)
+    mastr: list[dict[str, Any]] = field(default_factory=list)
+    vnb: list[dict[str, Any]] = field(default_factory=list)
+    bdew: dict[str, dict[str, Any]] = field(default_factory=dict)  # bdew_code -> row
+    sitemap_urls: dict[str, list[str]] = field(default_factory=dict)  # owner key -> URLs
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+
+
+def seed_checksum(path: Path) -> str:
+    """SHA-256 of the seed parquet file."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+async def seed_dnos(db: AsyncSession, force: bool = False) -> tuple[int, int, int]:
     """
     Seed DNOs from parquet seed data.
 
@@ -163,275 +233,474 @@ async def seed_dnos(db: AsyncSession) -> tuple[int, int, int]:
     - DNOVnbData (VNB Digital data, if enriched)
     - DNOBdewData (BDEW data, if enriched)
 
+    The file is diffed against one bulk read of the database and applied
+    with multi-row upserts per table. The run is skipped when the parquet
+    checksum matches the last successful seed (stored in seed_state).
+
+    Args:
+        db: Database session
+        force: Seed even if the seed file is unchanged
+
     Returns:
         Tuple of (inserted, updated, skipped).
     """
-    seed_data = load_seed_data()
-    if not seed_data:
+    seed_parquet_path = get_seed_parquet_path()
+    if seed_parquet_path is None:
         logger.warning(
             "No seed data file found",
             candidates=[str(path) for path in SEED_PARQUET_CANDIDATES],
         )
         return 0, 0, 0
 
-    seed_parquet_path = get_seed_parquet_path()
+    checksum = seed_checksum(seed_parquet_path)
+    state = await db.get(SeedStateModel, SEED_STATE_NAME)
+    if not force and state is not None and state.checksum == checksum:
+        logger.info(
+            "Seed data unchanged, skipping seeding",
+            path=str(seed_parquet_path),
+            seeded_at=state.seeded_at.isoformat() if state.seeded_at else None,
+        )
+        return 0, 0, 0
+
+    seed_data = load_seed_data() or []
     logger.info("Loading seed data", path=str(seed_parquet_path), count=len(seed_data))
 
-    inserted = 0
-    updated = 0
-    skipped = 0
+    snapshot = await load_seed_snapshot(db)
+    plan = plan_seed(seed_data, snapshot)
+    dno_ids = await apply_seed_plan(db, plan, snapshot)
 
-    for record in seed_data:
-        mastr_nr = record.get("mastr_nr")
-        if not mastr_nr:
-            logger.warning("Skipping record without mastr_nr", name=record.get("name"))
-            skipped += 1
-            continue
+    # MaStR stats and importance feed the DNO list read model
+    if dno_ids:
+        await refresh_dno_summaries(db, dno_ids)
 
-        try:
-            async with db.begin_nested():
-                result = await upsert_dno_from_seed(db, record)
-            if result == "inserted":
-                inserted += 1
-            elif result == "updated":
-                updated += 1
-            else:
-                skipped += 1
-        except Exception as e:
-            logger.error("Error seeding DNO", mastr_nr=mastr_nr, error=str(e))
-            skipped += 1
-
-    # Commit after processing all records
+    stmt = pg_insert(SeedStateModel).values(
+        name=SEED_STATE_NAME,
+        checksum=checksum,
+        record_count=len(seed_data),
+        seeded_at=func.now(),
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[SeedStateModel.name],
+            set_={
+                "checksum": stmt.excluded.checksum,
+                "record_count": stmt.excluded.record_count,
+                "seeded_at": stmt.excluded.seeded_at,
+            },
+        )
+    )
     await db.commit()
 
     logger.info(
         "Seeding complete",
-        inserted=inserted,
-        updated=updated,
-        skipped=skipped,
+        inserted=plan.inserted,
+        updated=plan.updated,
+        skipped=plan.skipped,
         total=len(seed_data),
     )
 
-    return inserted, updated, skipped
+    return plan.inserted, plan.updated, plan.skipped
 
 
-async def upsert_dno_from_seed(db: AsyncSession, record: dict[str, Any]) -> str:
-    """
-    Upsert a single DNO and its source data from seed record.
+async def load_seed_snapshot(db: AsyncSession) -> SeedSnapshot:
+    """Read the DNO, VNB and BDEW keys (and importance inputs) the seed diffs against."""
+    snapshot = SeedSnapshot()
 
-    Returns: 'inserted', 'updated', or 'skipped'
-    """
-    mastr_nr = record["mastr_nr"]
+    result = await db.execute(
+        select(
+            DNOModel.id,
+            DNOModel.mastr_nr,
+            DNOModel.slug,
+            DNOModel.vnb_id,
+            DNOModel.status,
+            DNOModel.crawlable,
+            DNOModel.connection_points_count,
+            DNOModel.total_capacity_mw,
+            DNOModel.customer_count,
+            DNOModel.service_area_km2,
+            DNOMastrData.has_customers,
+        ).outerjoin(DNOMastrData, DNOMastrData.dno_id == DNOModel.id)
+    )
+    keys: dict[int, str] = {}
+    for row in result:
+        key = row.mastr_nr or f"#{row.id}"
+        keys[row.id] = key
+        snapshot.ids[key] = row.id
+        if row.mastr_nr:
+            snapshot.dnos[row.mastr_nr] = row
+        snapshot.slug_owners[row.slug] = key
+        if row.vnb_id:
+            snapshot.vnb_owners[row.vnb_id] = key
+
+    for vnb_id, dno_id in await db.execute(select(DNOVnbData.vnb_id, DNOVnbData.dno_id)):
+        snapshot.vnb_owners[vnb_id] = keys.get(dno_id, f"#{dno_id}")
 
-    # Check if DNO already exists by mastr_nr (eagerly load mastr_data to avoid lazy load in async)
     result = await db.execute(
-        select(DNOModel)
-        .options(selectinload(DNOModel.mastr_data))
-        .where(DNOModel.mastr_nr == mastr_nr)
+        select(DNOBdewData.bdew_code, DNOBdewData.dno_id, DNOBdewData.market_function)
     )
-    existing_dno = result.scalar_one_or_none()
+    for bdew in result:
+        key = keys.get(bdew.dno_id, f"#{bdew.dno_id}")
+        snapshot.bdew_owners[bdew.bdew_code] = key
+        if bdew.market_function:
+            snapshot.bdew_functions.add((key, bdew.market_function))
 
-    if existing_dno:
-        dno = existing_dno
-        action = "updated"
-    else:
-        # Create new DNO
-        dno = DNOModel(
-            slug=record["slug"],
-            name=record["name"],
-            mastr_nr=mastr_nr,
-            source="seed",
-            status="uncrawled",
-            is_active=record.get("is_active", True),
-        )
-        db.add(dno)
-        await db.flush()  # Get the ID
-        action = "inserted"
-
-    # Update core fields (resolved values)
-    dno.name = record["name"]
-    dno.slug = record["slug"]
-    dno.region = record.get("region")
-    dno.is_active = record.get("is_active", True)
-
-    # Create/update MaStR source data
-    await upsert_mastr_data(db, dno, record)
-
-    # Create VNB data if present in enriched record
-    if record.get("vnb_id"):
-        await upsert_vnb_data(db, dno, record)
-        # Update resolved fields from VNB
-        dno.vnb_id = record["vnb_id"]
-        dno.website = record.get("website") or dno.website
-        dno.phone = record.get("phone") or dno.phone
-        dno.email = record.get("email") or dno.email
-        # Mark as enriched
-        dno.enrichment_status = "completed"
-        dno.last_enriched_at = datetime.now(UTC)
-    else:
-        # No VNB data present – mark as pending enrichment
-        dno.enrichment_status = "pending"
-        dno.last_enriched_at = None
+    return snapshot
 
-    # Seed robots/crawlability data if present
-    if record.get("status"):
-        dno.status = record["status"]
-    if record.get("crawlable") is not None:
-        dno.crawlable = record["crawlable"]
-    if record.get("blocked_reason"):
-        dno.crawl_blocked_reason = record["blocked_reason"]
-    if record.get("robots_txt"):
-        dno.robots_txt = record["robots_txt"]
-    if record.get("robots_fetched_at"):
-        dno.robots_fetched_at = parse_date(record["robots_fetched_at"])
-    if record.get("sitemap_urls"):
-        dno.sitemap_urls = record["sitemap_urls"]
-    if record.get("sitemap_parsed_urls"):
-        dno.sitemap_parsed_urls = record["sitemap_parsed_urls"]
-    if record.get("sitemap_fetched_at"):
-        dno.sitemap_fetched_at = parse_date(record["sitemap_fetched_at"])
-    if record.get("disallow_paths"):
-        dno.disallow_paths = record["disallow_paths"]
-
-    apply_importance_to_dno(dno)
-
-    # Create BDEW data if present in enriched record
-    if record.get("bdew_code"):
-        await upsert_bdew_data(db, dno, record)
-        # Update primary BDEW code on core (convert to string)
-        dno.primary_bdew_code = str(int(record["bdew_code"]))
-
-    logger.debug(f"{action.capitalize()} DNO from seed", mastr_nr=mastr_nr, name=record["name"])
-    return action
-
-
-async def upsert_mastr_data(db: AsyncSession, dno: DNOModel, record: dict[str, Any]) -> None:
-    """Create or update MaStR source data for a DNO."""
-
-    # Check if MaStR data already exists via explicit query (avoids lazy loading)
-    result = await db.execute(select(DNOMastrData).where(DNOMastrData.dno_id == dno.id))
-    mastr = result.scalar_one_or_none()
-
-    if mastr is None:
-        mastr = DNOMastrData(dno=dno)
-        db.add(mastr)
-
-    # Update fields
-    mastr.mastr_nr = record["mastr_nr"]
-    mastr.registered_name = record["name"]
-    mastr.acer_code = record.get("acer_code")
-    mastr.region = record.get("region")
-    mastr.address_components = record.get("address_components")
-    mastr.contact_address = record.get("contact_address")
-    mastr.marktrollen = record.get("marktrollen")
-    mastr.is_active = record.get("is_active", True)
-    mastr.closed_network = record.get("closed_network", False)
-    mastr.registration_date = parse_date(record.get("registration_date"))
-    mastr.mastr_last_updated = parse_date(record.get("last_updated"))
-    mastr.activity_start = parse_date(record.get("activity_start"))
-    mastr.activity_end = parse_date(record.get("activity_end"))
-    mastr.last_synced_at = datetime.now(UTC)
 
-    stats = record.get("stats")
-    if isinstance(stats, dict):
-        connection_points = stats.get("connection_points") or {}
-        normalized_cp = _normalize_connection_points(connection_points)
-
-        mastr.connection_points_total = normalized_cp.get("total")
-        mastr.connection_points_by_level = normalized_cp.get("by_level")
-        mastr.connection_points_ns = normalized_cp.get("ns")
-        mastr.connection_points_ms = normalized_cp.get("ms")
-        mastr.connection_points_hs = normalized_cp.get("hs")
-        mastr.connection_points_hoe = normalized_cp.get("hoe")
-
-        networks = stats.get("networks") or {}
-        mastr.networks_count = networks.get("count")
-        mastr.has_customers = networks.get("has_customers")
-        mastr.closed_distribution_network = networks.get("closed_distribution_network")
-
-        capacity = stats.get("installed_capacity_mw") or {}
-        mastr.total_capacity_mw = parse_decimal(capacity.get("total"))
-        mastr.solar_capacity_mw = parse_decimal(capacity.get("solar"))
-        mastr.wind_capacity_mw = parse_decimal(capacity.get("wind"))
-        mastr.storage_capacity_mw = parse_decimal(capacity.get("storage"))
-        mastr.biomass_capacity_mw = parse_decimal(capacity.get("biomass"))
-        mastr.hydro_capacity_mw = parse_decimal(capacity.get("hydro"))
-
-        units = stats.get("unit_counts") or {}
-        mastr.solar_units = units.get("solar")
-        mastr.wind_units = units.get("wind")
-        mastr.storage_units = units.get("storage")
-
-        stats_quality = stats.get("data_quality")
-        if isinstance(stats_quality, str) and stats_quality:
-            mastr.stats_data_quality = stats_quality
+def plan_seed(records: list[dict[str, Any]], snapshot: SeedSnapshot) -> SeedPlan:
+    """
+    Diff seed records against the database snapshot.
+
+    Records that would violate a unique key (slug, VNB id, one BDEW code per
+    market function) are skipped, as are records without mastr_nr or with an
+    invalid slug. A later record with the same mastr_nr replaces an earlier
+    one.
+    """
+    plan = SeedPlan()
+    now = datetime.now(UTC)
+
+    by_mastr_nr: dict[str, dict[str, Any]] = {}
+    for record in records:
+        mastr_nr = record.get("mastr_nr")
+        if not mastr_nr:
+            logger.warning("Skipping record without mastr_nr", name=record.get("name"))
+            plan.skipped += 1
+            continue
+        if mastr_nr in by_mastr_nr:
+            plan.skipped += 1
+        by_mastr_nr[mastr_nr] = record
+
+    slug_owners = dict(snapshot.slug_owners)
+    vnb_owners = dict(snapshot.vnb_owners)
+    bdew_owners = dict(snapshot.bdew_owners)
+    bdew_functions = set(snapshot.bdew_functions)
+
+    for mastr_nr, record in by_mastr_nr.items():
+        slug = record.get("slug") or ""
+        vnb_id = str(record["vnb_id"]) if record.get("vnb_id") else None
+        bdew_code = str(int(record["bdew_code"])) if record.get("bdew_code") else None
+        market_function = record.get("bdew_market_function")
+
+        problem = None
+        if not SLUG_PATTERN.fullmatch(slug):
+            problem = "invalid slug"
+        elif slug_owners.get(slug, mastr_nr) != mastr_nr:
+            problem = "slug belongs to another DNO"
+        elif vnb_id and vnb_owners.get(vnb_id, mastr_nr) != mastr_nr:
+            problem = "vnb_id belongs to another DNO"
+        elif (
+            bdew_code
+            and bdew_code not in bdew_owners
+            and market_function
+            and (mastr_nr, market_function) in bdew_functions
+        ):
+            problem = "DNO already has a BDEW code for this market function"
+        if problem:
+            logger.error("Error seeding DNO", mastr_nr=mastr_nr, error=problem)
+            plan.skipped += 1
+            continue
+
+        slug_owners[slug] = mastr_nr
+        if vnb_id:
+            vnb_owners[vnb_id] = mastr_nr
+
+        existing = snapshot.dnos.get(mastr_nr)
+        if existing is None:
+            plan.inserted += 1
         else:
-            has_full_data = stats.get("has_full_data")
-            if has_full_data is True:
-                mastr.stats_data_quality = "full"
-            elif has_full_data is False:
-                mastr.stats_data_quality = "partial"
+            plan.updated += 1
+
+        mastr = _mastr_row(record, now)
+        plan.mastr.append(mastr)
+        plan.dnos.append(_dno_row(record, existing, mastr, vnb_id, bdew_code, now))
+        if vnb_id:
+            plan.vnb.append(
+                {
+                    "owner": mastr_nr,
+                    "vnb_id": vnb_id,
+                    "name": record["name"],
+                    "homepage_url": record.get("website"),
+                    "phone": record.get("phone"),
+                    "email": record.get("email"),
+                    "last_synced_at": now,
+                }
+            )
+        if record.get("sitemap_parsed_urls"):
+            plan.sitemap_urls[mastr_nr] = record["sitemap_parsed_urls"]
+        if bdew_code:
+            # An existing code keeps its DNO and only gets the record's details
+            owner = bdew_owners.setdefault(bdew_code, mastr_nr)
+            if owner == mastr_nr and market_function:
+                bdew_functions.add((mastr_nr, market_function))
+            plan.bdew[bdew_code] = {
+                "owner": owner,
+                "bdew_code": bdew_code,
+                "bdew_internal_id": _int_or_zero(record.get("bdew_internal_id")),
+                "bdew_company_uid": _int_or_zero(record.get("bdew_company_uid")),
+                "company_name": record["name"],
+                "market_function": market_function,
+                "last_synced_at": now,
+            }
+
+    return plan
+
+
+def _int_or_zero(value: Any) -> int:
+    return int(value) if value is not None else 0
+
+
+def _mastr_row(record: dict[str, Any], now: datetime) -> dict[str, Any]:
+    """dno_mastr_data values of a seed record (stats columns only if it has stats)."""
+    row: dict[str, Any] = {
+        "owner": record["mastr_nr"],
+        "mastr_nr": record["mastr_nr"],
+        "registered_name": record["name"],
+        "acer_code": record.get("acer_code"),
+        "region": record.get("region"),
+        "address_components": record.get("address_components"),
+        "contact_address": record.get("contact_address"),
+        "marktrollen": record.get("marktrollen"),
+        "is_active": record.get("is_active", True),
+        "closed_network": record.get("closed_network", False),
+        "registration_date": parse_date(record.get("registration_date")),
+        "mastr_last_updated": parse_date(record.get("last_updated")),
+        "activity_start": parse_date(record.get("activity_start")),
+        "activity_end": parse_date(record.get("activity_end")),
+        "last_synced_at": now,
+    }
 
-        mastr.stats_computed_at = parse_date(stats.get("computed_at")) or datetime.now(UTC)
+    stats = record.get("stats")
+    if not isinstance(stats, dict):
+        return row
+
+    normalized_cp = _normalize_connection_points(stats.get("connection_points") or {})
+    networks = stats.get("networks") or {}
+    capacity = stats.get("installed_capacity_mw") or {}
+    units = stats.get("unit_counts") or {}
+
+    stats_quality = stats.get("data_quality")
+    if not (isinstance(stats_quality, str) and stats_quality):
+        has_full_data = stats.get("has_full_data")
+        stats_quality = (
+            ("full" if has_full_data else "partial") if isinstance(has_full_data, bool) else None
+        )
 
-        dno.connection_points_count = mastr.connection_points_total
-        dno.total_capacity_mw = mastr.total_capacity_mw
+    row.update(
+        {
+            "connection_points_total": normalized_cp.get("total"),
+            "connection_points_by_level": normalized_cp.get("by_level"),
+            "connection_points_ns": normalized_cp.get("ns"),
+            "connection_points_ms": normalized_cp.get("ms"),
+            "connection_points_hs": normalized_cp.get("hs"),
+            "connection_points_hoe": normalized_cp.get("hoe"),
+            "networks_count": networks.get("count"),
+            "has_customers": networks.get("has_customers"),
+            "closed_distribution_network": networks.get("closed_distribution_network"),
+            "total_capacity_mw": parse_decimal(capacity.get("total")),
+            "solar_capacity_mw": parse_decimal(capacity.get("solar")),
+            "wind_capacity_mw": parse_decimal(capacity.get("wind")),
+            "storage_capacity_mw": parse_decimal(capacity.get("storage")),
+            "biomass_capacity_mw": parse_decimal(capacity.get("biomass")),
+            "hydro_capacity_mw": parse_decimal(capacity.get("hydro")),
+            "solar_units": units.get("solar"),
+            "wind_units": units.get("wind"),
+            "storage_units": units.get("storage"),
+            "stats_data_quality": stats_quality,
+            "stats_computed_at": parse_date(stats.get("computed_at")) or now,
+        }
+    )
+    return row
 
 
-async def upsert_vnb_data(db: AsyncSession, dno: DNOModel, record: dict[str, Any]) -> None:
-    """Create or update VNB Digital source data for a DNO."""
+def _dno_row(
+    record: dict[str, Any],
+    existing: Any | None,
+    mastr: dict[str, Any],
+    vnb_id: str | None,
+    bdew_code: str | None,
+    now: datetime,
+) -> dict[str, Any]:
+    """Resolved DNOModel values of a seed record.
 
-    vnb_id = record.get("vnb_id")
-    if not vnb_id:
-        return
+    Columns in SEED_COALESCE_COLUMNS are None when the record has no value;
+    the upsert then keeps the stored value.
+    """
+    has_stats = "connection_points_total" in mastr
+    if has_stats:
+        connection_points = mastr["connection_points_total"]
+        total_capacity = mastr["total_capacity_mw"]
+        has_customers = mastr["has_customers"]
+    else:
+        connection_points = existing.connection_points_count if existing else None
+        total_capacity = existing.total_capacity_mw if existing else None
+        has_customers = existing.has_customers if existing else None
+
+    importance = SimpleNamespace(
+        connection_points_count=connection_points,
+        customer_count=existing.customer_count if existing else None,
+        service_area_km2=existing.service_area_km2 if existing else None,
+        mastr_data=SimpleNamespace(has_customers=has_customers),
+    )
+    apply_importance_to_dno(importance)
 
-    # Check if VNB data already exists via explicit query (avoids lazy loading)
-    result = await db.execute(select(DNOVnbData).where(DNOVnbData.dno_id == dno.id))
-    vnb = result.scalar_one_or_none()
+    if record.get("status"):
+        status = record["status"]
+    else:
+        status = existing.status if existing else "uncrawled"
+    if record.get("crawlable") is not None:
+        crawlable = record["crawlable"]
+    else:
+        crawlable = existing.crawlable if existing else True
+
+    return {
+        "owner": record["mastr_nr"],
+        "mastr_nr": record["mastr_nr"],
+        "slug": record["slug"],
+        "name": record["name"],
+        "region": record.get("region"),
+        "is_active": record.get("is_active", True),
+        "source": "seed",
+        "status": status,
+        "crawlable": crawlable,
+        "connection_points_count": connection_points,
+        "total_capacity_mw": total_capacity,
+        # Resolved from VNB data; kept as stored when the record has none
+        "vnb_id": vnb_id,
+        "website": (record.get("website") or None) if vnb_id else None,
+        "phone": (record.get("phone") or None) if vnb_id else None,
+        "email": (record.get("email") or None) if vnb_id else None,
+        "enrichment_status": "completed" if vnb_id else "pending",
+        "last_enriched_at": now if vnb_id else None,
+        "primary_bdew_code": bdew_code,
+        # Crawlability from robots.txt/sitemap checks
+        "crawl_blocked_reason": record.get("blocked_reason") or None,
+        "robots_txt": record.get("robots_txt") or None,
+        "robots_fetched_at": parse_date(record.get("robots_fetched_at")),
+        "sitemap_urls": record.get("sitemap_urls") or None,
+        "sitemap_fetched_at": parse_date(record.get("sitemap_fetched_at")),
+        "disallow_paths": record.get("disallow_paths") or None,
+        "importance_score": importance.importance_score,
+        "importance_confidence": importance.importance_confidence,
+        "importance_version": importance.importance_version,
+        "importance_factors": importance.importance_factors,
+        "importance_updated_at": importance.importance_updated_at,
+    }
 
-    if vnb is None:
-        vnb = DNOVnbData(dno_id=dno.id, vnb_id=str(vnb_id), name=record["name"])
-        db.add(vnb)
 
-    # Update fields
-    vnb.vnb_id = str(vnb_id)
-    vnb.name = record["name"]
-    vnb.homepage_url = record.get("website")
-    vnb.phone = record.get("phone")
-    vnb.email = record.get("email")
-    vnb.last_synced_at = datetime.now(UTC)
+def _values(row: dict[str, Any], ids: dict[str, int] | None = None) -> dict[str, Any]:
+    """Insert values of a plan row: owner key resolved to dno_id, None as SQL NULL.
 
+    SQL NULL rather than JSON null, so COALESCE keeps stored JSON values.
+    """
+    owner: str = row["owner"]
+    values = {
+        key: null() if value is None else value for key, value in row.items() if key != "owner"
+    }
+    if ids is not None:
+        values["dno_id"] = ids[owner]
+    return values
 
-async def upsert_bdew_data(db: AsyncSession, dno: DNOModel, record: dict[str, Any]) -> None:
-    """Create or update BDEW source data for a DNO."""
 
-    bdew_code = record.get("bdew_code")
-    if not bdew_code:
-        return
+async def _upsert(
+    db: AsyncSession,
+    model: type[Base],
+    rows: list[dict[str, Any]],
+    conflict: list[str],
+    set_columns: Iterable[str],
+    coalesce_columns: Iterable[str] = (),
+    returning: tuple = (),
+) -> list[Row]:
+    """Multi-row INSERT ... ON CONFLICT DO UPDATE in chunks.
+
+    Columns in set_columns take the new value, coalesce_columns keep the
+    stored value where the new one is NULL.
+    """
+    returned: list[Row] = []
+    for start in range(0, len(rows), SEED_CHUNK_SIZE):
+        stmt = pg_insert(model).values(rows[start : start + SEED_CHUNK_SIZE])
+        set_: dict[str, Any] = {name: stmt.excluded[name] for name in set_columns}
+        set_.update(
+            {
+                name: func.coalesce(stmt.excluded[name], model.__table__.c[name])
+                for name in coalesce_columns
+            }
+        )
+        set_["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(index_elements=conflict, set_=set_)
+        if returning:
+            returned.extend((await db.execute(stmt.returning(*returning))).all())
+        else:
+            await db.execute(stmt)
+    return returned
+
 
-    # Convert to string (parquet stores as int, DB expects string)
-    bdew_code = str(int(bdew_code))
+async def apply_seed_plan(db: AsyncSession, plan: SeedPlan, snapshot: SeedSnapshot) -> list[int]:
+    """Write a seed plan with multi-row upserts per table (the caller commits).
 
-    # Check if this BDEW code already exists
-    result = await db.execute(select(DNOBdewData).where(DNOBdewData.bdew_code == bdew_code))
-    existing_bdew = result.scalar_one_or_none()
+    Returns:
+        IDs of all seeded DNOs.
+    """
+    if not plan.dnos:
+        return []
+
+    dno_values = [_values(row) for row in plan.dnos]
+    dno_set = [
+        name
+        for name in dno_values[0]
+        if name not in SEED_COALESCE_COLUMNS and name not in ("mastr_nr", "source")
+    ]
+    returned = await _upsert(
+        db,
+        DNOModel,
+        dno_values,
+        conflict=["mastr_nr"],
+        set_columns=dno_set,
+        coalesce_columns=SEED_COALESCE_COLUMNS,
+        returning=(DNOModel.id, DNOModel.mastr_nr),
+    )
+    ids = dict(snapshot.ids)
+    ids.update({mastr_nr: dno_id for dno_id, mastr_nr in returned})
+
+    # Rows without stats leave the stored MaStR statistics untouched
+    for has_stats in (True, False):
+        rows = [
+            _values(row, ids)
+            for row in plan.mastr
+            if ("connection_points_total" in row) == has_stats
+        ]
+        if rows:
+            await _upsert(
+                db,
+                DNOMastrData,
+                rows,
+                conflict=["dno_id"],
+                set_columns=[name for name in rows[0] if name != "dno_id"],
+            )
+
+    if plan.vnb:
+        rows = [_values(row, ids) for row in plan.vnb]
+        await _upsert(
+            db,
+            DNOVnbData,
+            rows,
+            conflict=["dno_id"],
+            set_columns=[name for name in rows[0] if name != "dno_id"],
+        )
 
-    if existing_bdew:
-        bdew = existing_bdew
-    else:
-        bdew = DNOBdewData(
-            dno_id=dno.id,
-            bdew_code=bdew_code,
-            company_name=record["name"],
+    if plan.bdew:
+        rows = [_values(row, ids) for row in plan.bdew.values()]
+        await _upsert(
+            db,
+            DNOBdewData,
+            rows,
+            conflict=["bdew_code"],
+            set_columns=[name for name in rows[0] if name not in ("dno_id", "bdew_code")],
         )
-        db.add(bdew)
-
-    # Update fields
-    bdew.bdew_internal_id = record.get("bdew_internal_id", 0)
-    bdew.bdew_company_uid = record.get("bdew_company_uid", 0)
-    bdew.company_name = record["name"]
-    bdew.market_function = record.get("bdew_market_function")
-    bdew.last_synced_at = datetime.now(UTC)
+
+    # Records without parsed sitemap URLs keep the stored ones
+    await replace_sitemap_urls(db, {ids[owner]: urls for owner, urls in plan.sitemap_urls.items()})
+
+    return [ids[row["owner"]] for row in plan.dnos]
 
 
 async def get_dnos_needing_enrichment(
@@ -5,12 +5,14 @@ This package contains the ARQ worker configuration and job functions
 that orchestrate the services layer.
 
 Architecture:
-- CrawlWorkerSettings: Dedicated single worker for crawling (steps 0-3)
-  - Ensures polite crawling with no parallel requests to same domain
+- CrawlWorkerSettings: Worker(s) for crawling (steps 0-3)
+  - Runs several crawl jobs at once, one per registered domain (Redis lease)
+  - Per-host token buckets in Redis keep request rates polite across workers
   - Listens on "crawl" queue
 
 - ExtractWorkerSettings: Worker(s) for extraction (steps 4-6)
   - Can be scaled horizontally since no external requests
+  - CPU-heavy PDF/Excel parsing runs in a process pool (timeouts, memory caps)
   - Listens on "extract" queue
 
 """
@@ -21,6 +23,9 @@ from arq.connections import RedisSettings
 from app.core.config import settings
 from app.db import close_db, get_db_session, init_db
 from app.db.seeder import seed_dnos
+from app.services.domain_throttle import init_domain_throttle
+from app.services.extraction.parse_pool import init_parse_pool, shutdown_parse_pool
+from app.services.search_cache import init_search_cache
 
 logger = structlog.get_logger()
 
@@ -36,6 +41,15 @@ async def startup_with_seeding(ctx):
     logger.info("Starting up worker (with seeding)...")
     await init_db()
 
+    # Per-domain politeness shared by all crawl jobs and workers
+    init_domain_throttle(ctx["redis"])
+
+    # Finalized data invalidates cached public search responses
+    init_search_cache(ctx["redis"])
+
+    # Classification parses PDFs; keep that off the event loop
+    init_parse_pool()
+
     # Seed the database with DNO data
     logger.info("Running database seeder...")
     async with get_db_session() as db:
@@ -69,18 +83,21 @@ async def startup_simple(ctx):
     """Initialize the worker context without seeding (extract worker)."""
     logger.info("Starting up worker (simple)...")
     await init_db()
+    init_parse_pool()
+    init_search_cache(ctx["redis"])
     logger.info("Worker startup complete.")
 
 
 async def shutdown(ctx):
     """Cleanup the worker context."""
     logger.info("Shutting down worker...")
+    shutdown_parse_pool()
     await close_db()
     logger.info("Worker shutdown complete.")
 
 
 # Import job functions
-from app.jobs.crawl_job import process_crawl  # noqa: E402
+from app.jobs.crawl_job import CRAWL_MAX_TRIES, process_crawl  # noqa: E402
 from app.jobs.enrichment_job import enrich_dno  # noqa: E402
 from app.jobs.extract_job import process_extract  # noqa: E402
 
@@ -94,7 +111,10 @@ class CrawlWorkerSettings:
     - Step 01: Discover (BFS crawl)
     - Step 03: Download
 
-    IMPORTANT: Only run ONE crawl worker to ensure polite crawling!
+    Politeness is enforced per domain, not per worker: a crawl job holds a
+    Redis lease on its DNO's registered domain (other jobs for that domain are
+    deferred), and every request passes a shared per-host token bucket.
+    Several crawl workers can therefore run side by side.
     """
 
     functions = [
@@ -108,13 +128,17 @@ class CrawlWorkerSettings:
     on_shutdown = shutdown
     handle_signals = False
 
-    # CRITICAL: Only process one job at a time for polite crawling
-    max_jobs = 1
+    # Concurrent jobs; each holds a different domain lease, so no site sees parallel crawls
+    max_jobs = settings.crawler_max_concurrent
 
     # Job timeout: 20 minutes for crawl jobs (bulk download + potential deeper pass)
     # Prevents jobs from hanging indefinitely
     job_timeout = 1200
 
+    # Jobs whose domain is leased are deferred via Retry; allow plenty of re-deliveries
+    # (the last one fails the job instead of leaving it pending)
+    max_tries = CRAWL_MAX_TRIES
+
 
 class ExtractWorkerSettings:
     """
@@ -138,9 +162,9 @@ class ExtractWorkerSettings:
     on_shutdown = shutdown
     handle_signals = False
 
-    # Can process multiple jobs (no external requests)
-    # Start with 1, can increase if needed
-    max_jobs = 1
+    # Can process multiple jobs (no external crawl requests); PDF/Excel parsing
+    # runs in the parse pool, so concurrent jobs parse on separate cores
+    max_jobs = settings.extract_max_concurrent
 
     # Job timeout: 5 minutes for extract jobs (AI extraction)
     job_timeout = 300
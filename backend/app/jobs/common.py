@@ -2,21 +2,47 @@
 
 from datetime import UTC, datetime
 
+from sqlalchemy.orm.attributes import flag_modified
+
 from app.db.models import CrawlJobModel
+from app.services.dno_summary import refresh_dno_summary
+
+# Step checkpoints live in job.context["checkpoint"]:
+#   completed_steps: checkpoint keys of the steps finished in the current crawl pass
+#   downloads: files fetched so far by an interrupted download step
+#   resumes: how often the job was paused and resumed
+CHECKPOINT_KEY = "checkpoint"
+
+# Context keys written by each checkpointed crawl step (carried over when a
+# retry resumes from a failed job). Step 00 is not listed: its pre-flight
+# checks and registry lookups are cheap and should be fresh on every run.
+CHECKPOINT_OUTPUTS = {
+    "discover": ("candidate_urls", "pages_crawled", "parent_pages"),
+    "download": ("downloaded_files", "strategy"),
+    "classify": ("classified_files", "unclassified_files", "deepen_crawl"),
+}
 
 
-async def mark_job_running(job: CrawlJobModel, db) -> bool:
+async def mark_job_running(job: CrawlJobModel, db, resuming: bool = False) -> bool:
     """Mark a job as running.
 
+    Args:
+        job: Job to start
+        db: Database session
+        resuming: The job is re-delivered after its worker died mid-run, so a
+            "running" status is stale and the job may continue
+
     Returns False when the job is already completed/cancelled and should be treated as idempotent.
     """
-    if job.status in {"completed", "cancelled", "running"}:
+    finalized = {"completed", "cancelled"} if resuming else {"completed", "cancelled", "running"}
+    if job.status in finalized:
         return False
 
     if not job.started_at:
         job.started_at = datetime.now(UTC)
 
     job.status = "running"
+    await refresh_dno_summary(db, job.dno_id)
     await db.commit()
     return True
 
@@ -27,6 +53,8 @@ async def mark_job_completed(job: CrawlJobModel, db, current_step: str) -> None:
     job.progress = 100
     job.current_step = current_step
     job.completed_at = datetime.now(UTC)
+    # Counts changed by the job's steps are picked up together with the status
+    await refresh_dno_summary(db, job.dno_id)
     await db.commit()
 
 
@@ -35,3 +63,81 @@ async def ensure_job_failure_timestamp(job: CrawlJobModel, db) -> None:
     if not job.completed_at:
         job.completed_at = datetime.now(UTC)
         await db.commit()
+
+
+def get_checkpoint(job: CrawlJobModel) -> dict:
+    """Checkpoint state of a job (empty dict if none yet)."""
+    return (job.context or {}).get(CHECKPOINT_KEY) or {}
+
+
+def _set_checkpoint(job: CrawlJobModel, checkpoint: dict) -> None:
+    # Update in place: steps keep a reference to job.context while they run
+    context = job.context if job.context is not None else {}
+    context[CHECKPOINT_KEY] = checkpoint
+    job.context = context
+    # In-place changes are invisible to the ORM; flag so the whole dict is written
+    flag_modified(job, "context")
+
+
+def is_step_checkpointed(job: CrawlJobModel, step_key: str) -> bool:
+    """Whether the step already completed in the current crawl pass."""
+    return step_key in get_checkpoint(job).get("completed_steps", [])
+
+
+def checkpoint_step(job: CrawlJobModel, step_key: str) -> None:
+    """Record a completed step (persisted with the caller's next commit)."""
+    checkpoint = dict(get_checkpoint(job))
+    completed = checkpoint.get("completed_steps", [])
+    if step_key not in completed:
+        checkpoint["completed_steps"] = [*completed, step_key]
+    checkpoint.pop("downloads", None)  # Partial progress is now part of the step output
+    checkpoint["updated_at"] = datetime.now(UTC).isoformat()
+    _set_checkpoint(job, checkpoint)
+
+
+def checkpoint_downloads(job: CrawlJobModel, downloads: list[dict]) -> None:
+    """Record files fetched so far by a running download step."""
+    checkpoint = dict(get_checkpoint(job))
+    checkpoint["downloads"] = list(downloads)
+    checkpoint["updated_at"] = datetime.now(UTC).isoformat()
+    _set_checkpoint(job, checkpoint)
+
+
+def reset_step_checkpoints(job: CrawlJobModel, step_keys: tuple[str, ...]) -> None:
+    """Forget completed steps so they run again (e.g. for a deeper crawl pass)."""
+    checkpoint = dict(get_checkpoint(job))
+    checkpoint["completed_steps"] = [
+        key for key in checkpoint.get("completed_steps", []) if key not in step_keys
+    ]
+    checkpoint.pop("downloads", None)
+    _set_checkpoint(job, checkpoint)
+
+
+def resume_context(previous_context: dict | None) -> dict:
+    """Context for a new crawl job that continues where a failed one stopped.
+
+    Carries over the outputs of the steps the previous job completed, plus the
+    files its download step had already fetched, so the new job only does the
+    missing work.
+    """
+    previous_context = previous_context or {}
+    checkpoint = previous_context.get(CHECKPOINT_KEY) or {}
+    completed = [key for key in checkpoint.get("completed_steps", []) if key in CHECKPOINT_OUTPUTS]
+    downloads = checkpoint.get("downloads") if "download" not in completed else None
+    if not completed and not downloads:
+        return {}
+
+    context: dict = {}
+    for step_key in completed:
+        for key in CHECKPOINT_OUTPUTS[step_key]:
+            if key in previous_context:
+                context[key] = previous_context[key]
+    # Stay in the same crawl pass (a deeper pass uses larger limits)
+    for key in ("crawl_pass", "max_depth", "max_pages"):
+        if key in previous_context:
+            context[key] = previous_context[key]
+
+    context[CHECKPOINT_KEY] = {"completed_steps": completed}
+    if downloads:
+        context[CHECKPOINT_KEY]["downloads"] = downloads
+    return context
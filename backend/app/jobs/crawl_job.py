@@ -13,24 +13,72 @@ for each classified data type.
 Supports crawl deepening: if classify finds nothing on first pass,
 re-runs steps 1-3 with increased depth/pages (max one deepening pass).
 
-Designed to run on a single dedicated worker to ensure polite crawling
-(no parallel requests to the same domain).
+Politeness is enforced per domain: a job takes a Redis lease on its DNO's
+registered domain before running, and jobs for a leased domain are deferred
+(arq Retry). Many jobs for distinct domains can therefore run concurrently.
+A job still waiting on its last arq delivery is failed rather than dropped.
+
+Jobs are resumable: every step records its completion (and the download step
+every fetched file) in job.context["checkpoint"]. A job that reaches its time
+budget pauses and is re-queued, a job re-delivered after its worker died
+continues where it stopped, and both only do the missing work.
 """
 
+import asyncio
 import contextlib
+from datetime import UTC, datetime
 
 import structlog
-from sqlalchemy import func, select
+from arq import Retry
+from sqlalchemy import func, select, update
 
+from app.core.config import settings
 from app.db import get_db_session
-from app.db.models import CrawlJobModel, HLZFModel, NetzentgelteModel
-from app.jobs.common import ensure_job_failure_timestamp, mark_job_completed, mark_job_running
+from app.db.models import (
+    CrawlJobModel,
+    CrawlJobStepModel,
+    DNOModel,
+    HLZFModel,
+    NetzentgelteModel,
+)
+from app.jobs.common import (
+    CHECKPOINT_KEY,
+    ensure_job_failure_timestamp,
+    get_checkpoint,
+    mark_job_completed,
+    mark_job_running,
+    reset_step_checkpoints,
+)
+from app.services.dno_summary import refresh_dno_summary
+from app.services.domain_throttle import get_domain_throttle, registered_domain
 
 logger = structlog.get_logger()
 
 # Steps for crawl job (steps 0-3)
 CRAWL_STEPS = None  # Lazy loaded to avoid circular imports
 
+# Domain lease lifetime: crawl job_timeout (1200s) plus a safety margin, so a
+# lease held by a killed worker expires on its own
+CRAWL_LEASE_TTL_SECONDS = 1200 + 60
+
+# Time a single run may take before the job pauses at its last checkpoint and
+# is re-queued; stays below job_timeout so arq never kills a job mid-step
+CRAWL_TIME_BUDGET_SECONDS = 1200 - 60
+
+# Pauses per job before it is failed as timed out
+MAX_CRAWL_RESUMES = 3
+
+# Delay before a paused job continues
+CRAWL_RESUME_DEFER_SECONDS = 5
+
+# arq deliveries per job; every lease wait and every pause uses one. Covers a
+# wait for one fully resumed crawl of the same domain ((MAX_CRAWL_RESUMES + 1)
+# leases at crawler_lease_retry_seconds per try) with headroom
+CRAWL_MAX_TRIES = 200
+
+# Steps re-run by a deeper crawl pass
+DEEPEN_STEP_KEYS = ("discover", "download", "classify")
+
 
 def get_crawl_steps():
     """Lazy load crawl steps to avoid circular imports."""
@@ -79,152 +127,304 @@ async def process_crawl(
             log.error("Job not found", job_id=job_id)
             return {"status": "error", "message": "Job not found"}
 
-        # Mark job as running (idempotent if already finalized)
-        should_run = await mark_job_running(job, db)
-        if not should_run:
+        # A "running" job delivered again means its worker died mid-run
+        # (crash, shutdown): continue from its checkpoints
+        resuming = job.status == "running" and ctx.get("job_try", 1) > 1
+        if job.status in {"completed", "cancelled", "running"} and not resuming:
             log.info("Crawl job already finalized; skipping re-execution")
             return {"status": job.status, "message": "Job already finalized"}
 
-        steps = get_crawl_steps()
-        total_steps = len(steps)
+        # Only one crawl per domain at a time; defers (raises Retry) if leased
+        try:
+            lease_domain = await _acquire_domain_lease(db, job, log)
+        except DomainBusyError as e:
+            job.current_step = f"Waiting for {e.domain} (another crawl in progress)"
+            return await _defer_or_fail(
+                ctx,
+                db,
+                job,
+                log,
+                settings.crawler_lease_retry_seconds,
+                f"Gave up waiting for {e.domain} (another crawl in progress)",
+            )
 
         try:
-            # Run step 0 (gather context) first — checks for cached files
-            await steps[0].execute(db, job, 1, total_steps)
-
-            # Check if we can skip crawling: cached files exist for target year
-            job_ctx = job.context or {}
-            cached_files = job_ctx.get("cached_files", {})
-            skip_crawl = False
-
-            if cached_files:
-                # Check which types already have unflagged data in the DB
-                imported = await _check_imported_data(db, job.dno_id, job.year)
-                needs_extract = {
-                    dt: path for dt, path in cached_files.items() if dt not in imported
-                }
+            if resuming:
+                log.info("Resuming interrupted crawl job", checkpoint=get_checkpoint(job))
+            async with asyncio.timeout(CRAWL_TIME_BUDGET_SECONDS):
+                return await _run_crawl(db, job, log, resuming=resuming)
+        except TimeoutError:
+            return await _pause_crawl(ctx, db, job, log)
+        finally:
+            if lease_domain:
+                await get_domain_throttle().release_lease(lease_domain, f"job:{job_id}")
 
-                # Check if any data types are completely missing (no cache + no import).
-                # If so, we must still crawl to discover them.
-                all_types = {"netzentgelte", "hlzf"}
-                covered = set(cached_files.keys()) | imported
-                missing_types = all_types - covered
-
-                if missing_types:
-                    log.info(
-                        "Data types missing from cache and DB, crawl required",
-                        missing=list(missing_types),
-                        cached=list(cached_files.keys()),
-                        imported=list(imported),
-                    )
-
-                if not needs_extract and imported and not missing_types:
-                    # All data types are either cached+imported or imported — skip entirely
-                    skip_crawl = True
-                    log.info(
-                        "All data already imported, skipping crawl",
-                        imported=list(imported),
-                        cached=list(cached_files.keys()),
-                    )
-                    await mark_job_completed(
-                        job, db, current_step="Skipped - data already imported"
-                    )
-                    return {
-                        "status": "completed",
-                        "message": f"Data already imported for {', '.join(imported)}",
-                    }
 
-                if needs_extract and not missing_types:
-                    # Files exist but data not imported — skip crawl, go straight to extract
-                    skip_crawl = True
-                    log.info(
-                        "Cached files found, skipping crawl and queuing extract",
-                        needs_extract=list(needs_extract.keys()),
-                        already_imported=list(imported),
-                    )
-                    # Build classified_files from cache so _enqueue_extract_jobs works
-                    classified = {}
-                    for dt, path in needs_extract.items():
-                        ext = path.rsplit(".", 1)[-1] if "." in path else "pdf"
-                        classified[dt] = {
-                            "path": path,
-                            "format": ext,
-                            "record_count": -1,  # Unknown, from cache
-                            "source_url": "cached",
-                        }
-                    job_ctx["classified_files"] = classified
-                    job.context = job_ctx
-                    await db.commit()
-
-            if not skip_crawl:
-                # Run remaining steps (discover, download, classify)
-                for i, step in enumerate(steps[1:], 2):
-                    await step.execute(db, job, i, total_steps)
-
-            # Check if classify requested a deeper crawl
-            job_ctx = job.context or {}
-            if job_ctx.get("deepen_crawl") and job_ctx.get("crawl_pass", 1) == 1:
-                log.info("Deepening crawl: re-running discover/download/classify")
-
-                # Update context for deeper pass
-                job_ctx["crawl_pass"] = 2
-                job_ctx["max_depth"] = 5
-                job_ctx["max_pages"] = 150
-                job_ctx["deepen_crawl"] = False
-                job.context = job_ctx
-                await db.commit()
+class DomainBusyError(Exception):
+    """Another crawl job holds the lease on the DNO's domain."""
 
-                # Re-run steps 1-3 (discover, download, classify) with deeper settings
-                # Steps are 0-indexed in the list: [0]=gather, [1]=discover, [2]=download, [3]=classify
-                deeper_steps = steps[1:]  # discover, download, classify
-                for i, step in enumerate(deeper_steps, total_steps + 1):
-                    await step.execute(db, job, i, total_steps + len(deeper_steps))
-
-            # Crawl steps completed successfully
-            await mark_job_completed(job, db, current_step="Crawl Completed - Queuing Extract")
-
-            # Enqueue extract job(s) for each classified data type
-            extract_job_ids = await _enqueue_extract_jobs(db, job, log)
-
-            if extract_job_ids:
-                # Store first child ID for backwards compat
-                job.child_job_id = extract_job_ids[0]
-                job.current_step = f"Completed - {len(extract_job_ids)} extract job(s) queued"
-                job.context = {
-                    **(job.context or {}),
-                    "child_job_ids": extract_job_ids,
-                }
-                await db.commit()
+    def __init__(self, domain: str):
+        super().__init__(f"Domain {domain} is leased by another crawl job")
+        self.domain = domain
+
+
+async def _acquire_domain_lease(db, job: CrawlJobModel, log) -> str | None:
+    """Take (or renew) the crawl lease on the DNO's registered domain.
+
+    Returns the leased domain, or None when no throttle is configured or the
+    DNO has no website (step 00 fails those jobs anyway).
+
+    Raises:
+        DomainBusyError: Another crawl job currently holds the domain
+    """
+    throttle = get_domain_throttle()
+    if throttle is None:
+        return None
+
+    dno = await db.get(DNOModel, job.dno_id)
+    domain = registered_domain(dno.website) if dno and dno.website else None
+    if not domain:
+        return None
+
+    if not await throttle.try_acquire_lease(domain, f"job:{job.id}", CRAWL_LEASE_TTL_SECONDS):
+        log.info(
+            "Domain busy, deferring crawl job",
+            domain=domain,
+            defer_seconds=settings.crawler_lease_retry_seconds,
+        )
+        raise DomainBusyError(domain)
+
+    return domain
+
+
+async def _defer_or_fail(
+    ctx: dict,
+    db,
+    job: CrawlJobModel,
+    log,
+    defer_seconds: int,
+    reason: str,
+) -> dict:
+    """Re-queue the job, or fail it when this was its last arq delivery.
+
+    arq drops a job after max_tries without touching its row, which would
+    leave it "pending" forever; the last delivery therefore fails it instead.
+
+    Raises:
+        Retry: The job is re-queued after defer_seconds
+    """
+    job_try = ctx.get("job_try", 1)
+    if job_try < CRAWL_MAX_TRIES:
+        await db.commit()
+        raise Retry(defer=defer_seconds)
+
+    log.error("Crawl job ran out of deliveries", job_try=job_try, reason=reason)
+    job.status = "failed"
+    job.error_message = reason
+    job.completed_at = datetime.now(UTC)
+    await refresh_dno_summary(db, job.dno_id)
+    await db.commit()
+    return {"status": "failed", "message": reason}
+
+
+async def _pause_crawl(ctx: dict, db, job: CrawlJobModel, log) -> dict:
+    """Re-queue a job that used up its time budget, or fail it after too many pauses.
+
+    Everything up to the last checkpoint is kept; the interrupted step starts
+    over (the download step only fetches files it had not fetched yet).
+
+    Raises:
+        Retry: The job is re-queued and resumes from its checkpoints
+    """
+    # The cancelled step may have left the session mid-transaction
+    await db.rollback()
+    await db.refresh(job)
+
+    checkpoint = get_checkpoint(job)
+    resumes = checkpoint.get("resumes", 0)
 
+    await db.execute(
+        update(CrawlJobStepModel)
+        .where(CrawlJobStepModel.job_id == job.id, CrawlJobStepModel.status == "running")
+        .values(status="failed", completed_at=datetime.now(UTC))
+    )
+
+    if resumes >= MAX_CRAWL_RESUMES:
+        log.error("Crawl job exceeded its time budget too often", resumes=resumes)
+        job.status = "failed"
+        job.error_message = f"Timed out after {resumes + 1} runs of {CRAWL_TIME_BUDGET_SECONDS}s"
+        job.completed_at = datetime.now(UTC)
+        await refresh_dno_summary(db, job.dno_id)
+        await db.commit()
+        return {"status": "failed", "message": job.error_message}
+
+    log.info(
+        "Crawl job reached its time budget, resuming from checkpoint",
+        completed_steps=checkpoint.get("completed_steps", []),
+        resumes=resumes + 1,
+    )
+    job.context = {**(job.context or {}), CHECKPOINT_KEY: {**checkpoint, "resumes": resumes + 1}}
+    job.status = "pending"
+    job.current_step = "Paused - resuming from checkpoint"
+    await refresh_dno_summary(db, job.dno_id)
+    return await _defer_or_fail(
+        ctx,
+        db,
+        job,
+        log,
+        CRAWL_RESUME_DEFER_SECONDS,
+        "Could not resume: crawl job ran out of deliveries",
+    )
+
+
+async def _run_crawl(db, job: CrawlJobModel, log, resuming: bool = False) -> dict:
+    """Run the crawl steps for a job whose domain lease is held.
+
+    Steps that completed in an earlier run of this job are skipped.
+    """
+    # Mark job as running (idempotent if already finalized)
+    should_run = await mark_job_running(job, db, resuming=resuming)
+    if not should_run:
+        log.info("Crawl job already finalized; skipping re-execution")
+        return {"status": job.status, "message": "Job already finalized"}
+
+    steps = get_crawl_steps()
+    total_steps = len(steps)
+
+    try:
+        # Run step 0 (gather context) first — checks for cached files
+        await steps[0].execute(db, job, 1, total_steps)
+
+        # Check if we can skip crawling: cached files exist for target year
+        job_ctx = job.context or {}
+        cached_files = job_ctx.get("cached_files", {})
+        skip_crawl = False
+
+        if cached_files:
+            # Check which types already have unflagged data in the DB
+            imported = await _check_imported_data(db, job.dno_id, job.year)
+            needs_extract = {dt: path for dt, path in cached_files.items() if dt not in imported}
+
+            # Check if any data types are completely missing (no cache + no import).
+            # If so, we must still crawl to discover them.
+            all_types = {"netzentgelte", "hlzf"}
+            covered = set(cached_files.keys()) | imported
+            missing_types = all_types - covered
+
+            if missing_types:
+                log.info(
+                    "Data types missing from cache and DB, crawl required",
+                    missing=list(missing_types),
+                    cached=list(cached_files.keys()),
+                    imported=list(imported),
+                )
+
+            if not needs_extract and imported and not missing_types:
+                # All data types are either cached+imported or imported — skip entirely
+                skip_crawl = True
                 log.info(
-                    "Crawl job completed, extract jobs enqueued",
-                    extract_job_ids=extract_job_ids,
+                    "All data already imported, skipping crawl",
+                    imported=list(imported),
+                    cached=list(cached_files.keys()),
                 )
+                await mark_job_completed(job, db, current_step="Skipped - data already imported")
                 return {
                     "status": "completed",
-                    "message": f"Crawl completed, {len(extract_job_ids)} extract job(s) queued",
-                    "extract_job_ids": extract_job_ids,
+                    "message": f"Data already imported for {', '.join(imported)}",
                 }
+
+            if needs_extract and not missing_types:
+                # Files exist but data not imported — skip crawl, go straight to extract
+                skip_crawl = True
+                log.info(
+                    "Cached files found, skipping crawl and queuing extract",
+                    needs_extract=list(needs_extract.keys()),
+                    already_imported=list(imported),
+                )
+                # Build classified_files from cache so _enqueue_extract_jobs works
+                classified = {}
+                for dt, path in needs_extract.items():
+                    ext = path.rsplit(".", 1)[-1] if "." in path else "pdf"
+                    classified[dt] = {
+                        "path": path,
+                        "format": ext,
+                        "record_count": -1,  # Unknown, from cache
+                        "source_url": "cached",
+                    }
+                job_ctx["classified_files"] = classified
+                job.context = job_ctx
+                await db.commit()
+
+        if not skip_crawl:
+            # Run remaining steps (discover, download, classify)
+            for i, step in enumerate(steps[1:], 2):
+                await step.execute(db, job, i, total_steps)
+
+        # Check if classify requested a deeper crawl
+        job_ctx = job.context or {}
+        if job_ctx.get("deepen_crawl") and job_ctx.get("crawl_pass", 1) == 1:
+            log.info("Deepening crawl: re-running discover/download/classify")
+
+            # Update context for deeper pass
+            job_ctx["crawl_pass"] = 2
+            job_ctx["max_depth"] = 5
+            job_ctx["max_pages"] = 150
+            job_ctx["deepen_crawl"] = False
+            job.context = job_ctx
+            reset_step_checkpoints(job, DEEPEN_STEP_KEYS)
+            await db.commit()
+
+            # Re-run steps 1-3 (discover, download, classify) with deeper settings
+            # Steps are 0-indexed in the list: [0]=gather, [1]=discover, [2]=download, [3]=classify
+            deeper_steps = steps[1:]  # discover, download, classify
+            for i, step in enumerate(deeper_steps, total_steps + 1):
+                await step.execute(db, job, i, total_steps + len(deeper_steps))
+
+        # Crawl steps completed successfully
+        await mark_job_completed(job, db, current_step="Crawl Completed - Queuing Extract")
+
+        # Enqueue extract job(s) for each classified data type
+        extract_job_ids = await _enqueue_extract_jobs(db, job, log)
+
+        if extract_job_ids:
+            # Store first child ID for backwards compat
+            job.child_job_id = extract_job_ids[0]
+            job.current_step = f"Completed - {len(extract_job_ids)} extract job(s) queued"
+            job.context = {
+                **(job.context or {}),
+                "child_job_ids": extract_job_ids,
+            }
+            await db.commit()
+
+            log.info(
+                "Crawl job completed, extract jobs enqueued",
+                extract_job_ids=extract_job_ids,
+            )
+            return {
+                "status": "completed",
+                "message": f"Crawl completed, {len(extract_job_ids)} extract job(s) queued",
+                "extract_job_ids": extract_job_ids,
+            }
+        else:
+            classified = (job.context or {}).get("classified_files", {})
+            if not classified:
+                job.current_step = "Completed - No extractable data found"
+                await db.commit()
+                log.warning("Crawl completed but no data classified")
             else:
-                classified = (job.context or {}).get("classified_files", {})
-                if not classified:
-                    job.current_step = "Completed - No extractable data found"
-                    await db.commit()
-                    log.warning("Crawl completed but no data classified")
-                else:
-                    log.warning("Crawl completed but no extract jobs created")
-                return {
-                    "status": "completed",
-                    "message": "Crawl completed (no extract jobs spawned)",
-                }
+                log.warning("Crawl completed but no extract jobs created")
+            return {
+                "status": "completed",
+                "message": "Crawl completed (no extract jobs spawned)",
+            }
 
-        except Exception as e:
-            log.error("Crawl job failed", error=str(e))
-            # BaseStep sets job.status/completed_at on step failures,
-            # but ensure completed_at is set even for non-step errors
-            with contextlib.suppress(Exception):
-                await ensure_job_failure_timestamp(job, db)
-            return {"status": "failed", "message": str(e)}
+    except Exception as e:
+        log.error("Crawl job failed", error=str(e))
+        # BaseStep sets job.status/completed_at on step failures,
+        # but ensure completed_at is set even for non-step errors
+        with contextlib.suppress(Exception):
+            await ensure_job_failure_timestamp(job, db)
+        return {"status": "failed", "message": str(e)}
 
 
 async def _check_imported_data(db, dno_id: int, year: int) -> set[str]:
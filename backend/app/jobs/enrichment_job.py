@@ -19,6 +19,7 @@ from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import DNOModel
+from app.services.dno_summary import refresh_dno_summary
 from app.services.robots_parser import fetch_robots_txt
 from app.services.vnb import VNBDigitalClient
 from app.services.vnb.models import VNBResult
@@ -112,6 +113,8 @@ async def enrich_dno(ctx: dict, dno_id: int) -> dict:
             # === Step 3: Mark as Completed ===
             dno.enrichment_status = "completed"
             dno.last_enriched_at = datetime.now(UTC)
+            # Names and crawlability feed the DNO list and search
+            await refresh_dno_summary(db, dno.id)
 
             await db.commit()
 
@@ -21,6 +21,8 @@ from sqlalchemy import select
 from app.db import get_db_session
 from app.db.models import CrawlJobModel
 from app.jobs.common import ensure_job_failure_timestamp, mark_job_completed, mark_job_running
+from app.services.dno_summary import refresh_dno_summary
+from app.services.search_cache import invalidate_search_cache
 
 logger = structlog.get_logger()
 
@@ -77,6 +79,7 @@ async def process_extract(
             log.error("No file to extract from", job_id=job_id)
             job.status = "failed"
             job.error_message = "No file path in job context"
+            await refresh_dno_summary(db, job.dno_id)
             await db.commit()
             return {"status": "failed", "message": "No file to extract from"}
 
@@ -136,6 +139,7 @@ async def _release_dno_lock(db, dno_id: int, log):
                 dno.status = "crawled"
                 dno.crawl_locked_at = None
                 await fresh_db.commit()
+                await invalidate_search_cache(dno_id)
                 log.debug("Released DNO crawl lock", dno_id=dno_id)
     except Exception as e:
         log.error("Failed to release DNO lock", dno_id=dno_id, error=str(e))
@@ -5,6 +5,8 @@ import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import CrawlJobModel, CrawlJobStepModel
+from app.jobs.common import checkpoint_step, is_step_checkpointed
+from app.services.dno_summary import refresh_dno_summary
 
 logger = structlog.get_logger()
 
@@ -24,6 +26,9 @@ class BaseStep(ABC):
 
     label: str = "Base Step"
     description: str = "Performing base step..."
+    # Key under which completion is recorded in job.context["checkpoint"];
+    # checkpointed steps are skipped when an interrupted job resumes
+    checkpoint_key: str | None = None
 
     def __init__(self):
         self.log = logger.bind(step=self.label)
@@ -37,6 +42,25 @@ class BaseStep(ABC):
         self, db: AsyncSession, job: CrawlJobModel, step_num: int, total_steps: int
     ) -> None:
         """Wrapper around run() that handles DB updates and logging."""
+        # 0. Completed before the job was interrupted: keep its output
+        if self.checkpoint_key and is_step_checkpointed(job, self.checkpoint_key):
+            self.log.info(f"Step {step_num}/{total_steps} resumed from checkpoint")
+            now = datetime.now(UTC)
+            db.add(
+                CrawlJobStepModel(
+                    job_id=job.id,
+                    step_name=self.label,
+                    status="done",
+                    started_at=now,
+                    completed_at=now,
+                    duration_seconds=0,
+                    details={"description": self.description, "result": "Resumed from checkpoint"},
+                )
+            )
+            job.progress = int((step_num / total_steps) * 100)
+            await db.commit()
+            return
+
         self.log.info(f"Starting step {step_num}/{total_steps}")
 
         # 1. Update Job progress
@@ -71,6 +95,8 @@ class BaseStep(ABC):
                 step_record.details = {**(step_record.details or {}), "result": result_msg}
 
             job.progress = int((step_num / total_steps) * 100)
+            if self.checkpoint_key:
+                checkpoint_step(job, self.checkpoint_key)
             await db.commit()
             self.log.info(f"Step {step_num}/{total_steps} completed")
 
@@ -94,6 +120,7 @@ class BaseStep(ABC):
                 job.status = "failed"
                 job.completed_at = datetime.now(UTC)
                 job.error_message = f"Step '{self.label}' failed: {e!s}"
+                await refresh_dno_summary(db, job.dno_id)
 
                 await db.commit()
             except Exception as commit_err:
@@ -27,6 +27,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.db.models import CrawlJobModel, DNOModel, DNOSourceProfile, DownloadRegistryModel
 from app.jobs.steps.base import BaseStep, StepError
+from app.services.domain_throttle import crawl_event_hooks
 from app.services.user_agent import build_user_agent
 
 logger = structlog.get_logger()
@@ -44,6 +45,7 @@ _CF_CHALLENGE_MARKERS = [
 class GatherContextStep(BaseStep):
     label = "Gathering Context"
     description = "Loading DNO info, running pre-flight checks, and checking for cached files..."
+    checkpoint_key = "gather_context"
 
     async def run(self, db: AsyncSession, job: CrawlJobModel) -> str:
         log = logger.bind(dno_id=job.dno_id, job_id=job.id)
@@ -76,6 +78,7 @@ class GatherContextStep(BaseStep):
             headers={"User-Agent": user_agent},
             follow_redirects=True,
             trust_env=False,
+            event_hooks=crawl_event_hooks(),
         ) as client:
             # B) robots.txt blocks root
             from app.services.url_utils import RobotsChecker
@@ -167,6 +170,7 @@ class GatherContextStep(BaseStep):
                     "source_url": entry.source_url,
                     "classification": entry.classification,
                     "file_path": entry.file_path,
+                    "file_hash": entry.file_hash,
                     "file_format": entry.file_format,
                 }
             )
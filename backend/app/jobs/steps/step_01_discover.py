@@ -29,7 +29,14 @@ from app.core.config import settings
 from app.db.models import CrawlJobModel, DNOModel
 from app.jobs.steps.base import BaseStep, StepError
 from app.services.discovery import DiscoveryManager
+from app.services.domain_throttle import crawl_event_hooks
+from app.services.http_cache import get_http_cache
 from app.services.pattern_learner import PatternLearner
+from app.services.sitemap_store import (
+    count_sitemap_urls,
+    is_sitemap_fresh,
+    select_sitemap_candidates,
+)
 from app.services.url_utils import DOCUMENT_EXTENSIONS, UrlProber
 from app.services.user_agent import build_user_agent, require_contact_for_bfs
 from app.services.web_crawler import WebCrawler, get_keywords_for_data_type
@@ -66,6 +73,7 @@ class DiscoverStep(BaseStep):
 
     label = "Discovering Sources"
     description = "Finding candidate URLs for all data types..."
+    checkpoint_key = "discover"
 
     async def run(self, db: AsyncSession, job: CrawlJobModel) -> str:
         ctx = job.context or {}
@@ -88,16 +96,13 @@ class DiscoverStep(BaseStep):
         # Load DNO from DB for sitemap cache
         dno = await db.get(DNOModel, job.dno_id)
 
-        # Check sitemap cache with TTL (120 days)
+        # Check sitemap cache with TTL (120 days); only URLs that can score are loaded
         cached_sitemap_urls = None
-        if dno and dno.sitemap_parsed_urls and dno.sitemap_fetched_at:
-            from datetime import UTC, datetime, timedelta
-
-            sitemap_ttl_days = 120
-            cache_age = datetime.now(UTC) - dno.sitemap_fetched_at.replace(tzinfo=UTC)
-            if cache_age < timedelta(days=sitemap_ttl_days):
-                cached_sitemap_urls = dno.sitemap_parsed_urls
-                log.info("using_cached_sitemap", count=len(cached_sitemap_urls))
+        if dno and is_sitemap_fresh(dno.sitemap_fetched_at):
+            stored = await count_sitemap_urls(db, dno.id)
+            if stored:
+                cached_sitemap_urls = await select_sitemap_candidates(db, dno.id, "all", job.year)
+                log.info("using_cached_sitemap", count=stored, candidates=len(cached_sitemap_urls))
 
         # Build HTTP client
         initiator_ip = ctx.get("initiator_ip")
@@ -113,6 +118,7 @@ class DiscoverStep(BaseStep):
                 max_keepalive_connections=10,
                 keepalive_expiry=30.0,
             ),
+            event_hooks=crawl_event_hooks(),
         ) as client:
             prober = UrlProber(client)
             learner = PatternLearner()
@@ -189,7 +195,7 @@ class DiscoverStep(BaseStep):
             # =================================================================
             # Strategy 3: Sitemap discovery (combined keywords)
             # =================================================================
-            discovery = DiscoveryManager(client)
+            discovery = DiscoveryManager(client, http_cache=get_http_cache())
             discovery_result = await discovery.discover(
                 base_url=dno_website,
                 data_type="all",
@@ -272,6 +278,8 @@ class DiscoverStep(BaseStep):
                     max_depth=max_depth,
                     max_pages=max_pages,
                     request_delay=getattr(settings, "crawler_delay", 0.5),
+                    concurrency=settings.crawler_frontier_concurrency,
+                    http_cache=get_http_cache(),
                 )
 
                 keywords = get_keywords_for_data_type("all")
@@ -1,40 +1,51 @@
 """
 Step 02: Bulk Download
 
-Downloads ALL candidate URLs to bulk-data/{dno_slug}/.
+Downloads ALL candidate URLs into the content-addressed document store.
 
 What it does:
 - Download each candidate URL sequentially
-- Store files in data/bulk-data/{dno_slug}/
+- Store files as blobs in data/blobs/ (identical content is stored once,
+  across URLs, DNOs and years)
 - Track downloads in ctx["downloaded_files"]
 - Limits: max 30 files, max 50MB per file, max 200MB total
 - Individual failures logged as warnings, step fails only if zero files downloaded
+- Conditional GET (If-None-Match / If-Modified-Since) against the HTTP cache:
+  on 304 the blob saved by an earlier crawl is reused without re-downloading.
+  Entries whose body is not a blob (pages the crawler cached with their own
+  body copy, which eviction deletes) are fetched unconditionally
+- Checkpoints every fetched file in job.context["checkpoint"]["downloads"],
+  so a job resumed after a timeout or crash only fetches the remaining URLs
 
 File storage convention:
-    data/bulk-data/
-    ├── westnetz/
-    │   ├── westnetz_00_a1b2c3d4.pdf
-    │   ├── westnetz_01_e5f6g7h8.xlsx
-    │   └── westnetz_02_i9j0k1l2.html
-    └── rheinnetz/
-        └── rheinnetz_00_m3n4o5p6.pdf
+    data/blobs/
+    ├── 3f/
+    │   └── 3fa9c0...e1.pdf      # {sha256}.{ext}
+    └── a7/
+        └── a70b12...9c.xlsx
+
+The per-DNO/year view of these blobs is the download registry (step 03).
 
 Output stored in job.context:
-- downloaded_files: list of {path, format, url, size_bytes}
+- downloaded_files: list of {path, format, url, size_bytes, content_hash}
 """
 
 import asyncio
 import hashlib
 import zipfile
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import httpx
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
 from app.db.models import CrawlJobModel
+from app.jobs.common import checkpoint_downloads, get_checkpoint
 from app.jobs.steps.base import BaseStep, StepError
+from app.services.document_store import DocumentStore, get_document_store
+from app.services.domain_throttle import crawl_event_hooks
+from app.services.http_cache import CachedResponse, HttpCache, get_http_cache
 
 logger = structlog.get_logger()
 
@@ -50,9 +61,21 @@ MAGIC_BYTES = {
 }
 
 
+@dataclass
+class FetchedFile:
+    """Outcome of a single (possibly conditional) download."""
+
+    content: bytes = b""
+    content_type: str = ""
+    size: int = 0
+    not_modified: bool = False  # Server answered 304 to our validators
+    headers: dict[str, str] = field(default_factory=dict)
+
+
 class DownloadStep(BaseStep):
     label = "Downloading"
     description = "Downloading candidate files to local storage..."
+    checkpoint_key = "download"
 
     async def run(self, db: AsyncSession, job: CrawlJobModel) -> str:
         ctx = job.context or {}
@@ -86,17 +109,11 @@ class DownloadStep(BaseStep):
         if not candidates:
             raise StepError("No candidate URLs to download - discovery step may have failed")
 
-        # Build save directory (path traversal protection)
-        base_dir = Path(settings.storage_path) / "bulk-data"
-        save_dir = base_dir / dno_slug
-        if not save_dir.resolve().is_relative_to(base_dir.resolve()):
-            raise StepError(f"Invalid slug for path construction: {dno_slug}")
-        save_dir.mkdir(parents=True, exist_ok=True)
+        store = get_document_store()
 
         # Merge with existing downloads (for multi-pass crawls)
         existing_files = ctx.get("downloaded_files", [])
         existing_urls = {f["url"] for f in existing_files}
-        start_idx = len(existing_files)
 
         # Build registry lookup for cross-run file reuse
         prior_downloads = ctx.get("prior_downloads", [])
@@ -104,23 +121,31 @@ class DownloadStep(BaseStep):
         for entry in prior_downloads:
             registry_by_url_hash[entry["url_hash"]] = entry
 
-        downloaded: list[dict] = []
+        http_cache = get_http_cache()
+
+        # Files fetched before this step was interrupted (job resumed from checkpoint)
+        downloaded: list[dict] = list(get_checkpoint(job).get("downloads", []))
+        if downloaded:
+            log.info("download_resumed", already_downloaded=len(downloaded))
+        done_urls = existing_urls | {f["url"] for f in downloaded}
         reused = 0
-        content_hashes_seen: set[str] = set()  # SHA-256 hashes for content dedup
-        total_bytes = sum(f.get("size_bytes", 0) for f in existing_files)
+        revalidated = 0
+        # SHA-256 hashes for content dedup
+        content_hashes_seen = {f["content_hash"] for f in downloaded if f.get("content_hash")}
+        total_bytes = sum(f.get("size_bytes", 0) for f in existing_files + downloaded)
         failed = 0
 
         async with httpx.AsyncClient(
             timeout=httpx.Timeout(connect=10.0, read=60.0, write=10.0, pool=10.0),
             follow_redirects=True,
             limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            event_hooks=crawl_event_hooks(),
         ) as client:
-            for i, candidate in enumerate(candidates[:MAX_FILES]):
+            for candidate in candidates[:MAX_FILES]:
                 url = candidate["url"]
-                idx = start_idx + i
 
-                # Skip URLs already downloaded in a previous pass
-                if url in existing_urls:
+                # Skip URLs already downloaded in a previous pass or attempt
+                if url in done_urls:
                     continue
 
                 # Check download registry: reuse file if it still exists on disk
@@ -135,6 +160,7 @@ class DownloadStep(BaseStep):
                                 "format": registry_entry.get("file_format", "pdf"),
                                 "url": url,
                                 "size_bytes": existing_path.stat().st_size,
+                                "content_hash": registry_entry.get("file_hash"),
                                 "source": "registry",
                             }
                         )
@@ -146,13 +172,44 @@ class DownloadStep(BaseStep):
                     log.warning("total_size_limit_reached", total_bytes=total_bytes)
                     break
 
+                cache_entry = await http_cache.get(url)
+                if cache_entry and not self._is_blob_entry(cache_entry, store):
+                    cache_entry = None
+
                 try:
-                    content, content_type, file_size = await self._stream_download(client, url, log)
+                    fetched = await self._stream_download(
+                        client, url, log, headers=HttpCache.conditional_headers(cache_entry)
+                    )
                 except Exception as e:
                     log.warning("download_failed", url=url[:80], error=str(e))
                     failed += 1
                     continue
 
+                # Unchanged since last crawl: reuse the copy saved back then
+                if fetched.not_modified and cache_entry:
+                    if cache_entry.content_hash in content_hashes_seen:
+                        continue
+                    if cache_entry.content_hash:
+                        content_hashes_seen.add(cache_entry.content_hash)
+                    downloaded.append(
+                        {
+                            "path": cache_entry.body_path,
+                            "format": cache_entry.file_format
+                            or self._detect_format_from_url(cache_entry.body_path),
+                            "url": url,
+                            "size_bytes": cache_entry.size_bytes,
+                            "content_hash": cache_entry.content_hash,
+                            "source": "http_cache",
+                        }
+                    )
+                    revalidated += 1
+                    log.debug("file_not_modified", url=url[:60])
+                    checkpoint_downloads(job, downloaded)
+                    await db.commit()
+                    continue
+
+                content = fetched.content
+                file_size = fetched.size
                 if not content:
                     failed += 1
                     continue
@@ -160,20 +217,15 @@ class DownloadStep(BaseStep):
                 total_bytes += file_size
 
                 # Detect format
-                file_format = self._detect_format(content, content_type, url)
+                file_format = self._detect_format(content, fetched.content_type, url)
                 ext = self._format_to_ext(file_format)
 
                 # Strip HTML at download time to remove scripts, nav, styles, etc.
                 if file_format == "html":
                     content = self._strip_html(content)
 
-                # Build filename: {slug}_{index}_{url_hash}.{ext}
-                url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-                filename = f"{dno_slug}_{idx:02d}_{url_hash}.{ext}"
-                save_path = save_dir / filename
-
-                # Compute content hash for deduplication
-                content_hash = hashlib.sha256(content).hexdigest()
+                # Save as blob (no-op if this content is already stored)
+                content_hash, save_path = await store.put(content, ext)
 
                 # Skip duplicate content (same file at different URL)
                 if content_hash in content_hashes_seen:
@@ -181,8 +233,13 @@ class DownloadStep(BaseStep):
                     continue
                 content_hashes_seen.add(content_hash)
 
-                # Save file
-                await asyncio.to_thread(save_path.write_bytes, content)
+                await http_cache.store(
+                    url,
+                    fetched.headers,
+                    body_path=save_path,
+                    file_format=file_format,
+                    content_hash=content_hash,
+                )
 
                 downloaded.append(
                     {
@@ -199,11 +256,15 @@ class DownloadStep(BaseStep):
                     url=url[:60],
                     format=file_format,
                     size_kb=file_size // 1024,
-                    index=idx,
+                    hash=content_hash[:12],
                 )
 
+                # Checkpoint after every fetch so a resumed job skips this file
+                checkpoint_downloads(job, downloaded)
+                await db.commit()
+
         # Extract files from downloaded ZIPs and replace ZIP entries
-        extracted_from_zips = await self._extract_zips(downloaded, save_dir, dno_slug, log)
+        extracted_from_zips = await self._extract_zips(downloaded, store, log)
         if extracted_from_zips:
             downloaded = extracted_from_zips
 
@@ -217,9 +278,11 @@ class DownloadStep(BaseStep):
                 f"Tried {len(candidates[:MAX_FILES])} candidates."
             )
 
-        parts = [f"Downloaded {len(downloaded) - reused} files"]
+        parts = [f"Downloaded {len(downloaded) - reused - revalidated} files"]
         if reused:
             parts.append(f"reused {reused} from registry")
+        if revalidated:
+            parts.append(f"{revalidated} unchanged (304)")
         parts.append(f"{total_bytes // 1024} KB total")
         if failed:
             parts.append(f"{failed} failed")
@@ -231,23 +294,34 @@ class DownloadStep(BaseStep):
         url: str,
         log: structlog.stdlib.BoundLogger,
         max_retries: int = 2,
-    ) -> tuple[bytes, str, int]:
-        """Stream download with size limit and retries."""
+        headers: dict[str, str] | None = None,
+    ) -> FetchedFile:
+        """Stream download with size limit and retries.
+
+        Args:
+            headers: Extra request headers, e.g. conditional validators from the HTTP cache
+
+        Returns:
+            FetchedFile; empty content on failure, not_modified=True on 304
+        """
         from app.services.retry_utils import RETRYABLE_EXCEPTIONS
 
         last_error = None
 
         for attempt in range(1, max_retries + 1):
             try:
-                async with client.stream("GET", url) as response:
+                async with client.stream("GET", url, headers=headers) as response:
                     if response.status_code == 429:
                         retry_after = response.headers.get("retry-after", "5")
                         wait_time = min(float(retry_after), 15.0)
                         await asyncio.sleep(wait_time)
                         continue
 
+                    if response.status_code == 304:
+                        return FetchedFile(not_modified=True, headers=dict(response.headers))
+
                     if response.status_code >= 400:
-                        return b"", "", 0
+                        return FetchedFile()
 
                     response.raise_for_status()
 
@@ -256,7 +330,7 @@ class DownloadStep(BaseStep):
 
                     if content_length and int(content_length) > MAX_FILE_SIZE:
                         log.debug("file_too_large", url=url[:60], size=content_length)
-                        return b"", "", 0
+                        return FetchedFile()
 
                     chunks = []
                     total_size = 0
@@ -264,10 +338,15 @@ class DownloadStep(BaseStep):
                         total_size += len(chunk)
                         if total_size > MAX_FILE_SIZE:
                             log.debug("file_too_large_streaming", url=url[:60])
-                            return b"", "", 0
+                            return FetchedFile()
                         chunks.append(chunk)
 
-                    return b"".join(chunks), content_type, total_size
+                    return FetchedFile(
+                        content=b"".join(chunks),
+                        content_type=content_type,
+                        size=total_size,
+                        headers=dict(response.headers),
+                    )
 
             except RETRYABLE_EXCEPTIONS as e:
                 last_error = e
@@ -279,11 +358,16 @@ class DownloadStep(BaseStep):
                     await asyncio.sleep(0.5 * (2 ** (attempt - 1)))
                     last_error = e
                     continue
-                return b"", "", 0
+                return FetchedFile()
 
         if last_error:
             raise last_error
-        return b"", "", 0
+        return FetchedFile()
+
+    @staticmethod
+    def _is_blob_entry(entry: CachedResponse, store: DocumentStore) -> bool:
+        """Whether a 304 for `entry` can reuse a document store blob."""
+        return bool(entry.content_hash and entry.file_format and store.holds(entry.body_path))
 
     @staticmethod
     def _strip_html(content: bytes) -> bytes:
@@ -300,14 +384,14 @@ class DownloadStep(BaseStep):
     async def _extract_zips(
         self,
         downloaded: list[dict],
-        save_dir: Path,
-        dno_slug: str,
+        store: DocumentStore,
         log: structlog.stdlib.BoundLogger,
     ) -> list[dict]:
         """Extract relevant files from downloaded ZIPs.
 
         Replaces ZIP entries in the downloaded list with their extracted
-        contents (PDFs, XLSX, HTML). Non-ZIP entries are kept as-is.
+        contents (PDFs, XLSX, HTML), each stored as its own blob. Non-ZIP
+        entries are kept as-is. The ZIP blob itself stays in the store.
         """
         # Relevant extensions inside ZIPs
         extract_exts = {".pdf", ".xlsx", ".xls", ".html", ".htm", ".csv"}
@@ -330,9 +414,6 @@ class DownloadStep(BaseStep):
 
                 for member_name in members:
                     file_format = self._detect_format_from_url(member_name)
-                    safe_name = Path(member_name).name.replace(" ", "_")
-                    dest_name = f"{dno_slug}_zip_{extracted_count:02d}_{safe_name}"
-                    dest_path = save_dir / dest_name
 
                     content = await asyncio.to_thread(self._read_zip_member, zip_path, member_name)
                     if not content:
@@ -342,9 +423,9 @@ class DownloadStep(BaseStep):
                     if file_format == "html":
                         content = self._strip_html(content)
 
-                    await asyncio.to_thread(dest_path.write_bytes, content)
-
-                    content_hash = hashlib.sha256(content).hexdigest()
+                    content_hash, dest_path = await store.put(
+                        content, self._format_to_ext(file_format)
+                    )
                     result.append(
                         {
                             "path": str(dest_path),
@@ -364,9 +445,6 @@ class DownloadStep(BaseStep):
                     members_extracted=len(members),
                 )
 
-                # Remove the ZIP file after extraction
-                await asyncio.to_thread(zip_path.unlink, missing_ok=True)
-
             except Exception as e:
                 log.warning("zip_extraction_failed", file=zip_path.name, error=str(e))
                 result.append(entry)
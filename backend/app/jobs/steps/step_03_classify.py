@@ -6,6 +6,8 @@ on all downloaded files to identify which contain netzentgelte and/or hlzf data.
 
 Algorithm:
 1. For each downloaded file, run netzentgelte and hlzf extractors
+   (results are memoized per content hash + year in the document store, so
+   content already classified for another URL, DNO or run is not re-parsed)
 2. Record extraction results (record count, pass/fail) per type
 3. Pick best candidate per type (highest valid record count)
 4. Move winning files from bulk-data/ to downloads/ with canonical naming
@@ -30,13 +32,25 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.db.models import CrawlJobModel, DownloadRegistryModel
 from app.jobs.steps.base import BaseStep
+from app.services.document_store import get_document_store, hash_file
+from app.services.extraction.page_index import (
+    HLZF_KEYWORDS,
+    NETZENTGELTE_KEYWORDS,
+    VOLTAGE_LEVEL_KEYWORDS,
+)
+from app.services.extraction.parse_pool import run_parser
+from app.services.keyword_matcher import keyword_matcher
 
 logger = structlog.get_logger()
 
+# Bump when extractors or keyword heuristics change to invalidate memoized results
+CLASSIFY_RESULT_VERSION = 3
+
 
 class ClassifyStep(BaseStep):
     label = "Classifying Documents"
     description = "Running regex extractors to identify data in downloaded documents..."
+    checkpoint_key = "classify"
 
     async def run(self, db: AsyncSession, job: CrawlJobModel) -> str:
         ctx = job.context or {}
@@ -55,6 +69,10 @@ class ClassifyStep(BaseStep):
         best: dict[str, dict] = {}  # {data_type: {path, format, record_count, source_url}}
         unclassified: list[dict] = []
 
+        store = get_document_store()
+        result_key = f"classify:v{CLASSIFY_RESULT_VERSION}:{job.year}"
+        memo_hits = 0
+
         for file_info in downloaded_files:
             file_path = Path(file_info["path"])
             file_format = file_info["format"]
@@ -64,25 +82,23 @@ class ClassifyStep(BaseStep):
                 log.warning("classify_file_missing", path=str(file_path))
                 continue
 
-            # Extract text once — reused for year detection and keyword fallback
-            file_text = await self._extract_text(file_path, file_format, db)
-
-            # Detect year from file content
-            detected_year = self._detect_year_from_text(file_text, file_format)
-
-            # Run extractors on this file
-            netz_count = await self._try_netzentgelte(file_path, file_format, job.year)
-            hlzf_count = await self._try_hlzf(file_path, file_format, job.year)
+            # Same content already classified for this year → reuse the result
+            content_hash = file_info.get("content_hash") or await asyncio.to_thread(
+                hash_file, file_path
+            )
+            analysis = await store.get_result(content_hash, result_key)
+            if analysis is None:
+                analysis, cacheable = await self._analyze_file(file_path, file_format, job.year, db)
+                if cacheable:
+                    await store.set_result(content_hash, result_key, analysis)
+            else:
+                memo_hits += 1
 
-            # Keyword fallback: if regex extraction failed, check if the
-            # file content strongly matches the expected data type so the
-            # AI extractor in step 04 gets a chance to process it.
-            netz_keyword = False
-            hlzf_keyword = False
-            if netz_count < 2:
-                netz_keyword = self._keyword_match_netzentgelte(file_text)
-            if hlzf_count < 2:
-                hlzf_keyword = self._keyword_match_hlzf(file_text)
+            detected_year = analysis["detected_year"]
+            netz_count = analysis["netz_count"]
+            hlzf_count = analysis["hlzf_count"]
+            netz_keyword = analysis["netz_keyword"]
+            hlzf_keyword = analysis["hlzf_keyword"]
 
             log.debug(
                 "classify_result",
@@ -151,6 +167,9 @@ class ClassifyStep(BaseStep):
                     }
                 )
 
+        if memo_hits:
+            log.info("classify_memo_hits", reused=memo_hits, files=len(downloaded_files))
+
         # Cross-type dedup: if the same file path won for both netzentgelte
         # and hlzf (same year suffix), keep only the type with the higher
         # record count.  A genuine HLZF document is 1-2 pages with time
@@ -241,6 +260,42 @@ class ClassifyStep(BaseStep):
 
         return f"No data found in {len(downloaded_files)} files"
 
+    async def _analyze_file(
+        self, file_path: Path, file_format: str, year: int, db: AsyncSession
+    ) -> tuple[dict, bool]:
+        """Run the regex extractors and keyword heuristics on one file.
+
+        Returns:
+            Tuple of (analysis, cacheable). The analysis dict holds
+            detected_year, netz_count, hlzf_count, netz_keyword and hlzf_keyword.
+            A PDF that still has almost no text (scanned, OCR unavailable) is
+            not cacheable so a later run can retry the OCR, and neither is a
+            file whose extractor raised (parse timeout, crashed parser process,
+            memory cap): its zero count may be transient.
+        """
+        # Extract text once — reused for year detection and keyword fallback
+        file_text = await self._extract_text(file_path, file_format, db)
+
+        # Run extractors on this file
+        netz_result = await self._try_netzentgelte(file_path, file_format, year)
+        hlzf_result = await self._try_hlzf(file_path, file_format, year)
+        extractor_failed = netz_result is None or hlzf_result is None
+        netz_count = netz_result or 0
+        hlzf_count = hlzf_result or 0
+
+        # Keyword fallback: if regex extraction failed, check if the
+        # file content strongly matches the expected data type so the
+        # AI extractor in step 04 gets a chance to process it.
+        analysis = {
+            "detected_year": self._detect_year_from_text(file_text, file_format),
+            "netz_count": netz_count,
+            "hlzf_count": hlzf_count,
+            "netz_keyword": netz_count < 2 and self._keyword_match_netzentgelte(file_text),
+            "hlzf_keyword": hlzf_count < 2 and self._keyword_match_hlzf(file_text),
+        }
+        cacheable = not extractor_failed and (file_format != "pdf" or len(file_text.strip()) >= 100)
+        return analysis, cacheable
+
     @staticmethod
     def _format_priority(fmt: str) -> int:
         """Return a priority score for file formats. PDFs are preferred."""
@@ -369,6 +424,15 @@ class ClassifyStep(BaseStep):
                     "hlzf_records": uc.get("hlzf_records", 0),
                 }
 
+            update_values = {
+                "classification": classification,
+                "classification_detail": detail or None,
+                "crawl_job_id": job_id,
+                "file_path": file_path,
+            }
+            if file_info.get("content_hash"):
+                update_values["file_hash"] = file_info["content_hash"]
+
             stmt = (
                 pg_insert(DownloadRegistryModel)
                 .values(
@@ -386,12 +450,7 @@ class ClassifyStep(BaseStep):
                 )
                 .on_conflict_do_update(
                     index_elements=["dno_id", "url_hash"],
-                    set_={
-                        "classification": classification,
-                        "classification_detail": detail or None,
-                        "crawl_job_id": job_id,
-                        "file_path": file_path,
-                    },
+                    set_=update_values,
                 )
             )
             await db.execute(stmt)
@@ -412,13 +471,10 @@ class ClassifyStep(BaseStep):
         """
         try:
             if file_format == "pdf":
-                import pdfplumber
+                from app.services.extraction.pdf_text_cache import get_page_texts
 
-                def _read_all_pages():
-                    with pdfplumber.open(file_path) as pdf:
-                        return "\n".join(page.extract_text() or "" for page in pdf.pages)
-
-                text = await asyncio.to_thread(_read_all_pages)
+                pages = await run_parser(get_page_texts, file_path)
+                text = "\n".join(pages)
 
                 # If pdfplumber got very little text, the PDF is likely scanned
                 if len(text.strip()) < 100 and db is not None:
@@ -524,29 +580,17 @@ class ClassifyStep(BaseStep):
         if not text:
             return False
 
-        text_lower = text.lower()
         # Check title area for strong keywords to avoid false positives from
         # documents that mention "Hochlast" deep in unrelated content.
-        title_area = text_lower[:500]
+        title_area = text[:500]
 
         # Must contain at least one strong HLZF keyword in title area
-        hlzf_keywords = [
-            "hochlastzeitfenster",
-            "hochlastzeit",
-            "atypische netznutzung",
-        ]
-        if not any(kw in title_area for kw in hlzf_keywords):
+        if not keyword_matcher(HLZF_KEYWORDS).matches_any(title_area):
             return False
 
         # Must contain voltage level references
-        vl_keywords = [
-            "mittelspannung",
-            "niederspannung",
-            "hochspannung",
-            "umspannung",
-        ]
         # Also check for standalone abbreviations with word boundaries
-        has_vl = any(kw in text_lower for kw in vl_keywords)
+        has_vl = keyword_matcher(VOLTAGE_LEVEL_KEYWORDS).matches_any(text)
         if not has_vl:
             has_vl = bool(re.search(r"\b(?:MS|NS|HS)(?:/(?:MS|NS|HS))?\b", text))
         if not has_vl:
@@ -568,11 +612,10 @@ class ClassifyStep(BaseStep):
         if not text:
             return False
 
-        text_lower = text.lower()
         # Check title area for strong keywords to avoid false positives from
         # documents like "Ergaenzende Bedingungen" or "Allgemeine Bedingungen"
         # that mention voltage levels and prices but are not tariff sheets.
-        title_area = text_lower[:500]
+        title_area = text[:500].lower()
 
         # Reject documents that are NOT standard netzentgelte even though
         # they contain "netzentgelt" in the title.
@@ -581,27 +624,17 @@ class ClassifyStep(BaseStep):
             return False
 
         # Must contain at least one strong Netzentgelte keyword in title area
-        netz_keywords = [
-            "netzentgelt",
-            "netznutzungsentgelt",
-            "leistungspreis",
-            "arbeitspreis",
-        ]
         # Also accept "preisblatt" but only when combined with a grid keyword
         has_preisblatt = "preisblatt" in title_area and any(
             kw in title_area for kw in ("netz", "strom", "entgelt")
         )
-        if not has_preisblatt and not any(kw in title_area for kw in netz_keywords):
+        if not has_preisblatt and not keyword_matcher(NETZENTGELTE_KEYWORDS).matches_any(
+            title_area
+        ):
             return False
 
         # Must contain voltage level references
-        vl_keywords = [
-            "mittelspannung",
-            "niederspannung",
-            "hochspannung",
-            "umspannung",
-        ]
-        has_vl = any(kw in text_lower for kw in vl_keywords)
+        has_vl = keyword_matcher(VOLTAGE_LEVEL_KEYWORDS).matches_any(text)
         if not has_vl:
             has_vl = bool(re.search(r"\b(?:MS|NS|HS)(?:/(?:MS|NS|HS))?\b", text))
         if not has_vl:
@@ -611,13 +644,13 @@ class ClassifyStep(BaseStep):
         price_hits = re.findall(r"\d{1,3}[,.]\d{1,4}", text)
         return len(price_hits) >= 4
 
-    async def _try_netzentgelte(self, file_path: Path, file_format: str, year: int) -> int:
-        """Try extracting netzentgelte data, return valid record count."""
+    async def _try_netzentgelte(self, file_path: Path, file_format: str, year: int) -> int | None:
+        """Try extracting netzentgelte data, return valid record count (None if it raised)."""
         try:
             if file_format == "pdf":
                 from app.services.extraction.pdf_extractor import extract_netzentgelte_from_pdf
 
-                records = await asyncio.to_thread(extract_netzentgelte_from_pdf, file_path)
+                records = await run_parser(extract_netzentgelte_from_pdf, file_path)
             elif file_format in ("html", "htm"):
                 # No HTML parser for netzentgelte yet, return 0
                 return 0
@@ -639,10 +672,10 @@ class ClassifyStep(BaseStep):
             return valid
         except Exception as e:
             logger.debug("netzentgelte_extract_failed", file=file_path.name, error=str(e))
-            return 0
+            return None
 
-    async def _try_hlzf(self, file_path: Path, file_format: str, year: int) -> int:
-        """Try extracting hlzf data, return valid record count.
+    async def _try_hlzf(self, file_path: Path, file_format: str, year: int) -> int | None:
+        """Try extracting hlzf data, return valid record count (None if it raised).
 
         For multi-year PDFs (records tagged with 'year'), counts only records
         matching the target year to avoid inflated scores vs single-year files.
@@ -651,7 +684,7 @@ class ClassifyStep(BaseStep):
             if file_format == "pdf":
                 from app.services.extraction.pdf_extractor import extract_hlzf_from_pdf
 
-                records = await asyncio.to_thread(extract_hlzf_from_pdf, file_path)
+                records = await run_parser(extract_hlzf_from_pdf, file_path)
             elif file_format in ("html", "htm"):
                 from app.services.extraction.html_extractor import extract_hlzf_from_html
 
@@ -670,7 +703,7 @@ class ClassifyStep(BaseStep):
             return len(records)
         except Exception as e:
             logger.debug("hlzf_extract_failed", file=file_path.name, error=str(e))
-            return 0
+            return None
 
     @staticmethod
     def _is_valid_value(v) -> bool:
@@ -4,7 +4,8 @@ Step 04: Extract Data
 Extracts structured data from downloaded files.
 
 Strategy (Regex-First with AI Fallback):
-1. Try regex/HTML extraction first (cheaper, works for most documents)
+1. Try regex/HTML extraction first (cheaper, works for most documents;
+   memoized per content hash in the document store)
 2. Run sanity check on extracted data:
    - Netzentgelte: ≥3 records with at least leistung OR arbeit non-null
    - HLZF: ≥1 record with winter non-null
@@ -34,12 +35,17 @@ from sqlalchemy.orm.attributes import flag_modified
 
 from app.db.models import CrawlJobModel
 from app.jobs.steps.base import BaseStep
+from app.services.document_store import get_document_store, hash_file
+from app.services.extraction.parse_pool import run_parser
 from app.services.extraction.prompts import build_extraction_prompt
 from app.services.extraction.validation import validate_extraction_sanity
 from app.services.sample_capture import SampleCapture
 
 logger = structlog.get_logger()
 
+# Bump when the regex/HTML extractors change to invalidate memoized records
+EXTRACT_RESULT_VERSION = 3
+
 
 class ExtractStep(BaseStep):
     label = "Extracting Data"
@@ -73,7 +79,9 @@ class ExtractStep(BaseStep):
             file_format=file_format,
         )
 
-        records, method = await self._extract_fallback(path, file_format, job.data_type, job.year)
+        records, method = await self._extract_regex_memoized(
+            path, file_format, job.data_type, job.year
+        )
         passed, reason = self._validate_extraction(records, job.data_type)
 
         if passed:
@@ -426,6 +434,23 @@ class ExtractStep(BaseStep):
 
         return metadata
 
+    async def _extract_regex_memoized(
+        self, file_path: Path, file_format: str, data_type: str, year: int
+    ) -> tuple[list, str]:
+        """Regex/HTML extraction, reusing records already extracted from identical content."""
+        store = get_document_store()
+        content_hash = await asyncio.to_thread(hash_file, file_path)
+        result_key = f"extract:v{EXTRACT_RESULT_VERSION}:{data_type}:{year}"
+
+        cached = await store.get_result(content_hash, result_key)
+        if cached is not None:
+            logger.info("regex_extraction_memo_hit", file=file_path.name, hash=content_hash[:12])
+            return cached["records"], cached["method"]
+
+        records, method = await self._extract_fallback(file_path, file_format, data_type, year)
+        await store.set_result(content_hash, result_key, {"records": records, "method": method})
+        return records, method
+
     async def _extract_fallback(
         self, file_path: Path, file_format: str, data_type: str, year: int
     ) -> tuple[list, str]:
@@ -453,9 +478,9 @@ class ExtractStep(BaseStep):
         )
 
         if data_type == "netzentgelte":
-            records = await asyncio.to_thread(extract_netzentgelte_from_pdf, file_path)
+            records = await run_parser(extract_netzentgelte_from_pdf, file_path)
         else:  # hlzf
-            records = await asyncio.to_thread(extract_hlzf_from_pdf, file_path)
+            records = await run_parser(extract_hlzf_from_pdf, file_path)
 
         return records, "pdf_regex"
 
@@ -8,6 +8,7 @@ What it does:
 - Save provenance to DataSourceModel
 - Update DNOSourceProfile with what worked (for learning)
 - Record successful URL patterns in CrawlPathPatternModel
+- Invalidate cached public search responses for the DNO
 - Mark job as completed
 
 Learning updates:
@@ -36,6 +37,7 @@ from app.core.constants import normalize_voltage_level
 from app.db.models import CrawlJobModel, DNOSourceProfile, HLZFModel, NetzentgelteModel
 from app.jobs.steps.base import BaseStep
 from app.services.pattern_learner import PatternLearner
+from app.services.search_cache import invalidate_search_cache
 
 logger = structlog.get_logger()
 
@@ -126,6 +128,9 @@ class FinalizeStep(BaseStep):
 
         await db.commit()
 
+        if saved_count:
+            await invalidate_search_cache(job.dno_id)
+
         # Determine source description for message
         # Priority: found_url > dno_name > file path > "cache"
         source = ctx.get("found_url")
@@ -0,0 +1,149 @@
+"""
+AI Request Batching
+
+Coalesces small text extractions that arrive close together (concurrent
+extract jobs in one worker) into a single provider call. The first request
+for a provider config opens a batch and waits up to ai_batch_window_seconds
+for more; the batch is sent when the window closes or ai_batch_max_items
+requests have joined. Every caller gets its own result back.
+
+Batching trades a little latency for fewer provider requests, which is what
+per-minute rate limits count. It is off by default (ai_batch_max_items = 1).
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+# (content, prompt) of one text extraction
+BatchItem = tuple[str, str]
+
+# Sends a batch; returns one result (or exception) per item, in order
+BatchRunner = Callable[[list[BatchItem]], Awaitable[list[Any]]]
+
+
+class BatchItemError(Exception):
+    """The batched response had no usable result for this item."""
+
+
+@dataclass
+class _PendingBatch:
+    items: list[BatchItem] = field(default_factory=list)
+    futures: list[asyncio.Future] = field(default_factory=list)
+    chars: int = 0
+    full: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class TextBatcher:
+    """Groups concurrent text extractions per provider into batched calls."""
+
+    def __init__(self, max_items: int, window_seconds: float, max_chars: int):
+        """
+        Initialize the batcher.
+
+        Args:
+            max_items: Requests per batch
+            window_seconds: How long an open batch waits for more requests
+            max_chars: Largest text that is batched (batches hold at most
+                max_items * max_chars characters)
+        """
+        self.max_items = max_items
+        self.window_seconds = window_seconds
+        self.max_chars = max_chars
+        self._open: dict[Hashable, _PendingBatch] = {}
+        self.log = logger.bind(component="TextBatcher")
+
+    def accepts(self, content: str) -> bool:
+        """Whether a text is small enough to be batched."""
+        return len(content) <= self.max_chars
+
+    async def submit(self, key: Hashable, content: str, prompt: str, run: BatchRunner) -> Any:
+        """Add a request to the open batch for `key` and wait for its result.
+
+        Args:
+            key: Batches are formed per key (the provider config)
+            content: Text to extract from
+            prompt: Extraction prompt for this text
+            run: Sends the batch; used if this request opens the batch
+
+        Raises:
+            BatchItemError: The batch response had no result for this item
+            Exception: Whatever `run` raised for the whole batch
+        """
+        batch = self._open.get(key)
+        leader = batch is None
+        if leader:
+            batch = _PendingBatch()
+            self._open[key] = batch
+
+        future = asyncio.get_running_loop().create_future()
+        batch.items.append((content, prompt))
+        batch.futures.append(future)
+        batch.chars += len(content)
+
+        if len(batch.items) >= self.max_items or batch.chars >= self.max_chars * self.max_items:
+            self._close(key, batch)
+
+        if leader:
+            await self._send(key, batch, run)
+        return await future
+
+    def _close(self, key: Hashable, batch: _PendingBatch) -> None:
+        """Stop new requests from joining `batch`."""
+        if self._open.get(key) is batch:
+            del self._open[key]
+        batch.full.set()
+
+    async def _send(self, key: Hashable, batch: _PendingBatch, run: BatchRunner) -> None:
+        try:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(batch.full.wait(), timeout=self.window_seconds)
+            self._close(key, batch)
+
+            if len(batch.items) > 1:
+                self.log.info("ai_batch_sending", key=str(key), size=len(batch.items))
+            results = await run(batch.items)
+            for future, result in zip(batch.futures, results, strict=False):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        except BaseException as e:
+            self._close(key, batch)
+            error = e if isinstance(e, Exception) else BatchItemError("Batch was cancelled")
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(error)
+            if not isinstance(e, Exception):
+                raise
+        finally:
+            # Items the runner returned nothing for
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(BatchItemError("No result in batch response"))
+
+
+# Created lazily when batching is enabled
+_text_batcher: TextBatcher | None = None
+
+
+def get_text_batcher() -> TextBatcher | None:
+    """Process-wide text batcher, or None if batching is disabled."""
+    from app.core.config import settings
+
+    global _text_batcher
+    if settings.ai_batch_max_items <= 1:
+        return None
+    if _text_batcher is None:
+        _text_batcher = TextBatcher(
+            max_items=settings.ai_batch_max_items,
+            window_seconds=settings.ai_batch_window_seconds,
+            max_chars=settings.ai_batch_max_chars,
+        )
+    return _text_batcher
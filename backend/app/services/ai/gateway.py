@@ -5,8 +5,11 @@ Main entry point for AI extraction with:
 - Multi-provider support (OpenRouter, LiteLLM, Custom)
 - Smart fallback on rate limits
 - Health tracking
+- Response cache keyed by (content hash, prompt hash, model, mode, pages sent)
+- Optional batching of small text extractions (fewer provider requests)
 """
 
+import asyncio
 import base64
 import io
 from pathlib import Path
@@ -17,9 +20,12 @@ from openai import RateLimitError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import AIProviderConfigModel
+from app.services.ai.batching import BatchItemError, get_text_batcher
 from app.services.ai.config_service import AIConfigService
 from app.services.ai.providers import PROVIDER_REGISTRY
 from app.services.ai.providers.base import BaseProvider
+from app.services.ai.response_cache import AIResponseCache, get_ai_response_cache, text_hash
+from app.services.document_store import hash_file
 
 logger = structlog.get_logger()
 
@@ -39,6 +45,10 @@ VISION_EXTENSIONS = {".pdf", ".png", ".jpg", ".jpeg", ".gif", ".webp"}
 # File extensions for text mode
 TEXT_EXTENSIONS = {".html", ".htm", ".txt", ".csv", ".xml"}
 
+# Version of the PDF page stripping, part of the response cache key: bump it
+# when the page selection (page_index keywords and rules) or stripping changes
+PDF_STRIP_VERSION = 1
+
 
 class NoProviderAvailableError(Exception):
     """Raised when no AI provider is available."""
@@ -46,6 +56,23 @@ class NoProviderAvailableError(Exception):
     pass
 
 
+def _pdf_variant(keep: list[int] | None) -> str:
+    """Response cache variant of a PDF payload: strip version and the pages sent."""
+    pages = ",".join(str(page) for page in keep) if keep else "all"
+    return f"strip-v{PDF_STRIP_VERSION}:{pages}"
+
+
+def _pdf_variants(keep: list[int] | None) -> tuple[str, ...]:
+    """Variants a response for this PDF may be cached under, preferred first.
+
+    When stripping the `keep` pages failed, the whole PDF was sent and the
+    response was stored under the "all" variant instead.
+    """
+    if not keep:
+        return (_pdf_variant(None),)
+    return (_pdf_variant(keep), _pdf_variant(None))
+
+
 class AIGateway:
     """Main AI extraction gateway.
 
@@ -154,33 +181,57 @@ class AIGateway:
                 "No AI providers configured. Add a provider in Admin → AI Configuration."
             )
 
-        last_error = None
+        # For PDFs, only pages with data-relevant keywords are sent
+        keep = (
+            await asyncio.to_thread(self._pdf_pages_to_keep, file_path)
+            if suffix == ".pdf"
+            else None
+        )
+
+        # Same document, pages, prompt and model as an earlier call → reuse its response
+        mode = "text" if suffix in TEXT_EXTENSIONS else "vision"
+        variants = _pdf_variants(keep) if suffix == ".pdf" else ("",)
+        variant = variants[0]
+        cache = get_ai_response_cache()
+        content_hash = await asyncio.to_thread(hash_file, file_path) if cache else None
+        cached = await self._cached_response(cache, configs, content_hash, prompt, mode, variants)
+        if cached is not None:
+            return cached
 
-        # For PDFs, strip irrelevant pages before sending to AI
-        pdf_bytes = None
-        if suffix == ".pdf":
-            pdf_bytes = self._strip_pdf_pages(file_path)
+        last_error = None
+        content = None
+        image_data = None
+
+        if suffix in TEXT_EXTENSIONS:
+            content = file_path.read_text(encoding="utf-8", errors="replace")
+        else:
+            pdf_bytes = (
+                await asyncio.to_thread(self._strip_pdf_pages, file_path, keep) if keep else None
+            )
+            if keep and pdf_bytes is None:
+                variant = _pdf_variant(None)  # Stripping failed, the whole PDF is sent
+            raw = pdf_bytes if pdf_bytes is not None else file_path.read_bytes()
+            image_data = base64.b64encode(raw).decode()
+        mime_type = MIME_TYPES.get(suffix, "application/octet-stream")
 
         for config in configs:
             try:
                 provider = self._create_provider(config)
 
-                if suffix in TEXT_EXTENSIONS:
-                    # Text mode
-                    content = file_path.read_text(encoding="utf-8", errors="replace")
-                    result = await provider.extract_text(content, prompt)
+                if content is not None:
+                    # Text mode (may be batched with other small texts)
+                    result = await self._provider_extract_text(provider, config, content, prompt)
                 else:
-                    # Vision mode — use stripped PDF if available
-                    raw = pdf_bytes if pdf_bytes is not None else file_path.read_bytes()
-                    image_data = base64.b64encode(raw).decode()
-                    mime_type = MIME_TYPES.get(suffix, "application/octet-stream")
+                    # Vision mode — stripped PDF if available
                     result = await provider.extract_vision(image_data, mime_type, prompt)
 
                 # Mark success
-                tokens = result.get("_extraction_meta", {}).get("usage", {}).get("total_tokens", 0)
-                await self.config_service.mark_success(config.id, tokens)
+                await self.config_service.mark_success(config.id, self._tokens_used(result))
                 await self.db.commit()
 
+                await self._store_response(
+                    cache, content_hash, prompt, config.model, mode, result, variant
+                )
                 return result
 
             except RateLimitError as e:
@@ -215,48 +266,114 @@ class AIGateway:
         raise NoProviderAvailableError(f"All providers failed. Last error: {last_error}")
 
     @staticmethod
-    def _strip_pdf_pages(file_path: Path) -> bytes | None:
-        """Keep only PDF pages that contain data-relevant keywords.
+    async def _cached_response(
+        cache: AIResponseCache | None,
+        configs: list[AIProviderConfigModel],
+        content_hash: str | None,
+        prompt: str,
+        mode: str,
+        variants: tuple[str, ...] = ("",),
+    ) -> Any | None:
+        """Cached response of any eligible model (in fallback order), or None."""
+        if cache is None or content_hash is None:
+            return None
 
-        Returns stripped PDF bytes, or None if stripping failed or all pages
-        are relevant (in which case the caller should use the original file).
+        for config in configs:
+            for variant in variants:
+                key = cache.cache_key(content_hash, prompt, config.model, mode, variant)
+                cached = await cache.get(key)
+                if cached is None:
+                    continue
+                logger.info("ai_response_cache_hit", model=config.model, mode=mode)
+                if isinstance(cached, dict):
+                    meta = cached.get("_extraction_meta", {})
+                    cached["_extraction_meta"] = {**meta, "cached": True}
+                return cached
+        return None
+
+    @staticmethod
+    async def _store_response(
+        cache: AIResponseCache | None,
+        content_hash: str | None,
+        prompt: str,
+        model: str,
+        mode: str,
+        response: Any,
+        variant: str = "",
+    ) -> None:
+        if cache is None or content_hash is None:
+            return
+        key = cache.cache_key(content_hash, prompt, model, mode, variant)
+        await cache.set(key, response, model, mode)
+
+    @staticmethod
+    async def _provider_extract_text(
+        provider: BaseProvider,
+        config: AIProviderConfigModel,
+        content: str,
+        prompt: str,
+    ) -> dict[str, Any]:
+        """Text extraction, batched with concurrent small texts when batching is on."""
+        batcher = get_text_batcher()
+        if batcher is None or not provider.SUPPORTS_TEXT_BATCH or not batcher.accepts(content):
+            return await provider.extract_text(content, prompt)
+
+        try:
+            return await batcher.submit(config.id, content, prompt, provider.extract_text_batch)
+        except BatchItemError as e:
+            logger.info("ai_batch_item_sent_alone", model=config.model, error=str(e))
+            return await provider.extract_text(content, prompt)
+
+    @staticmethod
+    def _tokens_used(result: dict[str, Any]) -> int:
+        """Tokens of a provider response (a batched call's tokens are split per item)."""
+        meta = result.get("_extraction_meta", {})
+        tokens = (meta.get("usage") or {}).get("total_tokens", 0) or 0
+        return tokens // max(meta.get("batch_size", 1), 1)
+
+    @staticmethod
+    def _pdf_pages_to_keep(file_path: Path) -> list[int] | None:
+        """PDF pages (0-based) that contain data-relevant keywords.
+
+        Returns None if the whole PDF should be sent: small PDFs, all or no
+        pages relevant, or the page index could not be built.
         """
-        KEYWORDS = [
-            "netzentgelt",
-            "entgelt",
-            "preisblatt",
-            "leistungspreis",
-            "arbeitspreis",
-            "hochlastzeitfenster",
-            "hochlastzeit",
-            "hochlast",
-            "netznutzung",
-            "mittelspannung",
-            "niederspannung",
-            "hochspannung",
-            "umspannung",
-        ]
         try:
             import fitz  # PyMuPDF
 
+            from app.services.extraction.page_index import build_page_index
+
             doc = fitz.open(file_path)
             total = len(doc)
+            doc.close()
             if total <= 2:
-                doc.close()
                 return None  # Not worth stripping small PDFs
 
-            keep: list[int] = []
-            for i in range(total):
-                text = (doc[i].get_text() or "").lower()
-                if any(kw in text for kw in KEYWORDS):
-                    keep.append(i)
+            # Keyword page index from the shared page text cache
+            keep = [page - 1 for page in build_page_index(file_path).relevant_pages()]
 
             if not keep or len(keep) == total:
-                doc.close()
                 return None  # All or no pages match — use original
+            return keep
+
+        except ImportError:
+            return None  # PyMuPDF not installed
+        except Exception as e:
+            logger.debug("pdf_page_selection_failed", file=file_path.name, error=str(e))
+            return None
+
+    @staticmethod
+    def _strip_pdf_pages(file_path: Path, keep: list[int]) -> bytes | None:
+        """PDF bytes with only the `keep` pages (0-based), or None if stripping failed."""
+        try:
+            import fitz  # PyMuPDF
+
+            doc = fitz.open(file_path)
+            total = len(doc)
 
             # Build stripped PDF
-            remove = [i for i in range(total) if i not in keep]
+            kept = set(keep)
+            remove = [i for i in range(total) if i not in kept]
             doc.delete_pages(remove)
 
             buf = io.BytesIO()
@@ -301,17 +418,25 @@ class AIGateway:
                 "No AI providers configured. Add a provider in Admin → AI Configuration."
             )
 
+        cache = get_ai_response_cache()
+        content_hash = text_hash(content)
+        cached = await self._cached_response(cache, configs, content_hash, prompt, "text")
+        if cached is not None:
+            return cached
+
         last_error = None
 
         for config in configs:
             try:
                 provider = self._create_provider(config)
-                result = await provider.extract_text(content, prompt)
+                result = await self._provider_extract_text(provider, config, content, prompt)
 
-                tokens = result.get("_extraction_meta", {}).get("usage", {}).get("total_tokens", 0)
-                await self.config_service.mark_success(config.id, tokens)
+                await self.config_service.mark_success(config.id, self._tokens_used(result))
                 await self.db.commit()
 
+                await self._store_response(
+                    cache, content_hash, prompt, config.model, "text", result
+                )
                 return result
 
             except RateLimitError as e:
@@ -348,7 +473,21 @@ class AIGateway:
         if not configs:
             return None
 
-        raw = self._strip_pdf_pages(file_path) or file_path.read_bytes()
+        keep = await asyncio.to_thread(self._pdf_pages_to_keep, file_path)
+        variants = _pdf_variants(keep)
+        variant = variants[0]
+        cache = get_ai_response_cache()
+        content_hash = await asyncio.to_thread(hash_file, file_path) if cache else None
+        cached = await self._cached_response(cache, configs, content_hash, prompt, "ocr", variants)
+        if cached is not None:
+            return cached
+
+        pdf_bytes = (
+            await asyncio.to_thread(self._strip_pdf_pages, file_path, keep) if keep else None
+        )
+        if keep and pdf_bytes is None:
+            variant = _pdf_variant(None)  # Stripping failed, the whole PDF is sent
+        raw = pdf_bytes if pdf_bytes is not None else file_path.read_bytes()
         image_data = base64.b64encode(raw).decode()
         last_error = None
 
@@ -371,6 +510,10 @@ class AIGateway:
                     text_len=len(text),
                     tokens=tokens,
                 )
+                if text:
+                    await self._store_response(
+                        cache, content_hash, prompt, config.model, "ocr", text, variant
+                    )
                 return text
 
             except RateLimitError as e:
@@ -29,6 +29,9 @@ class BaseProvider(ABC):
 
     MAX_OUTPUT_TOKENS = 4096
 
+    # Whether several text extractions may be packed into one request
+    SUPPORTS_TEXT_BATCH = True
+
     def __init__(self, config: AIProviderConfigModel):
         """Initialize provider with database config."""
         self.config = config
@@ -133,6 +136,64 @@ class BaseProvider(ABC):
         """
         ...
 
+    async def extract_text_batch(self, items: list[tuple[str, str]]) -> list[Any]:
+        """Extract structured data from several texts in one request.
+
+        Packs the (content, prompt) pairs into one numbered request and splits
+        the model's `results` list back into one result per item.
+
+        Args:
+            items: (content, prompt) pairs
+
+        Returns:
+            One parsed result (with _extraction_meta) per item, in order;
+            BatchItemError for items the model returned nothing usable for
+        """
+        if len(items) == 1:
+            content, prompt = items[0]
+            return [await self.extract_text(content, prompt)]
+
+        from app.services.ai.batching import BatchItemError
+
+        documents = "\n\n".join(
+            f"=== Document {i} ===\nTask:\n{prompt}\n\nContent:\n{content}"
+            for i, (content, prompt) in enumerate(items, 1)
+        )
+        batch_prompt = (
+            f"The content below holds {len(items)} numbered documents, each with its own "
+            "extraction task. Solve every task independently. Respond with one JSON object "
+            '{"results": [...]} containing one entry per document: the JSON object its task '
+            'asks for, plus "id" set to the document number.'
+        )
+        response = await self.extract_text(documents, batch_prompt)
+        meta = response.pop("_extraction_meta", {})
+
+        by_id = {}
+        for entry in response.get("results") or []:
+            if isinstance(entry, dict) and isinstance(entry.get("id"), int):
+                by_id[entry["id"]] = entry
+
+        results: list[Any] = []
+        for i in range(1, len(items) + 1):
+            entry = by_id.get(i)
+            if entry is None:
+                results.append(BatchItemError(f"Document {i} missing from batch response"))
+                continue
+            entry = {k: v for k, v in entry.items() if k != "id"}
+            try:
+                self._validate_json_result(entry)
+            except ValueError as e:
+                results.append(BatchItemError(f"Document {i}: {e}"))
+                continue
+            entry["_extraction_meta"] = {
+                **meta,
+                "mode": "text_batch",
+                "raw_response": json.dumps(entry, ensure_ascii=False),
+                "batch_size": len(items),
+            }
+            results.append(entry)
+        return results
+
     @abstractmethod
     async def extract_vision(
         self,
@@ -228,6 +289,16 @@ class BaseProvider(ABC):
             else:
                 raise
 
+        self._validate_json_result(parsed)
+        return parsed
+
+    @staticmethod
+    def _validate_json_result(parsed: Any) -> None:
+        """Check the structure of a parsed extraction result.
+
+        Raises:
+            ValueError: Not a dict, or 'data' is not a list of dicts
+        """
         # Validate basic structure: must be a dict
         if not isinstance(parsed, dict):
             raise ValueError(f"AI response must be a JSON object, got {type(parsed).__name__}")
@@ -243,5 +314,3 @@ class BaseProvider(ABC):
                     raise ValueError(
                         f"AI response record [{i}] must be a dict, got {type(record).__name__}"
                     )
-
-        return parsed
@@ -24,6 +24,8 @@ class LiteLLMProvider(BaseProvider):
     - Unified interface for enterprise deployments
     """
 
+    SUPPORTS_TEXT_BATCH = False
+
     def __init__(self, config: AIProviderConfigModel):
         super().__init__(config)
 
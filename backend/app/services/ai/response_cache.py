@@ -0,0 +1,165 @@
+"""
+AI Response Cache
+
+Provider responses keyed by what determines them: the SHA-256 of the source
+document (or text), the SHA-256 of the prompt, the model and the request mode
+(text / vision / ocr). Re-running extraction over documents that were already
+sent with the same prompt and model costs no tokens and no rate-limit budget.
+
+Storage layout (one JSON entry per key):
+    data/ai-cache/
+    ├── 3f/
+    │   └── 3fa9...e1.json   # {key, model, mode, stored_at, response}
+    └── ...
+
+Eviction:
+- TTL (ai_cache_ttl_days): older entries are treated as misses and removed
+- LRU (ai_cache_max_entries): a hit refreshes the entry's mtime; on the first
+  write of a process and then every EVICT_EVERY_WRITES writes, the least
+  recently used entries beyond the limit are deleted. Between two passes the
+  directory may exceed the limit by up to EVICT_EVERY_WRITES entries per process.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import itertools
+import json
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from app.services.document_store import atomic_write
+
+logger = structlog.get_logger()
+
+# Writes between two eviction passes (each pass lists and stats every entry)
+EVICT_EVERY_WRITES = 100
+
+
+def text_hash(text: str) -> str:
+    """SHA-256 of a prompt or text document."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class AIResponseCache:
+    """On-disk TTL/LRU cache of AI provider responses."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        ttl_seconds: float,
+        max_entries: int,
+        evict_every: int = EVICT_EVERY_WRITES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Directory holding the cache entries (created on first write)
+            ttl_seconds: Age after which an entry is a miss
+            max_entries: Entries kept before the least recently used are evicted
+            evict_every: Writes between two eviction passes
+        """
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.evict_every = max(evict_every, 1)
+        self._writes = itertools.count()  # Atomic increment across writer threads
+        self.log = logger.bind(component="AIResponseCache")
+
+    @staticmethod
+    def cache_key(content_hash: str, prompt: str, model: str, mode: str, variant: str = "") -> str:
+        """Key for a (content, prompt, model, mode) combination.
+
+        `variant` distinguishes different payloads built from the same source
+        document, e.g. the pages kept when a PDF is stripped.
+        """
+        raw = f"{content_hash}:{text_hash(prompt)}:{model}:{mode}:{variant}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    async def get(self, key: str) -> Any | None:
+        """Cached response for `key`, or None if missing or expired."""
+        return await asyncio.to_thread(self._read, key)
+
+    def _read(self, key: str) -> Any | None:
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            stored_at = datetime.fromisoformat(entry["stored_at"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.log.debug("ai_cache_entry_unreadable", path=str(path), error=str(e))
+            return None
+
+        if (datetime.now(UTC) - stored_at).total_seconds() > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+
+        with contextlib.suppress(OSError):
+            os.utime(path)  # Mark as recently used for LRU eviction
+        return entry.get("response")
+
+    async def set(self, key: str, response: Any, model: str, mode: str) -> None:
+        """Store a provider response and evict entries beyond the size limit."""
+        await asyncio.to_thread(self._write, key, response, model, mode)
+
+    def _write(self, key: str, response: Any, model: str, mode: str) -> None:
+        path = self._entry_path(key)
+        entry = {
+            "key": key,
+            "model": model,
+            "mode": mode,
+            "stored_at": datetime.now(UTC).isoformat(),
+            "response": response,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, json.dumps(entry).encode("utf-8"))
+        except (OSError, TypeError, ValueError) as e:
+            self.log.warning("ai_cache_store_failed", key=key[:12], error=str(e))
+            return
+        if next(self._writes) % self.evict_every == 0:
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        entries.sort()
+        for _mtime, path in entries[:excess]:
+            path.unlink(missing_ok=True)
+        self.log.debug("ai_cache_evicted", count=excess)
+
+
+# Shared per process so the write count that paces eviction spans all callers
+_ai_response_cache: AIResponseCache | None = None
+
+
+def get_ai_response_cache() -> AIResponseCache | None:
+    """AI response cache rooted at the configured storage path (None if disabled)."""
+    from app.core.config import settings
+
+    global _ai_response_cache
+    if settings.ai_cache_ttl_days <= 0:
+        return None
+    if _ai_response_cache is None:
+        _ai_response_cache = AIResponseCache(
+            settings.ai_cache_path,
+            ttl_seconds=settings.ai_cache_ttl_days * 86400,
+            max_entries=settings.ai_cache_max_entries,
+        )
+    return _ai_response_cache
@@ -12,6 +12,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import CrawlJobModel, HLZFModel, NetzentgelteModel
+from app.services.dno_summary import refresh_dno_summaries
 
 logger = structlog.get_logger()
 
@@ -186,6 +187,7 @@ async def create_bulk_extract_jobs(
 ) -> tuple[list[dict[str, Any]], int]:
     """Create CrawlJobModel rows for selected candidates and return enqueue payloads."""
     jobs_to_enqueue: list[dict[str, Any]] = []
+    queued_dno_ids: set[int] = set()
     files_scanned = 0
 
     for candidate in candidates:
@@ -223,6 +225,7 @@ async def create_bulk_extract_jobs(
         db.add(job)
         await db.flush()
         active_job_set.add((dno_id, year, data_type))
+        queued_dno_ids.add(dno_id)
 
         jobs_to_enqueue.append(
             {
@@ -234,6 +237,9 @@ async def create_bulk_extract_jobs(
             }
         )
 
+    # The new pending jobs change the DNOs' live status
+    await refresh_dno_summaries(db, queued_dno_ids)
+
     return jobs_to_enqueue, files_scanned
 
 
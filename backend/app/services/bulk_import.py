@@ -0,0 +1,161 @@
+"""
+Set-based import of Netzentgelte/HLZF rows.
+
+Rows are written with multi-row INSERT ... ON CONFLICT statements against
+the (dno_id, year, voltage_level) unique indexes instead of one ORM
+round-trip per record, so a full dataset restore is a handful of
+statements per data type.
+
+Merge semantics match the per-record import: values that are not provided
+(None) keep the stored value, new rows default to verification status
+"unverified" and extraction source "import". Because a NOT NULL default
+cannot be expressed per row in one ON CONFLICT clause, rows are grouped by
+which of these two fields they provide and each group gets its own
+statement.
+
+read_import_file() reads the flat rows of app.services.data_export back,
+so a dataset export can be restored through POST /dnos/import.
+"""
+
+import csv
+import io
+import json
+from collections.abc import Iterable
+
+from sqlalchemy import delete, func, literal_column, null, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import HLZFModel, NetzentgelteModel
+from app.services.data_export import HLZF_FIELDS, NETZENTGELTE_FIELDS
+
+# Rows per INSERT statement (asyncpg allows 32767 bind parameters)
+UPSERT_CHUNK_SIZE = 1000
+
+_TARGETS = {
+    "netzentgelte": (NetzentgelteModel, NETZENTGELTE_FIELDS),
+    "hlzf": (HLZFModel, HLZF_FIELDS),
+}
+
+_INSERT_DEFAULTS = {"verification_status": "unverified", "extraction_source": "import"}
+
+
+def read_import_file(content: bytes, filename: str) -> list[dict]:
+    """Decode an uploaded export file (.ndjson/.jsonl, .csv or .parquet) into records.
+
+    Raises:
+        ValueError: Unsupported extension or undecodable content
+    """
+    name = filename.lower()
+    if name.endswith((".ndjson", ".jsonl")):
+        return [json.loads(line) for line in content.decode("utf-8").splitlines() if line.strip()]
+    if name.endswith(".csv"):
+        records = list(csv.DictReader(io.StringIO(content.decode("utf-8-sig"))))
+        for record in records:
+            for key, value in record.items():
+                if value == "":
+                    record[key] = None
+                elif key in HLZF_FIELDS:
+                    record[key] = json.loads(value)
+        return records
+    if name.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        records = pq.read_table(io.BytesIO(content)).to_pylist()
+        for record in records:
+            for key in HLZF_FIELDS:
+                if isinstance(record.get(key), str):
+                    record[key] = json.loads(record[key])
+        return records
+    raise ValueError("Unsupported file type: use .ndjson, .csv or .parquet")
+
+
+def collapse_duplicates(rows: Iterable[dict]) -> list[dict]:
+    """Merge rows with the same (dno_id, year, voltage_level), later values winning.
+
+    One INSERT ... ON CONFLICT cannot touch a row twice; merging gives the
+    result of applying the rows one after another.
+    """
+    merged: dict[tuple, dict] = {}
+    for row in rows:
+        key = (row["dno_id"], row["year"], row["voltage_level"])
+        if key in merged:
+            merged[key].update({k: v for k, v in row.items() if v is not None})
+        else:
+            merged[key] = dict(row)
+    return list(merged.values())
+
+
+def _insert_values(row: dict) -> dict:
+    values = {}
+    for key, value in row.items():
+        if value is None:
+            # SQL NULL, not JSON null, so COALESCE keeps stored time windows
+            value = _INSERT_DEFAULTS.get(key, null())
+        values[key] = value
+    return values
+
+
+async def delete_for_replace(
+    db: AsyncSession,
+    data_type: str,
+    dno_years: Iterable[tuple[int, int]],
+) -> int:
+    """Delete the stored rows of the given (dno_id, year) pairs before a replace."""
+    model, _ = _TARGETS[data_type]
+    pairs = sorted(set(dno_years))
+    deleted = 0
+    for start in range(0, len(pairs), UPSERT_CHUNK_SIZE):
+        chunk = pairs[start : start + UPSERT_CHUNK_SIZE]
+        result = await db.execute(delete(model).where(tuple_(model.dno_id, model.year).in_(chunk)))
+        deleted += result.rowcount or 0
+    return deleted
+
+
+async def upsert_rows(db: AsyncSession, data_type: str, rows: list[dict]) -> tuple[int, int]:
+    """Insert or merge rows with multi-row INSERT ... ON CONFLICT.
+
+    Args:
+        db: Database session (the caller commits)
+        data_type: "netzentgelte" or "hlzf"
+        rows: Dicts with dno_id, year, voltage_level, the data type's value
+            fields, verification_status and extraction_source (None = not
+            provided); rows with the same key are merged first
+
+    Returns:
+        (created, updated)
+    """
+    model, value_fields = _TARGETS[data_type]
+    table = model.__table__
+
+    groups: dict[tuple[bool, bool], list[dict]] = {}
+    for row in collapse_duplicates(rows):
+        provided = (row["verification_status"] is not None, row["extraction_source"] is not None)
+        groups.setdefault(provided, []).append(row)
+
+    created = updated = 0
+    for (has_status, has_source), group in groups.items():
+        for start in range(0, len(group), UPSERT_CHUNK_SIZE):
+            values = [_insert_values(row) for row in group[start : start + UPSERT_CHUNK_SIZE]]
+            stmt = pg_insert(model).values(values)
+            set_ = {
+                # Omitted values keep what is stored
+                name: func.coalesce(stmt.excluded[name], table.c[name])
+                for name in value_fields
+            }
+            if has_status:
+                set_["verification_status"] = stmt.excluded.verification_status
+            if has_source:
+                set_["extraction_source"] = stmt.excluded.extraction_source
+            set_["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["dno_id", "year", "voltage_level"],
+                set_=set_,
+            ).returning(literal_column("(xmax = 0)").label("inserted"))
+            result = await db.execute(stmt)
+            for (inserted,) in result:
+                if inserted:
+                    created += 1
+                else:
+                    updated += 1
+    return created, updated
@@ -17,13 +17,20 @@ import io
 import re
 from dataclasses import dataclass
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
 
 import httpx
 import structlog
 
+from app.services.extraction.parse_pool import run_parser
+from app.services.keyword_matcher import KeywordMatcher
+
 logger = structlog.get_logger()
 
+# Logger for the static parser helpers (these run in parse pool processes)
+_parser_log = logger.bind(component="ContentVerifier")
+
 
 # =============================================================================
 # Data Types and Constants
@@ -227,6 +234,23 @@ STRUCTURE_PATTERNS = {
 }
 
 
+@lru_cache(maxsize=8)
+def _verifier_matcher(data_type: str) -> KeywordMatcher:
+    """Every keyword _verify_text() and _detect_data_type() check for a data type.
+
+    The text is scanned once per distinct keyword; the checks then look up the hits.
+    """
+    return KeywordMatcher(
+        dict.fromkeys(
+            [kw for group in REQUIRED_KEYWORDS.get(data_type, []) for kw in group]
+            + POSITIVE_KEYWORDS.get(data_type, [])
+            + NEGATIVE_KEYWORDS.get(data_type, [])
+            + POSITIVE_KEYWORDS["netzentgelte"]
+            + POSITIVE_KEYWORDS["hlzf"]
+        )
+    )
+
+
 # =============================================================================
 # Content Verifier
 # =============================================================================
@@ -558,6 +582,7 @@ class ContentVerifier:
     ) -> VerificationResult:
         """Internal text verification logic."""
         text_lower = text.lower()
+        found = _verifier_matcher(expected_data_type).hits(text_lower, lowered=True)
 
         # Track keywords
         found_keywords: list[str] = []
@@ -572,10 +597,10 @@ class ContentVerifier:
         # Check required keywords (at least one group must have a match)
         required = REQUIRED_KEYWORDS.get(expected_data_type, [])
         for keyword_group in required:
-            if any(kw in text_lower for kw in keyword_group):
+            if any(kw in found for kw in keyword_group):
                 required_met = True
                 for kw in keyword_group:
-                    if kw in text_lower:
+                    if kw in found:
                         found_keywords.append(kw)
                 break
             else:
@@ -584,14 +609,14 @@ class ContentVerifier:
         # Count positive keywords
         positive = POSITIVE_KEYWORDS.get(expected_data_type, [])
         for kw in positive:
-            if kw in text_lower:
+            if kw in found:
                 found_keywords.append(kw)
                 positive_score += 1
 
         # Count negative keywords (wrong data type markers)
         negative = NEGATIVE_KEYWORDS.get(expected_data_type, [])
         for kw in negative:
-            if kw in text_lower:
+            if kw in found:
                 negative_score += 2  # Heavier penalty
 
         # Check structural patterns
@@ -636,7 +661,7 @@ class ContentVerifier:
         confidence = max(0.0, min(1.0, confidence))
 
         # Determine detected data type (which type does this look like?)
-        detected = self._detect_data_type(text_lower)
+        detected = self._detect_data_type(found)
 
         # Final verification decision
         is_verified = (
@@ -666,25 +691,29 @@ class ContentVerifier:
             has_data_content=has_data_content,
         )
 
-    def _detect_data_type(self, text_lower: str) -> str | None:
-        """Try to detect which data type the text represents."""
+    def _detect_data_type(self, found: frozenset[str]) -> str | None:
+        """Try to detect which data type the text represents.
+
+        Args:
+            found: Keywords contained in the text (_verifier_matcher() hits)
+        """
         netz_score = 0
         hlzf_score = 0
 
         for kw in POSITIVE_KEYWORDS["netzentgelte"]:
-            if kw in text_lower:
+            if kw in found:
                 netz_score += 1
 
         for kw in POSITIVE_KEYWORDS["hlzf"]:
-            if kw in text_lower:
+            if kw in found:
                 hlzf_score += 1
 
         # Strong HLZF markers
-        if "hochlastzeitfenster" in text_lower or "hlzf" in text_lower:
+        if "hochlastzeitfenster" in found or "hlzf" in found:
             hlzf_score += 5
 
         # Strong Netzentgelte markers
-        if "netzentgelt" in text_lower and "leistungspreis" in text_lower:
+        if "netzentgelt" in found and "leistungspreis" in found:
             netz_score += 5
 
         if netz_score > hlzf_score and netz_score > 3:
@@ -752,13 +781,14 @@ class ContentVerifier:
             return "html"
 
     async def _extract_text(self, content: bytes, content_type: str, url: str) -> str | None:
-        """Extract text from content based on type."""
-        import asyncio
+        """Extract text from content based on type.
 
+        PDF and Excel parsing runs in the parse pool (CPU bound, GIL-holding).
+        """
         if content_type == "pdf":
-            return await asyncio.to_thread(self._extract_pdf_text, content)
+            return await run_parser(ContentVerifier._extract_pdf_text, content)
         elif content_type == "excel":
-            return await asyncio.to_thread(self._extract_excel_text, content)
+            return await run_parser(ContentVerifier._extract_excel_text, content)
         elif content_type == "html":
             return self._extract_html_text(content)
         elif content_type == "image":
@@ -773,7 +803,8 @@ class ContentVerifier:
             except Exception:
                 return None
 
-    def _extract_pdf_text(self, content: bytes) -> str | None:
+    @staticmethod
+    def _extract_pdf_text(content: bytes) -> str | None:
         """Extract text from PDF content with multiple fallbacks.
 
         Strategy:
@@ -784,42 +815,39 @@ class ContentVerifier:
         # Check for encryption marker early
         is_encrypted = b"/Encrypt" in content[:2048]
         if is_encrypted:
-            self.log.debug("PDF appears encrypted - extraction may be limited")
+            _parser_log.debug("PDF appears encrypted - extraction may be limited")
 
         # Try pdfplumber first (better for structured tables)
-        text = self._try_pdfplumber(content)
+        text = ContentVerifier._try_pdfplumber(content)
         if text:
             return text
 
         # Fallback to PyMuPDF (handles more formats)
-        text = self._try_pymupdf(content)
+        text = ContentVerifier._try_pymupdf(content)
         if text:
             return text
 
-        self.log.debug("pdf_extract_failed", reason="all_methods_failed")
+        _parser_log.debug("pdf_extract_failed", reason="all_methods_failed")
         return None
 
-    def _try_pdfplumber(self, content: bytes) -> str | None:
-        """Try extracting text using pdfplumber."""
+    @staticmethod
+    def _try_pdfplumber(content: bytes) -> str | None:
+        """Try extracting text using pdfplumber (via the shared page text cache)."""
         try:
-            import pdfplumber
-
-            pdf_file = io.BytesIO(content)
-            text_parts = []
+            from app.services.extraction.pdf_text_cache import get_page_texts
 
-            with pdfplumber.open(pdf_file) as pdf:
-                # Only read first few pages for sniffing
-                for page in pdf.pages[:3]:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
+            # Only read first few pages for sniffing; the bytes are not a stored blob,
+            # so nothing is written next to the blob store
+            pages = get_page_texts(content, max_pages=3, persist=False)
+            text_parts = [text for text in pages if text]
 
             return "\n".join(text_parts) if text_parts else None
         except Exception as e:
-            self.log.debug("pdfplumber_failed", error=str(e))
+            _parser_log.debug("pdfplumber_failed", error=str(e))
             return None
 
-    def _try_pymupdf(self, content: bytes) -> str | None:
+    @staticmethod
+    def _try_pymupdf(content: bytes) -> str | None:
         """Try extracting text using PyMuPDF (fitz)."""
         try:
             import fitz  # PyMuPDF
@@ -839,27 +867,29 @@ class ContentVerifier:
             finally:
                 doc.close()
         except ImportError:
-            self.log.debug("pymupdf_not_installed")
+            _parser_log.debug("pymupdf_not_installed")
             return None
         except Exception as e:
-            self.log.debug("pymupdf_failed", error=str(e))
+            _parser_log.debug("pymupdf_failed", error=str(e))
             return None
 
-    def _extract_excel_text(self, content: bytes) -> str | None:
+    @staticmethod
+    def _extract_excel_text(content: bytes) -> str | None:
         """Extract text from Excel content (XLSX and XLS formats)."""
         # Try XLSX first (most common)
-        text = self._try_xlsx(content)
+        text = ContentVerifier._try_xlsx(content)
         if text:
             return text
 
         # Try XLS (old binary format) if XLSX failed
-        text = self._try_xls(content)
+        text = ContentVerifier._try_xls(content)
         if text:
             return text
 
         return None
 
-    def _try_xlsx(self, content: bytes) -> str | None:
+    @staticmethod
+    def _try_xlsx(content: bytes) -> str | None:
         """Try extracting text from XLSX (Office Open XML)."""
         try:
             import openpyxl
@@ -876,10 +906,11 @@ class ContentVerifier:
 
             return "\n".join(text_parts) if text_parts else None
         except Exception as e:
-            self.log.debug("xlsx_extract_failed", error=str(e))
+            _parser_log.debug("xlsx_extract_failed", error=str(e))
             return None
 
-    def _try_xls(self, content: bytes) -> str | None:
+    @staticmethod
+    def _try_xls(content: bytes) -> str | None:
         """Try extracting text from XLS (old binary format)."""
         try:
             import xlrd
@@ -898,10 +929,10 @@ class ContentVerifier:
 
             return "\n".join(text_parts) if text_parts else None
         except ImportError:
-            self.log.debug("xlrd_not_installed")
+            _parser_log.debug("xlrd_not_installed")
             return None
         except Exception as e:
-            self.log.debug("xls_extract_failed", error=str(e))
+            _parser_log.debug("xls_extract_failed", error=str(e))
             return None
 
     def _extract_html_text(self, content: bytes) -> str | None:
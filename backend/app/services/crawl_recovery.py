@@ -3,6 +3,8 @@ Crawl Recovery Service for handling stuck crawl jobs.
 
 Recovers DNOs stuck in 'crawling' status due to crashes, OOM, or server restarts.
 Also resets stale CrawlJobModel entries stuck in pending/running status.
+Their step checkpoints stay in job.context, so re-triggering the crawl
+resumes from them instead of starting over.
 Should be called on application startup.
 """
 
@@ -13,6 +15,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import CrawlJobModel, DNOModel
+from app.services.dno_summary import refresh_dno_summaries
 
 logger = structlog.get_logger()
 
@@ -80,6 +83,7 @@ async def recover_stuck_crawl_jobs(
         recovered_count += 1
 
     if recovered_count > 0:
+        await refresh_dno_summaries(db, {job.dno_id for job in stuck_jobs})
         await db.commit()
         log.info("Recovered stuck crawl jobs", count=recovered_count)
     else:
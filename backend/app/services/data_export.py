@@ -0,0 +1,269 @@
+"""
+Streaming export of Netzentgelte/HLZF data.
+
+Rows are read with server-side cursors (AsyncSession.stream + yield_per) and
+encoded chunk by chunk, so memory use depends on the batch size, not on the
+number of exported rows. Supported formats:
+
+- ndjson: one JSON object per row
+- csv: one flat table, HLZF time windows as JSON strings
+- parquet: same flat schema, one row group per batch
+
+All formats share EXPORT_COLUMNS; a row's data_type tells Netzentgelte
+(price columns set) and HLZF (time window columns set) apart.
+"""
+
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Iterable
+from decimal import Decimal
+
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import VERIFICATION_STATUSES
+from app.db import get_db_session
+from app.db.models import DNOModel, HLZFModel, NetzentgelteModel
+
+logger = structlog.get_logger()
+
+# Rows fetched from the server-side cursor (and encoded) at a time
+EXPORT_BATCH_SIZE = 2000
+
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+NETZENTGELTE_FIELDS = ("leistung", "arbeit", "leistung_unter_2500h", "arbeit_unter_2500h")
+HLZF_FIELDS = ("winter", "fruehling", "sommer", "herbst")
+
+EXPORT_COLUMNS = (
+    "data_type",
+    "dno_id",
+    "dno_slug",
+    "dno_name",
+    "year",
+    "voltage_level",
+    *NETZENTGELTE_FIELDS,
+    *HLZF_FIELDS,
+    "verification_status",
+    "extraction_source",
+)
+
+
+def _verification_status(value: str | None) -> str:
+    return value if value in VERIFICATION_STATUSES else "unverified"
+
+
+def _price(value: Decimal | None) -> float | None:
+    return float(value) if value is not None else None
+
+
+def netzentgelte_record(row) -> dict:
+    """Export record of a Netzentgelte row (ORM object or column row)."""
+    record = {"year": row.year, "voltage_level": row.voltage_level}
+    record.update({field: _price(getattr(row, field)) for field in NETZENTGELTE_FIELDS})
+    record["verification_status"] = _verification_status(row.verification_status)
+    record["extraction_source"] = row.extraction_source
+    return record
+
+
+def hlzf_record(row) -> dict:
+    """Export record of an HLZF row (ORM object or column row)."""
+    record = {"year": row.year, "voltage_level": row.voltage_level}
+    record.update({field: getattr(row, field) for field in HLZF_FIELDS})
+    record["verification_status"] = _verification_status(row.verification_status)
+    record["extraction_source"] = row.extraction_source
+    return record
+
+
+async def iter_export_records(
+    db: AsyncSession,
+    data_types: Iterable[str],
+    dno_ids: list[int] | None = None,
+    years: list[int] | None = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[list[dict]]:
+    """Yield export records in batches, streamed from server-side cursors.
+
+    Args:
+        db: Database session used only for this export
+        data_types: "netzentgelte" and/or "hlzf"
+        dno_ids: Restrict to these DNOs (None = all DNOs)
+        years: Restrict to these years (None = all years)
+        batch_size: Rows per batch
+
+    Yields:
+        Lists of flat records with all EXPORT_COLUMNS keys
+    """
+    sources = (
+        ("netzentgelte", NetzentgelteModel, NETZENTGELTE_FIELDS, netzentgelte_record),
+        ("hlzf", HLZFModel, HLZF_FIELDS, hlzf_record),
+    )
+    for data_type, model, fields, to_record in sources:
+        if data_type not in data_types:
+            continue
+
+        query = (
+            select(
+                model.dno_id,
+                DNOModel.slug,
+                DNOModel.name,
+                model.year,
+                model.voltage_level,
+                *(getattr(model, field) for field in fields),
+                model.verification_status,
+                model.extraction_source,
+            )
+            .join(DNOModel, DNOModel.id == model.dno_id)
+            .order_by(model.dno_id, model.year, model.voltage_level)
+            .execution_options(yield_per=batch_size)
+        )
+        if dno_ids is not None:
+            query = query.where(model.dno_id.in_(dno_ids))
+        if years:
+            query = query.where(model.year.in_(years))
+
+        result = await db.stream(query)
+        async for partition in result.partitions(batch_size):
+            batch = []
+            for row in partition:
+                record = dict.fromkeys(EXPORT_COLUMNS)
+                record.update(to_record(row))
+                record["data_type"] = data_type
+                record["dno_id"] = row.dno_id
+                record["dno_slug"] = row.slug
+                record["dno_name"] = row.name
+                batch.append(record)
+            yield batch
+
+
+async def encode_ndjson(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """Encode record batches as NDJSON chunks."""
+    async for batch in batches:
+        yield "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch).encode()
+
+
+async def encode_csv(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """Encode record batches as CSV chunks (header first, JSON for time windows)."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    async for batch in batches:
+        for record in batch:
+            for field in HLZF_FIELDS:
+                if record[field] is not None:
+                    record[field] = json.dumps(record[field], ensure_ascii=False)
+            writer.writerow(record)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands written bytes out in chunks."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_schema():
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            ("data_type", pa.string()),
+            ("dno_id", pa.int64()),
+            ("dno_slug", pa.string()),
+            ("dno_name", pa.string()),
+            ("year", pa.int32()),
+            ("voltage_level", pa.string()),
+            *((field, pa.float64()) for field in NETZENTGELTE_FIELDS),
+            *((field, pa.string()) for field in HLZF_FIELDS),
+            ("verification_status", pa.string()),
+            ("extraction_source", pa.string()),
+        ]
+    )
+
+
+async def encode_parquet(batches: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """Encode record batches as a Parquet file, one row group per batch."""
+    # pyarrow is heavy to import and only needed for this format
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema()
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        async for batch in batches:
+            columns = {name: [record[name] for record in batch] for name in EXPORT_COLUMNS}
+            for field in HLZF_FIELDS:
+                columns[field] = [
+                    json.dumps(value, ensure_ascii=False) if value is not None else None
+                    for value in columns[field]
+                ]
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+_ENCODERS = {
+    "ndjson": encode_ndjson,
+    "csv": encode_csv,
+    "parquet": encode_parquet,
+}
+
+
+async def stream_export(
+    export_format: str,
+    data_types: Iterable[str],
+    dno_ids: list[int] | None = None,
+    years: list[int] | None = None,
+) -> AsyncIterator[bytes]:
+    """Encoded export chunks for a StreamingResponse.
+
+    Opens its own session: a request's session is closed before the
+    response body streams.
+    """
+    data_types = set(data_types)
+    rows = 0
+    async with get_db_session() as db:
+
+        async def counted() -> AsyncIterator[list[dict]]:
+            nonlocal rows
+            async for batch in iter_export_records(db, data_types, dno_ids, years):
+                rows += len(batch)
+                yield batch
+
+        async for chunk in _ENCODERS[export_format](counted()):
+            if chunk:
+                yield chunk
+
+    logger.info(
+        "data_export_streamed",
+        format=export_format,
+        rows=rows,
+        dnos=len(dno_ids) if dno_ids is not None else "all",
+        years=years,
+    )
@@ -6,7 +6,7 @@ Orchestrates discovery strategies:
 2. For HLZF, also check HTML pages for embedded tables
 3. Fall back to BFS if sitemap unavailable
 
-Uses stored sitemap_urls from DNO record when available.
+Uses stored sitemap URLs (app.services.sitemap_store) when available.
 """
 
 import httpx
@@ -20,6 +20,7 @@ from app.services.discovery.base import (
 )
 from app.services.discovery.scorer import score_html_for_data
 from app.services.discovery.sitemap import discover_via_sitemap
+from app.services.http_cache import HttpCache
 
 logger = structlog.get_logger()
 
@@ -46,9 +47,11 @@ class DiscoveryManager:
         self,
         client: httpx.AsyncClient,
         request_delay: float = 0.3,
+        http_cache: HttpCache | None = None,
     ):
         self.client = client
         self.request_delay = request_delay
+        self.http_cache = http_cache
         self.log = logger.bind(component="DiscoveryManager")
 
     async def discover(
@@ -71,7 +74,7 @@ class DiscoveryManager:
             base_url: DNO website URL
             data_type: "netzentgelte" or "hlzf"
             target_year: Optional target year
-            sitemap_urls: Pre-stored sitemap URLs from DNO record
+            sitemap_urls: Stored sitemap URLs (candidates from app.services.sitemap_store)
             max_candidates: Max candidates to return
 
         Returns:
@@ -98,6 +101,7 @@ class DiscoveryManager:
             data_type=data_type,
             target_year=target_year,
             sitemap_urls=sitemap_urls,  # Use pre-parsed URLs from DB
+            http_cache=self.http_cache,
             max_candidates=max_candidates,
         )
 
@@ -6,7 +6,7 @@ Ensures consistent ranking across sitemap and BFS discovery.
 """
 
 from app.services.discovery.base import FileType
-from app.services.web_crawler import NEGATIVE_KEYWORDS, get_keywords_for_data_type
+from app.services.web_crawler import get_keyword_matcher, negative_keyword_penalty
 
 # File type scoring bonuses
 FILE_TYPE_SCORES = {
@@ -56,7 +56,6 @@ def score_url(
     link_text_lower = link_text.lower() if link_text else ""
 
     score = 0.0
-    keywords_found = []
     has_year = False
 
     # File type bonus
@@ -64,22 +63,14 @@ def score_url(
     score += FILE_TYPE_SCORES.get(file_type, 0)
 
     # Positive keywords
-    keywords = get_keywords_for_data_type(data_type)
-    for kw in keywords:
-        kw_lower = kw.lower()
-        if kw_lower in url_lower:
-            score += 15
-            if kw not in keywords_found:
-                keywords_found.append(kw)
-        if kw_lower in link_text_lower:
-            score += 5
-            if kw not in keywords_found:
-                keywords_found.append(kw)
+    matcher = get_keyword_matcher(data_type)
+    url_keywords = matcher.find(url_lower)
+    link_keywords = matcher.find(link_text_lower)
+    score += 15 * len(url_keywords) + 5 * len(link_keywords)
+    keywords_found = list(dict.fromkeys(url_keywords + link_keywords))
 
     # Negative keywords (single flat list for all modes)
-    for neg_kw, penalty in NEGATIVE_KEYWORDS:
-        if neg_kw in url_lower or neg_kw in link_text_lower:
-            score += penalty  # penalty is already negative
+    score += negative_keyword_penalty(url_lower, link_text_lower)
 
     # Target year bonus (strong) + any-year bonus (moderate)
     if target_year:
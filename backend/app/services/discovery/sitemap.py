@@ -5,9 +5,23 @@ Uses sitemap.xml for efficient URL discovery:
 1. Parse stored sitemap URLs from DNO record (or fetch fresh)
 2. Score all URLs by keywords (no HTTP requests needed)
 3. Return top candidates sorted by relevance
+
+Fresh sitemaps are streamed: SitemapStreamParser consumes the body chunk by
+chunk (plain or gzip'd) and only keeps the <loc>/<lastmod> of each entry, so
+neither the document nor an element tree is held in memory. SitemapReader
+revalidates sitemaps against the HTTP cache, skips nested sitemaps whose
+<lastmod> predates the cached copy, and fetches the nested sitemaps of an
+index concurrently.
 """
 
+import asyncio
+import codecs
+import contextlib
 import re
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from urllib.parse import urlparse
 from xml.etree import ElementTree
 
@@ -22,6 +36,11 @@ from app.services.discovery.base import (
     FileType,
 )
 from app.services.discovery.scorer import detect_file_type, score_url
+from app.services.http_cache import CachedResponse, HttpCache
+from app.services.keyword_matcher import KeywordMatcher
+from app.services.retry_utils import with_retries
+from app.services.sitemap_store import candidate_patterns
+from app.services.url_utils import HTTP_NOT_MODIFIED, HTTP_OK
 
 logger = structlog.get_logger()
 
@@ -35,87 +54,190 @@ SITEMAP_PATHS = [
     "/sitemaps/sitemap.xml",
 ]
 
+# Bytes read from the response per parser feed
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Uncompressed size limit of one sitemap (sitemaps.org protocol limit)
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+
+# Nested sitemaps fetched at the same time
+NESTED_SITEMAP_CONCURRENCY = 4
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Entry elements and the child elements kept from them (matched by local name)
+ENTRY_TAGS = ("url", "sitemap")
+ENTRY_FIELDS = ("loc", "lastmod")
+
+# Fallback for malformed XML
+LOC_PATTERN = re.compile(r"<loc>([^<]+)</loc>")
+
+
+@dataclass
+class SitemapEntry:
+    """One <url> or <sitemap> entry of a sitemap."""
+
+    loc: str
+    lastmod: str | None = None
+    is_sitemap: bool = False
+
+
+def _local_name(tag: str) -> str:
+    """Element name without its namespace ("{ns}url" -> "url")."""
+    return tag.rpartition("}")[2]
+
+
+class _SitemapTarget:
+    """XMLParser target keeping only the <loc>/<lastmod> children of entries."""
+
+    def __init__(self):
+        self.entries: list[SitemapEntry] = []
+        self._path: list[str] = []
+        self._fields: dict[str, str] = {}
+        self._text: list[str] | None = None
+        self._field_depth = 0
+        self._entry = ""
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        name = _local_name(tag)
+        # Direct children only: <image:loc> inside <image:image> is not the page URL
+        if name in ENTRY_FIELDS and self._path and self._path[-1] in ENTRY_TAGS:
+            self._text = []
+            self._field_depth = len(self._path) + 1
+        elif name in ENTRY_TAGS:
+            self._entry = name
+        self._path.append(name)
+
+    def data(self, data: str) -> None:
+        if self._text is not None:
+            self._text.append(data)
+
+    def end(self, tag: str) -> None:
+        depth = len(self._path)
+        name = self._path.pop()
+        if self._text is not None and depth == self._field_depth:
+            self._fields[name] = "".join(self._text).strip()
+            self._text = None
+        elif name in ENTRY_TAGS:
+            self.flush()
+
+    def flush(self) -> None:
+        """Emit the entry being parsed if its <loc> is complete."""
+        loc = self._fields.get("loc")
+        if loc:
+            self.entries.append(
+                SitemapEntry(
+                    loc=loc,
+                    lastmod=self._fields.get("lastmod"),
+                    is_sitemap=self._entry == "sitemap",
+                )
+            )
+        self._fields = {}
 
-async def fetch_sitemap(
-    client: httpx.AsyncClient,
-    base_url: str,
-) -> str | None:
-    """
-    Try to fetch sitemap, first checking robots.txt for location.
-
-    Strategy:
-    1. Fetch robots.txt and look for Sitemap: directive
-    2. If found, use that URL
-    3. If not, try common sitemap paths
+    def close(self) -> None:
+        return None
 
-    Args:
-        client: HTTP client
-        base_url: Site base URL (e.g., https://www.example.de)
 
-    Returns:
-        Sitemap XML content, or None if not found
+class SitemapStreamParser:
+    """
+    Incremental sitemap parser.
+
+    feed() takes the body chunk by chunk and returns the entries completed so
+    far. Gzip'd sitemaps (.xml.gz) are recognized by their magic bytes and
+    inflated on the fly. Elements are matched by local name, which covers the
+    http/https sitemap namespaces and namespace-less files in a single pass.
+    After a parse error the rest of the body is scanned for <loc> tags.
+    Parsing stops at MAX_SITEMAP_BYTES of uncompressed XML.
     """
-    log = logger.bind(component="SitemapFetcher")
-
-    parsed = urlparse(base_url)
-    site_base = f"{parsed.scheme}://{parsed.netloc}"
-
-    sitemap_urls = []
-
-    # Step 1: Check robots.txt for Sitemap: directive
-    try:
-        robots_url = f"{site_base}/robots.txt"
-        response = await client.get(robots_url, timeout=10.0, follow_redirects=True)
-
-        if response.status_code == 200:
-            robots_content = response.text
-            # Extract Sitemap: URLs
-            for line in robots_content.splitlines():
-                line = line.strip()
-                if line.lower().startswith("sitemap:"):
-                    sitemap_url = line.split(":", 1)[1].strip()
-                    sitemap_urls.append(sitemap_url)
-                    log.info("Found sitemap in robots.txt", url=sitemap_url)
-
-    except Exception as e:
-        log.debug("Failed to fetch robots.txt", error=str(e))
-
-    # Step 2: Add common fallback paths
-    for path in SITEMAP_PATHS:
-        sitemap_urls.append(site_base + path)
-
-    # Step 3: Try each sitemap URL with retries
-    from app.services.retry_utils import with_retries
 
-    async def _fetch_sitemap_url(target_url: str) -> httpx.Response:
-        return await client.get(target_url, timeout=10.0, follow_redirects=True)
+    def __init__(self):
+        self._target = _SitemapTarget()
+        self._parser = DefusedET.XMLParser(target=self._target)
+        self._inflater = None
+        self._started = False
+        self._head = b""
+        self._decoder = None  # set once the regex fallback is active
+        self._tail = ""
+        self.size = 0
+        self.truncated = False
+
+    def feed(self, chunk: bytes | str) -> list[SitemapEntry]:
+        """Parse the next chunk of the body."""
+        if self.truncated or not chunk:
+            return []
+
+        if not self._started:
+            if isinstance(chunk, bytes):
+                # Wait for enough bytes to tell gzip from XML
+                self._head += chunk
+                if len(self._head) < len(GZIP_MAGIC):
+                    return []
+                chunk, self._head = self._head, b""
+                if chunk.startswith(GZIP_MAGIC):
+                    self._inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            self._started = True
+
+        if self._inflater is not None:
+            chunk = self._inflater.decompress(chunk, MAX_SITEMAP_BYTES - self.size + 1)
+
+        self.size += len(chunk)
+        if self.size > MAX_SITEMAP_BYTES:
+            self.truncated = True
+            chunk = chunk[: len(chunk) - (self.size - MAX_SITEMAP_BYTES)]
+        return self._parse(chunk)
+
+    def close(self) -> list[SitemapEntry]:
+        """Finish parsing and return the remaining entries."""
+        entries = []
+        if self._head:
+            entries.extend(self._parse(self._head))
+            self._head = b""
+        if self._inflater is not None and not self.truncated:
+            entries.extend(self._parse(self._inflater.flush()))
+
+        if self._decoder is None:
+            # Truncated or broken tail: keep what was parsed
+            with contextlib.suppress(ElementTree.ParseError, ValueError):
+                self._parser.close()
+            entries.extend(self._drain())
+        return entries
+
+    def _parse(self, data: bytes | str) -> list[SitemapEntry]:
+        if not data:
+            return []
+        if self._decoder is not None:
+            return self._scan(data)
 
-    for sitemap_url in sitemap_urls:
         try:
-            response: httpx.Response = await with_retries(
-                _fetch_sitemap_url, sitemap_url, max_attempts=2, backoff_base=0.5
-            )
-
-            # Check if it's valid XML (not a Cloudflare challenge)
-            if response.status_code == 200:
-                content = response.text
-                if (
-                    content.strip().startswith("<?xml")
-                    or "<urlset" in content[:500]
-                    or "<loc>" in content[:1000]
-                ):
-                    log.info("Found sitemap", url=sitemap_url)
-                    return content
-
-        except Exception as e:
-            log.debug("Sitemap fetch failed", url=sitemap_url[:60], error=str(e))
-            continue
-
-    log.info("No sitemap found", base_url=base_url)
-    return None
-
-
-def parse_sitemap(xml_content: str) -> tuple[list[str], list[str]]:
+            self._parser.feed(data)
+        except (ElementTree.ParseError, ValueError):
+            # Malformed XML or forbidden entities (defusedxml raises ValueErrors)
+            self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            self._target.flush()
+            return self._drain() + self._scan(data)
+        return self._drain()
+
+    def _drain(self) -> list[SitemapEntry]:
+        entries = self._target.entries
+        self._target.entries = []
+        return entries
+
+    def _scan(self, data: bytes | str) -> list[SitemapEntry]:
+        text = self._tail + (self._decoder.decode(data) if isinstance(data, bytes) else data)
+        entries = []
+        end = 0
+        for match in LOC_PATTERN.finditer(text):
+            entries.append(SitemapEntry(loc=match.group(1).strip()))
+            end = match.end()
+
+        # Keep a <loc> cut off at the chunk boundary for the next chunk
+        rest = text[end:]
+        start = rest.rfind("<loc>")
+        self._tail = rest[start:] if start != -1 else rest[-len("<loc>") :]
+        return entries
+
+
+def parse_sitemap(xml_content: str | bytes) -> tuple[list[str], list[str]]:
     """
     Parse URLs from sitemap XML.
 
@@ -123,88 +245,34 @@ def parse_sitemap(xml_content: str) -> tuple[list[str], list[str]]:
     Supports multiple namespace variations (http/https, with/without namespace).
 
     Args:
-        xml_content: Raw sitemap XML
+        xml_content: Raw sitemap XML (bytes may be gzip'd)
 
     Returns:
         Tuple of (urls, nested_sitemap_urls)
         - urls: Direct URLs found in this sitemap
         - nested_sitemap_urls: URLs of nested sitemaps (for sitemap indexes)
     """
-    urls = []
-    nested_sitemaps = []
-
-    try:
-        # Multiple namespace variations to try
-        namespace_variants = [
-            {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"},
-            {"sm": "https://www.sitemaps.org/schemas/sitemap/0.9"},
-            {},  # No namespace
-        ]
-
-        root = DefusedET.fromstring(xml_content)
-
-        # Try each namespace variant
-        for namespaces in namespace_variants:
-            # Check for sitemap index (contains other sitemaps)
-            if namespaces:
-                for sitemap_elem in root.findall(".//sm:sitemap", namespaces):
-                    loc = sitemap_elem.find("sm:loc", namespaces)
-                    if loc is not None and loc.text:
-                        nested_sitemaps.append(loc.text.strip())
-
-                # Extract URLs from urlset
-                for url_elem in root.findall(".//sm:url", namespaces):
-                    loc = url_elem.find("sm:loc", namespaces)
-                    if loc is not None and loc.text:
-                        urls.append(loc.text.strip())
-            else:
-                # No namespace - iterate directly
-                for sitemap in root.iter("sitemap"):
-                    loc = sitemap.find("loc")
-                    if loc is not None and loc.text:
-                        nested_sitemaps.append(loc.text.strip())
-
-                for url_elem in root.iter("url"):
-                    loc = url_elem.find("loc")
-                    if loc is not None and loc.text:
-                        url_text = loc.text.strip()
-                        if url_text not in nested_sitemaps:
-                            urls.append(url_text)
-
-            # If we found content, stop trying other namespaces
-            if urls or nested_sitemaps:
-                break
-
-        # Final fallback: extract namespace from root element
-        if not urls and not nested_sitemaps:
-            # Try to detect namespace from root tag
-            root_tag = root.tag
-            if "{" in root_tag:
-                ns = root_tag[root_tag.find("{") + 1 : root_tag.find("}")]
-                dynamic_ns = {"sm": ns}
-
-                for sitemap_elem in root.findall(".//sm:sitemap", dynamic_ns):
-                    loc = sitemap_elem.find("sm:loc", dynamic_ns)
-                    if loc is not None and loc.text:
-                        nested_sitemaps.append(loc.text.strip())
-
-                for url_elem in root.findall(".//sm:url", dynamic_ns):
-                    loc = url_elem.find("sm:loc", dynamic_ns)
-                    if loc is not None and loc.text:
-                        urls.append(loc.text.strip())
-
-    except ElementTree.ParseError:
-        # Try regex fallback for malformed XML
-        pattern = r"<loc>([^<]+)</loc>"
-        urls = [u.strip() for u in re.findall(pattern, xml_content)]
+    parser = SitemapStreamParser()
+    entries = parser.feed(xml_content) + parser.close()
 
     # Deduplicate while preserving order
-    urls = list(dict.fromkeys(urls))
-    nested_sitemaps = list(dict.fromkeys(nested_sitemaps))
+    urls = list(dict.fromkeys(e.loc for e in entries if not e.is_sitemap))
+    nested_sitemaps = list(dict.fromkeys(e.loc for e in entries if e.is_sitemap))
 
     return urls, nested_sitemaps
 
 
+def parse_lastmod(value: str | None) -> datetime | None:
+    """Parse a W3C datetime <lastmod>; values without a timezone count as UTC."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
 # Language path patterns to filter/prioritize
 PREFERRED_LANG = "/de/"
 FALLBACK_LANG = "/en/"
@@ -262,83 +330,258 @@ def filter_sitemaps_by_language(sitemap_urls: list[str]) -> list[str]:
         return neutral_sitemaps
 
 
-async def fetch_and_parse_sitemap_recursive(
-    client: httpx.AsyncClient,
-    sitemap_url: str,
-    max_depth: int = 2,
-    _current_depth: int = 0,
-) -> list[str]:
+async def sitemap_locations(client: httpx.AsyncClient, base_url: str) -> list[str]:
     """
-    Recursively fetch and parse sitemaps, following sitemap indexes.
+    Candidate sitemap URLs of a site.
+
+    Sitemap: directives from robots.txt come first, then the common paths.
 
     Args:
         client: HTTP client
-        sitemap_url: URL of sitemap to fetch
-        max_depth: Maximum recursion depth for nested sitemaps
-        _current_depth: Internal tracker for current depth
+        base_url: Site base URL (e.g., https://www.example.de)
 
     Returns:
-        List of all URLs found across all sitemaps
+        Sitemap URLs in the order they should be tried
     """
     log = logger.bind(component="SitemapFetcher")
-    all_urls = []
 
-    if _current_depth >= max_depth:
-        log.debug("Max sitemap depth reached", url=sitemap_url[:60], depth=_current_depth)
-        return all_urls
+    parsed = urlparse(base_url)
+    site_base = f"{parsed.scheme}://{parsed.netloc}"
+
+    locations = []
 
+    # Step 1: Check robots.txt for Sitemap: directive
     try:
-        response = await client.get(sitemap_url, timeout=10.0, follow_redirects=True)
+        robots_url = f"{site_base}/robots.txt"
+        response = await client.get(robots_url, timeout=10.0, follow_redirects=True)
 
-        if response.status_code != 200:
-            log.debug("Sitemap fetch failed", url=sitemap_url[:60], status=response.status_code)
-            return all_urls
+        if response.status_code == HTTP_OK:
+            for line in response.text.splitlines():
+                line = line.strip()
+                if line.lower().startswith("sitemap:"):
+                    sitemap_url = line.split(":", 1)[1].strip()
+                    locations.append(sitemap_url)
+                    log.info("Found sitemap in robots.txt", url=sitemap_url)
 
-        content = response.text
+    except Exception as e:
+        log.debug("Failed to fetch robots.txt", error=str(e))
 
-        # Verify it's XML
-        if not (
-            content.strip().startswith("<?xml")
-            or "<urlset" in content[:500]
-            or "<sitemapindex" in content[:500]
-        ):
-            log.debug("Not valid sitemap XML", url=sitemap_url[:60])
-            return all_urls
+    # Step 2: Add common fallback paths
+    for path in SITEMAP_PATHS:
+        locations.append(site_base + path)
 
-        urls, nested_sitemaps = parse_sitemap(content)
+    return list(dict.fromkeys(locations))
 
-        log.debug(
-            "Parsed sitemap",
-            url=sitemap_url[:60],
-            urls_found=len(urls),
-            nested_sitemaps=len(nested_sitemaps),
-            depth=_current_depth,
-        )
 
-        # Add direct URLs
-        all_urls.extend(urls)
-
-        # Recursively fetch nested sitemaps
-        # Filter by language preference (German first, English fallback)
-        if nested_sitemaps:
-            filtered_sitemaps = filter_sitemaps_by_language(nested_sitemaps)
-            log.info(
-                "Following nested sitemaps",
-                total=len(nested_sitemaps),
-                filtered=len(filtered_sitemaps),
-                depth=_current_depth,
-            )
-            # Fetch filtered nested sitemaps
-            for nested_url in filtered_sitemaps:
-                nested_urls = await fetch_and_parse_sitemap_recursive(
-                    client, nested_url, max_depth, _current_depth + 1
+@dataclass
+class SitemapDocument:
+    """What was read from one sitemap file."""
+
+    url: str
+    urls: list[str] = field(default_factory=list)
+    nested: list[tuple[str, datetime | None]] = field(default_factory=list)
+    urls_seen: int = 0
+    from_cache: bool = False
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.urls_seen and not self.nested
+
+
+class SitemapReader:
+    """
+    Streams sitemaps and follows sitemap indexes.
+
+    - Bodies are parsed while they arrive; url_filter is applied per URL, so
+      URLs that can't be used are never collected.
+    - With an HTTP cache, sitemaps are fetched with conditional GET and a 304
+      replays the cached body. A nested sitemap whose <lastmod> is not newer
+      than the cached copy is not requested at all.
+    - The nested sitemaps of one level are fetched concurrently, at most
+      `concurrency` at a time.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        http_cache: HttpCache | None = None,
+        url_filter: Callable[[str], bool] | None = None,
+        concurrency: int = NESTED_SITEMAP_CONCURRENCY,
+    ):
+        self.client = client
+        self.http_cache = http_cache
+        self.url_filter = url_filter
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.urls_seen = 0
+        self.log = logger.bind(component="SitemapReader")
+
+    async def read(
+        self,
+        sitemap_url: str,
+        lastmod: datetime | None = None,
+        max_attempts: int = 1,
+    ) -> SitemapDocument | None:
+        """
+        Fetch and parse one sitemap.
+
+        Args:
+            sitemap_url: Sitemap URL
+            lastmod: <lastmod> announced for it by the parent sitemap index
+            max_attempts: Attempts on connection errors and timeouts
+
+        Returns:
+            The parsed sitemap, or None if it could not be fetched
+        """
+        async with self.semaphore:
+            try:
+                document = await with_retries(
+                    self._read, sitemap_url, lastmod, max_attempts=max_attempts, backoff_base=0.5
+                )
+            except Exception as e:
+                self.log.debug("Sitemap fetch/parse failed", url=sitemap_url[:60], error=str(e))
+                return None
+
+        if document is not None:
+            self.urls_seen += document.urls_seen
+        return document
+
+    async def _read(self, sitemap_url: str, lastmod: datetime | None) -> SitemapDocument | None:
+        cache_entry = await self.http_cache.get(sitemap_url) if self.http_cache else None
+
+        # The parent index says the sitemap has not changed since it was cached
+        if (
+            cache_entry
+            and lastmod
+            and cache_entry.stored_at
+            and lastmod <= datetime.fromisoformat(cache_entry.stored_at)
+        ):
+            self.log.debug("Sitemap unchanged since cached", url=sitemap_url[:60])
+            return await self._read_cached(sitemap_url, cache_entry)
+
+        async with self.client.stream(
+            "GET",
+            sitemap_url,
+            headers=HttpCache.conditional_headers(cache_entry),
+            timeout=10.0,
+            follow_redirects=True,
+        ) as response:
+            if response.status_code == HTTP_NOT_MODIFIED and cache_entry:
+                return await self._read_cached(sitemap_url, cache_entry)
+
+            if response.status_code != HTTP_OK:
+                self.log.debug(
+                    "Sitemap fetch failed", url=sitemap_url[:60], status=response.status_code
                 )
-                all_urls.extend(nested_urls)
+                return None
 
-    except Exception as e:
-        log.debug("Sitemap fetch/parse failed", url=sitemap_url[:60], error=str(e))
+            # Keep the body only if a later 304 can replay it
+            cacheable = self.http_cache is not None and (
+                "etag" in response.headers or "last-modified" in response.headers
+            )
+            body: list[bytes] = []
+            document = SitemapDocument(url=sitemap_url)
+            parser = SitemapStreamParser()
+
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                if cacheable:
+                    body.append(chunk)
+                self._collect(document, parser.feed(chunk))
+                if parser.truncated:
+                    self.log.warning("Sitemap too large, truncated", url=sitemap_url[:60])
+                    break
+            self._collect(document, parser.close())
+
+        if cacheable and not parser.truncated:
+            await self.http_cache.store(sitemap_url, response.headers, body=b"".join(body))
+        return document
+
+    async def _read_cached(self, sitemap_url: str, cache_entry: CachedResponse) -> SitemapDocument:
+        document = self._parse_body(sitemap_url, await self.http_cache.read_body(cache_entry))
+        document.from_cache = True
+        return document
+
+    def parse(self, sitemap_url: str, content: str | bytes) -> SitemapDocument:
+        """Parse a sitemap body that is already in memory."""
+        document = self._parse_body(sitemap_url, content)
+        self.urls_seen += document.urls_seen
+        return document
+
+    def _parse_body(self, sitemap_url: str, content: str | bytes) -> SitemapDocument:
+        document = SitemapDocument(url=sitemap_url)
+        parser = SitemapStreamParser()
+        for start in range(0, len(content), STREAM_CHUNK_SIZE):
+            self._collect(document, parser.feed(content[start : start + STREAM_CHUNK_SIZE]))
+        self._collect(document, parser.close())
+        return document
+
+    def _collect(self, document: SitemapDocument, entries: list[SitemapEntry]) -> None:
+        for entry in entries:
+            if entry.is_sitemap:
+                document.nested.append((entry.loc, parse_lastmod(entry.lastmod)))
+                continue
+            document.urls_seen += 1
+            if self.url_filter is None or self.url_filter(entry.loc):
+                document.urls.append(entry.loc)
+
+    async def follow(self, documents: list[SitemapDocument], max_depth: int = 2) -> list[str]:
+        """
+        URLs of the given sitemaps and of their nested sitemaps.
+
+        Args:
+            documents: Sitemaps already read
+            max_depth: Levels of nested sitemaps to follow below them
+
+        Returns:
+            Deduplicated URLs in sitemap order
+        """
+        urls: list[str] = []
+        visited = {document.url for document in documents}
+
+        for depth in range(max_depth + 1):
+            for document in documents:
+                urls.extend(document.urls)
+
+            # Filter by language preference (German first, English fallback)
+            targets: dict[str, datetime | None] = {}
+            for document in documents:
+                lastmods = dict(document.nested)
+                for nested_url in filter_sitemaps_by_language(list(lastmods)):
+                    if nested_url not in visited:
+                        targets[nested_url] = lastmods[nested_url]
+            if not targets:
+                break
+            if depth == max_depth:
+                self.log.debug("Max sitemap depth reached", skipped=len(targets), depth=depth)
+                break
 
-    return all_urls
+            self.log.info("Following nested sitemaps", count=len(targets), depth=depth)
+            visited.update(targets)
+            results = await asyncio.gather(
+                *(self.read(nested_url, lastmod) for nested_url, lastmod in targets.items())
+            )
+            documents = [document for document in results if document is not None]
+
+        return list(dict.fromkeys(urls))
+
+    async def discover(self, base_url: str, max_depth: int = 2) -> list[str] | None:
+        """
+        Find the sitemap of a site and collect its URLs.
+
+        Tries the robots.txt sitemaps and the common paths in order; the first
+        one with any entries wins.
+
+        Returns:
+            Collected URLs, or None if no sitemap was found
+        """
+        for location in await sitemap_locations(self.client, base_url):
+            document = await self.read(location, max_attempts=2)
+            if document is None or document.is_empty:
+                continue
+            self.log.info("Found sitemap", url=location, from_cache=document.from_cache)
+            return await self.follow([document], max_depth)
+
+        self.log.info("No sitemap found", base_url=base_url)
+        return None
 
 
 async def discover_via_sitemap(
@@ -349,6 +592,7 @@ async def discover_via_sitemap(
     sitemap_content: str | None = None,
     sitemap_urls: list[str] | None = None,
     max_candidates: int = 50,
+    http_cache: HttpCache | None = None,
 ) -> DiscoveryResult:
     """
     Discover data files using sitemap.
@@ -362,8 +606,11 @@ async def discover_via_sitemap(
         data_type: "netzentgelte" or "hlzf"
         target_year: Optional target year
         sitemap_content: Pre-fetched sitemap content (or None to fetch fresh)
-        sitemap_urls: Pre-parsed sitemap URLs from DB cache (fastest path)
+        sitemap_urls: Pre-parsed sitemap URLs from DB cache (fastest path); may be
+            pre-selected to the URLs that can score, so an empty list is a valid
+            cache hit
         max_candidates: Max candidates to return
+        http_cache: Validator cache for conditional sitemap fetches
 
     Returns:
         DiscoveryResult with scored candidates
@@ -377,41 +624,32 @@ async def discover_via_sitemap(
         strategy=DiscoveryStrategy.SITEMAP,
     )
 
-    urls = []
-    nested_sitemaps = []
-
     # Fast path: use pre-parsed URLs from DB cache
-    if sitemap_urls:
+    if sitemap_urls is not None:
         log.info("Using cached sitemap URLs", count=len(sitemap_urls))
         urls = sitemap_urls
+        result.sitemap_urls_checked = len(urls)
     else:
-        # Fetch sitemap if not provided
-        if not sitemap_content:
-            sitemap_content = await fetch_sitemap(client, base_url)
+        # Only URLs that can score are kept while the sitemaps stream in
+        patterns = KeywordMatcher(candidate_patterns(data_type, target_year))
+        reader = SitemapReader(client, http_cache=http_cache, url_filter=patterns.matches_any)
 
-        if not sitemap_content:
+        if sitemap_content:
+            urls = await reader.follow([reader.parse(base_url, sitemap_content)])
+        else:
+            urls = await reader.discover(base_url)
+
+        if urls is None:
             log.info("No sitemap available")
             result.errors.append("No sitemap found")
             return result
 
-        # Parse URLs from sitemap (handles sitemap indexes recursively)
-        urls, nested_sitemaps = parse_sitemap(sitemap_content)
-
-    # If this is a sitemap index, recursively fetch nested sitemaps
-    if nested_sitemaps and not urls:
-        log.info("Sitemap is an index, fetching nested sitemaps", count=len(nested_sitemaps))
-        # Get the sitemap URL we're working with
-        urlparse(base_url)
-
-        for nested_url in nested_sitemaps:
-            nested_urls = await fetch_and_parse_sitemap_recursive(client, nested_url, max_depth=2)
-            urls.extend(nested_urls)
-
-    result.sitemap_urls_checked = len(urls)
-    log.info("Parsed sitemap", url_count=len(urls), nested_sitemaps_found=len(nested_sitemaps))
+        result.sitemap_urls_checked = reader.urls_seen
+        log.info("Parsed sitemap", urls_seen=reader.urls_seen, candidates=len(urls))
 
     if not urls:
-        result.errors.append("Sitemap empty or unparseable")
+        if sitemap_urls is None:
+            result.errors.append("Sitemap empty or unparseable")
         return result
 
     # Score each URL
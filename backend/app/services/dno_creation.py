@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from app.services.dno_enrichment import enrich_dno_from_web
-from app.services.vnb import VNBDigitalClient
+from app.services.vnb import get_vnb_client
 
 
 @dataclass
@@ -49,11 +49,7 @@ async def resolve_dno_creation_data(
 
     vnb_details = None
     if vnb_id and not all([resolved_website, resolved_phone, resolved_email]):
-        vnb_client = VNBDigitalClient(request_delay=0.5)
-        try:
-            vnb_details = await vnb_client.get_vnb_details(vnb_id)
-        finally:
-            await vnb_client.close()
+        vnb_details = await get_vnb_client(public_quota=False).get_vnb_details(vnb_id)
 
         if vnb_details:
             resolved_website = resolved_website or vnb_details.homepage_url
@@ -0,0 +1,279 @@
+"""
+DNO list read model (dno_summaries).
+
+The admin DNO list shows, filters and sorts by values that are aggregates
+over other tables: data point counts, the live status derived from active
+jobs, completeness against MaStR expectations and the importance score.
+It also carries the text the DNO search and autocomplete match against
+(names, aliases, BDEW codes, MaStR number) under a trigram index.
+Instead of computing them for every page request, they are stored in one
+row per DNO and refreshed set-based whenever an input changes:
+
+- Job pipeline: job created, started, completed, failed, paused, cancelled
+- Data routes: Netzentgelte/HLZF deletes and imports
+- DNO updates (names, crawlable, importance inputs), enrichment, skeleton
+  creation and the seeder
+
+refresh_dno_summaries() runs in the caller's transaction, so the summary
+commits (or rolls back) together with the change that triggered it. Every
+DNO creation path (skeletons, the create route, the seeder) writes the row
+of its new DNOs. Rows still missing, e.g. for DNOs inserted by scripts, are
+backfilled by fill_missing_dno_summaries() at API start-up; until then the
+list outer-joins the summary and falls back to defaults from the DNO.
+"""
+
+from collections.abc import Iterable
+
+import structlog
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.db.models import (
+    CrawlJobModel,
+    DNOModel,
+    DNOSummaryModel,
+    HLZFModel,
+    NetzentgelteModel,
+)
+from app.services.completeness import compute_completeness, connection_points_from_mastr
+from app.services.importance import compute_importance_for_dno
+
+logger = structlog.get_logger()
+
+# DNO ids per refresh query (bounded IN lists / bind parameters)
+REFRESH_CHUNK_SIZE = 1000
+
+
+def calculate_live_status(
+    *,
+    crawlable: bool,
+    data_points_count: int,
+    running_jobs: int,
+    pending_jobs: int,
+) -> str:
+    """Calculate DNO live status from preloaded counters."""
+    if running_jobs > 0:
+        return "running"
+    if pending_jobs > 0:
+        return "pending"
+    if not crawlable:
+        return "protected"
+    if data_points_count > 0:
+        return "crawled"
+    return "uncrawled"
+
+
+def data_points_score(data_points_count: int) -> int:
+    """List score: data points relative to a well-covered DNO (50 points = 100)."""
+    return min(round((data_points_count / 50) * 100), 100) if data_points_count > 0 else 0
+
+
+def build_search_text(dno: DNOModel) -> str:
+    """Searchable text of a DNO: names, aliases, identifiers (lowercased, deduplicated).
+
+    Args:
+        dno: DNO with vnb_data and bdew_data loaded
+    """
+    parts = [
+        dno.name,
+        dno.official_name,
+        dno.region,
+        dno.slug,
+        dno.mastr_nr,
+        dno.vnb_id,
+        dno.primary_bdew_code,
+    ]
+    if dno.vnb_data is not None:
+        parts += [dno.vnb_data.name, dno.vnb_data.official_name]
+    for bdew in dno.bdew_data or ():
+        parts += [bdew.bdew_code, bdew.company_name]
+    return " ".join(dict.fromkeys(part.strip().lower() for part in parts if part and part.strip()))
+
+
+def build_summary_row(
+    dno: DNOModel,
+    netz_levels: dict[str, int],
+    hlzf_levels: dict[str, int],
+    running_jobs: int,
+    pending_jobs: int,
+) -> dict:
+    """Summary column values for one DNO.
+
+    Args:
+        dno: DNO with mastr_data, vnb_data and bdew_data loaded
+        netz_levels: Netzentgelte record count per voltage level
+        hlzf_levels: HLZF record count per voltage level
+        running_jobs: Number of running jobs for the DNO
+        pending_jobs: Number of pending jobs for the DNO
+
+    Returns:
+        Dict of DNOSummaryModel column values
+    """
+    netzentgelte_count = sum(netz_levels.values())
+    hlzf_count = sum(hlzf_levels.values())
+    data_points_count = netzentgelte_count + hlzf_count
+
+    completeness = compute_completeness(
+        connection_points_from_mastr(dno.mastr_data), set(netz_levels), set(hlzf_levels)
+    )
+
+    if dno.importance_score is None:
+        importance = compute_importance_for_dno(dno)
+        importance_score = importance.score
+        importance_confidence = importance.confidence
+        importance_version = importance.version
+    else:
+        importance_score = dno.importance_score
+        importance_confidence = dno.importance_confidence
+        importance_version = dno.importance_version
+
+    return {
+        "dno_id": dno.id,
+        "netzentgelte_count": netzentgelte_count,
+        "hlzf_count": hlzf_count,
+        "data_points_count": data_points_count,
+        "score": data_points_score(data_points_count),
+        "live_status": calculate_live_status(
+            crawlable=dno.crawlable,
+            data_points_count=data_points_count,
+            running_jobs=running_jobs,
+            pending_jobs=pending_jobs,
+        ),
+        "running_jobs": running_jobs,
+        "pending_jobs": pending_jobs,
+        "completeness_score": completeness.score,
+        "importance_score": importance_score,
+        "importance_confidence": importance_confidence,
+        "importance_version": importance_version,
+        "search_text": build_search_text(dno),
+    }
+
+
+async def refresh_dno_summaries(db: AsyncSession, dno_ids: Iterable[int] | None = None) -> int:
+    """Recompute and upsert the summary rows of the given DNOs.
+
+    Runs a fixed number of grouped queries per chunk of DNOs, independent of
+    how much data they have. The caller commits.
+
+    Args:
+        db: Database session (pending changes are flushed first)
+        dno_ids: DNOs to refresh; None refreshes all DNOs
+
+    Returns:
+        Number of summary rows written
+    """
+    if dno_ids is None:
+        ids = list((await db.execute(select(DNOModel.id))).scalars())
+    else:
+        ids = sorted({dno_id for dno_id in dno_ids if dno_id is not None})
+
+    written = 0
+    for start in range(0, len(ids), REFRESH_CHUNK_SIZE):
+        chunk = ids[start : start + REFRESH_CHUNK_SIZE]
+        rows = await _compute_rows(db, chunk)
+        if not rows:
+            continue
+        stmt = pg_insert(DNOSummaryModel).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DNOSummaryModel.dno_id],
+            set_={
+                **{key: stmt.excluded[key] for key in rows[0] if key != "dno_id"},
+                "refreshed_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
+        written += len(rows)
+    return written
+
+
+async def refresh_dno_summary(db: AsyncSession, dno_id: int | None) -> None:
+    """Refresh one DNO's summary row, logging instead of raising on errors.
+
+    For hooks in the job pipeline and routes: a stale list row must not fail
+    the operation that triggered the refresh. Uses a savepoint so a failed
+    refresh leaves the caller's transaction usable.
+    """
+    if dno_id is None:
+        return
+    try:
+        async with db.begin_nested():
+            await refresh_dno_summaries(db, [dno_id])
+    except Exception as e:
+        logger.error("Failed to refresh DNO summary", dno_id=dno_id, error=str(e))
+
+
+async def fill_missing_dno_summaries(db: AsyncSession) -> int:
+    """Create summary rows for DNOs that have none yet.
+
+    Backfill run at API startup (DNOs that predate the read model); DNO
+    creation paths write their summary row themselves.
+    """
+    missing = await db.execute(
+        select(DNOModel.id)
+        .outerjoin(DNOSummaryModel, DNOSummaryModel.dno_id == DNOModel.id)
+        .where(DNOSummaryModel.dno_id.is_(None))
+    )
+    ids = list(missing.scalars())
+    if not ids:
+        return 0
+    written = await refresh_dno_summaries(db, ids)
+    await db.commit()
+    logger.info("Filled missing DNO summaries", count=written)
+    return written
+
+
+async def _compute_rows(db: AsyncSession, dno_ids: list[int]) -> list[dict]:
+    dnos = (
+        await db.execute(
+            select(DNOModel)
+            .options(
+                selectinload(DNOModel.mastr_data),
+                selectinload(DNOModel.vnb_data),
+                selectinload(DNOModel.bdew_data),
+            )
+            .where(DNOModel.id.in_(dno_ids))
+        )
+    ).scalars()
+
+    netz_levels: dict[int, dict[str, int]] = {}
+    netz_result = await db.execute(
+        select(NetzentgelteModel.dno_id, NetzentgelteModel.voltage_level, func.count())
+        .where(NetzentgelteModel.dno_id.in_(dno_ids))
+        .group_by(NetzentgelteModel.dno_id, NetzentgelteModel.voltage_level)
+    )
+    for dno_id, level, count in netz_result:
+        netz_levels.setdefault(dno_id, {})[level] = count
+
+    hlzf_levels: dict[int, dict[str, int]] = {}
+    hlzf_result = await db.execute(
+        select(HLZFModel.dno_id, HLZFModel.voltage_level, func.count())
+        .where(HLZFModel.dno_id.in_(dno_ids))
+        .group_by(HLZFModel.dno_id, HLZFModel.voltage_level)
+    )
+    for dno_id, level, count in hlzf_result:
+        hlzf_levels.setdefault(dno_id, {})[level] = count
+
+    job_counts: dict[int, dict[str, int]] = {}
+    job_result = await db.execute(
+        select(CrawlJobModel.dno_id, CrawlJobModel.status, func.count())
+        .where(
+            CrawlJobModel.dno_id.in_(dno_ids),
+            CrawlJobModel.status.in_(("running", "pending")),
+        )
+        .group_by(CrawlJobModel.dno_id, CrawlJobModel.status)
+    )
+    for dno_id, job_status, count in job_result:
+        job_counts.setdefault(dno_id, {})[job_status] = count
+
+    return [
+        build_summary_row(
+            dno,
+            netz_levels.get(dno.id, {}),
+            hlzf_levels.get(dno.id, {}),
+            running_jobs=job_counts.get(dno.id, {}).get("running", 0),
+            pending_jobs=job_counts.get(dno.id, {}).get("pending", 0),
+        )
+        for dno in dnos
+    ]
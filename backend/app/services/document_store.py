@@ -0,0 +1,134 @@
+"""
+Content-Addressed Document Store for DNO Crawler.
+
+Every downloaded document is stored once, under the SHA-256 of its bytes.
+The same Preisblatt reached through different URLs, or published by sister
+DNOs of one parent utility, ends up as a single blob. Per-DNO/year references
+live in the download registry (DownloadRegistryModel.file_hash / file_path).
+
+Storage layout:
+    data/blobs/
+    ├── 3f/
+    │   ├── 3fa9...e1.pdf            # blob (extension kept for format detection)
+    │   └── 3fa9...e1.results.json   # memoized analysis results for this content
+    └── ...
+
+Blobs are immutable: they are written once (temp file + rename) and never
+modified or deleted by the pipeline, so any number of references can point
+at the same path.
+
+Analysis results (classification counts, regex extraction records) are
+memoized per content hash under caller-chosen keys that include the year and
+a version, so a document already processed for one DNO is not parsed again
+for the next.
+"""
+
+import asyncio
+import hashlib
+import json
+import uuid
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class DocumentStore:
+    """SHA-256 addressed blob store with per-blob result memo."""
+
+    def __init__(self, root: str | Path):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding the blobs (created on first write)
+        """
+        self.root = Path(root)
+        self.log = logger.bind(component="DocumentStore")
+
+    def blob_path(self, content_hash: str, ext: str) -> Path:
+        """Path of the blob for `content_hash` with file extension `ext`."""
+        return self.root / content_hash[:2] / f"{content_hash}.{ext}"
+
+    def holds(self, path: str | Path) -> bool:
+        """Whether `path` is a file inside this store."""
+        return Path(path).resolve().is_relative_to(self.root.resolve())
+
+    def _results_path(self, content_hash: str) -> Path:
+        return self.root / content_hash[:2] / f"{content_hash}.results.json"
+
+    async def put(self, content: bytes, ext: str) -> tuple[str, Path]:
+        """Store `content` unless an identical blob already exists.
+
+        Returns:
+            Tuple of (sha256 hex digest, blob path)
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        path = self.blob_path(content_hash, ext)
+        stored = await asyncio.to_thread(self._write_blob, path, content)
+        if not stored:
+            self.log.debug("blob_deduplicated", hash=content_hash[:12], ext=ext)
+        return content_hash, path
+
+    @staticmethod
+    def _write_blob(path: Path, content: bytes) -> bool:
+        if path.exists():
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, content)
+        return True
+
+    async def get_result(self, content_hash: str, key: str) -> Any | None:
+        """Return the memoized result stored under `key`, or None."""
+        results = await asyncio.to_thread(self._read_results, content_hash)
+        return results.get(key)
+
+    async def set_result(self, content_hash: str, key: str, value: Any) -> None:
+        """Memoize `value` (JSON-serializable) for this content under `key`."""
+        try:
+            await asyncio.to_thread(self._update_results, content_hash, key, value)
+        except (OSError, TypeError, ValueError) as e:
+            self.log.warning("blob_result_store_failed", hash=content_hash[:12], error=str(e))
+
+    def _read_results(self, content_hash: str) -> dict[str, Any]:
+        path = self._results_path(content_hash)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.log.debug("blob_results_unreadable", path=str(path), error=str(e))
+            return {}
+
+    def _update_results(self, content_hash: str, key: str, value: Any) -> None:
+        # Read-modify-write; a lost update between workers only costs a recompute
+        results = self._read_results(content_hash)
+        results[key] = value
+        path = self._results_path(content_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, json.dumps(results).encode("utf-8"))
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write via a temp file + rename so readers never see partial files."""
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def hash_file(path: str | Path) -> str:
+    """SHA-256 of a file on disk, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_document_store() -> DocumentStore:
+    """Document store rooted at the configured storage path."""
+    from app.core.config import settings
+
+    return DocumentStore(settings.blobs_path)
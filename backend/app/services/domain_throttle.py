@@ -0,0 +1,242 @@
+"""
+Per-Domain Crawl Throttle for DNO Crawler.
+
+Replaces the old "one crawl worker, one job" politeness model with
+Redis-backed coordination so several crawl jobs can run at once:
+
+- Host token buckets: every outgoing crawl request takes a token from the
+  bucket of its host (www.example.de, cdn.example.de, ...). Buckets are shared
+  through Redis, so all crawl workers see the same per-host budget.
+- Domain leases: a crawl job holds a lease on the registered domain of its DNO
+  while it runs. A second job for the same domain is deferred instead of
+  hammering the site in parallel.
+
+Both layers fail open on Redis errors (logged), matching the API rate limiter.
+"""
+
+import asyncio
+from urllib.parse import urlparse
+
+import httpx
+import structlog
+from redis.asyncio import Redis
+
+logger = structlog.get_logger()
+
+# Atomic token bucket with bounded reservations.
+# Takes one token if the caller's slot is at most max_wait away: if the bucket
+# is empty the balance goes negative and the caller gets the time it must wait
+# for its reserved slot, which keeps waiting callers FIFO without polling
+# Redis. A slot further away is refused without taking a token, so the debt
+# never exceeds max_wait and the rate holds under load. Returns
+# {taken, seconds}: the wait for a taken token, or the time until a slot within
+# max_wait opens for a refused one.
+_TOKEN_BUCKET_LUA = """
+local key = KEYS[1]
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then
+    tokens = burst
+    ts = now
+end
+tokens = math.min(burst, tokens + (now - ts) * rate)
+local wait = (1 - tokens) / rate
+if wait > max_wait then
+    return {0, tostring(wait - max_wait)}
+end
+tokens = tokens - 1
+redis.call('HSET', key, 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', key, math.ceil((burst - tokens) / rate) + 60)
+if tokens >= 0 then
+    return {1, '0'}
+end
+return {1, tostring(-tokens / rate)}
+"""
+
+# Take a free lease, or renew it (reset its TTL) if the owner already holds it,
+# e.g. a job re-delivered after its worker died.
+_ACQUIRE_LEASE_LUA = """
+local owner = redis.call('GET', KEYS[1])
+if owner == false or owner == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# Release a lease only if it is still held by the same owner.
+_RELEASE_LEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# Second-level labels that are part of the public suffix (e.g. "example.co.uk")
+_MULTI_LABEL_SUFFIXES = {"co", "com", "org", "net", "gov", "ac"}
+
+
+def registered_domain(url_or_host: str) -> str | None:
+    """Reduce a URL or hostname to its registered domain.
+
+    Examples:
+        "https://www.netze-bw.de/netzentgelte" -> "netze-bw.de"
+        "cdn.stadtwerke-musterstadt.de" -> "stadtwerke-musterstadt.de"
+    """
+    if not url_or_host:
+        return None
+
+    host = urlparse(url_or_host).hostname if "://" in url_or_host else url_or_host
+    if not host:
+        return None
+
+    labels = host.lower().rstrip(".").split(".")
+    if len(labels) <= 2:
+        return ".".join(labels)
+    if labels[-2] in _MULTI_LABEL_SUFFIXES and len(labels[-1]) == 2:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+class HostThrottledError(Exception):
+    """No request slot for a host within max_wait (fail_fast acquire)."""
+
+    def __init__(self, host: str, retry_after: float):
+        super().__init__(f"Host {host} throttled, retry in {retry_after:.1f}s")
+        self.host = host
+        self.retry_after = retry_after
+
+
+class DomainThrottle:
+    """Redis-backed per-host token buckets and per-domain crawl leases."""
+
+    BUCKET_KEY_PREFIX = "crawl:bucket:"
+    LEASE_KEY_PREFIX = "crawl:lease:"
+
+    def __init__(
+        self,
+        redis: Redis,
+        host_rate: float = 1.0,
+        host_burst: int = 2,
+        max_wait: float = 60.0,
+    ):
+        """
+        Initialize the throttle.
+
+        Args:
+            redis: Redis connection shared with the worker
+            host_rate: Sustained requests per second allowed per host
+            host_burst: Bucket size (requests allowed back-to-back)
+            max_wait: Longest wait a reserved slot may need; slots further away are refused
+        """
+        self.redis = redis
+        self.host_rate = host_rate
+        self.host_burst = host_burst
+        self.max_wait = max_wait
+        self._take_token = redis.register_script(_TOKEN_BUCKET_LUA)
+        self._acquire_lease = redis.register_script(_ACQUIRE_LEASE_LUA)
+        self._release_lease = redis.register_script(_RELEASE_LEASE_LUA)
+        self.log = logger.bind(component="DomainThrottle")
+
+    async def acquire(self, host: str, fail_fast: bool = False) -> float:
+        """Wait until a request to `host` is allowed.
+
+        A slot is only reserved when it is at most max_wait away. Otherwise
+        the caller sleeps until such a slot opens and asks again, or, with
+        fail_fast, gets HostThrottledError.
+
+        Returns:
+            Seconds waited (0.0 if a token was immediately available)
+
+        Raises:
+            HostThrottledError: fail_fast is set and no slot is within max_wait
+        """
+        host = host.lower()
+        waited = 0.0
+        while True:
+            try:
+                taken, wait = await self._take_token(
+                    keys=[f"{self.BUCKET_KEY_PREFIX}{host}"],
+                    args=[self.host_rate, self.host_burst, self.max_wait],
+                )
+                wait = float(wait)
+            except Exception as e:
+                self.log.error("Redis error in host token bucket", host=host, error=str(e))
+                return waited
+
+            if taken:
+                break
+            if fail_fast:
+                self.log.warning("host_throttle_refused", host=host, retry_after=round(wait, 2))
+                raise HostThrottledError(host, wait)
+            await asyncio.sleep(wait)
+            waited += wait
+
+        if wait > 0:
+            self.log.debug("host_throttled", host=host, wait_seconds=round(wait, 2))
+            await asyncio.sleep(wait)
+        return waited + wait
+
+    async def try_acquire_lease(self, domain: str, owner: str, ttl_seconds: int) -> bool:
+        """Try to take the crawl lease for a registered domain.
+
+        An owner that already holds the lease renews it. The TTL guarantees
+        that a lease held by a killed worker expires.
+        """
+        try:
+            acquired = await self._acquire_lease(
+                keys=[f"{self.LEASE_KEY_PREFIX}{domain}"], args=[owner, ttl_seconds]
+            )
+            return bool(acquired)
+        except Exception as e:
+            self.log.error("Redis error acquiring domain lease", domain=domain, error=str(e))
+            return True
+
+    async def release_lease(self, domain: str, owner: str) -> None:
+        """Release the crawl lease if `owner` still holds it."""
+        try:
+            await self._release_lease(keys=[f"{self.LEASE_KEY_PREFIX}{domain}"], args=[owner])
+        except Exception as e:
+            self.log.error("Redis error releasing domain lease", domain=domain, error=str(e))
+
+    def event_hooks(self) -> dict[str, list]:
+        """httpx event hooks that throttle every request by its host."""
+
+        async def _throttle_request(request: httpx.Request) -> None:
+            await self.acquire(request.url.host)
+
+        return {"request": [_throttle_request]}
+
+
+# Throttle instance is created with the worker's Redis connection at startup
+_domain_throttle: DomainThrottle | None = None
+
+
+def init_domain_throttle(redis: Redis) -> DomainThrottle:
+    """Initialize the global domain throttle with a Redis connection."""
+    from app.core.config import settings
+
+    global _domain_throttle
+    _domain_throttle = DomainThrottle(
+        redis,
+        host_rate=1.0 / max(settings.crawler_request_delay, 0.1),
+        host_burst=settings.crawler_host_burst,
+    )
+    return _domain_throttle
+
+
+def get_domain_throttle() -> DomainThrottle | None:
+    """Get the global domain throttle, or None outside of crawl workers."""
+    return _domain_throttle
+
+
+def crawl_event_hooks() -> dict[str, list]:
+    """Event hooks for crawl HTTP clients (empty if no throttle is configured)."""
+    throttle = get_domain_throttle()
+    return throttle.event_hooks() if throttle else {}
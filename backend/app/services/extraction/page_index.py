@@ -0,0 +1,120 @@
+"""
+Keyword page index for PDFs.
+
+Netzentgelte and HLZF data usually sits on one to three pages of a document
+that can run to fifty or more (Regelungen, Ergänzende Bedingungen). A cheap
+first pass reads the PyMuPDF page text through pdf_text_cache, records which
+data-relevant keywords occur on which page, and the expensive work (pdfplumber
+text and table extraction, AI page stripping) then only touches the candidate
+pages.
+
+The keyword vocabulary is shared with file classification
+(step_03_classify._keyword_match_*) and AIGateway._pdf_pages_to_keep so all
+stages agree on what a relevant page looks like.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import structlog
+
+from app.services.extraction.pdf_text_cache import get_page_texts
+from app.services.keyword_matcher import KeywordMatcher
+
+logger = structlog.get_logger()
+
+# Strong Netzentgelte keywords (title area of a tariff sheet)
+NETZENTGELTE_KEYWORDS = (
+    "netzentgelt",
+    "netznutzungsentgelt",
+    "leistungspreis",
+    "arbeitspreis",
+)
+
+# Strong HLZF keywords (title area of an HLZF document)
+HLZF_KEYWORDS = (
+    "hochlastzeitfenster",
+    "hochlastzeit",
+    "atypische netznutzung",
+)
+
+VOLTAGE_LEVEL_KEYWORDS = (
+    "mittelspannung",
+    "niederspannung",
+    "hochspannung",
+    "umspannung",
+)
+
+# Weaker terms that still mark a page as data-relevant
+RELATED_KEYWORDS = (
+    "entgelt",
+    "preisblatt",
+    "hochlast",
+    "zeitfenster",
+    "netznutzung",
+)
+
+PAGE_KEYWORDS = tuple(
+    dict.fromkeys(NETZENTGELTE_KEYWORDS + HLZF_KEYWORDS + VOLTAGE_LEVEL_KEYWORDS + RELATED_KEYWORDS)
+)
+PAGE_MATCHER = KeywordMatcher(PAGE_KEYWORDS)
+
+# Candidate pages per data type: a page must hit at least one keyword of every group
+CANDIDATE_RULES: dict[str, tuple[tuple[str, ...], ...]] = {
+    "netzentgelte": (("netzentgelt", "leistungspreis"),),
+    "hlzf": (("hochlast",), ("zeitfenster",)),
+}
+
+# Engine used for the index pass
+INDEX_ENGINE = "pymupdf"
+
+
+@dataclass
+class PageIndex:
+    """Keyword hits per page of one PDF (1-based page numbers)."""
+
+    page_count: int
+    hits: dict[int, frozenset[str]] = field(default_factory=dict)
+
+    def pages_with_any(self, keywords: tuple[str, ...]) -> list[int]:
+        """Pages containing at least one of the keywords."""
+        wanted = set(keywords)
+        return [page for page, found in sorted(self.hits.items()) if found & wanted]
+
+    def candidate_pages(self, data_type: str) -> list[int]:
+        """Pages that may hold `data_type` data ("netzentgelte" or "hlzf")."""
+        groups = CANDIDATE_RULES[data_type]
+        return [
+            page
+            for page, found in sorted(self.hits.items())
+            if all(found.intersection(group) for group in groups)
+        ]
+
+    def relevant_pages(self) -> list[int]:
+        """Pages with any data-relevant keyword."""
+        return self.pages_with_any(PAGE_KEYWORDS)
+
+
+def index_page_texts(page_texts: list[str]) -> PageIndex:
+    """Build a PageIndex from already extracted page texts (index 0 = page 1)."""
+    hits: dict[int, frozenset[str]] = {}
+    for page_num, text in enumerate(page_texts, 1):
+        found = PAGE_MATCHER.hits(text)
+        if found:
+            hits[page_num] = found
+    return PageIndex(page_count=len(page_texts), hits=hits)
+
+
+def build_page_index(source: str | Path | bytes, content_hash: str | None = None) -> PageIndex:
+    """Build the keyword page index of a PDF from cached PyMuPDF page text.
+
+    Args:
+        source: PDF path or raw bytes
+        content_hash: SHA-256 of the PDF if the caller already knows it
+
+    Returns:
+        PageIndex with the keyword hits of every page
+    """
+    index = index_page_texts(get_page_texts(source, content_hash=content_hash, engine=INDEX_ENGINE))
+    logger.debug("pdf_page_index_built", page_count=index.page_count, hit_pages=len(index.hits))
+    return index
@@ -0,0 +1,235 @@
+"""
+Process-pool parsing engine for CPU-heavy document parsing.
+
+pdfplumber, openpyxl and xlrd are pure Python and hold the GIL, so running
+them through asyncio.to_thread serializes every parse in a worker and stalls
+the event loop. Workers that call init_parse_pool() at startup run these
+parsers in a pool of separate processes instead:
+
+- Sized pool (parse_pool_workers, 0 = one process per CPU); each task runs
+  alone in one of the pool's processes, which are reused between tasks
+- Per-task timeout (parse_task_timeout): the process running a task that
+  exceeds it is killed and replaced, and the caller gets ParseTimeoutError;
+  tasks in the other processes are not affected
+- Per-process memory cap (parse_memory_limit_mb, RLIMIT_AS): a pathological
+  PDF raises MemoryError inside its own process instead of taking down the
+  worker
+- A crashed process (segfault, OOM kill) fails only its own task and is
+  replaced for the next one
+
+Outside of workers (API, scripts, tests) no pool is configured and
+run_parser() falls back to asyncio.to_thread, so callers don't need to care.
+
+Parser functions must be picklable (module-level functions or staticmethods)
+and take picklable arguments (paths, bytes).
+"""
+
+import asyncio
+import multiprocessing
+import os
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from typing import Any, TypeVar
+
+import structlog
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+# Seconds an idle parser process gets to exit on shutdown before it is killed
+SHUTDOWN_GRACE_SECONDS = 5.0
+
+
+class ParseTimeoutError(TimeoutError):
+    """A parser task exceeded the per-task timeout and was killed."""
+
+
+class ParseCrashedError(RuntimeError):
+    """The parser process died (crash or OOM kill) while running a task."""
+
+
+def _init_parse_process(memory_limit_bytes: int) -> None:
+    """Parser process start-up: apply the address-space cap."""
+    if memory_limit_bytes <= 0:
+        return
+    try:
+        import resource
+
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+    except (ImportError, ValueError, OSError):
+        pass  # Not supported on this platform; run without a cap
+
+
+def _parse_process_main(conn: Connection, memory_limit_bytes: int) -> None:
+    """Parser process loop: run (fn, args) tasks from the pipe until it closes."""
+    _init_parse_process(memory_limit_bytes)
+    while True:
+        try:
+            fn, args = conn.recv()
+        except EOFError:
+            return
+        try:
+            reply = (True, fn(*args))
+        except BaseException as e:
+            reply = (False, e)
+        try:
+            conn.send(reply)
+        except Exception as e:  # Unpicklable result or exception
+            conn.send((False, RuntimeError(f"{fn.__qualname__}: unpicklable result: {e!r}")))
+
+
+class _ParseProcess:
+    """One parser process and the pipe that feeds it one task at a time."""
+
+    def __init__(self, context: multiprocessing.context.BaseContext, memory_limit_bytes: int):
+        self._conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_parse_process_main,
+            args=(child_conn, memory_limit_bytes),
+            name="parse-pool",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    async def run(self, fn: Callable[..., Any], args: tuple, timeout: float) -> tuple[bool, Any]:
+        """Send a task and wait for its (ok, result-or-exception) reply.
+
+        Raises:
+            TimeoutError: no reply within timeout
+            EOFError: the process died
+        """
+        self._conn.send((fn, args))
+        return await asyncio.wait_for(asyncio.to_thread(self._conn.recv), timeout=timeout)
+
+    def kill(self) -> None:
+        """Kill the process (a blocked recv in the reply thread then gets EOFError).
+
+        The pipe is left to be closed when the reply thread lets go of it.
+        """
+        self.process.kill()
+        self.process.join()
+
+    def stop(self, grace: float) -> None:
+        """Let an idle process exit by closing its pipe; kill it after `grace` seconds."""
+        self._conn.close()
+        self.process.join(grace)
+        if self.process.is_alive():
+            self.kill()
+
+
+class ParsePool:
+    """Parser processes with per-task timeouts, memory caps and crash recovery."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        task_timeout: float = 120.0,
+        memory_limit_mb: int = 2048,
+    ):
+        """
+        Initialize the pool (processes are started lazily on first use).
+
+        Args:
+            max_workers: Number of parser processes (None = os.cpu_count())
+            task_timeout: Seconds a single parse may take before it is killed
+            memory_limit_mb: Address-space cap per parser process (0 = unlimited)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.task_timeout = task_timeout
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024
+        # Fresh interpreters: forking a process with a running event loop is unsafe
+        self._context = multiprocessing.get_context("spawn")
+        self._slots: asyncio.Semaphore | None = None
+        self._idle: list[_ParseProcess] = []
+        self._busy: set[_ParseProcess] = set()
+        self.log = logger.bind(component="ParsePool")
+
+    async def run(self, fn: Callable[..., T], *args: Any, timeout: float | None = None) -> T:
+        """Run `fn(*args)` in a parser process of its own.
+
+        Raises:
+            ParseTimeoutError: the task exceeded its timeout (its process is killed)
+            ParseCrashedError: the parser process died
+            Exception: anything `fn` raised (including MemoryError from the cap)
+        """
+        timeout = timeout or self.task_timeout
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+
+        async with self._slots:
+            worker = self._idle.pop() if self._idle else self._start_process()
+            self._busy.add(worker)
+            try:
+                ok, value = await worker.run(fn, args, timeout)
+            except TimeoutError:
+                self.log.warning("parse_task_timeout", fn=fn.__qualname__, timeout=timeout)
+                worker.kill()
+                raise ParseTimeoutError(f"{fn.__qualname__} exceeded {timeout}s") from None
+            except (EOFError, OSError) as e:
+                self.log.error("parse_process_died", fn=fn.__qualname__, error=str(e))
+                worker.kill()
+                raise ParseCrashedError(f"Parser process died running {fn.__qualname__}") from e
+            except BaseException:
+                # Cancelled mid-task: the process may still be busy, don't reuse it
+                worker.kill()
+                raise
+            finally:
+                self._busy.discard(worker)
+
+            self._idle.append(worker)
+
+        if not ok:
+            raise value
+        return value
+
+    def _start_process(self) -> _ParseProcess:
+        return _ParseProcess(self._context, self.memory_limit_bytes)
+
+    def shutdown(self) -> None:
+        """Stop the parser processes."""
+        idle, self._idle = self._idle, []
+        busy, self._busy = self._busy, set()
+        for worker in idle:
+            worker.stop(SHUTDOWN_GRACE_SECONDS)
+        for worker in busy:
+            worker.kill()
+
+
+# Pool instance is created by workers at startup
+_parse_pool: ParsePool | None = None
+
+
+def init_parse_pool() -> ParsePool:
+    """Initialize the global parse pool from settings."""
+    from app.core.config import settings
+
+    global _parse_pool
+    _parse_pool = ParsePool(
+        max_workers=settings.parse_pool_workers or None,
+        task_timeout=settings.parse_task_timeout,
+        memory_limit_mb=settings.parse_memory_limit_mb,
+    )
+    return _parse_pool
+
+
+def get_parse_pool() -> ParsePool | None:
+    """Get the global parse pool, or None outside of workers."""
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Shut down the global parse pool (worker shutdown)."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown()
+        _parse_pool = None
+
+
+async def run_parser(fn: Callable[..., T], *args: Any) -> T:
+    """Run a CPU-bound parser in the process pool, or a thread if none is configured."""
+    pool = get_parse_pool()
+    if pool is None:
+        return await asyncio.to_thread(fn, *args)
+    return await pool.run(fn, *args)
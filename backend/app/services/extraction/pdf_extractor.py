@@ -1,22 +1,37 @@
 """
 PDF extraction utilities for DNO data extraction.
 
-Uses pdfplumber to extract text and tables from Netzentgelte PDFs.
+Extracts text and tables from Netzentgelte/HLZF PDFs with two engines:
+PyMuPDF first (fast), pdfplumber as fallback when the PyMuPDF tables don't
+yield records that pass the shared sanity check. Page text and tables are read
+through pdf_text_cache, so a PDF already parsed by classification or
+verification is not parsed again here, and only for the candidate pages of
+the keyword page index (page_index), not the whole document.
 """
 
-import asyncio
 import re
 from pathlib import Path
 from typing import Any
 
-import pdfplumber
 import structlog
 
 from app.core.constants import normalize_voltage_level
 from app.core.parsers import parse_german_number
+from app.services.extraction.page_index import build_page_index
+from app.services.extraction.parse_pool import run_parser
+from app.services.extraction.pdf_text_cache import (
+    get_page_tables,
+    get_page_text_map,
+    get_page_texts,
+    pdf_content_hash,
+)
+from app.services.extraction.validation import validate_extraction_sanity
 
 logger = structlog.get_logger()
 
+# Engine order for engine="auto": fast path first, reference engine as fallback
+PDF_ENGINES = ("pymupdf", "pdfplumber")
+
 
 def _parse_number_or_log(raw: str, field: str, page_num: int, voltage_level: str) -> float:
     """Parse numeric values and log malformed entries instead of silently skipping."""
@@ -36,13 +51,39 @@ def _parse_number_or_log(raw: str, field: str, page_num: int, voltage_level: str
 async def extract_netzentgelte_from_pdf_async(pdf_path: str | Path) -> list[dict[str, Any]]:
     """Async wrapper for extract_netzentgelte_from_pdf.
 
-    Wraps the synchronous pdfplumber operations in asyncio.to_thread()
-    to avoid blocking the event loop.
+    Runs the synchronous pdfplumber operations in the parse pool (separate
+    process, with timeout and memory cap) to avoid blocking the event loop.
     """
-    return await asyncio.to_thread(extract_netzentgelte_from_pdf, pdf_path)
+    return await run_parser(extract_netzentgelte_from_pdf, pdf_path)
+
+
+def _extract_with_fallback(
+    extract_fn, pdf_path: str | Path, data_type: str, engine: str
+) -> list[dict[str, Any]]:
+    """Run `extract_fn` with PyMuPDF, falling back to pdfplumber if the result fails sanity.
+
+    With an explicit engine ("pymupdf" / "pdfplumber") only that engine runs.
+    """
+    if engine != "auto":
+        return extract_fn(pdf_path, engine)
+
+    fast, reference = PDF_ENGINES
+    try:
+        records = extract_fn(pdf_path, fast)
+        passed, reason = validate_extraction_sanity(records, data_type)
+    except Exception as e:
+        passed, reason = False, f"{fast} failed: {e}"
+
+    if passed:
+        return records
+
+    logger.info("pdf_engine_fallback", pdf_path=str(pdf_path), engine=reference, reason=reason)
+    return extract_fn(pdf_path, reference)
 
 
-def extract_netzentgelte_from_pdf(pdf_path: str | Path) -> list[dict[str, Any]]:
+def extract_netzentgelte_from_pdf(
+    pdf_path: str | Path, engine: str = "auto"
+) -> list[dict[str, Any]]:
     """
     Extract Netzentgelte data from a PDF file.
 
@@ -50,35 +91,42 @@ def extract_netzentgelte_from_pdf(pdf_path: str | Path) -> list[dict[str, Any]]:
 
     Args:
         pdf_path: Path to the PDF file
+        engine: "auto" (PyMuPDF, pdfplumber fallback), "pymupdf" or "pdfplumber"
 
     Returns:
         List of dictionaries with extracted Netzentgelte records
     """
-    log = logger.bind(pdf_path=str(pdf_path))
+    return _extract_with_fallback(_extract_netzentgelte, pdf_path, "netzentgelte", engine)
+
+
+def _extract_netzentgelte(pdf_path: str | Path, engine: str) -> list[dict[str, Any]]:
+    """Netzentgelte extraction with one PDF engine."""
+    log = logger.bind(pdf_path=str(pdf_path), engine=engine)
     log.info("Starting PDF extraction")
 
     records = []
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            log.info("pdf_opened", page_count=len(pdf.pages))
+        content_hash = pdf_content_hash(pdf_path)
+        index = build_page_index(pdf_path, content_hash)
+        log.info("pdf_opened", page_count=index.page_count)
 
-            for page_num, page in enumerate(pdf.pages, 1):
-                text = page.extract_text() or ""
+        # Only pages with Netzentgelte keywords are parsed with the engine
+        data_pages = index.candidate_pages("netzentgelte")
+        page_texts = get_page_text_map(pdf_path, data_pages, content_hash, engine=engine)
+        page_tables = get_page_tables(pdf_path, data_pages, content_hash, engine=engine)
 
-                # Look for Netzentgelte data patterns
-                if "netzentgelt" in text.lower() or "leistungspreis" in text.lower():
-                    log.info("potential_data_found", page=page_num)
+        for page_num in data_pages:
+            log.info("potential_data_found", page=page_num)
 
-                    # Try to extract structured data from text
-                    page_records = _parse_netzentgelte_text(text, page_num)
-                    records.extend(page_records)
+            # Try to extract structured data from text
+            page_records = _parse_netzentgelte_text(page_texts[page_num], page_num)
+            records.extend(page_records)
 
-                    # Also try table extraction
-                    tables = page.extract_tables()
-                    for table in tables:
-                        table_records = _parse_netzentgelte_table(table, page_num)
-                        records.extend(table_records)
+            # Also try table extraction
+            for table in page_tables[page_num]:
+                table_records = _parse_netzentgelte_table(table, page_num)
+                records.extend(table_records)
 
     except Exception as e:
         log.error("pdf_extraction_error", error=str(e))
@@ -396,13 +444,13 @@ def find_pdf_url_for_dno(dno_name: str, year: int, pdf_type: str = "netzentgelte
 async def extract_hlzf_from_pdf_async(pdf_path: str | Path) -> list[dict[str, Any]]:
     """Async wrapper for extract_hlzf_from_pdf.
 
-    Wraps the synchronous pdfplumber operations in asyncio.to_thread()
-    to avoid blocking the event loop.
+    Runs the synchronous pdfplumber operations in the parse pool (separate
+    process, with timeout and memory cap) to avoid blocking the event loop.
     """
-    return await asyncio.to_thread(extract_hlzf_from_pdf, pdf_path)
+    return await run_parser(extract_hlzf_from_pdf, pdf_path)
 
 
-def extract_hlzf_from_pdf(pdf_path: str | Path) -> list[dict[str, Any]]:
+def extract_hlzf_from_pdf(pdf_path: str | Path, engine: str = "auto") -> list[dict[str, Any]]:
     """
     Extract HLZF (Hochlastzeitfenster) data from Regelungen PDF.
 
@@ -410,12 +458,17 @@ def extract_hlzf_from_pdf(pdf_path: str | Path) -> list[dict[str, Any]]:
 
     Args:
         pdf_path: Path to the Regelungen PDF file
+        engine: "auto" (PyMuPDF, pdfplumber fallback), "pymupdf" or "pdfplumber"
 
     Returns:
         List of dictionaries with HLZF records per voltage level
     """
+    return _extract_with_fallback(_extract_hlzf, pdf_path, "hlzf", engine)
+
 
-    log = logger.bind(pdf_path=str(pdf_path))
+def _extract_hlzf(pdf_path: str | Path, engine: str) -> list[dict[str, Any]]:
+    """HLZF extraction with one PDF engine."""
+    log = logger.bind(pdf_path=str(pdf_path), engine=engine)
     log.info("Starting HLZF extraction from PDF")
 
     records = []
@@ -423,43 +476,42 @@ def extract_hlzf_from_pdf(pdf_path: str | Path) -> list[dict[str, Any]]:
     # Voltage level patterns to look for
 
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            log.info("pdf_opened", page_count=len(pdf.pages))
-
-            # Find the HLZF table - typically has "Hochlastzeitfenster" header
-            full_text = ""
-
-            for page_num, page in enumerate(pdf.pages, 1):
-                text = page.extract_text() or ""
-                full_text += text + "\n"
-
-                if "hochlast" in text.lower() and "zeitfenster" in text.lower():
-                    log.info("hlzf_table_found", page=page_num)
-
-                    # Try to extract table from this page
-                    tables = page.extract_tables()
-
-                    # Merge fragmented tables (Netze BW 2023 issue)
-                    merged_tables = _merge_tables(tables)
-
-                    for table in merged_tables:
-                        hlzf_records = _parse_hlzf_table(table, page_num)
-                        if hlzf_records:
-                            records.extend(hlzf_records)
-                            log.info("hlzf_records_from_table", count=len(hlzf_records))
-
-                    # Fallback: try cross-table parsing for fragmented PDFs
-                    # (e.g. season header in one table, data rows in separate tables)
-                    if not records and tables:
-                        cross_records = _parse_hlzf_fragmented_tables(tables, page_num)
-                        if cross_records:
-                            records.extend(cross_records)
-                            log.info("hlzf_records_from_fragmented", count=len(cross_records))
-
-            # If no table extraction worked, try text-based extraction
-            if not records:
-                log.info("table_extraction_failed_trying_text")
-                records = _parse_hlzf_text(full_text)
+        content_hash = pdf_content_hash(pdf_path)
+        index = build_page_index(pdf_path, content_hash)
+        log.info("pdf_opened", page_count=index.page_count)
+
+        # Find the HLZF table - typically has "Hochlastzeitfenster" header
+        hlzf_pages = index.candidate_pages("hlzf")
+        page_tables = get_page_tables(pdf_path, hlzf_pages, content_hash, engine=engine)
+
+        for page_num in hlzf_pages:
+            log.info("hlzf_table_found", page=page_num)
+
+            # Try to extract table from this page
+            tables = page_tables[page_num]
+
+            # Merge fragmented tables (Netze BW 2023 issue)
+            merged_tables = _merge_tables(tables)
+
+            for table in merged_tables:
+                hlzf_records = _parse_hlzf_table(table, page_num)
+                if hlzf_records:
+                    records.extend(hlzf_records)
+                    log.info("hlzf_records_from_table", count=len(hlzf_records))
+
+            # Fallback: try cross-table parsing for fragmented PDFs
+            # (e.g. season header in one table, data rows in separate tables)
+            if not records and tables:
+                cross_records = _parse_hlzf_fragmented_tables(tables, page_num)
+                if cross_records:
+                    records.extend(cross_records)
+                    log.info("hlzf_records_from_fragmented", count=len(cross_records))
+
+        # If no table extraction worked, try text-based extraction
+        if not records:
+            log.info("table_extraction_failed_trying_text")
+            page_texts = get_page_texts(pdf_path, content_hash=content_hash, engine=engine)
+            records = _parse_hlzf_text("".join(text + "\n" for text in page_texts))
 
     except Exception as e:
         log.error("hlzf_extraction_error", error=str(e))
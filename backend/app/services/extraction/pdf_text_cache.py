@@ -0,0 +1,316 @@
+"""
+Memoized page-level PDF text and table extraction.
+
+Classification, content verification, regex extraction and the AI gateway all
+need the text (and sometimes the tables) of the same PDF. Instead of each
+stage opening it with pdfplumber again, they read pages through this cache.
+
+Two extraction engines are supported:
+- "pdfplumber": the reference engine (slow, precise table detection)
+- "pymupdf": fast path (words sorted into reading order, `Page.find_tables()`)
+
+Entries are keyed by the SHA-256 of the PDF bytes, the engine and its
+EXTRACTOR_VERSIONS entry, and persisted next to the document's blob in the
+content-addressed store:
+
+    data/blobs/3f/3fa9...e1.pdf                    # blob (document store)
+    data/blobs/3f/3fa9...e1.pages.json             # pdfplumber pages
+    data/blobs/3f/3fa9...e1.pages-pymupdf.json     # PyMuPDF pages
+
+Pages are filled in lazily: a caller that only needs the first three pages
+does not pay for the rest, and tables are only extracted for pages a caller
+asks for. A small in-process LRU avoids re-reading the JSON within a worker.
+
+Callers passing bytes that are not a stored blob (e.g. content being verified
+before it is saved) set persist=False, so no sidecar is left without its blob.
+
+All functions are synchronous and CPU bound; async code calls them through
+run_parser (app.services.extraction.parse_pool), which runs them in the parse
+process pool, or in a thread when no pool is configured. Each pool process has
+its own in-memory LRU; the sidecars are what the processes share.
+"""
+
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import fitz  # PyMuPDF
+import pdfplumber
+import structlog
+
+from app.services.document_store import atomic_write, hash_file
+
+logger = structlog.get_logger()
+
+# Bump the suffix when the way text/tables are extracted changes
+EXTRACTOR_VERSIONS = {
+    "pdfplumber": f"pdfplumber-{pdfplumber.__version__}-1",
+    "pymupdf": f"pymupdf-{fitz.VersionBind}-1",
+}
+DEFAULT_ENGINE = "pdfplumber"
+
+# Max vertical distance (points) between words on the same PyMuPDF text line
+LINE_TOLERANCE = 3.0
+
+# Parsed entries kept in memory per process
+MEMORY_CACHE_SIZE = 32
+
+Table = list[list[str | None]]
+
+_memory_cache: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def pdf_content_hash(source: str | Path | bytes) -> str:
+    """SHA-256 of a PDF given as path or bytes."""
+    if isinstance(source, bytes):
+        return hashlib.sha256(source).hexdigest()
+    return hash_file(source)
+
+
+def get_page_texts(
+    source: str | Path | bytes,
+    max_pages: int | None = None,
+    content_hash: str | None = None,
+    engine: str = DEFAULT_ENGINE,
+    persist: bool = True,
+) -> list[str]:
+    """Text of each page, from cache where possible.
+
+    Args:
+        source: PDF path or raw bytes
+        max_pages: Only return (and extract) the first N pages
+        content_hash: SHA-256 of the PDF if the caller already knows it
+        engine: "pdfplumber" or "pymupdf"
+        persist: Write extracted pages to the sidecar; False keeps them in memory only
+
+    Returns:
+        List of page texts, index 0 = page 1 ("" for pages without text)
+    """
+    entry = _load_entry(source, content_hash, engine)
+    count = entry["page_count"]
+    wanted = range(1, (min(count, max_pages) if max_pages else count) + 1)
+
+    missing = [n for n in wanted if str(n) not in entry["text"]]
+    if missing:
+        entry = _fill(source, entry, text_pages=missing, persist=persist)
+
+    return [entry["text"][str(n)] for n in wanted]
+
+
+def get_page_text_map(
+    source: str | Path | bytes,
+    page_numbers: Iterable[int],
+    content_hash: str | None = None,
+    engine: str = DEFAULT_ENGINE,
+) -> dict[int, str]:
+    """Text of selected pages only, from cache where possible.
+
+    Args:
+        source: PDF path or raw bytes
+        page_numbers: 1-based page numbers to return text for
+        content_hash: SHA-256 of the PDF if the caller already knows it
+        engine: "pdfplumber" or "pymupdf"
+
+    Returns:
+        Dict of page number -> page text
+    """
+    entry = _load_entry(source, content_hash, engine)
+    pages = [n for n in page_numbers if 1 <= n <= entry["page_count"]]
+
+    missing = [n for n in pages if str(n) not in entry["text"]]
+    if missing:
+        entry = _fill(source, entry, text_pages=missing)
+
+    return {n: entry["text"][str(n)] for n in pages}
+
+
+def get_page_tables(
+    source: str | Path | bytes,
+    page_numbers: Iterable[int],
+    content_hash: str | None = None,
+    engine: str = DEFAULT_ENGINE,
+) -> dict[int, list[Table]]:
+    """Tables of the given pages, from cache where possible.
+
+    Args:
+        source: PDF path or raw bytes
+        page_numbers: 1-based page numbers to return tables for
+        content_hash: SHA-256 of the PDF if the caller already knows it
+        engine: "pdfplumber" or "pymupdf"
+
+    Returns:
+        Dict of page number -> list of tables (rows of cell strings)
+    """
+    entry = _load_entry(source, content_hash, engine)
+    pages = [n for n in page_numbers if 1 <= n <= entry["page_count"]]
+
+    missing = [n for n in pages if str(n) not in entry["tables"]]
+    if missing:
+        entry = _fill(source, entry, table_pages=missing)
+
+    return {n: entry["tables"][str(n)] for n in pages}
+
+
+# =============================================================================
+# Internals
+# =============================================================================
+
+
+def _sidecar_path(content_hash: str, engine: str) -> Path:
+    from app.core.config import settings
+
+    suffix = "" if engine == "pdfplumber" else f"-{engine}"
+    return Path(settings.blobs_path) / content_hash[:2] / f"{content_hash}.pages{suffix}.json"
+
+
+def _open_pdf(source: str | Path | bytes):
+    return pdfplumber.open(io.BytesIO(source) if isinstance(source, bytes) else source)
+
+
+def _open_fitz(source: str | Path | bytes) -> fitz.Document:
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+
+def _page_count(source: str | Path | bytes, engine: str) -> int:
+    if engine == "pymupdf":
+        with _open_fitz(source) as doc:
+            return len(doc)
+    with _open_pdf(source) as pdf:
+        return len(pdf.pages)
+
+
+def _load_entry(
+    source: str | Path | bytes, content_hash: str | None, engine: str
+) -> dict[str, Any]:
+    if engine not in EXTRACTOR_VERSIONS:
+        raise ValueError(f"Unknown PDF engine: {engine}")
+    content_hash = content_hash or pdf_content_hash(source)
+    key = (content_hash, engine)
+
+    with _memory_lock:
+        entry = _memory_cache.get(key)
+        if entry is not None:
+            _memory_cache.move_to_end(key)
+            return entry
+
+    entry = _read_sidecar(content_hash, engine)
+    if entry is None:
+        entry = {
+            "content_hash": content_hash,
+            "engine": engine,
+            "version": EXTRACTOR_VERSIONS[engine],
+            "page_count": _page_count(source, engine),
+            "text": {},
+            "tables": {},
+        }
+
+    _remember(entry)
+    return entry
+
+
+def _read_sidecar(content_hash: str, engine: str) -> dict[str, Any] | None:
+    path = _sidecar_path(content_hash, engine)
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug("pdf_text_cache_unreadable", path=str(path), error=str(e))
+        return None
+
+    if entry.get("version") != EXTRACTOR_VERSIONS[engine]:
+        return None
+    return entry
+
+
+def _remember(entry: dict[str, Any]) -> None:
+    key = (entry["content_hash"], entry["engine"])
+    with _memory_lock:
+        _memory_cache[key] = entry
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _fill(
+    source: str | Path | bytes,
+    entry: dict[str, Any],
+    text_pages: Iterable[int] = (),
+    table_pages: Iterable[int] = (),
+    persist: bool = True,
+) -> dict[str, Any]:
+    """Extract the missing pages in one pass of the entry's engine and persist it."""
+    text_pages = list(text_pages)
+    table_pages = list(table_pages)
+    text: dict[str, str] = {}
+    tables: dict[str, list[Table]] = {}
+
+    if entry["engine"] == "pymupdf":
+        with _open_fitz(source) as doc:
+            for n in text_pages:
+                text[str(n)] = _fitz_page_text(doc[n - 1])
+            for n in table_pages:
+                tables[str(n)] = _fitz_page_tables(doc[n - 1])
+    else:
+        with _open_pdf(source) as pdf:
+            for n in text_pages:
+                text[str(n)] = pdf.pages[n - 1].extract_text() or ""
+            for n in table_pages:
+                tables[str(n)] = pdf.pages[n - 1].extract_tables()
+
+    # Build a new entry instead of mutating: other threads may be reading it
+    entry = {
+        **entry,
+        "text": {**entry["text"], **text},
+        "tables": {**entry["tables"], **tables},
+    }
+    _remember(entry)
+    if persist:
+        _write_sidecar(entry)
+    return entry
+
+
+def _fitz_page_text(page: fitz.Page) -> str:
+    """Page text in reading order, one line per visual line (like pdfplumber).
+
+    Words whose tops lie within LINE_TOLERANCE points form one line (table
+    cells of a row end up on the same line), lines run top-to-bottom and words
+    left-to-right, so regexes written against pdfplumber output keep working.
+    """
+    words = sorted(page.get_text("words"), key=lambda w: (w[1], w[0]))
+
+    lines: list[list[tuple]] = []
+    for word in words:
+        if lines and abs(word[1] - lines[-1][0][1]) <= LINE_TOLERANCE:
+            lines[-1].append(word)
+        else:
+            lines.append([word])
+
+    return "\n".join(" ".join(w[4] for w in sorted(line, key=lambda w: w[0])) for line in lines)
+
+
+def _fitz_page_tables(page: fitz.Page) -> list[Table]:
+    """Table candidates detected by PyMuPDF, as rows of cell strings."""
+    try:
+        finder = page.find_tables()
+    except Exception as e:  # Table detection is heuristic; treat failures as "no tables"
+        logger.debug("pymupdf_find_tables_failed", page=page.number + 1, error=str(e))
+        return []
+    return [table.extract() for table in finder.tables]
+
+
+def _write_sidecar(entry: dict[str, Any]) -> None:
+    path = _sidecar_path(entry["content_hash"], entry["engine"])
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, json.dumps(entry).encode("utf-8"))
+    except OSError as e:
+        logger.warning("pdf_text_cache_write_failed", path=str(path), error=str(e))
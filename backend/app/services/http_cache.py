@@ -0,0 +1,267 @@
+"""
+Persistent HTTP Conditional-Request Cache for DNO Crawler.
+
+Remembers the validators (ETag / Last-Modified) of every page and document
+fetched by the crawl pipeline, together with where its body lives on disk.
+On a re-crawl the next request carries If-None-Match / If-Modified-Since, and
+a 304 answer lets the caller reuse the stored bytes instead of downloading
+the whole Preisblatt again.
+
+Storage layout (one JSON entry per normalized URL):
+    data/http-cache/
+    ├── 3f/
+    │   ├── 3fa9...e1.json   # validators + body location
+    │   └── 3fa9...e1.body   # body, only for callers that don't keep their own copy
+    └── ...
+
+Downloaded files are not duplicated: the download step stores the path of the
+blob it already saved in the document store. An entry whose body file has
+disappeared is treated as a miss, so the next request is unconditional.
+
+Eviction (an evicted entry only costs one unconditional request):
+- TTL (http_cache_ttl_days): entries not used for longer are treated as misses
+  and removed, e.g. URLs that dropped out of the crawl
+- LRU (http_cache_max_entries): a hit refreshes the entry's mtime; on the first
+  write of a process and then every EVICT_EVERY_WRITES writes, expired entries
+  and the least recently used ones beyond the limit are deleted with their own
+  body copies (document store blobs are never touched)
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import itertools
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+import structlog
+
+from app.services.document_store import atomic_write
+from app.services.url_utils import normalize_url
+
+logger = structlog.get_logger()
+
+# Writes between two eviction passes (each pass lists and stats every entry)
+EVICT_EVERY_WRITES = 100
+
+
+@dataclass
+class CachedResponse:
+    """Validators and body location of a previously fetched URL."""
+
+    url: str
+    body_path: str
+    etag: str | None = None
+    last_modified: str | None = None
+    content_type: str = ""
+    file_format: str | None = None
+    content_hash: str | None = None
+    size_bytes: int = 0
+    stored_at: str | None = None
+
+
+class HttpCache:
+    """On-disk store of HTTP validators keyed by normalized URL."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        evict_every: int = EVICT_EVERY_WRITES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            root: Directory holding the cache entries (created on first write)
+            ttl_seconds: Time without use after which an entry is a miss (None = no expiry)
+            max_entries: Entries kept before the least recently used are evicted (None = no cap)
+            evict_every: Writes between two eviction passes
+        """
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.evict_every = max(evict_every, 1)
+        self._writes = itertools.count()  # Atomic increment across writer threads
+        self.log = logger.bind(component="HttpCache")
+
+    @staticmethod
+    def cache_key(url: str) -> str:
+        """SHA-256 of the normalized URL."""
+        return hashlib.sha256(normalize_url(url).encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    async def get(self, url: str) -> CachedResponse | None:
+        """Return the cache entry for `url`, or None if missing or its body is gone."""
+        return await asyncio.to_thread(self._read_entry, url)
+
+    def _read_entry(self, url: str) -> CachedResponse | None:
+        path = self._entry_path(self.cache_key(url))
+        try:
+            if self._expired(path.stat().st_mtime, time.time()):
+                self._remove(path)
+                return None
+            data = json.loads(path.read_text(encoding="utf-8"))
+            entry = CachedResponse(**data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            self.log.debug("http_cache_entry_unreadable", path=str(path), error=str(e))
+            return None
+
+        if not Path(entry.body_path).is_file():
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)  # Mark as recently used for TTL and LRU eviction
+        return entry
+
+    @staticmethod
+    def conditional_headers(entry: CachedResponse | None) -> dict[str, str]:
+        """Request headers that let the server answer 304 for `entry`."""
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    async def store(
+        self,
+        url: str,
+        response_headers: httpx.Headers | dict[str, str],
+        *,
+        body_path: str | Path | None = None,
+        body: bytes | None = None,
+        file_format: str | None = None,
+        content_hash: str | None = None,
+    ) -> CachedResponse | None:
+        """Record the validators of a 200 response.
+
+        Exactly one of `body_path` (the caller already saved the body) or
+        `body` (the cache keeps its own copy) must be given. Responses without
+        ETag and Last-Modified can't be revalidated and are not cached.
+
+        Returns:
+            The stored entry, or None if the response was not cacheable
+        """
+        return await asyncio.to_thread(
+            self._write_entry, url, response_headers, body_path, body, file_format, content_hash
+        )
+
+    def _write_entry(
+        self,
+        url: str,
+        response_headers: httpx.Headers | dict[str, str],
+        body_path: str | Path | None,
+        body: bytes | None,
+        file_format: str | None,
+        content_hash: str | None,
+    ) -> CachedResponse | None:
+        headers = {k.lower(): v for k, v in response_headers.items()}
+        etag = headers.get("etag")
+        last_modified = headers.get("last-modified")
+        key = self.cache_key(url)
+        entry_path = self._entry_path(key)
+
+        if not etag and not last_modified:
+            # Validators went away; drop the stale entry so we stop sending them
+            self._remove(entry_path)
+            return None
+
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            if body is not None:
+                own_body = entry_path.with_suffix(".body")
+                atomic_write(own_body, body)
+                body_path = own_body
+                size = len(body)
+                content_hash = content_hash or hashlib.sha256(body).hexdigest()
+            elif body_path is not None:
+                size = Path(body_path).stat().st_size
+            else:
+                raise ValueError("store() needs body or body_path")
+
+            entry = CachedResponse(
+                url=url,
+                body_path=str(body_path),
+                etag=etag,
+                last_modified=last_modified,
+                content_type=headers.get("content-type", ""),
+                file_format=file_format,
+                content_hash=content_hash,
+                size_bytes=size,
+                stored_at=datetime.now(UTC).isoformat(),
+            )
+            atomic_write(entry_path, json.dumps(asdict(entry)).encode("utf-8"))
+        except OSError as e:
+            self.log.warning("http_cache_store_failed", url=url[:80], error=str(e))
+            return None
+        if next(self._writes) % self.evict_every == 0:
+            self._evict()
+        return entry
+
+    async def read_body(self, entry: CachedResponse) -> bytes:
+        """Read the stored body of a cache entry."""
+        return await asyncio.to_thread(Path(entry.body_path).read_bytes)
+
+    def _expired(self, mtime: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - mtime > self.ttl_seconds
+
+    @staticmethod
+    def _remove(entry_path: Path) -> None:
+        """Delete an entry and the body copy the cache keeps for it, if any."""
+        entry_path.unlink(missing_ok=True)
+        entry_path.with_suffix(".body").unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        if self.ttl_seconds is None and self.max_entries is None:
+            return
+        now = time.time()
+        entries = []
+        expired = 0
+        for path in self.root.glob("*/*.json"):
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if self._expired(mtime, now):
+                self._remove(path)
+                expired += 1
+            else:
+                entries.append((mtime, path))
+
+        excess = len(entries) - self.max_entries if self.max_entries is not None else 0
+        if excess > 0:
+            entries.sort()
+            for _mtime, path in entries[:excess]:
+                self._remove(path)
+        if expired or excess > 0:
+            self.log.debug("http_cache_evicted", expired=expired, count=max(excess, 0))
+
+
+# Shared per process so the write count that paces eviction spans all callers
+_http_cache: HttpCache | None = None
+
+
+def get_http_cache() -> HttpCache:
+    """HTTP cache rooted at the configured storage path."""
+    from app.core.config import settings
+
+    global _http_cache
+    if _http_cache is None:
+        _http_cache = HttpCache(
+            settings.http_cache_path,
+            ttl_seconds=settings.http_cache_ttl_days * 86400 or None,
+            max_entries=settings.http_cache_max_entries or None,
+        )
+    return _http_cache
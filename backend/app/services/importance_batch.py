@@ -0,0 +1,341 @@
+"""Columnar importance scoring for all DNOs at once.
+
+compute_importance() scores one DNO; this module computes the same v1 score
+for every DNO in one pass over NumPy arrays:
+
+- load_importance_frame() reads the importance inputs of all DNOs with a
+  single query (no ORM objects).
+- calibrate() derives the p90 anchors from the data itself.
+- score_frame() computes every factor, the score and the confidence.
+- recompute_importance() writes scores and explainability payloads back
+  with one UPDATE ... FROM (VALUES ...) per chunk and syncs dno_summaries.
+
+Results match compute_importance() for the same calibration, so per-DNO
+updates (seeder, enrichment) and batch recomputes stay interchangeable.
+"""
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import JSON, DateTime, Float, Integer, String, column, func, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import DNOModel, DNOSummaryModel
+from app.db.source_models import DNOMastrData
+from app.services.importance import (
+    DEFAULT_CALIBRATION,
+    DEFAULT_FALLBACK_FACTORS,
+    IMPORTANCE_VERSION,
+    WEIGHTS,
+)
+
+# Rows per UPDATE statement (6 bind parameters per row, asyncpg allows 32767)
+UPDATE_CHUNK_SIZE = 2000
+
+# Calibration key per input column
+CALIBRATION_KEYS = {
+    "area_km2": "area_km2_p90",
+    "connection_points": "connection_points_p90",
+    "customer_count": "customer_count_p90",
+}
+
+# Customer factor when the count is missing, by has_customers
+_CUSTOMER_FALLBACKS = {
+    "has_customers_false": (0.0, "No direct customers reported"),
+    "has_customers_true": (0.35, "Has customers, but customer count missing"),
+    "default_fallback": (DEFAULT_FALLBACK_FACTORS["customers"], "Customer data unavailable"),
+}
+
+
+def importance_frame(rows: Iterable[tuple]) -> pd.DataFrame:
+    """Build the input frame from (id, connection_points, customer_count, has_customers,
+    area_km2) tuples. Missing values stay missing (nullable dtypes)."""
+    frame = pd.DataFrame(
+        list(rows),
+        columns=["id", "connection_points", "customer_count", "has_customers", "area_km2"],
+    )
+    return frame.astype(
+        {
+            "id": "int64",
+            "connection_points": "Int64",
+            "customer_count": "Int64",
+            "has_customers": "boolean",
+            "area_km2": "Float64",
+        }
+    )
+
+
+async def load_importance_frame(db: AsyncSession) -> pd.DataFrame:
+    """Importance inputs of all DNOs, resolved like compute_importance_for_dno()."""
+    result = await db.execute(
+        select(
+            DNOModel.id,
+            func.coalesce(DNOModel.connection_points_count, DNOMastrData.connection_points_total),
+            DNOModel.customer_count,
+            DNOMastrData.has_customers,
+            DNOModel.service_area_km2,
+        )
+        .outerjoin(DNOMastrData, DNOMastrData.dno_id == DNOModel.id)
+        .order_by(DNOModel.id)
+    )
+    return importance_frame(result.all())
+
+
+def _floats(series: pd.Series) -> np.ndarray:
+    return series.to_numpy(dtype=float, na_value=np.nan)
+
+
+def calibrate(frame: pd.DataFrame, quantile: float = 0.9) -> dict[str, float]:
+    """Calibration anchors at the given quantile of the positive values of each input.
+
+    Inputs without any positive value keep the default anchor.
+    """
+    calibration = dict(DEFAULT_CALIBRATION)
+    for name, key in CALIBRATION_KEYS.items():
+        raw = _floats(frame[name])
+        positive = raw[raw > 0]
+        if positive.size:
+            calibration[key] = round(float(np.quantile(positive, quantile)), 2)
+    return calibration
+
+
+def _normalize_log(raw: np.ndarray, p90: float) -> np.ndarray:
+    """Vectorized importance._normalize_log (NaN stays NaN)."""
+    denom = np.log1p(max(p90, 1.0))
+    with np.errstate(invalid="ignore"):
+        normalized = np.clip(np.log1p(np.maximum(raw, 0.0)) / denom, 0.0, 1.0)
+    return np.where(np.isnan(raw), np.nan, normalized)
+
+
+def score_frame(frame: pd.DataFrame, calibration: dict[str, float] | None = None) -> pd.DataFrame:
+    """Score every row of an importance frame.
+
+    Returns:
+        Frame indexed like the input with score, confidence, the normalized
+        factors, fallback flags and the customer factor source.
+    """
+    calibration_data = dict(DEFAULT_CALIBRATION)
+    if calibration:
+        calibration_data.update(calibration)
+
+    area = _normalize_log(_floats(frame["area_km2"]), calibration_data["area_km2_p90"])
+    area_fallback = np.isnan(area)
+    area = np.where(area_fallback, DEFAULT_FALLBACK_FACTORS["area"], area)
+
+    connection = _normalize_log(
+        _floats(frame["connection_points"]), calibration_data["connection_points_p90"]
+    )
+    connection_fallback = np.isnan(connection)
+    connection = np.where(connection_fallback, 0.0, connection)
+
+    customers = _normalize_log(
+        _floats(frame["customer_count"]), calibration_data["customer_count_p90"]
+    )
+    customer_fallback = np.isnan(customers)
+    has_customers = frame["has_customers"]
+    customer_source = np.select(
+        [
+            ~customer_fallback,
+            (has_customers == False).fillna(False).to_numpy(dtype=bool),  # noqa: E712
+            (has_customers == True).fillna(False).to_numpy(dtype=bool),  # noqa: E712
+        ],
+        ["customer_count", "has_customers_false", "has_customers_true"],
+        default="default_fallback",
+    )
+    customers = np.where(
+        customer_fallback,
+        np.select(
+            [customer_source == source for source in _CUSTOMER_FALLBACKS],
+            [factor for factor, _ in _CUSTOMER_FALLBACKS.values()],
+        ),
+        customers,
+    )
+
+    score = (
+        WEIGHTS["area"] * area
+        + WEIGHTS["connection_points"] * connection
+        + WEIGHTS["customers"] * customers
+    )
+    fallback_count = (
+        area_fallback.astype(int) + connection_fallback.astype(int) + customer_fallback.astype(int)
+    )
+    confidence = np.clip(1.0 - (fallback_count / 3.0) * 0.6, 0.0, 1.0)
+
+    return pd.DataFrame(
+        {
+            "score": np.round(score * 100, 2),
+            "confidence": np.round(confidence, 2),
+            "area": area,
+            "connection_points": connection,
+            "customers": customers,
+            "area_fallback": area_fallback,
+            "connection_points_fallback": connection_fallback,
+            "customers_fallback": customer_fallback,
+            "customer_source": customer_source,
+        },
+        index=frame.index,
+    )
+
+
+def build_factors(
+    frame: pd.DataFrame,
+    scores: pd.DataFrame,
+    calibration: dict[str, float] | None = None,
+    computed_at: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """Explainability payloads (importance_factors) in the format of compute_importance()."""
+    calibration_data = dict(DEFAULT_CALIBRATION)
+    if calibration:
+        calibration_data.update(calibration)
+    computed_at_iso = (computed_at or datetime.now(UTC)).isoformat()
+
+    def _column(name: str) -> list:
+        return [None if value is pd.NA else value for value in frame[name].tolist()]
+
+    factors = []
+    for area_km2, connection_points, customer_count, has_customers, row in zip(
+        _column("area_km2"),
+        _column("connection_points"),
+        _column("customer_count"),
+        _column("has_customers"),
+        scores.itertuples(index=False),
+        strict=True,
+    ):
+        if row.customer_source == "customer_count":
+            customer_meta = {
+                "source": "customer_count",
+                "raw": customer_count,
+                "normalized": row.customers,
+                "is_fallback": False,
+            }
+        else:
+            customer_meta = {
+                "source": row.customer_source,
+                "raw": None,
+                "normalized": row.customers,
+                "is_fallback": True,
+                "note": _CUSTOMER_FALLBACKS[row.customer_source][1],
+            }
+
+        factors.append(
+            {
+                "weights": dict(WEIGHTS),
+                "calibration": dict(calibration_data),
+                "inputs": {
+                    "area_km2": area_km2,
+                    "connection_points": connection_points,
+                    "customer_count": customer_count,
+                    "has_customers": has_customers,
+                },
+                "normalized": {
+                    "area": row.area,
+                    "connection_points": row.connection_points,
+                    "customers": row.customers,
+                },
+                "contributions": {
+                    "area": round(WEIGHTS["area"] * row.area * 100, 2),
+                    "connection_points": round(
+                        WEIGHTS["connection_points"] * row.connection_points * 100, 2
+                    ),
+                    "customers": round(WEIGHTS["customers"] * row.customers * 100, 2),
+                },
+                "fallbacks": {
+                    "area": bool(row.area_fallback),
+                    "connection_points": bool(row.connection_points_fallback),
+                    "customers": bool(row.customers_fallback),
+                },
+                "customer_factor_meta": customer_meta,
+                "computed_at": computed_at_iso,
+            }
+        )
+    return factors
+
+
+async def recompute_importance(
+    db: AsyncSession,
+    calibration: dict[str, float] | None = None,
+) -> int:
+    """Recompute and persist the importance of all DNOs (the caller commits).
+
+    Scores are written to dnos with one UPDATE ... FROM (VALUES ...) per
+    chunk, then copied to the dno_summaries read model.
+
+    Args:
+        db: Database session
+        calibration: Anchor overrides (default: DEFAULT_CALIBRATION)
+
+    Returns:
+        Number of DNOs scored
+    """
+    frame = await load_importance_frame(db)
+    if frame.empty:
+        return 0
+
+    computed_at = datetime.now(UTC)
+    scores = score_frame(frame, calibration)
+    rows = list(
+        zip(
+            frame["id"].tolist(),
+            scores["score"].tolist(),
+            scores["confidence"].tolist(),
+            build_factors(frame, scores, calibration, computed_at),
+            strict=True,
+        )
+    )
+
+    for start in range(0, len(rows), UPDATE_CHUNK_SIZE):
+        scored = values(
+            column("id", Integer),
+            column("importance_score", Float),
+            column("importance_confidence", Float),
+            column("importance_factors", JSON),
+            column("importance_version", String),
+            column("importance_updated_at", DateTime(timezone=True)),
+            name="scored",
+        ).data(
+            [
+                (dno_id, score, confidence, factors, IMPORTANCE_VERSION, computed_at)
+                for dno_id, score, confidence, factors in rows[start : start + UPDATE_CHUNK_SIZE]
+            ]
+        )
+        await db.execute(
+            update(DNOModel)
+            .where(DNOModel.id == scored.c.id)
+            .values(
+                importance_score=scored.c.importance_score,
+                importance_confidence=scored.c.importance_confidence,
+                importance_factors=scored.c.importance_factors,
+                importance_version=scored.c.importance_version,
+                importance_updated_at=scored.c.importance_updated_at,
+            )
+        )
+
+    # Keep the list read model's sort keys in step without a full refresh
+    await db.execute(
+        update(DNOSummaryModel)
+        .where(DNOSummaryModel.dno_id == DNOModel.id)
+        .values(
+            importance_score=DNOModel.importance_score,
+            importance_confidence=DNOModel.importance_confidence,
+            importance_version=DNOModel.importance_version,
+            refreshed_at=func.now(),
+        )
+    )
+    return len(rows)
+
+
+def score_distribution(scores: Iterable[float]) -> dict[str, Any]:
+    """p50, p90 and a 10-bucket histogram (0-9, ..., 90-100) of importance scores."""
+    ordered = np.sort(np.asarray(list(scores), dtype=float))
+    total = ordered.size
+    buckets = np.bincount(np.minimum(ordered // 10, 9).astype(int), minlength=10)
+    return {
+        "p50": round(float(ordered[int((total - 1) * 0.5)]), 2) if total else 0.0,
+        "p90": round(float(ordered[int((total - 1) * 0.9)]), 2) if total else 0.0,
+        "histogram": [
+            {"range": f"{i * 10}-{i * 10 + 9}", "count": int(buckets[i])} for i in range(10)
+        ],
+    }
@@ -0,0 +1,77 @@
+"""
+Shared keyword matcher for URL and text scoring.
+
+Crawler, discovery scorer, content verifier and file classification all ask
+the same question many times: which keywords of a fixed vocabulary occur in
+this URL, anchor text or document? KeywordMatcher answers it once per input:
+keywords are lowercased when the matcher is built, the input is lowercased
+once, and hits() returns every keyword it contains as a set that the
+individual checks (required groups, positive/negative markers, data type
+detection) then look up instead of scanning the text again.
+
+Matching uses CPython's substring search per distinct keyword. For
+vocabularies of this size (a few dozen keywords) that is several times faster
+than a single-pass regex alternation or a pure-Python Aho-Corasick automaton,
+whose per-character work runs in the interpreter; every search is linear in
+the input, so a fixed vocabulary keeps matching linear in input size.
+"""
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+
+class KeywordMatcher:
+    """Case-insensitive substring matcher for a fixed keyword list."""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the matcher.
+
+        Args:
+            keywords: Keywords in any case; order and repeats are kept for find()
+        """
+        self.keywords: tuple[str, ...] = tuple(keywords)
+        self._lowered = tuple(kw.lower() for kw in self.keywords)
+        self._distinct = tuple(dict.fromkeys(self._lowered))
+        # find() can return hits directly when the keywords are lowercase already
+        self._lowercase = self._lowered == self.keywords
+
+    def hits(self, text: str, *, lowered: bool = False) -> frozenset[str]:
+        """
+        Lowercased keywords contained in text.
+
+        Args:
+            text: Input text
+            lowered: The caller already lowercased text
+        """
+        if not text:
+            return frozenset()
+        text_lower = text if lowered else text.lower()
+        return frozenset([kw for kw in self._distinct if kw in text_lower])
+
+    def find(self, text: str) -> list[str]:
+        """Keywords contained in text, as given and in keyword order (repeats included)."""
+        if not text:
+            return []
+        if self._lowercase:
+            text_lower = text.lower()
+            return [kw for kw in self.keywords if kw in text_lower]
+        found = self.hits(text)
+        return [
+            kw
+            for kw, kw_lower in zip(self.keywords, self._lowered, strict=True)
+            if kw_lower in found
+        ]
+
+    def matches_any(self, text: str) -> bool:
+        """Whether text contains at least one keyword (stops at the first hit)."""
+        if not text:
+            return False
+        text_lower = text.lower()
+        return any(kw in text_lower for kw in self._distinct)
+
+
+@lru_cache(maxsize=128)
+def keyword_matcher(keywords: tuple[str, ...]) -> KeywordMatcher:
+    """Shared matcher for a keyword tuple, built once per distinct tuple."""
+    return KeywordMatcher(keywords)
@@ -0,0 +1,175 @@
+"""
+Public search response cache (Redis).
+
+A `POST /search` lookup that hits an existing location or DNO always does the
+same work: address normalization, location lookup, DNO + MaStR load, the
+Netzentgelte/HLZF queries and completeness scoring. The serialized
+PublicSearchResponse is cached in Redis so repeated lookups cost one GET.
+
+Keys:
+    search:resp:<kind>:<value>:<years>   # response JSON
+        kind = addr (address/coordinates hash) | mastr | vnb | name
+        years = sorted year filter or "all"
+    search:dno:<dno_id>:keys             # set of response keys showing that DNO
+    search:dno:<dno_id>:gen              # bumped on every invalidation
+
+Writers of DNO data (finalize step, import, verification, manual edits) call
+invalidate_search_cache(dno_id) after committing. Responses are stored only if
+the DNO's generation is still the one seen before the database reads, so a
+request racing an invalidation cannot put stale data back. Entries expire
+after search_cache_ttl_seconds, which bounds staleness for changes that do not
+invalidate (e.g. refreshed MaStR statistics).
+
+Redis errors are logged and treated as misses (fail open), matching the rate
+limiter.
+"""
+
+import structlog
+from redis.asyncio import Redis
+
+logger = structlog.get_logger()
+
+# Store only if the DNO was not invalidated since `generation` was read.
+# KEYS[1] = response key, KEYS[2] = DNO key set, KEYS[3] = DNO generation
+# ARGV[1] = payload, ARGV[2] = TTL seconds, ARGV[3] = generation seen by the caller
+_STORE_LUA = """
+local current = redis.call('GET', KEYS[3]) or '0'
+if current ~= ARGV[3] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', tonumber(ARGV[2]))
+redis.call('SADD', KEYS[2], KEYS[1])
+redis.call('EXPIRE', KEYS[2], tonumber(ARGV[2]))
+return 1
+"""
+
+# Drop every cached response of a DNO and bump its generation.
+# KEYS[1] = DNO key set, KEYS[2] = DNO generation
+_INVALIDATE_LUA = """
+redis.call('INCR', KEYS[2])
+local keys = redis.call('SMEMBERS', KEYS[1])
+for i = 1, #keys, 500 do
+    redis.call('DEL', unpack(keys, i, math.min(i + 499, #keys)))
+end
+redis.call('DEL', KEYS[1])
+return #keys
+"""
+
+
+class SearchCache:
+    """Read-through cache of serialized public search responses."""
+
+    RESPONSE_KEY_PREFIX = "search:resp:"
+    DNO_KEY_PREFIX = "search:dno:"
+
+    def __init__(self, redis: Redis, ttl_seconds: int = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            redis: Redis connection
+            ttl_seconds: Lifetime of a cached response
+        """
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self._store = redis.register_script(_STORE_LUA)
+        self._invalidate = redis.register_script(_INVALIDATE_LUA)
+        self.log = logger.bind(component="SearchCache")
+
+    @classmethod
+    def response_key(cls, kind: str, value: str, years: list[int] | None) -> str:
+        """Key of a cached response for a lookup and year filter."""
+        years_part = ",".join(str(y) for y in sorted(set(years))) if years else "all"
+        return f"{cls.RESPONSE_KEY_PREFIX}{kind}:{value}:{years_part}"
+
+    @classmethod
+    def _dno_keys(cls, dno_id: int) -> tuple[str, str]:
+        prefix = f"{cls.DNO_KEY_PREFIX}{dno_id}"
+        return f"{prefix}:keys", f"{prefix}:gen"
+
+    async def get(self, key: str) -> str | None:
+        """Cached response JSON, or None on a miss."""
+        try:
+            payload = await self.redis.get(key)
+        except Exception as e:
+            self.log.error("Redis error reading search cache", error=str(e))
+            return None
+        if payload is None:
+            return None
+        return payload.decode() if isinstance(payload, bytes) else payload
+
+    async def generation(self, dno_id: int) -> str | None:
+        """Current invalidation generation of a DNO (None if Redis is unavailable).
+
+        Read it before loading the DNO's data and pass it to set().
+        """
+        _, gen_key = self._dno_keys(dno_id)
+        try:
+            value = await self.redis.get(gen_key)
+        except Exception as e:
+            self.log.error("Redis error reading search cache generation", error=str(e))
+            return None
+        if value is None:
+            return "0"
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    async def set(self, key: str, dno_id: int, payload: str, generation: str) -> bool:
+        """Store a response unless the DNO was invalidated since `generation`.
+
+        Returns:
+            True if the response was stored
+        """
+        keys_key, gen_key = self._dno_keys(dno_id)
+        try:
+            stored = await self._store(
+                keys=[key, keys_key, gen_key],
+                args=[payload, self.ttl_seconds, generation],
+            )
+        except Exception as e:
+            self.log.error("Redis error writing search cache", error=str(e))
+            return False
+        return bool(stored)
+
+    async def invalidate_dno(self, dno_id: int) -> int:
+        """Drop all cached responses showing a DNO.
+
+        Returns:
+            Number of response keys removed
+        """
+        keys_key, gen_key = self._dno_keys(dno_id)
+        try:
+            removed = int(await self._invalidate(keys=[keys_key, gen_key]))
+        except Exception as e:
+            self.log.error("Redis error invalidating search cache", dno_id=dno_id, error=str(e))
+            return 0
+        if removed:
+            self.log.debug("search_cache_invalidated", dno_id=dno_id, keys=removed)
+        return removed
+
+
+# Cache instance is created with a Redis connection at startup (API and workers)
+_search_cache: SearchCache | None = None
+
+
+def init_search_cache(redis: Redis) -> SearchCache | None:
+    """Initialize the global search cache (None if disabled by configuration)."""
+    from app.core.config import settings
+
+    global _search_cache
+    if settings.search_cache_ttl_seconds <= 0:
+        _search_cache = None
+    else:
+        _search_cache = SearchCache(redis, ttl_seconds=settings.search_cache_ttl_seconds)
+    return _search_cache
+
+
+def get_search_cache() -> SearchCache | None:
+    """Get the global search cache, or None if it is not initialized."""
+    return _search_cache
+
+
+async def invalidate_search_cache(dno_id: int | None) -> None:
+    """Drop cached search responses of a DNO (no-op without a cache)."""
+    cache = get_search_cache()
+    if cache is not None and dno_id is not None:
+        await cache.invalidate_dno(dno_id)
@@ -0,0 +1,179 @@
+"""
+Request coalescing (single-flight) across API workers.
+
+When several public searches miss the database for the same new address at
+the same time, only one of them should spend VNB Digital quota. The first
+request for a key becomes the leader and runs the lookup; identical requests
+wait for its result instead of calling upstream themselves.
+
+Two layers:
+- In-process: requests in the same worker await the leader's future
+- Redis: a lock per key (SET NX EX) elects one leader across workers; the
+  leader publishes its result under a short-lived key that waiting workers
+  poll for
+
+If the leader fails, its lock is released without a result and the next
+waiter takes over. Waiters that time out (or hit Redis errors) run the lookup
+themselves, so the layer fails open like the rate limiter.
+"""
+
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable
+
+import structlog
+from redis.asyncio import Redis
+
+logger = structlog.get_logger()
+
+# Delete the lock only if we still own it.
+# KEYS[1] = lock key, ARGV[1] = owner token
+_RELEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one execution."""
+
+    LOCK_KEY_PREFIX = "flight:lock:"
+    RESULT_KEY_PREFIX = "flight:result:"
+
+    def __init__(
+        self,
+        redis: Redis,
+        wait_timeout: float = 60.0,
+        result_ttl: int = 10,
+        poll_interval: float = 0.1,
+    ):
+        """
+        Initialize the single-flight group.
+
+        Args:
+            redis: Redis connection shared by all API workers
+            wait_timeout: Longest a waiter waits for the leader (also the lock TTL)
+            result_ttl: Seconds a leader's result stays readable for late waiters
+            poll_interval: Seconds between result checks of a waiting worker
+        """
+        self.redis = redis
+        self.wait_timeout = wait_timeout
+        self.result_ttl = result_ttl
+        self.poll_interval = poll_interval
+        self._release = redis.register_script(_RELEASE_LUA)
+        self._local: dict[str, asyncio.Future] = {}
+        self.log = logger.bind(component="SingleFlight")
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[str]]) -> tuple[str, bool]:
+        """Run `fn` once for all concurrent callers of `key`.
+
+        Args:
+            key: Identifies identical work (e.g. "addr:<address hash>")
+            fn: Does the work and returns its result serialized as a string
+
+        Returns:
+            (result, shared) - shared is True if another request produced it
+        """
+        pending = self._local.get(key)
+        if pending is not None:
+            try:
+                # shield: a cancelled waiter must not cancel the leader's future
+                return await asyncio.shield(pending), True
+            except Exception:
+                pass
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+            # The leader failed; take over
+            return await self.do(key, fn)
+
+        future = asyncio.get_running_loop().create_future()
+        self._local[key] = future
+        try:
+            result, shared = await self._do_distributed(key, fn)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; waiters without one would log it
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result, shared
+        finally:
+            del self._local[key]
+
+    async def _do_distributed(self, key: str, fn: Callable[[], Awaitable[str]]) -> tuple[str, bool]:
+        lock_key = f"{self.LOCK_KEY_PREFIX}{key}"
+        result_key = f"{self.RESULT_KEY_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.wait_timeout
+        waited = False
+
+        while True:
+            try:
+                result = await self.redis.get(result_key)
+                if result is not None:
+                    if waited:
+                        self.log.debug("single_flight_shared", key=key)
+                    return (result.decode() if isinstance(result, bytes) else result), True
+                acquired = await self.redis.set(
+                    lock_key, token, nx=True, ex=max(1, int(self.wait_timeout))
+                )
+            except Exception as e:
+                self.log.error("Redis error in single flight", key=key, error=str(e))
+                return await fn(), False
+
+            if acquired:
+                return await self._lead(key, lock_key, result_key, token, fn), False
+
+            if loop.time() >= deadline:
+                self.log.warning("single_flight_wait_timeout", key=key)
+                return await fn(), False
+
+            waited = True
+            await asyncio.sleep(self.poll_interval)
+
+    async def _lead(
+        self,
+        key: str,
+        lock_key: str,
+        result_key: str,
+        token: str,
+        fn: Callable[[], Awaitable[str]],
+    ) -> str:
+        try:
+            result = await fn()
+            try:
+                # Publish before releasing the lock so no waiter misses it
+                await self.redis.set(result_key, result, ex=self.result_ttl)
+            except Exception as e:
+                self.log.error("Redis error publishing single flight result", error=str(e))
+            return result
+        finally:
+            try:
+                await self._release(keys=[lock_key], args=[token])
+            except Exception as e:
+                self.log.error("Redis error releasing single flight lock", key=key, error=str(e))
+
+
+# Created with the API's Redis connection at startup
+_single_flight: SingleFlight | None = None
+
+
+def init_single_flight(redis: Redis) -> SingleFlight:
+    """Initialize the global single-flight group with a Redis connection."""
+    from app.core.config import settings
+
+    global _single_flight
+    _single_flight = SingleFlight(redis, wait_timeout=settings.vnb_single_flight_timeout)
+    return _single_flight
+
+
+def get_single_flight() -> SingleFlight | None:
+    """Get the global single-flight group, or None if Redis is not configured."""
+    return _single_flight
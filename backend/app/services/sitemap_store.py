@@ -0,0 +1,103 @@
+"""
+Sitemap URL store.
+
+URLs extracted from a DNO's sitemaps are stored one per row in
+dno_sitemap_urls instead of as an inline JSON list on dnos, so loading a DNO
+no longer drags tens of thousands of URLs along.
+
+Discovery only needs the URLs that can score: score_url() gives a positive
+score only for a positive keyword, the target year or a document file
+extension, and everything else is dropped. select_sitemap_candidates()
+expresses exactly that as one trigram-indexed ILIKE query, so the Python
+scoring only sees the matches. Like score_url(), the patterns match the whole
+URL, so a keyword in the host name (e.g. "netz") selects every URL of a site.
+"""
+
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import DNOSitemapURLModel
+from app.services.web_crawler import get_keywords_for_data_type
+
+# Parsed sitemaps are reused for this long before they are fetched again
+SITEMAP_TTL_DAYS = 120
+
+# Rows per INSERT statement (asyncpg allows 32767 bind parameters)
+INSERT_CHUNK_SIZE = 10000
+
+# Substrings detect_file_type() maps to a document type (.pdfx/.xlsx/.docx included)
+DOCUMENT_MARKERS = (".pdf", ".xls", ".doc")
+
+
+def is_sitemap_fresh(fetched_at: datetime | None) -> bool:
+    """Whether a sitemap parsed at fetched_at is still within the TTL."""
+    if fetched_at is None:
+        return False
+    return datetime.now(UTC) - fetched_at.replace(tzinfo=UTC) < timedelta(days=SITEMAP_TTL_DAYS)
+
+
+async def replace_sitemap_urls(db: AsyncSession, urls_by_dno: dict[int, Iterable[str]]) -> int:
+    """Replace the stored sitemap URLs of the given DNOs (the caller commits).
+
+    Returns:
+        Number of URLs stored
+    """
+    if not urls_by_dno:
+        return 0
+
+    await db.execute(
+        delete(DNOSitemapURLModel).where(DNOSitemapURLModel.dno_id.in_(list(urls_by_dno)))
+    )
+
+    rows = [
+        {"dno_id": dno_id, "url": url}
+        for dno_id, urls in urls_by_dno.items()
+        for url in dict.fromkeys(url for url in urls if url)
+    ]
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        await db.execute(
+            DNOSitemapURLModel.__table__.insert(), rows[start : start + INSERT_CHUNK_SIZE]
+        )
+    return len(rows)
+
+
+async def count_sitemap_urls(db: AsyncSession, dno_id: int) -> int:
+    """Number of stored sitemap URLs of a DNO."""
+    result = await db.execute(select(func.count()).where(DNOSitemapURLModel.dno_id == dno_id))
+    return result.scalar_one()
+
+
+def candidate_patterns(data_type: str, target_year: int | None = None) -> list[str]:
+    """Substrings of which a URL must contain at least one to be a sitemap candidate."""
+    patterns = {kw.lower() for kw in get_keywords_for_data_type(data_type)}
+    patterns.update(DOCUMENT_MARKERS)
+    if target_year:
+        patterns.add(str(target_year))
+    # "netzentgelte" adds nothing once "netz" is matched
+    return sorted(p for p in patterns if not any(q != p and q in p for q in patterns))
+
+
+async def select_sitemap_candidates(
+    db: AsyncSession,
+    dno_id: int,
+    data_type: str,
+    target_year: int | None = None,
+) -> list[str]:
+    """Stored sitemap URLs of a DNO that score_url() could rank, in insertion order."""
+    result = await db.execute(
+        select(DNOSitemapURLModel.url)
+        .where(
+            DNOSitemapURLModel.dno_id == dno_id,
+            or_(
+                *(
+                    DNOSitemapURLModel.url.icontains(pattern, autoescape=True)
+                    for pattern in candidate_patterns(data_type, target_year)
+                )
+            ),
+        )
+        .order_by(DNOSitemapURLModel.id)
+    )
+    return list(result.scalars())
@@ -38,6 +38,7 @@ _RobotsCacheEntry = tuple[RobotFileParser | None, float]
 ALLOWED_PORTS = {80, 443}
 HTTP_OK = 200
 HTTP_PARTIAL = 206
+HTTP_NOT_MODIFIED = 304
 HTTP_TOO_MANY_REQUESTS = 429
 
 # Allowed content types for data sources
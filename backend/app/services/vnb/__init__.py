@@ -5,6 +5,7 @@ Provides DNO (Verteilnetzbetreiber) resolution via the vnbdigital.de GraphQL API
 
 Components:
 - VNBDigitalClient: API client for VNB lookups
+- get_vnb_client: application-scoped clients (pooled, Redis cache and rate limit)
 - SkeletonService: DNO skeleton creation with lazy registration
 
 Usage:
@@ -16,7 +17,14 @@ Usage:
     dno, created = await skeleton_service.get_or_create_dno(db, name, vnb_id)
 """
 
-from app.services.vnb.client import VNBDigitalClient, vnb_client
+from app.services.vnb.client import (
+    VNBDigitalClient,
+    VNBQuotaExceededError,
+    close_vnb_client,
+    get_vnb_client,
+    init_vnb_client,
+    vnb_client,
+)
 from app.services.vnb.models import (
     DNODetails,
     LocationResult,
@@ -40,10 +48,14 @@ __all__ = [
     "SkeletonService",
     # Client
     "VNBDigitalClient",
+    "VNBQuotaExceededError",
     # Data models
     "VNBResult",
     "VNBSearchResult",
+    "close_vnb_client",
     "generate_slug",
+    "get_vnb_client",
+    "init_vnb_client",
     "normalize_address",
     "skeleton_service",
     "snap_coordinate",
@@ -0,0 +1,76 @@
+"""
+VNB Digital Module - Result Cache.
+
+Redis-backed cache of VNB Digital lookups shared by all API workers:
+- search_address: address string → coordinates (geocodes practically never change)
+- lookup_by_coordinates: coordinate → VNBs, keyed by the coordinate rounded
+  to COORDINATE_PRECISION so nearby lookups share an entry
+- get_vnb_details: VNB id → homepage and contact details
+
+Only successful results are cached: the client returns None / [] for both
+"not found" and upstream errors, and an outage must not be remembered.
+Redis errors are logged and treated as misses.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+import structlog
+from redis.asyncio import Redis
+
+logger = structlog.get_logger()
+
+# Entry lifetimes per lookup kind (seconds)
+CACHE_TTLS = {
+    "address": 30 * 86400,
+    "coordinates": 7 * 86400,
+    "details": 86400,
+}
+
+# Decimal places of coordinate cache keys (4 ≈ 11 m, the location search tolerance)
+COORDINATE_PRECISION = 4
+
+
+def coordinate_cache_key(coordinates: str) -> str:
+    """Rounded "lat,lon" used as cache key for coordinate lookups."""
+    try:
+        lat, lon = (float(part) for part in coordinates.split(","))
+    except ValueError:
+        return coordinates.strip()
+    return f"{lat:.{COORDINATE_PRECISION}f},{lon:.{COORDINATE_PRECISION}f}"
+
+
+class VNBCache:
+    """Shared TTL cache of VNB Digital results (JSON in Redis)."""
+
+    KEY_PREFIX = "vnb:cache:"
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self.log = logger.bind(component="VNBCache")
+
+    def _key(self, kind: str, lookup: str) -> str:
+        digest = hashlib.sha256(lookup.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}{kind}:{digest}"
+
+    async def get(self, kind: str, lookup: str) -> Any | None:
+        """Cached JSON value of a lookup, or None on a miss."""
+        try:
+            raw = await self.redis.get(self._key(kind, lookup))
+        except Exception as e:
+            self.log.error("Redis error reading VNB cache", kind=kind, error=str(e))
+            return None
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    async def set(self, kind: str, lookup: str, value: Any) -> None:
+        """Store a JSON-serializable lookup result for the kind's TTL."""
+        try:
+            await self.redis.set(self._key(kind, lookup), json.dumps(value), ex=CACHE_TTLS[kind])
+        except Exception as e:
+            self.log.error("Redis error writing VNB cache", kind=kind, error=str(e))
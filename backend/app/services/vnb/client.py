@@ -3,16 +3,27 @@ VNB Digital Module - API Client.
 
 Async client for VNB Digital GraphQL API.
 Implements rate limiting to avoid overloading the API.
+
+The API uses application-scoped clients (init_vnb_client/get_vnb_client):
+a pooled keep-alive connection, a Redis token bucket shared by all workers
+and a Redis cache of address, coordinate and details lookups. Only the public
+search client checks the global VNB quota; admin lookups and DNO creation use
+a client without it.
 """
 
 import asyncio
 import time
 import urllib.parse
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
 from typing import ClassVar
 
 import httpx
 import structlog
+from redis.asyncio import Redis
 
+from app.services.domain_throttle import DomainThrottle, HostThrottledError
+from app.services.vnb.cache import VNBCache, coordinate_cache_key
 from app.services.vnb.models import (
     DNODetails,
     LocationResult,
@@ -27,6 +38,17 @@ from app.services.vnb.queries import (
 
 logger = structlog.get_logger()
 
+# Longest an API request waits for a VNB request slot before it gets a 503
+VNB_MAX_WAIT_SECONDS = 5.0
+
+
+class VNBQuotaExceededError(Exception):
+    """No VNB request slot within the shared pace's max_wait."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"VNB Digital busy, retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
 
 class VNBDigitalClient:
     """
@@ -50,6 +72,10 @@ class VNBDigitalClient:
         self,
         request_delay: float = 1.0,
         timeout: float = 15.0,
+        cache: VNBCache | None = None,
+        throttle: DomainThrottle | None = None,
+        before_request: Callable[[], Awaitable[None]] | None = None,
+        max_connections: int = 10,
     ):
         """
         Initialize the VNB Digital API client.
@@ -57,9 +83,18 @@ class VNBDigitalClient:
         Args:
             request_delay: Minimum seconds between requests (1.0 - 10.0)
             timeout: Request timeout in seconds
+            cache: Shared result cache (lookups are not cached without one)
+            throttle: Distributed rate limiter; replaces the in-instance request_delay
+            before_request: Awaited before every upstream request (e.g. a global quota
+                check); exceptions propagate to the caller
+            max_connections: Size of the keep-alive connection pool
         """
         self.request_delay = max(1.0, min(10.0, request_delay))
         self.timeout = timeout
+        self.cache = cache
+        self.throttle = throttle
+        self.before_request = before_request
+        self.max_connections = max_connections
         self._last_request_time: float = 0.0
         self._client: httpx.AsyncClient | None = None
         self.log = logger.bind(component="VNBDigitalClient")
@@ -67,7 +102,14 @@ class VNBDigitalClient:
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the shared httpx client."""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=self.timeout, headers=self.HEADERS)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=self.HEADERS,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
         return self._client
 
     async def close(self) -> None:
@@ -77,7 +119,22 @@ class VNBDigitalClient:
             self._client = None
 
     async def _wait_for_rate_limit(self) -> None:
-        """Wait to respect rate limiting."""
+        """Wait to respect rate limiting.
+
+        Raises:
+            VNBQuotaExceededError: If the shared pace has no slot within its max_wait
+        """
+        if self.before_request:
+            await self.before_request()
+        if self.throttle:
+            try:
+                await self.throttle.acquire(
+                    urllib.parse.urlparse(self.API_URL).hostname or "", fail_fast=True
+                )
+            except HostThrottledError as e:
+                raise VNBQuotaExceededError(e.retry_after) from e
+            return
+
         elapsed = time.time() - self._last_request_time
         if elapsed < self.request_delay:
             sleep_time = self.request_delay - elapsed
@@ -104,6 +161,18 @@ class VNBDigitalClient:
         Returns:
             LocationResult with coordinates, or None if not found
         """
+        lookup = " ".join(address.lower().split())
+        if self.cache:
+            cached = await self.cache.get("address", lookup)
+            if cached:
+                return LocationResult(**cached)
+
+        result = await self._fetch_address(address)
+        if result and self.cache:
+            await self.cache.set("address", lookup, asdict(result))
+        return result
+
+    async def _fetch_address(self, address: str) -> LocationResult | None:
         await self._wait_for_rate_limit()
 
         log = self.log.bind(address=address[:50])
@@ -166,11 +235,27 @@ class VNBDigitalClient:
         Returns:
             List of VNBResult objects
         """
-        await self._wait_for_rate_limit()
-
         if voltage_types is None:
             voltage_types = ["Niederspannung", "Mittelspannung"]
 
+        lookup = f"{coordinate_cache_key(coordinates)}|{','.join(voltage_types)}"
+        if self.cache:
+            cached = await self.cache.get("coordinates", lookup)
+            if cached:
+                return [VNBResult(**vnb) for vnb in cached]
+
+        results = await self._fetch_vnbs_by_coordinates(coordinates, voltage_types)
+        if results and self.cache:
+            await self.cache.set("coordinates", lookup, [asdict(vnb) for vnb in results])
+        return results
+
+    async def _fetch_vnbs_by_coordinates(
+        self,
+        coordinates: str,
+        voltage_types: list[str],
+    ) -> list[VNBResult]:
+        await self._wait_for_rate_limit()
+
         log = self.log.bind(coordinates=coordinates)
         log.info("Looking up VNBs by coordinates")
 
@@ -286,6 +371,17 @@ class VNBDigitalClient:
         Returns:
             DNODetails with homepage_url and contact info, or None on error
         """
+        if self.cache:
+            cached = await self.cache.get("details", vnb_id)
+            if cached:
+                return DNODetails(**cached)
+
+        details = await self._fetch_vnb_details(vnb_id)
+        if details and self.cache:
+            await self.cache.set("details", vnb_id, asdict(details))
+        return details
+
+    async def _fetch_vnb_details(self, vnb_id: str) -> DNODetails | None:
         await self._wait_for_rate_limit()
 
         log = self.log.bind(vnb_id=vnb_id)
@@ -387,3 +483,69 @@ class VNBDigitalClient:
 
 # Default client instance
 vnb_client = VNBDigitalClient(request_delay=1.0)
+
+# Application-scoped clients, created at API startup with the shared Redis connection
+_shared_client: VNBDigitalClient | None = None  # public search (global quota)
+_internal_client: VNBDigitalClient | None = None  # admin lookups, DNO creation
+
+
+def init_vnb_client(
+    redis: Redis,
+    before_request: Callable[[], Awaitable[None]] | None = None,
+) -> VNBDigitalClient:
+    """Initialize the application-scoped VNB clients (cache + distributed rate limit).
+
+    Both clients share the Redis cache and token bucket; only the public one
+    runs before_request.
+
+    Args:
+        redis: Redis connection shared by all API workers
+        before_request: Awaited before every public upstream request (global quota check)
+    """
+    from app.core.config import settings
+
+    global _shared_client, _internal_client
+    cache = VNBCache(redis)
+    throttle = DomainThrottle(
+        redis,
+        host_rate=settings.vnb_request_rate,
+        host_burst=settings.vnb_request_burst,
+        max_wait=VNB_MAX_WAIT_SECONDS,
+    )
+    request_delay = 1.0 / max(settings.vnb_request_rate, 0.1)
+    _shared_client = VNBDigitalClient(
+        request_delay=request_delay,
+        cache=cache,
+        throttle=throttle,
+        before_request=before_request,
+    )
+    _internal_client = VNBDigitalClient(request_delay=request_delay, cache=cache, throttle=throttle)
+    return _shared_client
+
+
+def get_vnb_client(public_quota: bool = True) -> VNBDigitalClient:
+    """The application-scoped VNB client.
+
+    Args:
+        public_quota: Count upstream requests against the global public search
+            quota; admin lookups and DNO creation pass False
+
+    Falls back to the default client (no cache, quota or shared pace) when
+    Redis is not set up, logged as an error like the rate limiter's fail-open.
+    """
+    client = _shared_client if public_quota else _internal_client
+    if client is None:
+        logger.error(
+            "vnb_client_unavailable",
+            detail="Redis down or not configured, VNB quota and shared pacing bypassed",
+        )
+        return vnb_client
+    return client
+
+
+async def close_vnb_client() -> None:
+    """Close the connection pools of the shared and default clients."""
+    for client in (_shared_client, _internal_client):
+        if client:
+            await client.close()
+    await vnb_client.close()
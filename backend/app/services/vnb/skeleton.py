@@ -11,14 +11,18 @@ from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
 
 import structlog
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models import DNOModel, LocationModel
+from app.services.dno_summary import refresh_dno_summary
 
 logger = structlog.get_logger()
 
+# Points per bulk geocoord query (one bounding box each)
+GEOCOORD_QUERY_CHUNK = 200
+
 
 # =============================================================================
 # Data Classes
@@ -107,6 +111,19 @@ def snap_coordinate(value: float) -> Decimal:
     return Decimal(str(value)).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
 
 
+def _snapped_box(lat: float, lon: float, tolerance: float) -> tuple[Decimal, Decimal, Decimal]:
+    """Snapped center and tolerance of a geocoord bounding box."""
+    return snap_coordinate(lat), snap_coordinate(lon), Decimal(str(tolerance))
+
+
+def _box_clause(snapped_lat: Decimal, snapped_lon: Decimal, tol: Decimal):
+    """Indexable BETWEEN predicates for a geocoord bounding box."""
+    return and_(
+        LocationModel.latitude.between(snapped_lat - tol, snapped_lat + tol),
+        LocationModel.longitude.between(snapped_lon - tol, snapped_lon + tol),
+    )
+
+
 def generate_slug(name: str) -> str:
     """Generate URL-safe slug from DNO name."""
     slug = name.lower()
@@ -187,6 +204,8 @@ class SkeletonService:
 
         try:
             db.add(dno)
+            await db.flush()
+            await refresh_dno_summary(db, dno.id)
             await db.commit()
             await db.refresh(dno)
 
@@ -243,22 +262,66 @@ class SkeletonService:
         tolerance: float = 0.0001,
     ) -> LocationModel | None:
         """
-        Find location by coordinates with spatial tolerance.
+        Find the nearest location within a spatial tolerance.
 
         Tolerance 0.0001° ≈ 11 meters at equator.
-        Uses ABS comparison to avoid float precision issues.
+        Plain range predicates on the columns (instead of abs(column - x) < tol)
+        let Postgres answer the bounding box from idx_locations_geocoord.
         """
-        snapped_lat = snap_coordinate(lat)
-        snapped_lon = snap_coordinate(lon)
+        snapped_lat, snapped_lon, tol = _snapped_box(lat, lon, tolerance)
 
         result = await db.execute(
-            select(LocationModel).where(
-                func.abs(LocationModel.latitude - snapped_lat) < tolerance,
-                func.abs(LocationModel.longitude - snapped_lon) < tolerance,
+            select(LocationModel)
+            .where(_box_clause(snapped_lat, snapped_lon, tol))
+            .order_by(
+                func.abs(LocationModel.latitude - snapped_lat)
+                + func.abs(LocationModel.longitude - snapped_lon)
             )
+            .limit(1)
         )
         return result.scalars().first()
 
+    async def find_locations_by_geocoords(
+        self,
+        db: AsyncSession,
+        points: list[tuple[float, float]],
+        tolerance: float = 0.0001,
+    ) -> dict[tuple[float, float], LocationModel]:
+        """
+        Bulk find_location_by_geocoord for many points.
+
+        One query per chunk of points ORs their bounding boxes (each one an
+        index range scan); the nearest candidate per point is then picked with
+        the same snapped coordinates, inclusive bounds and distance as the
+        single lookup.
+
+        Returns:
+            Dict of (lat, lon) -> nearest location (points without one are missing)
+        """
+        boxes = {point: _snapped_box(*point, tolerance) for point in dict.fromkeys(points)}
+        found: dict[tuple[float, float], LocationModel] = {}
+
+        items = list(boxes.items())
+        for start in range(0, len(items), GEOCOORD_QUERY_CHUNK):
+            chunk = items[start : start + GEOCOORD_QUERY_CHUNK]
+            result = await db.execute(
+                select(LocationModel).where(or_(*(_box_clause(*box) for _, box in chunk)))
+            )
+            candidates = list(result.scalars())
+
+            for point, (snapped_lat, snapped_lon, tol) in chunk:
+                best, best_distance = None, None
+                for location in candidates:
+                    d_lat = abs(Decimal(location.latitude) - snapped_lat)
+                    d_lon = abs(Decimal(location.longitude) - snapped_lon)
+                    if d_lat > tol or d_lon > tol:
+                        continue
+                    if best_distance is None or d_lat + d_lon < best_distance:
+                        best, best_distance = location, d_lat + d_lon
+                if best is not None:
+                    found[point] = best
+        return found
+
     async def get_or_create_location(
         self,
         db: AsyncSession,
@@ -9,6 +9,8 @@ Features:
 - Priority queue based on keyword relevance
 - Depth-limited traversal
 - JS/SPA detection fallback
+- Optional concurrent frontier (N fetches in flight across hosts, per-host delay)
+- Optional HTTP cache: conditional GETs for HTML pages, 304 reuses the stored body
 """
 
 import asyncio
@@ -16,6 +18,7 @@ import random
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from heapq import heappop, heappush
 from urllib.parse import urljoin, urlparse
 
@@ -24,8 +27,11 @@ import structlog
 from bs4 import BeautifulSoup, FeatureNotFound
 
 from app.services.content_verifier import score_for_data_type
+from app.services.http_cache import HttpCache
+from app.services.keyword_matcher import KeywordMatcher, keyword_matcher
 from app.services.url_utils import (
     DOCUMENT_EXTENSIONS,
+    HTTP_NOT_MODIFIED,
     HTTP_OK,
     RobotsChecker,
     UrlProber,
@@ -38,23 +44,27 @@ logger = structlog.get_logger()
 # Minimum content length to trigger SPA/Headless check
 MIN_HTML_CONTENT_LENGTH = 1024
 
-# Pre-compiled regex patterns for URL scoring (avoid recompilation per call)
-_TOKEN_URL_PATTERNS = [
-    re.compile(pattern, re.IGNORECASE)
-    for pattern in [
-        r"/(media_token|get_file|download_id|fileadmin)/[\w-]+$",
-        r"/ajax/.*download",
-        r"\.(asp|aspx|php)\?.*file",
-        r"/_layouts/.*/download",
-        r"/blob/",
-        r"/download\.(?:php|aspx?)\?",
-        r"/Binaerfile\.asp",
-        r"/getmedia/",
-        r"/dms_download/",
-        r"/attachment/",
-        r"/file\.axd",
-    ]
-]
+# Pre-compiled regex patterns for URL scoring (avoid recompilation per call).
+# Token URL patterns are combined into one regex so a URL is searched once.
+_TOKEN_URL_PATTERN = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in [
+            r"/(media_token|get_file|download_id|fileadmin)/[\w-]+$",
+            r"/ajax/.*download",
+            r"\.(asp|aspx|php)\?.*file",
+            r"/_layouts/.*/download",
+            r"/blob/",
+            r"/download\.(?:php|aspx?)\?",
+            r"/Binaerfile\.asp",
+            r"/getmedia/",
+            r"/dms_download/",
+            r"/attachment/",
+            r"/file\.axd",
+        ]
+    ),
+    re.IGNORECASE,
+)
 
 _YEAR_PATTERNS = [
     re.compile(pattern)
@@ -67,6 +77,10 @@ _YEAR_PATTERNS = [
     ]
 ]
 
+# Max queue items skipped (busy/cooling host) per frontier fill before waiting again.
+# Bounds re-heap work when most of the queue belongs to one host.
+FRONTIER_SCAN_LIMIT = 64
+
 # Preferred HTML parsers in order (lxml is fastest, html.parser is most forgiving)
 HTML_PARSERS = ["lxml", "html.parser", "html5lib"]
 
@@ -244,6 +258,8 @@ class WebCrawler:
         max_pages: int = 50,
         request_delay: float = 0.5,
         timeout: float = 10.0,
+        concurrency: int = 1,
+        http_cache: HttpCache | None = None,
     ):
         """Initialize crawler.
 
@@ -252,8 +268,10 @@ class WebCrawler:
             user_agent: User-Agent string for crawl requests
             max_depth: Maximum crawl depth from start URL
             max_pages: Maximum pages to crawl per session
-            request_delay: Delay between requests (politeness)
+            request_delay: Delay between requests to the same host (politeness)
             timeout: Request timeout in seconds
+            concurrency: Max fetches in flight (across distinct hosts). 1 = sequential BFS
+            http_cache: Optional validator cache for conditional page fetches
         """
         self.client = client
         self.user_agent = user_agent
@@ -261,6 +279,8 @@ class WebCrawler:
         self.max_pages = max_pages
         self.request_delay = request_delay
         self.timeout = timeout
+        self.concurrency = max(1, concurrency)
+        self.http_cache = http_cache
 
         self.prober = UrlProber(client)
         self.robots = RobotsChecker(client)
@@ -327,54 +347,43 @@ class WebCrawler:
             max_depth=self.max_depth,
             max_pages=self.max_pages,
             priority_paths=len(priority_paths or []),
+            concurrency=self.concurrency,
         )
 
-        while queue and pages_crawled < self.max_pages:
-            item = heappop(queue)
-            url = item.url
-            depth = item.depth
-
-            # Skip if too deep
-            if depth > self.max_depth:
-                continue
-
-            # Check robots.txt
-            if not await self.robots.can_fetch(url):
-                self.log.debug("Blocked by robots.txt", url=url[:60])
-                continue
+        if self.concurrency > 1:
+            pages_crawled = await self._crawl_frontier(
+                queue, visited, results, target_keywords, data_type, allowed_domains, target_year
+            )
+        else:
+            while queue and pages_crawled < self.max_pages:
+                item = heappop(queue)
+                url = item.url
+                depth = item.depth
+
+                # Skip if too deep
+                if depth > self.max_depth:
+                    continue
 
-            # Politeness delay
-            if pages_crawled > 0:
-                # Jitter should be proportional, not absolute
-                jitter = random.uniform(0.5, 1.5)  # 50% to 150% of base delay
-                delay = max(0.5, self.request_delay * jitter)
-                await asyncio.sleep(delay)
+                # Check robots.txt
+                if not await self.robots.can_fetch(url):
+                    self.log.debug("Blocked by robots.txt", url=url[:60])
+                    continue
 
-            # Fetch and analyze the URL
-            result, links = await self._fetch_and_analyze(
-                url, depth, target_keywords, data_type, allowed_domains, target_year
-            )
+                # Politeness delay
+                if pages_crawled > 0:
+                    await asyncio.sleep(self._politeness_delay())
 
-            if result:
-                pages_crawled += 1
-                results.append(result)
-
-                # Queue discovered links (with anchor text for scoring)
-                for link, anchor_text in links:
-                    normalized_link = normalize_url(link)
-                    if normalized_link not in visited:
-                        visited.add(normalized_link)
-                        link_score = self._score_url(
-                            normalized_link,
-                            depth + 1,
-                            target_keywords,
-                            data_type,
-                            target_year,
-                            link_text=anchor_text,
-                        )
-                        heappush(queue, QueueItem(-link_score, normalized_link, depth + 1))
+                # Fetch and analyze the URL
+                result, links = await self._fetch_and_analyze(
+                    url, depth, target_keywords, data_type, allowed_domains, target_year
+                )
 
-        # Sort results by score (highest first)
+                if result:
+                    pages_crawled += 1
+                    results.append(result)
+                    self._queue_links(
+                        queue, visited, links, depth, target_keywords, data_type, target_year
+                    )
 
         # Sort results by score (highest first)
         results.sort(key=lambda r: r.score, reverse=True)
@@ -388,6 +397,172 @@ class WebCrawler:
 
         return results
 
+    async def _crawl_frontier(
+        self,
+        queue: list[QueueItem],
+        visited: set[str],
+        results: list[CrawlResult],
+        target_keywords: list[str],
+        data_type: str | None,
+        allowed_domains: set[str],
+        target_year: int | None,
+    ) -> int:
+        """Crawl with up to `concurrency` fetches in flight.
+
+        Items are still taken from the priority queue in score order, but a
+        host only ever has one fetch in flight and must cool down for the
+        politeness delay before its next one. Items for busy hosts are skipped
+        over (and kept in the queue) so other hosts (www/apex, CDN document
+        hosts) can be fetched meanwhile.
+
+        Returns:
+            Number of pages crawled
+        """
+        loop = asyncio.get_running_loop()
+        in_flight: dict[asyncio.Task, tuple[QueueItem, str]] = {}
+        host_ready_at: dict[str, float] = {}
+        pages_crawled = 0
+
+        async def _fetch(item: QueueItem) -> tuple[CrawlResult | None, list[tuple[str, str]]]:
+            if not await self.robots.can_fetch(item.url):
+                self.log.debug("Blocked by robots.txt", url=item.url[:60])
+                return None, []
+            return await self._fetch_and_analyze(
+                item.url, item.depth, target_keywords, data_type, allowed_domains, target_year
+            )
+
+        try:
+            while (queue or in_flight) and pages_crawled < self.max_pages:
+                now = loop.time()
+                busy_hosts = {host for _, host in in_flight.values()}
+                skipped: list[QueueItem] = []
+
+                # Fill free slots in priority order with items whose host is ready
+                while (
+                    queue
+                    and len(in_flight) < self.concurrency
+                    and pages_crawled + len(in_flight) < self.max_pages
+                    and len(skipped) < FRONTIER_SCAN_LIMIT
+                ):
+                    item = heappop(queue)
+                    if item.depth > self.max_depth:
+                        continue
+                    host = urlparse(item.url).hostname or ""
+                    if host in busy_hosts or host_ready_at.get(host, 0.0) > now:
+                        skipped.append(item)
+                        continue
+                    busy_hosts.add(host)
+                    in_flight[asyncio.create_task(_fetch(item))] = (item, host)
+
+                for item in skipped:
+                    heappush(queue, item)
+
+                # Wake up when a fetch completes or the next cooling host becomes ready
+                cooling = [
+                    host_ready_at[h]
+                    for h in {urlparse(i.url).hostname or "" for i in skipped}
+                    if h in host_ready_at and h not in busy_hosts
+                ]
+                timeout = max(min(cooling) - now, 0.0) if cooling else None
+
+                if not in_flight:
+                    if timeout is None:
+                        break
+                    await asyncio.sleep(timeout)
+                    continue
+
+                done, _ = await asyncio.wait(
+                    in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    item, host = in_flight.pop(task)
+                    host_ready_at[host] = loop.time() + self._politeness_delay()
+                    try:
+                        result, links = task.result()
+                    except Exception as e:
+                        self.log.debug("Frontier fetch failed", url=item.url[:60], error=str(e))
+                        continue
+
+                    if result and pages_crawled < self.max_pages:
+                        pages_crawled += 1
+                        results.append(result)
+                        self._queue_links(
+                            queue,
+                            visited,
+                            links,
+                            item.depth,
+                            target_keywords,
+                            data_type,
+                            target_year,
+                        )
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        return pages_crawled
+
+    def _politeness_delay(self) -> float:
+        """Delay before the next request to the same host."""
+        # Jitter should be proportional, not absolute
+        jitter = random.uniform(0.5, 1.5)  # 50% to 150% of base delay
+        return max(0.5, self.request_delay * jitter)
+
+    def _queue_links(
+        self,
+        queue: list[QueueItem],
+        visited: set[str],
+        links: list[tuple[str, str]],
+        depth: int,
+        target_keywords: list[str],
+        data_type: str | None,
+        target_year: int | None,
+    ) -> None:
+        """Queue discovered links (with anchor text for scoring)."""
+        for link, anchor_text in links:
+            normalized_link = normalize_url(link)
+            if normalized_link not in visited:
+                visited.add(normalized_link)
+                link_score = self._score_url(
+                    normalized_link,
+                    depth + 1,
+                    target_keywords,
+                    data_type,
+                    target_year,
+                    link_text=anchor_text,
+                )
+                heappush(queue, QueueItem(-link_score, normalized_link, depth + 1))
+
+    async def _get_page(self, url: str) -> str | None:
+        """GET an HTML page, revalidating against the HTTP cache when available.
+
+        Returns:
+            Page text, or None if the page could not be fetched
+        """
+        cache_entry = await self.http_cache.get(url) if self.http_cache else None
+
+        response = await self.client.get(
+            url,
+            headers=HttpCache.conditional_headers(cache_entry),
+            timeout=self.timeout,
+            follow_redirects=True,
+        )
+
+        if response.status_code == HTTP_NOT_MODIFIED and cache_entry:
+            body = await self.http_cache.read_body(cache_entry)
+            # Decode exactly like the original 200 response (charset from its content-type)
+            cached = httpx.Response(
+                HTTP_OK, headers={"content-type": cache_entry.content_type}, content=body
+            )
+            return cached.text
+
+        if response.status_code != HTTP_OK:
+            return None
+
+        if self.http_cache:
+            await self.http_cache.store(url, response.headers, body=response.content)
+        return response.text
+
     async def _fetch_and_analyze(
         self,
         url: str,
@@ -433,16 +608,9 @@ class WebCrawler:
 
         # It's HTML - fetch and parse for links
         try:
-            response = await self.client.get(
-                final_url,
-                timeout=self.timeout,
-                follow_redirects=True,
-            )
-
-            if response.status_code != HTTP_OK:
+            content = await self._get_page(final_url)
+            if content is None:
                 return None, []
-
-            content = response.text
             content_length = len(content)
 
             # Check for possible SPA (suspiciously small content)
@@ -529,7 +697,7 @@ class WebCrawler:
         Many CMS platforms (TYPO3, SharePoint, ASP.NET, etc.) use opaque token URLs
         for downloads like /media_token/abc123 or /get_file/xyz without file extensions.
         """
-        return any(pattern.search(url) for pattern in _TOKEN_URL_PATTERNS)
+        return _TOKEN_URL_PATTERN.search(url) is not None
 
     def _score_url(
         self,
@@ -556,12 +724,10 @@ class WebCrawler:
         score += self._get_document_score(url_lower, url)
 
         # Keyword bonuses (URL + anchor text)
-        for keyword in target_keywords:
-            kw_lower = keyword.lower()
-            if kw_lower in url_lower:
-                score += 15
-            if link_text_lower and kw_lower in link_text_lower:
-                score += 10
+        matcher = keyword_matcher(tuple(target_keywords))
+        score += 15 * len(matcher.find(url_lower))
+        if link_text_lower:
+            score += 10 * len(matcher.find(link_text_lower))
 
         # Year in URL bonus (current/recent years)
         score += self._get_year_bonus(url_lower, target_year)
@@ -577,9 +743,7 @@ class WebCrawler:
                 break
 
         # Negative keyword penalty (filter out wrong document types)
-        for neg_kw, penalty in NEGATIVE_KEYWORDS:
-            if neg_kw in url_lower or neg_kw in link_text_lower:
-                score += penalty  # penalty is already negative
+        score += negative_keyword_penalty(url_lower, link_text_lower)
 
         # Data-type-specific scoring (skip for "all" to avoid cross-type penalties)
         if data_type and data_type != "all":
@@ -640,13 +804,11 @@ class WebCrawler:
 
     def _find_keywords_in_url(self, url: str, target_keywords: list[str]) -> list[str]:
         """Find which target keywords appear in URL."""
-        url_lower = url.lower()
-        return [kw for kw in target_keywords if kw.lower() in url_lower]
+        return keyword_matcher(tuple(target_keywords)).find(url)
 
     def _find_keywords_in_text(self, text: str, target_keywords: list[str]) -> list[str]:
         """Find which target keywords appear in text content."""
-        text_lower = text.lower()
-        return [kw for kw in target_keywords if kw.lower() in text_lower]
+        return keyword_matcher(tuple(target_keywords)).find(text)
 
     def _is_relevant_external_link(
         self, url: str, anchor_text: str, target_keywords: list[str]
@@ -656,8 +818,8 @@ class WebCrawler:
         Returns True if the URL path or anchor text contains at least one
         target keyword, indicating the link likely points to relevant data.
         """
-        search_text = (urlparse(url).path + " " + anchor_text).lower()
-        return any(kw.lower() in search_text for kw in target_keywords)
+        search_text = urlparse(url).path + " " + anchor_text
+        return keyword_matcher(tuple(target_keywords)).matches_any(search_text)
 
     def _extract_links(
         self,
@@ -758,3 +920,18 @@ def get_keywords_for_data_type(data_type: str) -> list[str]:
     keywords = KEYWORDS.get(data_type, []).copy()
     keywords.extend(KEYWORDS.get("both", []))
     return keywords
+
+
+@lru_cache(maxsize=16)
+def get_keyword_matcher(data_type: str) -> KeywordMatcher:
+    """Matcher over get_keywords_for_data_type(data_type), built once per data type."""
+    return KeywordMatcher(get_keywords_for_data_type(data_type))
+
+
+def negative_keyword_penalty(url_lower: str, link_text_lower: str = "") -> int:
+    """Sum of the NEGATIVE_KEYWORDS penalties hit by a URL or its anchor text."""
+    score = 0
+    for neg_kw, penalty in NEGATIVE_KEYWORDS:
+        if neg_kw in url_lower or neg_kw in link_text_lower:
+            score += penalty  # penalty is already negative
+    return score
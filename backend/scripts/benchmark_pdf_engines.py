@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Compare PyMuPDF and pdfplumber extraction on a corpus of PDFs.
+
+Runs the netzentgelte and HLZF regex extractors with each engine on every PDF
+and reports wall time and whether both engines produced the same records.
+The page text cache is pointed at a temporary directory, so every run parses
+from scratch.
+
+Usage:
+    python scripts/benchmark_pdf_engines.py                    # all PDFs under downloads/
+    python scripts/benchmark_pdf_engines.py data/samples a.pdf # explicit dirs/files
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+ENGINES = ("pymupdf", "pdfplumber")
+
+
+def collect_pdfs(paths: list[Path]) -> list[Path]:
+    pdfs: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            pdfs.extend(sorted(path.rglob("*.pdf")))
+        elif path.suffix.lower() == ".pdf":
+            pdfs.append(path)
+    return pdfs
+
+
+def run_engine(extract_fn, pdf: Path, engine: str) -> tuple[float, list[dict] | None]:
+    from app.services.extraction import pdf_text_cache
+
+    pdf_text_cache._memory_cache.clear()
+    start = time.perf_counter()
+    try:
+        records = extract_fn(pdf, engine=engine)
+    except Exception:
+        records = None
+    return time.perf_counter() - start, records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark PDF extraction engines")
+    parser.add_argument("paths", nargs="*", type=Path, help="PDF files or directories")
+    args = parser.parse_args()
+
+    from app.core.config import settings
+    from app.services.extraction.pdf_extractor import (
+        extract_hlzf_from_pdf,
+        extract_netzentgelte_from_pdf,
+    )
+
+    pdfs = collect_pdfs(args.paths or [Path(settings.downloads_path)])
+    if not pdfs:
+        print("No PDFs found")
+        return
+
+    # Keep the benchmark's page caches out of the real blob store
+    settings.storage_path = tempfile.mkdtemp(prefix="pdf-bench-")
+
+    extractors = {"netzentgelte": extract_netzentgelte_from_pdf, "hlzf": extract_hlzf_from_pdf}
+    totals = dict.fromkeys(ENGINES, 0.0)
+    mismatches = 0
+
+    print(f"{'file':<50} {'type':<13} {'pymupdf':>9} {'plumber':>9} {'recs':>9}  same")
+    for pdf in pdfs:
+        for data_type, extract_fn in extractors.items():
+            results = {engine: run_engine(extract_fn, pdf, engine) for engine in ENGINES}
+            for engine, (elapsed, _records) in results.items():
+                totals[engine] += elapsed
+
+            fast_records = results["pymupdf"][1]
+            ref_records = results["pdfplumber"][1]
+            same = fast_records == ref_records
+            if not same:
+                mismatches += 1
+
+            counts = "/".join("err" if r is None else str(len(r)) for _t, r in results.values())
+            print(
+                f"{pdf.name[:50]:<50} {data_type:<13} "
+                f"{results['pymupdf'][0]:>8.2f}s {results['pdfplumber'][0]:>8.2f}s "
+                f"{counts:>9}  {'yes' if same else 'NO'}"
+            )
+
+    print()
+    print(f"PDFs:        {len(pdfs)}")
+    print(f"pymupdf:     {totals['pymupdf']:.2f}s")
+    print(f"pdfplumber:  {totals['pdfplumber']:.2f}s")
+    if totals["pymupdf"]:
+        print(f"speedup:     {totals['pdfplumber'] / totals['pymupdf']:.1f}x")
+    print(f"mismatches:  {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
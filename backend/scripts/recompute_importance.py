@@ -6,20 +6,14 @@ import asyncio
 import sys
 from pathlib import Path
 
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-
 BACKEND_DIR = Path(__file__).resolve().parent.parent
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
 
-async def recompute(dry_run: bool) -> dict[str, int]:
+async def recompute(dry_run: bool, quantile: float | None) -> dict[str, int]:
     from app.db.database import async_session_maker
-    from app.db.models import DNOModel
-    from app.services.importance import apply_importance_to_dno
-
-    batch_size = 200
+    from app.services.importance_batch import calibrate, load_importance_frame, recompute_importance
 
     stats = {
         "total": 0,
@@ -27,35 +21,18 @@ async def recompute(dry_run: bool) -> dict[str, int]:
     }
 
     async with async_session_maker() as session:
-        last_id = 0
-
-        while True:
-            result = await session.execute(
-                select(DNOModel)
-                .options(selectinload(DNOModel.mastr_data))
-                .where(DNOModel.id > last_id)
-                .order_by(DNOModel.id.asc())
-                .limit(batch_size)
-            )
-            dnos = result.scalars().all()
-            if not dnos:
-                break
-
-            for dno in dnos:
-                apply_importance_to_dno(dno)
-                stats["updated"] += 1
-
-            stats["total"] += len(dnos)
-            last_id = dnos[-1].id
+        calibration = None
+        if quantile is not None:
+            calibration = calibrate(await load_importance_frame(session), quantile)
+            print(f"Calibration at q={quantile}: {calibration}")
 
-            if dry_run:
-                await session.flush()
-                session.expunge_all()
-            else:
-                await session.commit()
+        stats["updated"] = await recompute_importance(session, calibration)
+        stats["total"] = stats["updated"]
 
         if dry_run:
             await session.rollback()
+        else:
+            await session.commit()
 
     return stats
 
@@ -63,9 +40,16 @@ async def recompute(dry_run: bool) -> dict[str, int]:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Recompute DNO importance scores")
     parser.add_argument("--dry-run", action="store_true", help="Validate without commit")
+    parser.add_argument(
+        "--quantile",
+        type=float,
+        default=None,
+        help="Calibrate the p90 anchors at this quantile of the current data (e.g. 0.9) "
+        "instead of the defaults; per-DNO updates keep using the defaults",
+    )
     args = parser.parse_args()
 
-    summary = asyncio.run(recompute(dry_run=args.dry_run))
+    summary = asyncio.run(recompute(dry_run=args.dry_run, quantile=args.quantile))
     print("Importance recompute summary")
     print(f"  total:   {summary['total']}")
     print(f"  updated: {summary['updated']}")
@@ -2,12 +2,14 @@
 Pytest configuration and fixtures for DNO Crawler tests.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable, Iterator
+from typing import Any
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -75,3 +77,86 @@ def mock_auth_headers() -> dict[str, str]:
     No headers needed.
     """
     return {}
+
+
+class FakeResult:
+    """Query result over canned rows."""
+
+    def __init__(self, rows: Iterable[Any] = ()):
+        self.rows = list(rows)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.rows)
+
+    def scalars(self) -> "FakeResult":
+        return self
+
+    def all(self) -> list[Any]:
+        return list(self.rows)
+
+    def first(self) -> Any:
+        return self.rows[0] if self.rows else None
+
+    def scalar_one_or_none(self) -> Any:
+        return self.first()
+
+
+class FakeSession:
+    """In-memory stand-in for AsyncSession in unit tests.
+
+    Records every executed statement and answers it with ``rows``, or with
+    the rows stored for the statement's first selected entity when
+    ``rows_by_entity`` is given. Flushing assigns ids from ``next_id`` to
+    added objects that have none.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[Any] = (),
+        rows_by_entity: dict[Any, list[Any]] | None = None,
+        next_id: int = 1,
+    ):
+        self.rows = list(rows)
+        self.rows_by_entity = rows_by_entity
+        self.next_id = next_id
+        self.statements: list[Any] = []
+        self.entities: list[Any] = []
+        self.added: list[Any] = []
+        self.commits = 0
+
+    @property
+    def sql(self) -> list[str]:
+        """The executed statements compiled for PostgreSQL."""
+        return [str(stmt.compile(dialect=postgresql.dialect())) for stmt in self.statements]
+
+    async def execute(self, stmt: Any, params: Any = None) -> FakeResult:
+        self.statements.append(stmt)
+        if self.rows_by_entity is None:
+            return FakeResult(self.rows)
+        entity = stmt.column_descriptions[0]["entity"]
+        self.entities.append(entity)
+        return FakeResult(self.rows_by_entity.get(entity, []))
+
+    def add(self, obj: Any) -> None:
+        self.added.append(obj)
+
+    async def flush(self) -> None:
+        for obj in self.added:
+            if getattr(obj, "id", None) is None:
+                obj.id = self.next_id
+                self.next_id += 1
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def refresh(self, obj: Any) -> None:
+        pass
+
+    async def get(self, model: Any, key: Any) -> Any:
+        return None
+
+
+@pytest.fixture
+def fake_session() -> type[FakeSession]:
+    """The fake session class; call it with the rows queries should return."""
+    return FakeSession
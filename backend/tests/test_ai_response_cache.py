@@ -0,0 +1,102 @@
+"""Tests for the AI response cache and text batching."""
+
+import asyncio
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+from app.services.ai.batching import BatchItemError, TextBatcher
+from app.services.ai.gateway import PDF_STRIP_VERSION, AIGateway, _pdf_variant, _pdf_variants
+from app.services.ai.response_cache import AIResponseCache
+
+
+async def test_cache_hits_per_model_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = AIResponseCache(tmp_path, ttl_seconds=3600, max_entries=2, evict_every=1)
+    key_a = cache.cache_key("hash-a", "prompt", "model-1", "vision")
+    key_b = cache.cache_key("hash-b", "prompt", "model-1", "vision")
+    key_c = cache.cache_key("hash-c", "prompt", "model-1", "vision")
+
+    await cache.set(key_a, {"data": [{"voltage_level": "MS"}]}, "model-1", "vision")
+    await cache.set(key_b, {"data": []}, "model-1", "vision")
+    assert await cache.get(key_a) == {"data": [{"voltage_level": "MS"}]}
+    assert await cache.get(cache.cache_key("hash-a", "prompt", "model-2", "vision")) is None
+
+    # b was used least recently, so it goes when c arrives
+    path_b = cache._entry_path(key_b)
+    os.utime(path_b, (1, 1))
+    await cache.set(key_c, {"data": []}, "model-1", "vision")
+    assert not path_b.exists()
+    assert await cache.get(key_a) is not None
+
+
+async def test_eviction_runs_every_n_writes(tmp_path: Path) -> None:
+    cache = AIResponseCache(tmp_path, ttl_seconds=3600, max_entries=1, evict_every=3)
+
+    def entries() -> int:
+        return len(list(tmp_path.glob("*/*.json")))
+
+    for i in range(3):
+        await cache.set(cache.cache_key(f"hash-{i}", "p", "m", "text"), {}, "m", "text")
+    # Only the first write of the process evicted
+    assert entries() == 3
+
+    await cache.set(cache.cache_key("hash-3", "p", "m", "text"), {}, "m", "text")
+    assert entries() == 1
+
+
+def test_stripped_pdf_pages_are_part_of_the_key() -> None:
+    keys = {
+        AIResponseCache.cache_key("hash", "prompt", "model", "vision", _pdf_variant(keep))
+        for keep in (None, [0, 3], [0, 4])
+    }
+    assert len(keys) == 3
+    # Bumping the strip version invalidates stripped and unstripped payloads alike
+    assert all(f"v{PDF_STRIP_VERSION}:" in _pdf_variant(keep) for keep in (None, [0, 3]))
+
+
+async def test_response_for_unstripped_pdf_is_found_when_stripping_failed(
+    tmp_path: Path,
+) -> None:
+    cache = AIResponseCache(tmp_path, ttl_seconds=3600, max_entries=10)
+    configs = [SimpleNamespace(model="model-1")]
+    # Stripping pages 0 and 3 failed, so the whole PDF was sent and stored as "all"
+    key = cache.cache_key("hash", "prompt", "model-1", "ocr", _pdf_variant(None))
+    await cache.set(key, "Preisblatt 2025", "model-1", "ocr")
+
+    cached = await AIGateway._cached_response(
+        cache, configs, "hash", "prompt", "ocr", _pdf_variants([0, 3])
+    )
+
+    assert cached == "Preisblatt 2025"
+
+
+async def test_expired_entries_are_misses(tmp_path: Path) -> None:
+    cache = AIResponseCache(tmp_path, ttl_seconds=0, max_entries=10)
+    key = cache.cache_key("hash", "prompt", "model", "text")
+    await cache.set(key, {"data": []}, "model", "text")
+
+    assert await cache.get(key) is None
+    assert not cache._entry_path(key).exists()
+
+
+async def test_batcher_coalesces_concurrent_requests() -> None:
+    batcher = TextBatcher(max_items=3, window_seconds=1.0, max_chars=1000)
+    sent: list[list[tuple[str, str]]] = []
+
+    async def run(items):
+        sent.append(items)
+        results = [{"data": [content]} for content, _prompt in items]
+        results[-1] = BatchItemError("missing")
+        return results
+
+    results = await asyncio.gather(
+        batcher.submit("cfg", "a", "p1", run),
+        batcher.submit("cfg", "b", "p2", run),
+        batcher.submit("cfg", "c", "p3", run),
+        return_exceptions=True,
+    )
+
+    assert len(sent) == 1
+    assert [content for content, _prompt in sent[0]] == ["a", "b", "c"]
+    assert results[:2] == [{"data": ["a"]}, {"data": ["b"]}]
+    assert isinstance(results[2], BatchItemError)
@@ -0,0 +1,227 @@
+"""Tests for the batch search request model, bulk hits and NDJSON stream."""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+
+import pytest
+import structlog
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.api.routes import search
+from app.api.routes.search import (
+    BatchSearchItem,
+    BatchSearchRequest,
+    PublicSearchResponse,
+    _batch_line,
+    _item_hash,
+)
+from app.db import DNOModel, HLZFModel, LocationModel, NetzentgelteModel
+from app.services.vnb import VNBQuotaExceededError, normalize_address
+
+
+def test_batch_item_requires_exactly_one_input() -> None:
+    with pytest.raises(ValidationError):
+        BatchSearchItem(ref="a")
+    with pytest.raises(ValidationError):
+        BatchSearchItem(
+            address={"street": "Musterstr. 1", "zip_code": "50667", "city": "Köln"},
+            coordinates={"latitude": 50.9, "longitude": 6.9},
+        )
+
+    request = BatchSearchRequest(
+        items=[
+            {
+                "ref": "a",
+                "address": {"street": "Musterstr. 1", "zip_code": "50667", "city": "Köln"},
+            },
+            {"ref": "b", "coordinates": {"latitude": 50.9, "longitude": 6.9}},
+        ]
+    )
+    assert [item.ref for item in request.items] == ["a", "b"]
+
+
+def test_item_hash_matches_location_hashes() -> None:
+    address_item = BatchSearchItem(
+        address={"street": "Musterstr. 1", "zip_code": "50667", "city": "Köln"}
+    )
+    assert (
+        _item_hash(address_item) == normalize_address("Musterstr. 1", "50667", "Köln").address_hash
+    )
+
+    coords_item = BatchSearchItem(coordinates={"latitude": 50.9, "longitude": 6.9})
+    assert _item_hash(coords_item) == hashlib.sha256(b"50.9,6.9").hexdigest()
+
+
+def test_batch_line_is_one_json_object() -> None:
+    item = BatchSearchItem(ref="r1", coordinates={"latitude": 50.9, "longitude": 6.9})
+
+    line = _batch_line(3, item, PublicSearchResponse(found=False, has_data=False))
+    assert line.endswith("\n") and "\n" not in line[:-1]
+    entry = json.loads(line)
+    assert entry["index"] == 3 and entry["ref"] == "r1"
+    assert entry["result"]["found"] is False
+
+    entry = json.loads(_batch_line(4, item, error="vnb_quota_exhausted", retry_after=60))
+    assert entry == {"index": 4, "ref": "r1", "error": "vnb_quota_exhausted", "retry_after": 60}
+
+
+def _address_item(ref: str, street: str) -> BatchSearchItem:
+    return BatchSearchItem(ref=ref, address={"street": street, "zip_code": "50667", "city": "Köln"})
+
+
+async def test_load_batch_hits_answers_known_locations_in_bulk(monkeypatch, fake_session) -> None:
+    items = [
+        _address_item("known", "Musterstr. 1"),
+        _address_item("unknown", "Musterstr. 2"),
+        BatchSearchItem(ref="near", coordinates={"latitude": 50.9, "longitude": 6.9}),
+        _address_item("same", "Musterstr. 1"),
+    ]
+    dno = DNOModel(id=7, slug="rheinnetz", name="RheinNetz", status="crawled")
+    address = {"street_clean": "Musterstr", "zip_code": "50667", "city": "Köln"}
+    by_address = LocationModel(
+        id=1, dno_id=7, address_hash=_item_hash(items[0]), latitude=50.93, longitude=6.95, **address
+    )
+    by_coords = LocationModel(
+        id=2, dno_id=7, address_hash="other", latitude=50.9, longitude=6.9, **address
+    )
+    session = fake_session(
+        rows_by_entity={
+            LocationModel: [by_address],
+            DNOModel: [dno],
+            NetzentgelteModel: [
+                NetzentgelteModel(dno_id=7, year=2025, voltage_level="MS", leistung=1.0, arbeit=2.0)
+            ],
+        }
+    )
+
+    async def _find_locations_by_geocoords(db, points):
+        assert points == [(50.9, 6.9)]
+        return {(50.9, 6.9): by_coords}
+
+    monkeypatch.setattr(
+        search.skeleton_service, "find_locations_by_geocoords", _find_locations_by_geocoords
+    )
+
+    hits = await search._load_batch_hits(session, items, [2025])
+
+    assert sorted(hits) == [0, 2, 3]
+    assert hits[0].location.street == by_address.street_clean
+    assert hits[2].location.latitude == 50.9
+    assert all(hit.dno.id == 7 and hit.has_data for hit in hits.values())
+    # One query per table for the whole batch
+    assert session.entities == [LocationModel, DNOModel, NetzentgelteModel, HLZFModel]
+
+
+@contextlib.asynccontextmanager
+async def _no_db():
+    yield None
+
+
+async def _collect(request: BatchSearchRequest) -> list[dict]:
+    return [
+        json.loads(line) async for line in search._stream_batch(request, structlog.get_logger())
+    ]
+
+
+@pytest.fixture
+def batch_env(monkeypatch):
+    """Batch search with a known item 1 and scripted miss lookups."""
+    calls: list[str] = []
+
+    async def _load_batch_hits(db, items, years):
+        return {1: PublicSearchResponse(found=True, has_data=False)}
+
+    monkeypatch.setattr(search, "get_db_session", _no_db)
+    monkeypatch.setattr(search, "_load_batch_hits", _load_batch_hits)
+    return calls
+
+
+async def test_stream_yields_hits_then_misses_in_completion_order(monkeypatch, batch_env) -> None:
+    async def _search_by_address(db, address, years, log):
+        batch_env.append(address.street)
+        # The first miss finishes last
+        await asyncio.sleep(0.01 if address.street == "Musterstr. 0" else 0)
+        return PublicSearchResponse(found=True, has_data=False, message=address.street)
+
+    monkeypatch.setattr(search, "_search_by_address", _search_by_address)
+    monkeypatch.setattr(search, "BATCH_MAX_MISS_LOOKUPS", 2)
+    request = BatchSearchRequest(
+        items=[_address_item(f"r{i}", f"Musterstr. {i}") for i in range(4)]
+    )
+
+    lines = await _collect(request)
+
+    assert [line["index"] for line in lines] == [1, 3, 2, 0]
+    assert lines[1]["error"] == "batch_miss_limit_exceeded"
+    assert lines[2]["result"]["message"] == "Musterstr. 2"
+    assert lines[3]["result"]["message"] == "Musterstr. 0"
+    assert sorted(batch_env) == ["Musterstr. 0", "Musterstr. 2"]
+
+
+@pytest.mark.parametrize(
+    "refusal",
+    [
+        # Shared VNB request pace of the client
+        VNBQuotaExceededError(41.2),
+        # Global VNB quota of the rate limiter
+        HTTPException(status_code=503, detail="quota", headers={"Retry-After": "42"}),
+    ],
+)
+async def test_quota_exhaustion_short_circuits_remaining_misses(
+    monkeypatch, batch_env, refusal
+) -> None:
+    async def _search_by_address(db, address, years, log):
+        batch_env.append(address.street)
+        raise refusal
+
+    monkeypatch.setattr(search, "_search_by_address", _search_by_address)
+    monkeypatch.setattr(search, "BATCH_MISS_CONCURRENCY", 1)
+    request = BatchSearchRequest(
+        items=[_address_item(f"r{i}", f"Musterstr. {i}") for i in range(4)]
+    )
+
+    lines = await _collect(request)
+
+    assert batch_env == ["Musterstr. 0"]
+    assert [line["index"] for line in lines] == [1, 0, 2, 3]
+    assert all(
+        line
+        == {
+            "index": line["index"],
+            "ref": line["ref"],
+            "error": "vnb_quota_exhausted",
+            "retry_after": 42,
+        }
+        for line in lines[1:]
+    )
+
+
+async def test_closing_the_stream_cancels_pending_lookups(monkeypatch, batch_env) -> None:
+    cancelled: list[str] = []
+
+    async def _search_by_address(db, address, years, log):
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(address.street)
+            raise
+
+    monkeypatch.setattr(search, "_search_by_address", _search_by_address)
+    request = BatchSearchRequest(
+        items=[_address_item(f"r{i}", f"Musterstr. {i}") for i in range(8)]
+    )
+
+    stream = search._stream_batch(request, structlog.get_logger())
+    assert json.loads(await anext(stream))["index"] == 1
+    # Let the workers start their lookups, then disconnect
+    pending = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0.01)
+    pending.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await pending
+    await stream.aclose()
+
+    assert len(cancelled) == search.BATCH_MISS_CONCURRENCY
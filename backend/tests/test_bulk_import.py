@@ -0,0 +1,89 @@
+"""Tests for the set-based Netzentgelte/HLZF import."""
+
+from app.services.bulk_import import collapse_duplicates, read_import_file, upsert_rows
+from app.services.data_export import EXPORT_COLUMNS, encode_csv, encode_parquet
+
+WINTER = [{"start": "07:30:00", "end": "15:30:00"}]
+
+
+async def _export(encoder) -> bytes:
+    netz = dict.fromkeys(EXPORT_COLUMNS)
+    netz.update(data_type="netzentgelte", dno_id=1, year=2025, voltage_level="NS", arbeit=5.12)
+    hlzf = dict.fromkeys(EXPORT_COLUMNS)
+    hlzf.update(data_type="hlzf", dno_id=1, year=2025, voltage_level="NS", winter=WINTER)
+
+    async def batches():
+        yield [netz, hlzf]
+
+    return b"".join([chunk async for chunk in encoder(batches())])
+
+
+def _row(**values) -> dict:
+    row = {
+        "dno_id": 1,
+        "year": 2025,
+        "voltage_level": "NS",
+        "leistung": None,
+        "arbeit": None,
+        "leistung_unter_2500h": None,
+        "arbeit_unter_2500h": None,
+        "verification_status": None,
+        "extraction_source": None,
+    }
+    row.update(values)
+    return row
+
+
+async def test_reads_csv_and_parquet_exports_back() -> None:
+    for encoder, filename in ((encode_csv, "data.csv"), (encode_parquet, "data.parquet")):
+        records = read_import_file(await _export(encoder), filename)
+
+        assert [r["data_type"] for r in records] == ["netzentgelte", "hlzf"]
+        assert records[0]["winter"] is None
+        assert records[1]["winter"] == WINTER
+        assert float(records[0]["arbeit"]) == 5.12
+
+
+def test_collapse_duplicates_applies_later_values() -> None:
+    rows = collapse_duplicates([_row(arbeit=1.0, leistung=2.0), _row(year=2024), _row(arbeit=3.0)])
+
+    assert len(rows) == 2
+    assert rows[0]["arbeit"] == 3.0
+    assert rows[0]["leistung"] == 2.0
+
+
+async def test_upsert_keeps_defaults_out_of_the_update(fake_session) -> None:
+    db = fake_session([(True,)])
+
+    await upsert_rows(
+        db, "netzentgelte", [_row(arbeit=1.0), _row(year=2024, extraction_source="x")]
+    )
+
+    assert len(db.sql) == 2
+    without_source, with_source = db.sql
+    assert "ON CONFLICT (dno_id, year, voltage_level) DO UPDATE" in without_source
+    assert "coalesce(excluded.arbeit, netzentgelte.arbeit)" in without_source
+    assert "extraction_source = excluded.extraction_source" not in without_source
+    assert "extraction_source = excluded.extraction_source" in with_source
+    assert "verification_status = excluded" not in with_source
+
+
+async def test_dataset_records_report_row_errors(fake_session) -> None:
+    from app.api.routes.dnos.import_export import _parse_dataset_records
+
+    records = [
+        {"data_type": "netzentgelte", "dno_slug": "netz-ulm", "year": 2025, "voltage_level": "NS"},
+        {"data_type": "hlzf", "dno_id": "1", "year": 2025, "voltage_level": "XX"},
+        {"data_type": "netzentgelte", "dno_id": 99, "year": 2025, "voltage_level": "NS"},
+        {"data_type": "other"},
+    ]
+
+    rows, errors, error_count = await _parse_dataset_records(
+        fake_session([(1, "netz-ulm")]), records
+    )
+
+    assert [r["dno_id"] for r in rows["netzentgelte"]] == [1]
+    assert rows["hlzf"] == []
+    assert error_count == 3
+    assert [e["row"] for e in errors] == [2, 3, 4]
+    assert "voltage_level" in errors[0]["error"]
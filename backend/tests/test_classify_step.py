@@ -0,0 +1,42 @@
+"""Tests for the classify step's per-document analysis memo."""
+
+from pathlib import Path
+
+import pytest
+
+from app.jobs.steps import step_03_classify
+from app.jobs.steps.step_03_classify import ClassifyStep
+from app.services.extraction.parse_pool import ParseTimeoutError
+
+PDF_TEXT = "Preisblatt Netzentgelte 2025 Leistungspreis Arbeitspreis " * 5
+
+
+async def _analyze(monkeypatch: pytest.MonkeyPatch, run_parser) -> tuple[dict, bool]:
+    step = ClassifyStep()
+
+    async def extract_text(file_path, file_format, db=None):
+        return PDF_TEXT
+
+    monkeypatch.setattr(step, "_extract_text", extract_text)
+    monkeypatch.setattr(step_03_classify, "run_parser", run_parser)
+    return await step._analyze_file(Path("preisblatt.pdf"), "pdf", 2025, None)
+
+
+async def test_parse_timeout_is_not_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def timed_out(fn, *args):
+        raise ParseTimeoutError(f"{fn.__qualname__} exceeded 120s")
+
+    analysis, cacheable = await _analyze(monkeypatch, timed_out)
+
+    assert (analysis["netz_count"], analysis["hlzf_count"]) == (0, 0)
+    assert not cacheable
+
+
+async def test_empty_extraction_is_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def no_records(fn, *args):
+        return []
+
+    analysis, cacheable = await _analyze(monkeypatch, no_records)
+
+    assert (analysis["netz_count"], analysis["hlzf_count"]) == (0, 0)
+    assert cacheable
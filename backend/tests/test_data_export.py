@@ -0,0 +1,87 @@
+"""Tests for the streaming Netzentgelte/HLZF export encoders."""
+
+import csv
+import io
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pyarrow.parquet as pq
+
+from app.services.data_export import (
+    EXPORT_COLUMNS,
+    encode_csv,
+    encode_ndjson,
+    encode_parquet,
+    netzentgelte_record,
+)
+
+
+def _record(dno_id: int, data_type: str) -> dict:
+    record = dict.fromkeys(EXPORT_COLUMNS)
+    record.update(
+        data_type=data_type,
+        dno_id=dno_id,
+        dno_slug="netz-ulm",
+        dno_name="Netz Ulm",
+        year=2025,
+        voltage_level="NS",
+        verification_status="unverified",
+    )
+    if data_type == "hlzf":
+        record["winter"] = [{"start": "07:30:00", "end": "15:30:00"}]
+    else:
+        record["arbeit"] = 5.12
+    return record
+
+
+async def _batches():
+    yield [_record(1, "netzentgelte"), _record(2, "netzentgelte")]
+    yield [_record(3, "hlzf")]
+
+
+async def _encode(encoder) -> bytes:
+    return b"".join([chunk async for chunk in encoder(_batches())])
+
+
+async def test_ndjson_one_line_per_record() -> None:
+    lines = (await _encode(encode_ndjson)).decode().splitlines()
+
+    assert [json.loads(line)["dno_id"] for line in lines] == [1, 2, 3]
+
+
+async def test_csv_has_header_and_json_time_windows() -> None:
+    content = await _encode(encode_csv)
+    rows = list(csv.DictReader(io.StringIO(content.decode())))
+
+    assert len(rows) == 3
+    assert rows[0]["arbeit"] == "5.12"
+    assert json.loads(rows[2]["winter"]) == [{"start": "07:30:00", "end": "15:30:00"}]
+
+
+async def test_parquet_writes_one_row_group_per_batch() -> None:
+    data = io.BytesIO(await _encode(encode_parquet))
+
+    assert pq.ParquetFile(data).num_row_groups == 2
+    table = pq.read_table(data)
+    assert table.num_rows == 3
+    assert table.column_names == list(EXPORT_COLUMNS)
+
+
+def test_zero_prices_are_exported() -> None:
+    row = SimpleNamespace(
+        year=2025,
+        voltage_level="MS",
+        leistung=Decimal("0"),
+        arbeit=None,
+        leistung_unter_2500h=None,
+        arbeit_unter_2500h=None,
+        verification_status="bogus",
+        extraction_source="ai",
+    )
+
+    record = netzentgelte_record(row)
+
+    assert record["leistung"] == 0.0
+    assert record["arbeit"] is None
+    assert record["verification_status"] == "unverified"
@@ -0,0 +1,85 @@
+"""Tests for DNO list sort keys and keyset cursors."""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.api.routes.dnos.crud import (
+    _decode_cursor,
+    _encode_cursor,
+    _escape_like,
+    _keyset_after,
+    _list_data_score,
+    _list_importance,
+    _list_sort_keys,
+    _serialize_dno_list_item,
+)
+from app.db.models import DNOModel
+
+
+def test_sort_keys_end_with_unique_id() -> None:
+    for sort_by in ("name_asc", "name_desc", "region_desc", "importance_desc", "score_asc"):
+        key, _ = _list_sort_keys(sort_by)[-1]
+        assert key is DNOModel.id
+
+
+def test_score_sorts_keep_importance_meaning() -> None:
+    assert _list_sort_keys("score_desc")[0] == (_list_importance, True)
+    assert _list_sort_keys("score_asc")[0] == (_list_importance, False)
+    assert _list_sort_keys("data_score_desc")[0] == (_list_data_score, True)
+
+
+def test_keyset_condition_continues_after_last_row() -> None:
+    keys = _list_sort_keys("importance_desc")
+    condition = _keyset_after(keys, [12.5, "Netz Ulm", 7])
+    sql = str(
+        select(DNOModel.id)
+        .where(condition)
+        .compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+
+    assert "coalesce(dno_summaries.importance_score, dnos.importance_score, 0.0) < 12.5" in sql
+    assert "dnos.name > 'Netz Ulm'" in sql
+    assert "dnos.id > 7" in sql
+
+
+def test_cursor_round_trip_and_validation() -> None:
+    region_keys = _list_sort_keys("region_asc")
+    cursor = _encode_cursor("region_asc", [0, "köln", "Rheinische Netz", 42])
+    assert _decode_cursor(cursor, "region_asc", region_keys) == [0, "köln", "Rheinische Netz", 42]
+
+    # Float keys accept integral JSON numbers
+    importance_keys = _list_sort_keys("importance_desc")
+    cursor = _encode_cursor("importance_desc", [3, "Netz Ulm", 7])
+    assert _decode_cursor(cursor, "importance_desc", importance_keys) == [3, "Netz Ulm", 7]
+
+    invalid = [
+        # Another sort with the same number of keys
+        ("data_score_desc", _encode_cursor("importance_desc", [3, "Netz Ulm", 7])),
+        # Wrong value types
+        ("importance_desc", _encode_cursor("importance_desc", ["3", "Netz Ulm", 7])),
+        ("importance_desc", _encode_cursor("importance_desc", [3.5, "Netz Ulm", True])),
+        ("importance_desc", _encode_cursor("importance_desc", [3.5, None, 7])),
+        # Wrong length, no payload
+        ("importance_desc", _encode_cursor("importance_desc", [3.5, 7])),
+        ("importance_desc", "not-a-cursor!"),
+    ]
+    for sort, cursor in invalid:
+        with pytest.raises(HTTPException) as error:
+            _decode_cursor(cursor, sort, _list_sort_keys(sort))
+        assert error.value.status_code == 400
+
+
+def test_escape_like_wildcards() -> None:
+    assert _escape_like("50%_off\\") == "50\\%\\_off\\\\"
+
+
+def test_dno_without_summary_row_is_listed_with_defaults() -> None:
+    dno = DNOModel(id=5, slug="netze-ulm", name="Netze Ulm", crawlable=False, importance_score=3.5)
+
+    item = _serialize_dno_list_item(dno=dno, summary=None, include_stats=False)
+
+    assert item["status"] == "protected"
+    assert (item["data_points_count"], item["score"]) == (0, 0)
+    assert item["importance_score"] == 3.5
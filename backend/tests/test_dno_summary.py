@@ -0,0 +1,82 @@
+"""Tests for the precomputed DNO list summary rows."""
+
+from types import SimpleNamespace
+
+from app.services.dno_summary import build_search_text, build_summary_row, calculate_live_status
+
+
+def _dno(**overrides) -> SimpleNamespace:
+    fields = {
+        "id": 7,
+        "crawlable": True,
+        "mastr_data": None,
+        "importance_score": 42.0,
+        "importance_confidence": 0.8,
+        "importance_version": "v1",
+        "name": "Stadtwerke Ulm",
+        "official_name": "Stadtwerke Ulm/Neu-Ulm Netze GmbH",
+        "region": "Baden-Württemberg",
+        "slug": "stadtwerke-ulm",
+        "mastr_nr": "SNB123456789",
+        "vnb_id": None,
+        "primary_bdew_code": "9900000000001",
+        "vnb_data": None,
+        "bdew_data": [],
+    }
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_live_status_prefers_active_jobs() -> None:
+    assert (
+        calculate_live_status(crawlable=False, data_points_count=5, running_jobs=1, pending_jobs=2)
+        == "running"
+    )
+    assert (
+        calculate_live_status(crawlable=True, data_points_count=0, running_jobs=0, pending_jobs=1)
+        == "pending"
+    )
+    assert (
+        calculate_live_status(crawlable=False, data_points_count=5, running_jobs=0, pending_jobs=0)
+        == "protected"
+    )
+
+
+def test_summary_row_aggregates_counts_and_keeps_stored_importance() -> None:
+    row = build_summary_row(
+        _dno(),
+        netz_levels={"NS": 2, "MS": 1},
+        hlzf_levels={"NS": 1},
+        running_jobs=0,
+        pending_jobs=0,
+    )
+
+    assert row["dno_id"] == 7
+    assert (row["netzentgelte_count"], row["hlzf_count"], row["data_points_count"]) == (3, 1, 4)
+    assert row["score"] == 8
+    assert row["live_status"] == "crawled"
+    assert row["completeness_score"] == 100  # No MaStR expectations, data present
+    assert row["importance_score"] == 42.0
+
+
+def test_summary_row_for_uncrawled_dno() -> None:
+    row = build_summary_row(_dno(), {}, {}, running_jobs=0, pending_jobs=0)
+
+    assert row["data_points_count"] == 0
+    assert row["score"] == 0
+    assert row["live_status"] == "uncrawled"
+    assert row["completeness_score"] == 0
+
+
+def test_search_text_covers_aliases_and_codes() -> None:
+    dno = _dno(
+        vnb_data=SimpleNamespace(name="SWU Netze", official_name=None),
+        bdew_data=[SimpleNamespace(bdew_code="9900000000001", company_name="SWU Netze GmbH")],
+    )
+
+    text = build_search_text(dno)
+
+    assert "stadtwerke ulm/neu-ulm netze gmbh" in text
+    assert "swu netze gmbh" in text
+    assert "snb123456789" in text
+    assert text.count("9900000000001") == 1  # Primary code and BDEW row deduplicated
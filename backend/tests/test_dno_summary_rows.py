@@ -0,0 +1,90 @@
+"""Every DNO creation path writes the new DNO's list summary row."""
+
+import pytest
+
+from app.api.routes.dnos import crud
+from app.api.routes.dnos.schemas import CreateDNORequest
+from app.db import seeder
+from app.jobs import enrichment_job
+from app.services import dno_creation
+from app.services.vnb import skeleton
+from app.services.vnb.skeleton import SkeletonService
+
+
+def _record_refreshes(monkeypatch: pytest.MonkeyPatch, module, name: str) -> list:
+    refreshed = []
+
+    async def refresh(db, dno_ids):
+        refreshed.append(dno_ids)
+
+    monkeypatch.setattr(module, name, refresh)
+    return refreshed
+
+
+async def test_skeleton_creation_writes_summary(
+    monkeypatch: pytest.MonkeyPatch, fake_session
+) -> None:
+    refreshed = _record_refreshes(monkeypatch, skeleton, "refresh_dno_summary")
+
+    async def enqueue(dno_id):
+        pass
+
+    monkeypatch.setattr(enrichment_job, "enqueue_enrichment_job", enqueue)
+
+    dno, created = await SkeletonService().get_or_create_dno(
+        fake_session(next_id=41), name="Netze Ulm", vnb_id="vnb-1"
+    )
+
+    assert created
+    assert refreshed == [dno.id] == [41]
+
+
+async def test_create_route_writes_summary(monkeypatch: pytest.MonkeyPatch, fake_session) -> None:
+    refreshed = _record_refreshes(monkeypatch, crud, "refresh_dno_summary")
+
+    async def resolve(**kwargs):
+        return dno_creation.DNOCreationResolvedData(
+            official_name=None,
+            website=None,
+            phone=None,
+            email=None,
+            contact_address=None,
+            crawlable=True,
+            crawl_blocked_reason=None,
+            robots_txt=None,
+            sitemap_urls=None,
+            disallow_paths=None,
+            tech_info=None,
+        )
+
+    monkeypatch.setattr(dno_creation, "resolve_dno_creation_data", resolve)
+
+    response = await crud.create_dno(
+        CreateDNORequest(name="Netze Ulm"), fake_session(next_id=41), None
+    )
+
+    assert response.data["id"] == "41"
+    assert refreshed == [41]
+
+
+async def test_seeder_writes_summaries_of_seeded_dnos(
+    monkeypatch: pytest.MonkeyPatch, tmp_path, fake_session
+) -> None:
+    refreshed = _record_refreshes(monkeypatch, seeder, "refresh_dno_summaries")
+    seed_file = tmp_path / "dnos_enriched.parquet"
+    seed_file.write_bytes(b"seed")
+
+    async def load_snapshot(db):
+        return seeder.SeedSnapshot()
+
+    async def apply_plan(db, plan, snapshot):
+        return [7, 8]
+
+    monkeypatch.setattr(seeder, "get_seed_parquet_path", lambda: seed_file)
+    monkeypatch.setattr(seeder, "load_seed_data", lambda: [])
+    monkeypatch.setattr(seeder, "load_seed_snapshot", load_snapshot)
+    monkeypatch.setattr(seeder, "apply_seed_plan", apply_plan)
+
+    await seeder.seed_dnos(fake_session(next_id=41))
+
+    assert refreshed == [[7, 8]]
@@ -0,0 +1,33 @@
+"""Tests for the content-addressed document store."""
+
+import hashlib
+from pathlib import Path
+
+from app.services.document_store import DocumentStore, hash_file
+
+
+async def test_put_deduplicates_identical_content(tmp_path: Path) -> None:
+    store = DocumentStore(tmp_path)
+    content = b"%PDF-1.7 Preisblatt Netzentgelte 2025"
+
+    hash_a, path_a = await store.put(content, "pdf")
+    hash_b, path_b = await store.put(content, "pdf")
+
+    assert hash_a == hash_b == hashlib.sha256(content).hexdigest()
+    assert path_a == path_b == tmp_path / hash_a[:2] / f"{hash_a}.pdf"
+    assert path_a.read_bytes() == content
+    assert hash_file(path_a) == hash_a
+    assert len(list(tmp_path.rglob("*.pdf"))) == 1
+
+
+async def test_results_are_memoized_per_key(tmp_path: Path) -> None:
+    store = DocumentStore(tmp_path)
+    content_hash, _ = await store.put(b"<html>hlzf</html>", "html")
+
+    assert await store.get_result(content_hash, "classify:v1:2025") is None
+
+    await store.set_result(content_hash, "classify:v1:2025", {"hlzf_count": 4})
+    await store.set_result(content_hash, "classify:v1:2024", {"hlzf_count": 0})
+
+    assert await store.get_result(content_hash, "classify:v1:2025") == {"hlzf_count": 4}
+    assert await store.get_result(content_hash, "classify:v1:2024") == {"hlzf_count": 0}
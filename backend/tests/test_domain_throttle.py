@@ -0,0 +1,122 @@
+"""Tests for per-domain crawl throttling: domains, leases and host buckets."""
+
+import asyncio
+import uuid
+
+import pytest
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.services.domain_throttle import DomainThrottle, HostThrottledError, registered_domain
+
+
+def test_registered_domain_strips_subdomains() -> None:
+    assert registered_domain("https://www.netze-bw.de/netzentgelte") == "netze-bw.de"
+    assert registered_domain("cdn.stadtwerke-musterstadt.de") == "stadtwerke-musterstadt.de"
+
+
+def test_registered_domain_keeps_apex() -> None:
+    assert registered_domain("https://westnetz.de") == "westnetz.de"
+
+
+def test_registered_domain_handles_multi_label_suffix() -> None:
+    assert registered_domain("https://files.example.co.uk/doc.pdf") == "example.co.uk"
+
+
+def test_registered_domain_rejects_empty_input() -> None:
+    assert registered_domain("") is None
+    assert registered_domain("https://") is None
+
+
+async def _throttle() -> DomainThrottle:
+    """DomainThrottle on the configured Redis (skips if it is not reachable)."""
+    redis = Redis.from_url(str(settings.redis_url), socket_connect_timeout=0.5)
+    try:
+        await redis.ping()
+    except Exception as e:
+        await redis.aclose()
+        pytest.skip(f"Redis not available: {e}")
+    return DomainThrottle(redis, host_rate=20.0, host_burst=2)
+
+
+async def test_lease_acquire_renew_release() -> None:
+    domain = f"{uuid.uuid4().hex}.example.de"
+    key = f"{DomainThrottle.LEASE_KEY_PREFIX}{domain}"
+
+    throttle = await _throttle()
+    try:
+        assert await throttle.try_acquire_lease(domain, "job:1", 30)
+        assert not await throttle.try_acquire_lease(domain, "job:2", 30)
+
+        # The holder (e.g. a re-delivered job) renews its lease
+        assert await throttle.try_acquire_lease(domain, "job:1", 120)
+        assert 30 < await throttle.redis.ttl(key) <= 120
+
+        # Only the holder can release it
+        await throttle.release_lease(domain, "job:2")
+        assert not await throttle.try_acquire_lease(domain, "job:2", 30)
+        await throttle.release_lease(domain, "job:1")
+        assert await throttle.try_acquire_lease(domain, "job:2", 30)
+    finally:
+        await throttle.redis.delete(key)
+        await throttle.redis.aclose()
+
+
+async def test_token_bucket_allows_burst_then_refills() -> None:
+    host = f"www.{uuid.uuid4().hex}.example.de"
+
+    throttle = await _throttle()
+    try:
+        assert await throttle.acquire(host) == 0.0
+        assert await throttle.acquire(host) == 0.0
+        # Bucket empty: the third request waits for its slot (1/20 s)
+        assert 0.0 < await throttle.acquire(host) <= 0.05
+        await asyncio.sleep(0.1)
+        assert await throttle.acquire(host) == 0.0
+
+        # Slots further than max_wait away are refused without taking a token
+        throttle.max_wait = 0.0
+        with pytest.raises(HostThrottledError):
+            await throttle.acquire(host, fail_fast=True)
+        await asyncio.sleep(0.06)
+        assert await throttle.acquire(host, fail_fast=True) == 0.0
+        # Without fail_fast the caller waits for the next free token instead
+        assert 0.0 < await throttle.acquire(host) <= 0.1
+    finally:
+        await throttle.redis.delete(f"{DomainThrottle.BUCKET_KEY_PREFIX}{host}")
+        await throttle.redis.aclose()
+
+
+async def test_redis_errors_fail_open() -> None:
+    redis = Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.2)
+    throttle = DomainThrottle(redis)
+    try:
+        assert await throttle.acquire("www.example.de") == 0.0
+        assert await throttle.try_acquire_lease("example.de", "job:1", 30)
+        await throttle.release_lease("example.de", "job:1")
+    finally:
+        await redis.aclose()
+
+
+async def test_refused_slots_wait_or_fail_fast() -> None:
+    replies: list[list] = []
+
+    async def _take_token(keys, args):
+        assert args[2] == 5.0  # max_wait is passed to the script
+        return replies.pop(0)
+
+    redis = Redis(host="127.0.0.1", port=1)
+    throttle = DomainThrottle(redis, max_wait=5.0)
+    throttle._take_token = _take_token
+    try:
+        # Refused once, then a slot 0.01 s away
+        replies.extend([[0, b"0.02"], [1, b"0.01"]])
+        assert await throttle.acquire("www.example.de") == pytest.approx(0.03)
+
+        replies.append([0, b"2.5"])
+        with pytest.raises(HostThrottledError) as refused:
+            await throttle.acquire("www.example.de", fail_fast=True)
+        assert refused.value.retry_after == 2.5
+        assert not replies
+    finally:
+        await redis.aclose()
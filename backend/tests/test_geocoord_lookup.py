@@ -0,0 +1,49 @@
+"""Tests for the indexed bounding-box geocoord lookups."""
+
+from decimal import Decimal
+
+from app.db import LocationModel
+from app.services.vnb.skeleton import SkeletonService
+
+
+def _location(location_id: int, lat: str, lon: str) -> LocationModel:
+    return LocationModel(id=location_id, latitude=Decimal(lat), longitude=Decimal(lon))
+
+
+def _where(sql: str) -> str:
+    return sql.split("WHERE", 1)[1].split("ORDER BY", 1)[0]
+
+
+async def test_single_lookup_uses_range_predicates(fake_session) -> None:
+    session = fake_session()
+
+    await SkeletonService().find_location_by_geocoord(session, 50.9375, 6.9603)
+
+    where = _where(session.sql[0])
+    assert "locations.latitude BETWEEN" in where
+    assert "locations.longitude BETWEEN" in where
+    assert "abs(" not in where
+
+
+async def test_bulk_lookup_picks_nearest_with_inclusive_snapped_bounds(fake_session) -> None:
+    session = fake_session(
+        [
+            _location(1, "50.937500", "6.960300"),
+            _location(2, "50.937560", "6.960340"),
+            _location(3, "50.940000", "6.960300"),  # ~280 m away
+            _location(4, "48.137249", "11.575490"),  # exactly on the tolerance edge
+        ]
+    )
+
+    found = await SkeletonService().find_locations_by_geocoords(
+        session,
+        [(50.93755, 6.96033), (50.9385, 6.9603), (48.137149, 11.57549), (50.93755, 6.96033)],
+    )
+
+    assert {point: location.id for point, location in found.items()} == {
+        (50.93755, 6.96033): 2,
+        (48.137149, 11.57549): 4,
+    }
+    # Duplicate points share one bounding box in one query
+    assert len(session.statements) == 1
+    assert _where(session.sql[0]).count("locations.latitude BETWEEN") == 3
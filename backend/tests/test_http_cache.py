@@ -0,0 +1,110 @@
+"""Tests for the persistent HTTP conditional-request cache."""
+
+import os
+from pathlib import Path
+
+from app.jobs.steps.step_02_download import DownloadStep
+from app.services.document_store import DocumentStore
+from app.services.http_cache import HttpCache
+
+
+async def test_store_and_revalidate_with_existing_body(tmp_path: Path) -> None:
+    body_file = tmp_path / "westnetz_00_abcd1234.pdf"
+    body_file.write_bytes(b"%PDF-1.7 preisblatt")
+    cache = HttpCache(tmp_path / "http-cache")
+    url = "https://www.westnetz.de/preisblatt.pdf?utm_source=x"
+
+    entry = await cache.store(
+        url,
+        {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        body_path=body_file,
+        file_format="pdf",
+    )
+    assert entry is not None
+
+    # Tracking params are normalized away, so the same entry is found
+    cached = await cache.get("https://WWW.westnetz.de/preisblatt.pdf")
+    assert cached is not None
+    assert cached.size_bytes == body_file.stat().st_size
+    assert HttpCache.conditional_headers(cached) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+
+
+async def test_inline_body_is_kept_by_cache(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path)
+    await cache.store("https://example.de/netz", {"etag": "W/1"}, body=b"<html></html>")
+
+    cached = await cache.get("https://example.de/netz")
+    assert cached is not None
+    assert await cache.read_body(cached) == b"<html></html>"
+
+
+async def test_missing_body_or_validators_is_a_miss(tmp_path: Path) -> None:
+    body_file = tmp_path / "page.html"
+    body_file.write_bytes(b"x")
+    cache = HttpCache(tmp_path / "cache")
+    url = "https://example.de/page"
+
+    await cache.store(url, {"etag": '"1"'}, body_path=body_file)
+    body_file.unlink()
+    assert await cache.get(url) is None
+
+    # A response without validators removes the old entry
+    body_file.write_bytes(b"x")
+    await cache.store(url, {}, body_path=body_file)
+    assert await cache.get(url) is None
+    assert HttpCache.conditional_headers(None) == {}
+
+
+async def test_unused_entries_expire_with_their_own_body(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path, ttl_seconds=3600)
+    url = "https://example.de/netz"
+    await cache.store(url, {"etag": '"1"'}, body=b"<html></html>")
+    entry_path = cache._entry_path(cache.cache_key(url))
+
+    os.utime(entry_path, (1, 1))
+    assert await cache.get(url) is None
+    assert not entry_path.exists()
+    assert not entry_path.with_suffix(".body").exists()
+
+
+async def test_eviction_keeps_recently_used_entries_and_caller_bodies(tmp_path: Path) -> None:
+    body_file = tmp_path / "blob.pdf"
+    body_file.write_bytes(b"%PDF")
+    cache = HttpCache(tmp_path / "cache", max_entries=2, evict_every=3)
+    urls = [f"https://example.de/preisblatt-{i}.pdf" for i in range(4)]
+
+    for url in urls[:3]:
+        await cache.store(url, {"etag": '"1"'}, body_path=body_file)
+    # Eviction ran on the first write only, so the cap is exceeded until the next pass
+    assert len(list((tmp_path / "cache").glob("*/*.json"))) == 3
+
+    for i, url in enumerate(urls[:3], 1):
+        os.utime(cache._entry_path(cache.cache_key(url)), (i, i))
+    await cache.get(urls[0])  # A hit makes urls[0] recently used again
+    await cache.store(urls[3], {"etag": '"1"'}, body_path=body_file)
+
+    assert [await cache.get(url) is not None for url in urls] == [True, False, False, True]
+    assert body_file.exists()
+
+
+async def test_download_reuses_only_blob_backed_entries(tmp_path: Path) -> None:
+    store = DocumentStore(tmp_path / "blobs")
+    cache = HttpCache(tmp_path / "http-cache")
+    content_hash, blob = await store.put(b"%PDF-1.7", "pdf")
+
+    # Download step: the body is a blob of the document store
+    downloaded = await cache.store(
+        "https://example.de/preisblatt.pdf",
+        {"etag": '"1"'},
+        body_path=blob,
+        file_format="pdf",
+        content_hash=content_hash,
+    )
+    # Crawler: the cache keeps its own (evictable) copy of the page
+    crawled = await cache.store("https://example.de/netz", {"etag": '"2"'}, body=b"<html>")
+
+    assert DownloadStep._is_blob_entry(downloaded, store)
+    assert not DownloadStep._is_blob_entry(crawled, store)
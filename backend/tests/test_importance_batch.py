@@ -0,0 +1,73 @@
+"""Tests for columnar importance scoring."""
+
+import json
+
+from app.services.importance import ImportanceInputs, compute_importance
+from app.services.importance_batch import (
+    build_factors,
+    calibrate,
+    importance_frame,
+    recompute_importance,
+    score_distribution,
+    score_frame,
+)
+
+ROWS = [
+    (1, 120, None, False, None),
+    (2, 25000, 300000, True, 900.5),
+    (3, None, None, None, None),
+    (4, 0, 0, True, 0.0),
+    (5, 4000, None, True, 2500.0),
+]
+
+
+def test_scores_match_per_dno_scoring() -> None:
+    frame = importance_frame(ROWS)
+    scores = score_frame(frame, {"connection_points_p90": 8000.0})
+
+    for (_, cp, customers, has_customers, area), score, confidence in zip(
+        ROWS, scores["score"], scores["confidence"], strict=True
+    ):
+        expected = compute_importance(
+            ImportanceInputs(cp, customers, has_customers, area),
+            calibration={"connection_points_p90": 8000.0},
+        )
+        assert (score, confidence) == (expected.score, expected.confidence)
+
+
+def test_factors_match_per_dno_payload() -> None:
+    frame = importance_frame(ROWS)
+    factors = build_factors(frame, score_frame(frame))
+
+    json.dumps(factors)
+    expected = compute_importance(ImportanceInputs(120, None, False, None)).factors
+    assert factors[0]["inputs"] == expected["inputs"]
+    assert factors[0]["fallbacks"] == expected["fallbacks"]
+    assert factors[0]["customer_factor_meta"] == expected["customer_factor_meta"]
+    assert factors[2]["customer_factor_meta"]["source"] == "default_fallback"
+
+
+def test_calibrate_uses_positive_values_only() -> None:
+    calibration = calibrate(importance_frame(ROWS), quantile=0.5)
+
+    assert calibration["connection_points_p90"] == 4000.0
+    assert calibration["customer_count_p90"] == 300000.0
+    assert calibration["area_km2_p90"] == 1700.25
+
+
+def test_score_distribution_buckets() -> None:
+    distribution = score_distribution([5.0, 55.0, 99.5, 100.0])
+
+    assert distribution["p50"] == 55.0
+    assert [bucket["count"] for bucket in distribution["histogram"]][-1] == 2
+    assert score_distribution([])["p90"] == 0.0
+
+
+async def test_recompute_writes_one_update_per_table(fake_session) -> None:
+    db = fake_session(ROWS)
+
+    assert await recompute_importance(db) == len(ROWS)
+    _, dnos, summaries = db.sql
+    assert dnos.startswith("UPDATE dnos SET importance_score=scored.importance_score")
+    assert "FROM (VALUES" in dnos
+    assert summaries.startswith("UPDATE dno_summaries SET importance_score=dnos.importance_score")
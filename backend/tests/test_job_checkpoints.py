@@ -0,0 +1,97 @@
+"""Tests for crawl job step checkpoints and re-deliveries."""
+
+import pytest
+import structlog
+from arq import Retry
+
+from app.db.models import CrawlJobModel
+from app.jobs import CrawlWorkerSettings, crawl_job
+from app.jobs.common import (
+    checkpoint_downloads,
+    checkpoint_step,
+    is_step_checkpointed,
+    reset_step_checkpoints,
+    resume_context,
+)
+
+
+def _job(context: dict | None = None) -> CrawlJobModel:
+    return CrawlJobModel(dno_id=1, year=2025, data_type="all", job_type="full", context=context)
+
+
+def test_checkpoints_track_steps_and_partial_downloads() -> None:
+    job = _job({"candidate_urls": [{"url": "https://example.de/a.pdf"}]})
+    ctx = job.context
+
+    checkpoint_step(job, "discover")
+    checkpoint_downloads(job, [{"url": "https://example.de/a.pdf", "path": "/blobs/a.pdf"}])
+
+    # Steps hold on to job.context while they run; updates must land in that dict
+    assert job.context is ctx
+    assert is_step_checkpointed(job, "discover")
+    assert not is_step_checkpointed(job, "download")
+    assert len(ctx["checkpoint"]["downloads"]) == 1
+
+    checkpoint_step(job, "download")
+    assert "downloads" not in job.context["checkpoint"]
+
+    reset_step_checkpoints(job, ("discover", "download", "classify"))
+    assert job.context["checkpoint"]["completed_steps"] == []
+
+
+def test_resume_context_carries_completed_step_outputs() -> None:
+    previous = {
+        "dno_slug": "netze-bw",
+        "prior_downloads": [{"url_hash": "x"}],
+        "candidate_urls": [{"url": "https://example.de/a.pdf"}],
+        "pages_crawled": 12,
+        "crawl_pass": 2,
+        "checkpoint": {
+            "completed_steps": ["gather_context", "discover"],
+            "downloads": [{"url": "https://example.de/a.pdf"}],
+            "resumes": 1,
+        },
+    }
+
+    context = resume_context(previous)
+
+    # Step 00 output is rebuilt by the new job; pause counters start over
+    assert "dno_slug" not in context
+    assert "prior_downloads" not in context
+    assert context["candidate_urls"] == previous["candidate_urls"]
+    assert context["pages_crawled"] == 12
+    assert context["crawl_pass"] == 2
+    assert context["checkpoint"] == {
+        "completed_steps": ["discover"],
+        "downloads": [{"url": "https://example.de/a.pdf"}],
+    }
+
+
+def test_resume_context_without_progress_is_empty() -> None:
+    assert resume_context(None) == {}
+    assert resume_context({"checkpoint": {"completed_steps": ["gather_context"]}}) == {}
+
+
+async def test_deferred_job_is_failed_on_its_last_delivery(monkeypatch, fake_session) -> None:
+    async def _refresh_dno_summary(db, dno_id):
+        return None
+
+    monkeypatch.setattr(crawl_job, "refresh_dno_summary", _refresh_dno_summary)
+    log = structlog.get_logger()
+    job = _job()
+    job.status = "pending"
+
+    async def _defer(job_try: int) -> dict:
+        return await crawl_job._defer_or_fail(
+            {"job_try": job_try}, fake_session(), job, log, 30, "Gave up waiting for example.de"
+        )
+
+    with pytest.raises(Retry) as retry:
+        await _defer(crawl_job.CRAWL_MAX_TRIES - 1)
+    assert retry.value.defer_score == 30_000
+    assert job.status == "pending"
+
+    result = await _defer(crawl_job.CRAWL_MAX_TRIES)
+    assert result == {"status": "failed", "message": "Gave up waiting for example.de"}
+    assert job.status == "failed" and job.completed_at is not None
+    assert CrawlWorkerSettings.max_tries == crawl_job.CRAWL_MAX_TRIES
@@ -0,0 +1,54 @@
+"""Tests for the shared keyword matcher and the scorers built on it."""
+
+from app.services.content_verifier import ContentVerifier
+from app.services.discovery.scorer import score_url
+from app.services.extraction.page_index import index_page_texts
+from app.services.keyword_matcher import KeywordMatcher, keyword_matcher
+
+
+def test_matcher_hits_and_find() -> None:
+    matcher = KeywordMatcher(["Netz", "entgelt", "netz", "hlzf"])
+
+    assert matcher.hits("Preisblatt NETZENTGELTE") == {"netz", "entgelt"}
+    assert matcher.find("Preisblatt NETZENTGELTE") == ["Netz", "entgelt", "netz"]
+    assert matcher.find("") == []
+    assert matcher.matches_any("/downloads/HLZF-2025.pdf")
+    assert not matcher.matches_any("/karriere")
+    assert keyword_matcher(("a", "b")) is keyword_matcher(("a", "b"))
+
+
+def test_score_url_counts_url_and_anchor_hits() -> None:
+    score, keywords, has_year = score_url(
+        "https://www.example.de/downloads/Preisblatt_2025.pdf",
+        "netzentgelte",
+        2025,
+        link_text="Netzentgelte Strom",
+    )
+
+    # pdf 20, url: preisblatt + downloads 2x15, anchor: netzentgelte, entgelt, strom, netz 4x5,
+    # target year 50
+    assert score == 120
+    assert set(keywords) == {"preisblatt", "downloads", "netzentgelte", "entgelt", "strom", "netz"}
+    assert keywords[:2] == ["preisblatt", "downloads"]
+    assert has_year
+
+
+def test_verifier_detects_data_type_from_one_scan() -> None:
+    verifier = ContentVerifier()
+    text = (
+        "Hochlastzeitfenster 2025 Mittelspannung Winter 08:00 - 12:00 Uhr "
+        "Sommer entfällt Herbst 17:00 - 19:00"
+    )
+
+    result = verifier.verify_text(text, "hlzf", 2025)
+
+    assert result.detected_data_type == "hlzf"
+    assert result.is_verified
+    assert "hochlastzeitfenster" in result.keywords_found
+
+
+def test_page_index_records_hits_per_page() -> None:
+    index = index_page_texts(["Deckblatt", "Netzentgelte Leistungspreis", "Hochlast Zeitfenster"])
+
+    assert index.candidate_pages("netzentgelte") == [2]
+    assert index.candidate_pages("hlzf") == [3]
@@ -0,0 +1,63 @@
+"""Tests for the process-pool parsing engine."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.extraction.parse_pool import ParsePool, ParseTimeoutError, run_parser
+
+
+def _square(x: int) -> int:
+    return x * x
+
+
+def _sleep(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+async def test_pool_runs_tasks_and_recovers_after_timeout() -> None:
+    pool = ParsePool(max_workers=1, task_timeout=0.5, memory_limit_mb=0)
+
+    try:
+        # Generous timeout for the first task: it includes process start-up
+        assert await pool.run(_square, 7, timeout=30) == 49
+
+        with pytest.raises(ParseTimeoutError):
+            await pool.run(_sleep, 30)
+
+        # The stuck process was killed; the next task gets a fresh pool
+        assert await pool.run(_square, 3, timeout=30) == 9
+    finally:
+        pool.shutdown()
+
+
+def _fail(message: str) -> None:
+    raise ValueError(message)
+
+
+async def test_timeout_kills_only_the_stuck_task() -> None:
+    pool = ParsePool(max_workers=2, task_timeout=30, memory_limit_mb=0)
+
+    try:
+        # Start both processes first so start-up does not count against the timeout
+        await asyncio.gather(pool.run(_square, 1), pool.run(_square, 2))
+        processes = {worker.process.pid for worker in pool._idle}
+
+        stuck = pool.run(_sleep, 30, timeout=0.5)
+        neighbour = pool.run(_sleep, 1.5)
+        results = await asyncio.gather(stuck, neighbour, return_exceptions=True)
+
+        assert isinstance(results[0], ParseTimeoutError)
+        assert results[1] == 1.5
+        # Exceptions of the parser reach the caller; its process stays in use
+        with pytest.raises(ValueError, match="broken table"):
+            await pool.run(_fail, "broken table")
+        assert len({worker.process.pid for worker in pool._idle} & processes) == 1
+    finally:
+        pool.shutdown()
+
+
+async def test_run_parser_without_pool_uses_thread() -> None:
+    assert await run_parser(_square, 4) == 16
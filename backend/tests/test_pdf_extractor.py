@@ -0,0 +1,74 @@
+"""Tests for the PyMuPDF fast path and page targeting in the PDF extractor."""
+
+from pathlib import Path
+
+import fitz
+import pytest
+
+from app.core.config import settings
+from app.services.extraction import pdf_extractor, pdf_text_cache
+
+ROWS = [
+    ["Spannungsebene", "Leistungspreis", "Arbeitspreis", "Leistungspreis", "Arbeitspreis"],
+    ["Hochspannung", "10,50", "1,20", "50,10", "0,30"],
+    ["Mittelspannung", "12,30", "2,10", "60,20", "0,40"],
+    ["Niederspannung", "14,00", "3,50", "70,00", "0,50"],
+]
+
+
+@pytest.fixture
+def preisblatt(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(settings, "storage_path", str(tmp_path))
+    pdf_text_cache._memory_cache.clear()
+
+    doc = fitz.open()
+    doc.new_page().insert_text((50, 40), "Allgemeine Bedingungen")
+    page = doc.new_page()
+    page.insert_text((50, 40), "Netzentgelte 2025 Preisblatt")
+    for i, row in enumerate(ROWS):
+        for j, cell in enumerate(row):
+            rect = fitz.Rect(50 + j * 100, 60 + i * 20, 150 + j * 100, 80 + i * 20)
+            page.draw_rect(rect, color=(0, 0, 0))
+            page.insert_text((rect.x0 + 2, rect.y1 - 5), cell, fontsize=8)
+    for _ in range(3):
+        doc.new_page().insert_text((50, 40), "Anschlussnutzung und Messstellenbetrieb")
+    path = tmp_path / "preisblatt.pdf"
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_engines_agree_on_table_records(preisblatt: Path) -> None:
+    fast = pdf_extractor.extract_netzentgelte_from_pdf(preisblatt, engine="pymupdf")
+    reference = pdf_extractor.extract_netzentgelte_from_pdf(preisblatt, engine="pdfplumber")
+
+    assert len(fast) == 3
+    assert fast == reference
+
+
+def test_auto_falls_back_to_pdfplumber_when_fast_path_fails(
+    preisblatt: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engines_used: list[str] = []
+    real_extract = pdf_extractor._extract_netzentgelte
+
+    def _tracking(pdf_path, engine):
+        engines_used.append(engine)
+        return [] if engine == "pymupdf" else real_extract(pdf_path, engine)
+
+    monkeypatch.setattr(pdf_extractor, "_extract_netzentgelte", _tracking)
+    records = pdf_extractor.extract_netzentgelte_from_pdf(preisblatt)
+
+    assert engines_used == ["pymupdf", "pdfplumber"]
+    assert len(records) == 3
+
+
+def test_only_candidate_pages_are_parsed(preisblatt: Path) -> None:
+    records = pdf_extractor.extract_netzentgelte_from_pdf(preisblatt, engine="pdfplumber")
+
+    assert {r["source_page"] for r in records} == {2}
+    content_hash = pdf_text_cache.pdf_content_hash(preisblatt)
+    entry = pdf_text_cache._memory_cache[(content_hash, "pdfplumber")]
+    assert entry["page_count"] == 5
+    assert set(entry["text"]) == {"2"}
+    assert set(entry["tables"]) == {"2"}
@@ -0,0 +1,77 @@
+"""Tests for the memoized PDF page text cache."""
+
+from pathlib import Path
+
+import fitz
+import pytest
+
+from app.core.config import settings
+from app.services.content_verifier import ContentVerifier
+from app.services.extraction import pdf_text_cache
+
+
+def _make_pdf(path: Path, pages: list[str]) -> None:
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        page.insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+
+
+@pytest.fixture
+def blob_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(settings, "storage_path", str(tmp_path))
+    pdf_text_cache._memory_cache.clear()
+    return tmp_path / "blobs"
+
+
+def test_page_texts_are_persisted_and_reused(tmp_path: Path, blob_root: Path, monkeypatch) -> None:
+    pdf_path = tmp_path / "preisblatt.pdf"
+    _make_pdf(pdf_path, ["Deckblatt", "Netzentgelte Mittelspannung", "Anhang"])
+
+    first = pdf_text_cache.get_page_texts(pdf_path, max_pages=2)
+    assert len(first) == 2
+    assert "Netzentgelte" in first[1]
+
+    content_hash = pdf_text_cache.pdf_content_hash(pdf_path)
+    assert (blob_root / content_hash[:2] / f"{content_hash}.pages.json").exists()
+
+    # A fresh process (empty memory cache) reads pages from the sidecar; only
+    # the page that was never extracted opens the PDF again
+    pdf_text_cache._memory_cache.clear()
+    opened: list[int] = []
+    real_fill = pdf_text_cache._fill
+
+    def _tracking_fill(source, entry, text_pages=(), table_pages=(), persist=True):
+        opened.extend(text_pages)
+        return real_fill(source, entry, text_pages, table_pages, persist)
+
+    monkeypatch.setattr(pdf_text_cache, "_fill", _tracking_fill)
+    all_pages = pdf_text_cache.get_page_texts(pdf_path.read_bytes())
+
+    assert all_pages[:2] == first
+    assert "Anhang" in all_pages[2]
+    assert opened == [3]
+
+
+def test_stale_extractor_version_is_ignored(tmp_path: Path, blob_root: Path, monkeypatch) -> None:
+    pdf_path = tmp_path / "hlzf.pdf"
+    _make_pdf(pdf_path, ["Hochlastzeitfenster"])
+    pdf_text_cache.get_page_texts(pdf_path)
+
+    pdf_text_cache._memory_cache.clear()
+    monkeypatch.setattr(pdf_text_cache, "EXTRACTOR_VERSIONS", {"pdfplumber": "pdfplumber-0.0.0-0"})
+    content_hash = pdf_text_cache.pdf_content_hash(pdf_path)
+
+    assert pdf_text_cache._read_sidecar(content_hash, "pdfplumber") is None
+
+
+def test_sniffing_unstored_bytes_writes_no_sidecar(tmp_path: Path, blob_root: Path) -> None:
+    pdf_path = tmp_path / "upload.pdf"
+    _make_pdf(pdf_path, ["Preisblatt Netzentgelte"])
+
+    text = ContentVerifier._try_pdfplumber(pdf_path.read_bytes())
+
+    assert text is not None and "Netzentgelte" in text
+    assert not list(blob_root.rglob("*.json"))
@@ -0,0 +1,55 @@
+"""Tests for the Redis-backed public search response cache."""
+
+import uuid
+
+import pytest
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.services.search_cache import SearchCache
+
+
+def test_response_key_normalizes_year_filter() -> None:
+    assert SearchCache.response_key("addr", "abc", [2025, 2024, 2025]) == (
+        "search:resp:addr:abc:2024,2025"
+    )
+    assert SearchCache.response_key("vnb", "7654", None) == "search:resp:vnb:7654:all"
+
+
+async def test_redis_errors_fail_open() -> None:
+    redis = Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.2)
+    cache = SearchCache(redis, ttl_seconds=60)
+    try:
+        assert await cache.get("search:resp:addr:abc:all") is None
+        assert await cache.generation(1) is None
+        assert await cache.set("search:resp:addr:abc:all", 1, "{}", "0") is False
+        assert await cache.invalidate_dno(1) == 0
+    finally:
+        await redis.aclose()
+
+
+async def test_invalidation_drops_responses_and_blocks_stale_writes() -> None:
+    redis = Redis.from_url(str(settings.redis_url), socket_connect_timeout=0.5)
+    try:
+        await redis.ping()
+    except Exception as e:
+        await redis.aclose()
+        pytest.skip(f"Redis not available: {e}")
+
+    cache = SearchCache(redis, ttl_seconds=60)
+    dno_id = -uuid.uuid4().int % 10**9  # Negative id never used by real DNOs
+    key = SearchCache.response_key("addr", uuid.uuid4().hex, None)
+    try:
+        generation = await cache.generation(dno_id)
+        assert await cache.set(key, dno_id, '{"found": true}', generation)
+        assert await cache.get(key) == '{"found": true}'
+
+        # A response built before this invalidation must not be stored
+        assert await cache.invalidate_dno(dno_id) == 1
+        assert await cache.get(key) is None
+        assert not await cache.set(key, dno_id, '{"found": true}', generation)
+        assert await cache.get(key) is None
+    finally:
+        await cache.invalidate_dno(dno_id)
+        await redis.delete(*SearchCache._dno_keys(dno_id))
+        await redis.aclose()
@@ -0,0 +1,103 @@
+"""Tests for the set-based DNO seeder."""
+
+from types import SimpleNamespace
+
+from app.db.seeder import SeedSnapshot, apply_seed_plan, plan_seed
+
+
+def _record(mastr_nr: str, slug: str, **values) -> dict:
+    record = {"mastr_nr": mastr_nr, "slug": slug, "name": slug.title()}
+    record.update(values)
+    return record
+
+
+def _existing(dno_id: int, mastr_nr: str, **values) -> SimpleNamespace:
+    row = {
+        "id": dno_id,
+        "mastr_nr": mastr_nr,
+        "status": "crawled",
+        "crawlable": False,
+        "connection_points_count": 500,
+        "total_capacity_mw": None,
+        "customer_count": None,
+        "service_area_km2": None,
+        "has_customers": True,
+    }
+    row.update(values)
+    return SimpleNamespace(**row)
+
+
+def test_plan_counts_inserts_updates_and_conflicts() -> None:
+    snapshot = SeedSnapshot(
+        dnos={"SNB1": _existing(1, "SNB1")},
+        ids={"SNB1": 1, "#2": 2},
+        slug_owners={"netz-a": "SNB1", "netz-b": "#2"},
+        vnb_owners={"vnb-b": "#2"},
+    )
+    records = [
+        _record("SNB1", "netz-a"),
+        _record("SNB2", "netz-new"),
+        _record("SNB3", "netz-b"),  # slug of another DNO
+        _record("SNB4", "netz-d", vnb_id="vnb-b"),  # VNB id of another DNO
+        _record("SNB5", "Bad Slug"),
+        _record(None, "netz-x"),
+    ]
+
+    plan = plan_seed(records, snapshot)
+
+    assert (plan.inserted, plan.updated, plan.skipped) == (1, 1, 4)
+    assert [row["owner"] for row in plan.dnos] == ["SNB1", "SNB2"]
+
+
+def test_plan_keeps_existing_values_without_record_values() -> None:
+    snapshot = SeedSnapshot(dnos={"SNB1": _existing(1, "SNB1")}, ids={"SNB1": 1})
+
+    (existing,) = plan_seed([_record("SNB1", "netz-a")], snapshot).dnos
+    (new,) = plan_seed([_record("SNB2", "netz-b", status="protected")], snapshot).dnos
+
+    assert existing["status"] == "crawled"
+    assert existing["crawlable"] is False
+    assert existing["connection_points_count"] == 500
+    assert existing["importance_score"] > 0
+    assert existing["enrichment_status"] == "pending"
+    assert new["status"] == "protected"
+    assert new["crawlable"] is True
+
+
+def test_plan_assigns_shared_bdew_code_to_first_dno() -> None:
+    records = [
+        _record("SNB1", "netz-a", bdew_code=9900001000001.0, bdew_market_function="Netzbetreiber"),
+        _record("SNB2", "netz-b", bdew_code=9900001000001.0, bdew_market_function="Netzbetreiber"),
+        _record("SNB1", "netz-a", bdew_code=9900002000002.0, bdew_market_function="Netzbetreiber"),
+    ]
+
+    plan = plan_seed(records, SeedSnapshot())
+
+    # The repeated SNB1 record replaces the first one
+    assert plan.skipped == 1
+    assert set(plan.bdew) == {"9900001000001", "9900002000002"}
+    assert plan.bdew["9900001000001"]["owner"] == "SNB2"
+    assert plan.bdew["9900001000001"]["company_name"] == "Netz-B"
+    assert plan.dnos[0]["primary_bdew_code"] == "9900002000002"
+
+
+async def test_apply_writes_one_upsert_per_table(fake_session) -> None:
+    db = fake_session([(7, "SNB1")])
+    record = _record(
+        "SNB1",
+        "netz-a",
+        vnb_id="vnb-a",
+        stats={"connection_points": {"total": 10}, "networks": {"has_customers": True}},
+    )
+    plan = plan_seed([record], SeedSnapshot())
+
+    dno_ids = await apply_seed_plan(db, plan, SeedSnapshot())
+
+    assert dno_ids == [7]
+    dnos, mastr, vnb = db.sql
+    assert "ON CONFLICT (mastr_nr) DO UPDATE" in dnos
+    assert "website = coalesce(excluded.website, dnos.website)" in dnos
+    assert "source = " not in dnos
+    assert "ON CONFLICT (dno_id) DO UPDATE" in mastr
+    assert "connection_points_total = excluded.connection_points_total" in mastr
+    assert "INSERT INTO dno_vnb_data" in vnb
@@ -0,0 +1,91 @@
+"""Tests for request coalescing of concurrent VNB lookups."""
+
+import asyncio
+import uuid
+
+import pytest
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.services.single_flight import SingleFlight
+
+
+def _unreachable_redis() -> Redis:
+    return Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.2)
+
+
+async def test_concurrent_calls_in_one_worker_share_the_leader_result() -> None:
+    redis = _unreachable_redis()
+    flight = SingleFlight(redis)
+    calls = 0
+
+    async def _lookup() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return '{"found": true}'
+
+    try:
+        results = await asyncio.gather(*(flight.do("addr:abc", _lookup) for _ in range(5)))
+    finally:
+        await redis.aclose()
+
+    assert calls == 1
+    assert {payload for payload, _ in results} == {'{"found": true}'}
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+
+
+async def test_waiter_takes_over_when_leader_fails() -> None:
+    redis = _unreachable_redis()
+    flight = SingleFlight(redis)
+    calls = 0
+
+    async def _lookup() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        if calls == 1:
+            raise RuntimeError("upstream error")
+        return "ok"
+
+    try:
+        first, second = await asyncio.gather(
+            flight.do("coord:1,2", _lookup),
+            flight.do("coord:1,2", _lookup),
+            return_exceptions=True,
+        )
+    finally:
+        await redis.aclose()
+
+    assert isinstance(first, RuntimeError)
+    assert second == ("ok", False)
+    assert calls == 2
+
+
+async def test_workers_coordinate_through_redis() -> None:
+    redis = Redis.from_url(str(settings.redis_url), socket_connect_timeout=0.5)
+    try:
+        await redis.ping()
+    except Exception as e:
+        await redis.aclose()
+        pytest.skip(f"Redis not available: {e}")
+
+    # Two instances behave like two API workers
+    workers = [SingleFlight(redis, poll_interval=0.01) for _ in range(2)]
+    key = f"addr:{uuid.uuid4().hex}"
+    calls = 0
+
+    async def _lookup() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return "result"
+
+    try:
+        results = await asyncio.gather(*(w.do(key, _lookup) for w in workers))
+    finally:
+        await redis.delete(f"{SingleFlight.RESULT_KEY_PREFIX}{key}")
+        await redis.aclose()
+
+    assert calls == 1
+    assert [payload for payload, _ in results] == ["result", "result"]
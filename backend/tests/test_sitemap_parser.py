@@ -0,0 +1,105 @@
+"""Tests for the streaming sitemap parser and reader."""
+
+import gzip
+
+import httpx
+
+from app.services.discovery.sitemap import SitemapReader, SitemapStreamParser, parse_sitemap
+from app.services.http_cache import HttpCache
+
+INDEX = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="https://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://www.example.de/de/sitemap.xml.gz</loc><lastmod>2024-01-01</lastmod></sitemap>
+  <sitemap><loc>https://www.example.de/fr/sitemap.xml</loc></sitemap>
+</sitemapindex>"""
+
+URLSET = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+  <url><loc>https://www.example.de/netzentgelte</loc>
+    <image:image><image:loc>https://www.example.de/logo.png</image:loc></image:image>
+  </url>
+  <url><loc>https://www.example.de/karriere</loc></url>
+  <url><loc>https://www.example.de/preisblatt-2025.pdf</loc></url>
+</urlset>"""
+
+
+def _feed_bytewise(parser: SitemapStreamParser, body: bytes) -> list[str]:
+    entries = []
+    for i in range(len(body)):
+        entries.extend(parser.feed(body[i : i + 1]))
+    return [entry.loc for entry in entries + parser.close()]
+
+
+def test_namespaces_and_gzip_parse_alike() -> None:
+    plain = parse_sitemap(URLSET)
+    bare = parse_sitemap(
+        URLSET.decode().replace(' xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"', "")
+    )
+    zipped = _feed_bytewise(SitemapStreamParser(), gzip.compress(URLSET))
+
+    assert plain == (
+        [
+            "https://www.example.de/netzentgelte",
+            "https://www.example.de/karriere",
+            "https://www.example.de/preisblatt-2025.pdf",
+        ],
+        [],
+    )
+    assert bare == plain
+    assert zipped == plain[0]
+    assert parse_sitemap(INDEX)[1][0] == "https://www.example.de/de/sitemap.xml.gz"
+
+
+def test_malformed_xml_falls_back_to_loc_scan() -> None:
+    body = b"<urlset><url><loc>https://a.de/x</loc></url><url><loc>https://a.de/y</loc>&bogus;"
+
+    assert _feed_bytewise(SitemapStreamParser(), body) == ["https://a.de/x", "https://a.de/y"]
+
+
+async def test_reader_follows_index_with_filter_and_cache(tmp_path) -> None:
+    requests: list[tuple[str, str | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.url.path, request.headers.get("if-none-match")))
+        if request.url.path == "/sitemap_index.xml":
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, headers={"etag": '"v1"'}, content=INDEX)
+        if request.url.path == "/de/sitemap.xml.gz":
+            return httpx.Response(
+                200,
+                headers={"last-modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+                content=gzip.compress(URLSET),
+            )
+        return httpx.Response(404)
+
+    async def _collect() -> tuple[list[str] | None, int]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            reader = SitemapReader(
+                client,
+                http_cache=HttpCache(tmp_path),
+                url_filter=lambda url: "netz" in url or url.endswith(".pdf"),
+            )
+            document = await reader.read("https://www.example.de/sitemap_index.xml")
+            return await reader.follow([document]), reader.urls_seen
+
+    first, seen = await _collect()
+    second, _ = await _collect()
+
+    assert (
+        first
+        == second
+        == [
+            "https://www.example.de/netzentgelte",
+            "https://www.example.de/preisblatt-2025.pdf",
+        ]
+    )
+    assert seen == 3
+    # /fr/ is filtered out; on the second run the index answers 304 and the
+    # nested sitemap is skipped because its <lastmod> predates the cached copy
+    assert requests == [
+        ("/sitemap_index.xml", None),
+        ("/de/sitemap.xml.gz", None),
+        ("/sitemap_index.xml", '"v1"'),
+    ]
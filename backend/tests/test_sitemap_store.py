@@ -0,0 +1,50 @@
+"""Tests for the sitemap URL store and its candidate prefilter."""
+
+from app.services.discovery.base import FileType
+from app.services.discovery.scorer import detect_file_type, score_url
+from app.services.discovery.sitemap import discover_via_sitemap
+from app.services.sitemap_store import candidate_patterns, select_sitemap_candidates
+
+URLS = [
+    "https://www.example.de/",
+    "https://www.example.de/ueber-uns/team",
+    "https://www.example.de/netzentgelte",
+    "https://www.example.de/Downloads/Preisblatt_2025.PDF",
+    "https://www.example.de/presse/2025/jubilaeum",
+    "https://www.example.de/fileadmin/tabelle.xlsx",
+    "https://www.example.de/hochlastzeitfenster",
+    "https://www.example.de/karriere/stellen.docx",
+]
+
+
+def test_prefilter_keeps_every_url_discovery_would_keep() -> None:
+    patterns = candidate_patterns("all", 2025)
+
+    for url in URLS:
+        score, _, _ = score_url(url, "all", 2025)
+        kept = score > 0 or detect_file_type(url) != FileType.UNKNOWN
+        if kept:
+            assert any(pattern in url.lower() for pattern in patterns), url
+
+    assert not any(pattern in URLS[1].lower() for pattern in patterns)
+    assert "netz" in patterns
+    assert "netzentgelte" not in patterns
+
+
+async def test_candidate_query_is_one_ilike_filter(fake_session) -> None:
+    db = fake_session(["u"])
+
+    assert await select_sitemap_candidates(db, 7, "all", 2025) == ["u"]
+    (statement,) = db.sql
+    assert "dno_sitemap_urls.dno_id = %(dno_id_1)s" in statement
+    assert statement.count("ILIKE") == len(candidate_patterns("all", 2025))
+
+
+async def test_empty_candidate_list_is_a_cache_hit() -> None:
+    # client=None: fetching the sitemap again would fail
+    result = await discover_via_sitemap(
+        None, "https://www.example.de", "all", 2025, sitemap_urls=[]
+    )
+
+    assert result.documents == []
+    assert result.errors == []
@@ -0,0 +1,139 @@
+"""Tests for the cached, shared VNB Digital client."""
+
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import Request
+from redis.asyncio import Redis
+
+from app.api.main import app
+from app.services.domain_throttle import HostThrottledError
+from app.services.vnb import client as client_module
+from app.services.vnb.cache import VNBCache, coordinate_cache_key
+from app.services.vnb.client import (
+    VNBDigitalClient,
+    VNBQuotaExceededError,
+    get_vnb_client,
+    init_vnb_client,
+)
+
+
+class _MemoryCache(VNBCache):
+    def __init__(self) -> None:
+        self.entries: dict[tuple[str, str], Any] = {}
+
+    async def get(self, kind: str, lookup: str) -> Any | None:
+        return self.entries.get((kind, lookup))
+
+    async def set(self, kind: str, lookup: str, value: Any) -> None:
+        self.entries[(kind, lookup)] = value
+
+
+def _client(handler, cache: VNBCache | None = None) -> tuple[VNBDigitalClient, list[str]]:
+    quota_checks: list[str] = []
+
+    async def _quota() -> None:
+        quota_checks.append("vnb")
+
+    client = VNBDigitalClient(cache=cache, before_request=_quota)
+    client.request_delay = 0.0
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, quota_checks
+
+
+def test_coordinate_cache_key_groups_nearby_points() -> None:
+    assert coordinate_cache_key("50.937512,6.960312") == coordinate_cache_key("50.93749,6.96029")
+    assert coordinate_cache_key("50.9375,6.9603") != coordinate_cache_key("50.9385,6.9603")
+
+
+async def test_cached_lookups_skip_upstream_and_quota() -> None:
+    calls = 0
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        vnbs = [{"_id": "42", "name": "Netz GmbH", "types": ["STROM"], "voltageTypes": []}]
+        return httpx.Response(200, json={"data": {"vnb_coordinates": {"vnbs": vnbs}}})
+
+    client, quota_checks = _client(_handler, cache=_MemoryCache())
+    try:
+        first = await client.lookup_by_coordinates("50.937512,6.960312")
+        second = await client.lookup_by_coordinates("50.93749,6.96029")
+    finally:
+        await client.close()
+
+    assert first == second
+    assert first[0].vnb_id == "42" and first[0].is_electricity
+    assert calls == 1
+    assert quota_checks == ["vnb"]
+
+
+async def test_failed_lookups_are_not_cached() -> None:
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(502)
+
+    cache = _MemoryCache()
+    client, quota_checks = _client(_handler, cache=cache)
+    try:
+        assert await client.get_vnb_details("42") is None
+        assert await client.get_vnb_details("42") is None
+    finally:
+        await client.close()
+
+    assert cache.entries == {}
+    assert len(quota_checks) == 2
+
+
+async def test_throttle_refusal_raises_without_upstream_call() -> None:
+    calls = 0
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={})
+
+    class _BusyThrottle:
+        async def acquire(self, host: str, fail_fast: bool = False) -> float:
+            assert fail_fast
+            raise HostThrottledError(host, 2.2)
+
+    client, _ = _client(_handler)
+    client.throttle = _BusyThrottle()
+    try:
+        with pytest.raises(VNBQuotaExceededError) as busy:
+            await client.search_address("Musterstr. 1, 50667 Köln")
+    finally:
+        await client.close()
+
+    assert busy.value.retry_after == 2.2
+    assert calls == 0
+
+
+async def test_refused_lookup_is_a_503_with_retry_after() -> None:
+    handler = app.exception_handlers[VNBQuotaExceededError]
+    request = Request({"type": "http", "method": "POST", "path": "/api/v1/search/", "headers": []})
+
+    response = await handler(request, VNBQuotaExceededError(2.2))
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+
+
+def test_only_public_client_checks_the_quota(monkeypatch) -> None:
+    async def _quota() -> None:
+        return None
+
+    monkeypatch.setattr(client_module, "_shared_client", None)
+    monkeypatch.setattr(client_module, "_internal_client", None)
+    # Without Redis set up both fall back to the default client
+    assert get_vnb_client() is client_module.vnb_client
+    assert get_vnb_client(public_quota=False) is client_module.vnb_client
+
+    public = init_vnb_client(Redis(host="127.0.0.1", port=1), before_request=_quota)
+    internal = get_vnb_client(public_quota=False)
+
+    assert get_vnb_client() is public
+    assert public.before_request is _quota
+    assert internal is not public and internal.before_request is None
+    assert internal.cache is public.cache and internal.throttle is public.throttle
@@ -0,0 +1,82 @@
+"""Tests for the WebCrawler concurrent frontier."""
+
+import asyncio
+
+import httpx
+
+from app.services.web_crawler import CrawlResult, WebCrawler
+
+
+def _make_crawler(concurrency: int) -> WebCrawler:
+    crawler = WebCrawler(
+        client=httpx.AsyncClient(),
+        user_agent="test",
+        max_depth=3,
+        max_pages=12,
+        concurrency=concurrency,
+    )
+
+    async def allow_all(url: str) -> bool:
+        return True
+
+    crawler.robots.can_fetch = allow_all
+    crawler._politeness_delay = lambda: 0.01
+    return crawler
+
+
+class _FetchStats:
+    """Peak number of fetches in flight, per host and across hosts."""
+
+    def __init__(self) -> None:
+        self.in_flight: dict[str, int] = {}
+        self.peak_by_host: dict[str, int] = {}
+        self.peak_hosts = 0
+
+    def enter(self, host: str) -> None:
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.peak_by_host[host] = max(self.peak_by_host.get(host, 0), self.in_flight[host])
+        self.peak_hosts = max(self.peak_hosts, sum(1 for n in self.in_flight.values() if n))
+
+    def leave(self, host: str) -> None:
+        self.in_flight[host] -= 1
+
+
+def _install_fake_site(crawler: WebCrawler) -> _FetchStats:
+    hosts = ["https://www.example.de", "https://example.de", "https://cdn.example.de"]
+    stats = _FetchStats()
+
+    async def fake_fetch(url, depth, target_keywords, data_type, allowed_domains, target_year):
+        host = httpx.URL(url).host
+        stats.enter(host)
+        await asyncio.sleep(0.05)
+        stats.leave(host)
+        links = [(f"{h}/page-{depth}-{i}", "netzentgelte") for h in hosts for i in range(3)]
+        result = CrawlResult(url=url, final_url=url, content_type="text/html", depth=depth, score=0)
+        return result, links
+
+    crawler._fetch_and_analyze = fake_fetch
+    return stats
+
+
+async def test_frontier_respects_max_pages_and_one_fetch_per_host() -> None:
+    crawler = _make_crawler(concurrency=3)
+    stats = _install_fake_site(crawler)
+
+    results = await crawler.crawl("https://www.example.de/", target_keywords=["netzentgelte"])
+
+    assert len(results) == 12
+    # Asserted after the crawl: errors inside fetches are swallowed by the frontier
+    assert stats.peak_by_host == {"www.example.de": 1, "example.de": 1, "cdn.example.de": 1}
+
+
+async def test_frontier_fetches_distinct_hosts_concurrently() -> None:
+    sequential = _make_crawler(concurrency=1)
+    sequential_stats = _install_fake_site(sequential)
+    await sequential.crawl("https://www.example.de/", target_keywords=["netzentgelte"])
+
+    frontier = _make_crawler(concurrency=3)
+    frontier_stats = _install_fake_site(frontier)
+    await frontier.crawl("https://www.example.de/", target_keywords=["netzentgelte"])
+
+    assert sequential_stats.peak_hosts == 1
+    assert frontier_stats.peak_hosts >= 2
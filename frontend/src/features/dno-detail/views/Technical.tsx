@@ -57,7 +57,7 @@
  * - robots_txt: Raw robots.txt content
  * - robots_fetched_at: Timestamp (TTL: 150 days)
  * - sitemap_urls: Sitemap URLs from robots.txt
- * - sitemap_parsed_urls: All URLs extracted from sitemaps
+ * - sitemap_url_count: Number of URLs extracted from sitemaps (dno_sitemap_urls)
  * - sitemap_fetched_at: Timestamp (TTL: 120 days)
  * - disallow_paths: Blocked paths
  * - crawlable: Boolean
@@ -89,7 +89,7 @@
  * API ENDPOINTS NEEDED
  * ============================================================================
  * The existing GET /api/dnos/{id} should already return:
- * - sitemap_parsed_urls (array of strings)
+ * - sitemap_url_count (number; the URLs themselves need a paginated endpoint)
  * - robots_txt (string)
  * - disallow_paths (array of strings)
  * - sitemap_fetched_at (ISO timestamp)
@@ -129,7 +129,7 @@ export function Technical() {
             <div className="rounded-lg border bg-card p-8 text-center text-muted-foreground">
                 <p className="text-lg font-medium mb-2">Technical View</p>
                 <p className="text-sm">
-                    This page will display sitemap URLs ({dno.sitemap_parsed_urls?.length || 0} URLs),
+                    This page will display sitemap URLs ({dno.sitemap_url_count || 0} URLs),
                     robots.txt data, and crawl metadata.
                 </p>
                 <p className="text-sm mt-2">
@@ -172,7 +172,7 @@ export const api = {
       per_page?: number;
       q?: string;
       status?: 'uncrawled' | 'crawled' | 'running' | 'pending' | 'protected';
-      sort_by?: 'name_asc' | 'name_desc' | 'importance_asc' | 'importance_desc' | 'score_asc' | 'score_desc' | 'region_asc';
+      sort_by?: 'name_asc' | 'name_desc' | 'importance_asc' | 'importance_desc' | 'score_asc' | 'score_desc' | 'data_score_asc' | 'data_score_desc' | 'region_asc';
     }): Promise<ApiResponse<DNO[]>> {
       const { data } = await apiClient.get("/dnos/", {
         params: {
@@ -452,7 +452,12 @@ export const api = {
       return data;
     },
 
-    async getImportanceDistribution(): Promise<
+    async getImportanceDistribution(params?: {
+      quantile?: number;
+      area_km2_p90?: number;
+      connection_points_p90?: number;
+      customer_count_p90?: number;
+    }): Promise<
       ApiResponse<{
         total: number;
         scored: number;
@@ -472,9 +477,29 @@ export const api = {
           fallback_customers: number;
           fallback_area: number;
         };
+        what_if?: {
+          calibration: {
+            area_km2_p90: number;
+            connection_points_p90: number;
+            customer_count_p90: number;
+          };
+          p50: number;
+          p90: number;
+          histogram: { range: string; count: number }[];
+          top: {
+            id: number;
+            slug: string;
+            name: string;
+            importance_score: number;
+            importance_confidence: number | null;
+            connection_points_count: number | null;
+          }[];
+          changed: number;
+          mean_delta: number;
+        };
       }>
     > {
-      const { data } = await apiClient.get("/admin/importance/distribution");
+      const { data } = await apiClient.get("/admin/importance/distribution", { params });
       return data;
     },
 
@@ -78,7 +78,7 @@ export function AdminPage() {
 
   const { data: importanceResponse, isLoading: importanceLoading } = useQuery({
     queryKey: adminKeys.importance.distribution,
-    queryFn: api.admin.getImportanceDistribution,
+    queryFn: () => api.admin.getImportanceDistribution(),
     enabled: isAdmin(),
   });
 
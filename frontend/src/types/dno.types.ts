@@ -157,7 +157,7 @@ export interface DNO {
     robots_txt?: string;
     robots_fetched_at?: string;  // TTL: 150 days
     sitemap_urls?: string[];  // Sitemap URLs from robots.txt
-    sitemap_parsed_urls?: string[];  // All URLs extracted from sitemaps
+    sitemap_url_count?: number;  // URLs extracted from sitemaps (stored in dno_sitemap_urls)
     sitemap_fetched_at?: string;  // TTL: 120 days
     disallow_paths?: string[];
     // Technical Stack
@@ -6,6 +6,7 @@ from decimal import Decimal
 from typing import Any
 
 from .models import (
+    CAPACITY_FIELDS,
     CapacityStats,
     DNORecord,
     DNOStats,
@@ -14,6 +15,7 @@ from .models import (
     EnergyUnitRecord,
     ExportMetadata,
     NetworkRecord,
+    UNIT_COUNT_FIELDS,
     UnitCounts,
     VoltageDistribution,
     VOLTAGE_LEVEL_CATALOG,
@@ -99,6 +101,55 @@ def aggregate_networks(
     return result
 
 
+def add_unit_capacity(stats: CapacityStats, unit: EnergyUnitRecord) -> None:
+    """Add one unit's gross capacity to its energy source category."""
+    # Get capacity in MW (convert from kW)
+    capacity_kw = unit.gross_capacity_kw or Decimal("0")
+    capacity_mw = capacity_kw / Decimal("1000")
+    
+    # Map energy source to category
+    source_cat = ENERGY_SOURCE_CATALOG.get(unit.energy_source or "", "other")
+    
+    if source_cat == "solar":
+        stats.solar_mw += capacity_mw
+    elif source_cat == "wind":
+        stats.wind_mw += capacity_mw
+    elif source_cat == "storage":
+        stats.storage_mw += capacity_mw
+    elif source_cat == "biomass":
+        stats.biomass_mw += capacity_mw
+    elif source_cat == "hydro":
+        stats.hydro_mw += capacity_mw
+    else:
+        stats.other_mw += capacity_mw
+
+
+def add_unit_count(counts: UnitCounts, unit: EnergyUnitRecord) -> None:
+    """Count one unit by its type."""
+    if unit.unit_type == "solar":
+        counts.solar += 1
+    elif unit.unit_type == "wind":
+        counts.wind += 1
+    elif unit.unit_type == "storage":
+        counts.storage += 1
+    elif unit.unit_type == "biomass":
+        counts.biomass += 1
+    elif unit.unit_type == "hydro":
+        counts.hydro += 1
+
+
+def merge_capacity(target: CapacityStats, other: CapacityStats) -> None:
+    """Add the capacities of other to target in-place."""
+    for name in CAPACITY_FIELDS:
+        setattr(target, name, getattr(target, name) + getattr(other, name))
+
+
+def merge_unit_counts(target: UnitCounts, other: UnitCounts) -> None:
+    """Add the unit counts of other to target in-place."""
+    for name in UNIT_COUNT_FIELDS:
+        setattr(target, name, getattr(target, name) + getattr(other, name))
+
+
 def aggregate_capacity(
     dno_units: dict[str, list[EnergyUnitRecord]],
 ) -> dict[str, CapacityStats]:
@@ -111,28 +162,8 @@ def aggregate_capacity(
     
     for dno_nr, units in dno_units.items():
         stats = CapacityStats()
-        
         for unit in units:
-            # Get capacity in MW (convert from kW)
-            capacity_kw = unit.gross_capacity_kw or Decimal("0")
-            capacity_mw = capacity_kw / Decimal("1000")
-            
-            # Map energy source to category
-            source_cat = ENERGY_SOURCE_CATALOG.get(unit.energy_source or "", "other")
-            
-            if source_cat == "solar":
-                stats.solar_mw += capacity_mw
-            elif source_cat == "wind":
-                stats.wind_mw += capacity_mw
-            elif source_cat == "storage":
-                stats.storage_mw += capacity_mw
-            elif source_cat == "biomass":
-                stats.biomass_mw += capacity_mw
-            elif source_cat == "hydro":
-                stats.hydro_mw += capacity_mw
-            else:
-                stats.other_mw += capacity_mw
-        
+            add_unit_capacity(stats, unit)
         result[dno_nr] = stats
     
     return result
@@ -150,19 +181,8 @@ def aggregate_unit_counts(
     
     for dno_nr, units in dno_units.items():
         counts = UnitCounts()
-        
         for unit in units:
-            if unit.unit_type == "solar":
-                counts.solar += 1
-            elif unit.unit_type == "wind":
-                counts.wind += 1
-            elif unit.unit_type == "storage":
-                counts.storage += 1
-            elif unit.unit_type == "biomass":
-                counts.biomass += 1
-            elif unit.unit_type == "hydro":
-                counts.hydro += 1
-        
+            add_unit_count(counts, unit)
         result[dno_nr] = counts
     
     return result
@@ -173,11 +193,17 @@ def aggregate_dno_stats(
     connection_points: dict[str, ConnectionPointRecord],
     dno_to_cps: dict[str, list[str]],
     networks: dict[str, NetworkRecord],
-    dno_units: dict[str, list[EnergyUnitRecord]],
+    dno_units: dict[str, list[EnergyUnitRecord]] | None = None,
+    capacity_stats: dict[str, CapacityStats] | None = None,
+    unit_counts: dict[str, UnitCounts] | None = None,
 ) -> tuple[dict[str, DNOStats], ExportMetadata]:
     """
     Perform all aggregations and create final DNOStats objects.
     
+    Capacity and unit counts come either from parsed unit records
+    (dno_units) or pre-aggregated per DNO (capacity_stats/unit_counts, as
+    produced by mastr.pipeline).
+    
     Returns:
         - Dict mapping DNO MaStR number to DNOStats
         - ExportMetadata with processing statistics
@@ -185,8 +211,10 @@ def aggregate_dno_stats(
     # Run aggregations
     cp_stats = aggregate_connection_points(dno_to_cps, connection_points, dnos)
     network_stats = aggregate_networks(networks, dnos)
-    capacity_stats = aggregate_capacity(dno_units)
-    unit_counts = aggregate_unit_counts(dno_units)
+    if capacity_stats is None:
+        capacity_stats = aggregate_capacity(dno_units or {})
+    if unit_counts is None:
+        unit_counts = aggregate_unit_counts(dno_units or {})
     
     # Build final stats objects
     result: dict[str, DNOStats] = {}
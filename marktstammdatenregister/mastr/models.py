@@ -138,6 +138,10 @@ class UnitCounts:
     hydro: int = 0
 
 
+CAPACITY_FIELDS = ("solar_mw", "wind_mw", "storage_mw", "biomass_mw", "hydro_mw", "other_mw")
+UNIT_COUNT_FIELDS = ("solar", "wind", "storage", "biomass", "hydro")
+
+
 @dataclass
 class DNOStats:
     """Pre-computed statistics for a single DNO."""
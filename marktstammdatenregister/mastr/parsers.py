@@ -13,6 +13,11 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Iterator
 
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml is optional, ElementTree works (slower)
+    etree = None
+
 from .models import (
     ACTIVE_STATUS_IDS,
     DNO_ROLES,
@@ -29,8 +34,19 @@ def fast_iterparse(file_path: str, tag: str) -> Iterator[ET.Element]:
     Memory-efficient XML parsing using iterparse.
     
     Yields elements matching the tag and clears memory after processing.
+    With lxml, the parser itself filters by tag, so only matching elements
+    are handed to Python; the standard library parser is the fallback.
     """
     try:
+        if etree is not None:
+            context = etree.iterparse(file_path, events=("end",), tag=tag, huge_tree=True)
+            for _, elem in context:
+                yield elem
+                # Drop the element and already processed siblings
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            return
         context = ET.iterparse(file_path, events=("start", "end"))
         _, root = next(context)
         for event, elem in context:
@@ -271,6 +287,76 @@ def build_location_to_dno_map(
 # Energy Unit Parsers
 # =============================================================================
 
+# Unit file patterns, their unit types and record tags
+UNIT_FILE_CONFIGS: list[tuple[str, str, str]] = [
+    ("EinheitenSolar_*.xml", "solar", "EinheitSolar"),
+    ("EinheitenWind.xml", "wind", "EinheitWind"),
+    ("EinheitenStromSpeicher_*.xml", "storage", "EinheitStromSpeicher"),
+    ("EinheitenBiomasse.xml", "biomass", "EinheitBiomasse"),
+    ("EinheitenWasser.xml", "hydro", "EinheitWasser"),
+]
+
+
+def find_unit_files(data_dir: str) -> list[tuple[str, str, str]]:
+    """
+    List all energy unit files in the data directory.
+    
+    Returns list of (file_path, unit_type, tag) tuples.
+    """
+    return [
+        (file_path, unit_type, tag)
+        for pattern, unit_type, tag in UNIT_FILE_CONFIGS
+        for file_path in sorted(glob.glob(os.path.join(data_dir, pattern)))
+    ]
+
+
+def iter_energy_units(
+    file_path: str,
+    unit_type: str,
+    tag: str,
+    loc_to_dno: dict[str, str],
+    stats: dict[str, int],
+    include_inactive: bool = False,
+) -> Iterator[tuple[str, EnergyUnitRecord]]:
+    """
+    Stream the units of one energy unit file that resolve to a DNO.
+    
+    Yields (DNO MaStR number, EnergyUnitRecord) pairs; skipped units are
+    counted in stats.
+    """
+    for elem in fast_iterparse(file_path, tag):
+        # Check operational status
+        status = elem.findtext("EinheitBetriebsstatus")
+        if not include_inactive and status not in ACTIVE_STATUS_IDS:
+            stats["skipped_inactive"] += 1
+            continue
+        
+        # Get location and resolve to DNO
+        loc_nr = elem.findtext("LokationMaStRNummer")
+        dno_nr = loc_to_dno.get(loc_nr) if loc_nr else None
+        
+        if not dno_nr:
+            stats["no_dno"] += 1
+            continue
+        
+        # Extract unit data
+        unit = EnergyUnitRecord(
+            mastr_nr=elem.findtext("EinheitMastrNummer") or "",
+            location_mastr_nr=loc_nr,
+            energy_source=elem.findtext("Energietraeger"),
+            gross_capacity_kw=safe_decimal(elem.findtext("Bruttoleistung")),
+            net_capacity_kw=safe_decimal(elem.findtext("Nettonennleistung")),
+            operational_status=status,
+            bundesland=elem.findtext("Bundesland"),
+            plz=elem.findtext("Postleitzahl"),
+            city=elem.findtext("Ort"),
+            inbetriebnahme_date=safe_date(elem.findtext("Inbetriebnahmedatum")),
+            unit_type=unit_type,
+        )
+        stats[unit_type] += 1
+        yield dno_nr, unit
+
+
 def parse_energy_units(
     data_dir: str,
     loc_to_dno: dict[str, str],
@@ -280,6 +366,8 @@ def parse_energy_units(
     Parse all energy unit files and aggregate by DNO.
     
     Returns dict mapping DNO MaStR number to list of EnergyUnitRecords.
+    Serial and holds every unit in memory; transform_mastr.py uses the
+    parallel, aggregating pipeline in mastr.pipeline instead.
     
     Args:
         data_dir: Path to MaStR data directory
@@ -289,67 +377,12 @@ def parse_energy_units(
     dno_units: dict[str, list[EnergyUnitRecord]] = defaultdict(list)
     stats = defaultdict(int)
     
-    # Define unit file patterns and their types
-    unit_configs = [
-        ("EinheitenSolar_*.xml", "solar"),
-        ("EinheitenWind.xml", "wind"),
-        ("EinheitenStromSpeicher_*.xml", "storage"),
-        ("EinheitenBiomasse.xml", "biomass"),
-        ("EinheitenWasser.xml", "hydro"),
-    ]
-    
-    for pattern, unit_type in unit_configs:
-        files = sorted(glob.glob(os.path.join(data_dir, pattern)))
-        
-        for file_path in files:
-            print(f"  Parsing {os.path.basename(file_path)}...")
-            
-            # Determine tag name based on unit type
-            if unit_type == "solar":
-                tag = "EinheitSolar"
-            elif unit_type == "wind":
-                tag = "EinheitWind"
-            elif unit_type == "storage":
-                tag = "EinheitStromSpeicher"
-            elif unit_type == "biomass":
-                tag = "EinheitBiomasse"
-            elif unit_type == "hydro":
-                tag = "EinheitWasser"
-            else:
-                tag = "Einheit"
-            
-            for elem in fast_iterparse(file_path, tag):
-                # Check operational status
-                status = elem.findtext("EinheitBetriebsstatus")
-                if not include_inactive and status not in ACTIVE_STATUS_IDS:
-                    stats["skipped_inactive"] += 1
-                    continue
-                
-                # Get location and resolve to DNO
-                loc_nr = elem.findtext("LokationMaStRNummer")
-                dno_nr = loc_to_dno.get(loc_nr) if loc_nr else None
-                
-                if not dno_nr:
-                    stats["no_dno"] += 1
-                    continue
-                
-                # Extract unit data
-                unit = EnergyUnitRecord(
-                    mastr_nr=elem.findtext("EinheitMastrNummer") or "",
-                    location_mastr_nr=loc_nr,
-                    energy_source=elem.findtext("Energietraeger"),
-                    gross_capacity_kw=safe_decimal(elem.findtext("Bruttoleistung")),
-                    net_capacity_kw=safe_decimal(elem.findtext("Nettonennleistung")),
-                    operational_status=status,
-                    bundesland=elem.findtext("Bundesland"),
-                    plz=elem.findtext("Postleitzahl"),
-                    city=elem.findtext("Ort"),
-                    inbetriebnahme_date=safe_date(elem.findtext("Inbetriebnahmedatum")),
-                    unit_type=unit_type,
-                )
-                
-                dno_units[dno_nr].append(unit)
-                stats[unit_type] += 1
+    for file_path, unit_type, tag in find_unit_files(data_dir):
+        print(f"  Parsing {os.path.basename(file_path)}...")
+        for dno_nr, unit in iter_energy_units(
+            file_path, unit_type, tag, loc_to_dno, stats, include_inactive
+        ):
+            dno_units[dno_nr].append(unit)
     
     print(f"  Unit stats: {dict(stats)}")
     return dno_units
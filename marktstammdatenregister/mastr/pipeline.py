@@ -0,0 +1,271 @@
+"""
+Parallel, incremental energy unit aggregation.
+
+The EinheitenXXX_n.xml shards dominate the transformation runtime. This
+module parses them in worker processes and folds every unit straight into
+per-DNO CapacityStats/UnitCounts, so neither the workers nor the main
+process hold unit records in memory.
+
+Shard results are cached as JSON by checksum: a shard is only parsed again
+if its content, the location → DNO linkage (Lokationen and
+Netzanschlusspunkte files) or the parse options changed. File checksums
+are themselves remembered by size and modification time, so unchanged
+files are not re-read just to hash them.
+"""
+
+import glob
+import hashlib
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from decimal import Decimal
+
+from .aggregators import add_unit_capacity, add_unit_count, merge_capacity, merge_unit_counts
+from .models import CAPACITY_FIELDS, UNIT_COUNT_FIELDS, CapacityStats, UnitCounts
+from .parsers import find_unit_files, iter_energy_units
+
+# Bump when the shard result format or aggregation logic changes
+CACHE_VERSION = 1
+
+# Files whose content determines the location -> DNO linkage
+LINKAGE_PATTERNS = ("Lokationen_*.xml", "Netzanschlusspunkte_*.xml")
+
+# Location -> DNO map of a worker process (set once by _init_worker)
+_loc_to_dno: dict[str, str] = {}
+
+
+def _init_worker(loc_to_dno: dict[str, str]) -> None:
+    global _loc_to_dno
+    _loc_to_dno = loc_to_dno
+
+
+def file_checksum(file_path: str) -> str:
+    """SHA-256 of a file's content."""
+    with open(file_path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def parse_unit_shard(
+    file_path: str,
+    unit_type: str,
+    tag: str,
+    include_inactive: bool = False,
+) -> dict:
+    """
+    Aggregate one energy unit file per DNO (runs in a worker process).
+
+    Returns a JSON-serializable shard result:
+        {"dnos": {mastr_nr: {"capacity_mw": {...}, "units": {...}}}, "stats": {...}}
+    """
+    capacity: dict[str, CapacityStats] = defaultdict(CapacityStats)
+    counts: dict[str, UnitCounts] = defaultdict(UnitCounts)
+    stats: dict[str, int] = defaultdict(int)
+
+    for dno_nr, unit in iter_energy_units(
+        file_path, unit_type, tag, _loc_to_dno, stats, include_inactive
+    ):
+        add_unit_capacity(capacity[dno_nr], unit)
+        add_unit_count(counts[dno_nr], unit)
+
+    return {
+        "dnos": {
+            dno_nr: {
+                # Decimals as strings: sums stay exact across shards
+                "capacity_mw": {
+                    name: str(getattr(capacity[dno_nr], name)) for name in CAPACITY_FIELDS
+                },
+                "units": {name: getattr(counts[dno_nr], name) for name in UNIT_COUNT_FIELDS},
+            }
+            for dno_nr in capacity
+        },
+        "stats": dict(stats),
+    }
+
+
+def _run_shard(args: tuple[str, str, str, bool]) -> dict:
+    return parse_unit_shard(*args)
+
+
+class ShardCache:
+    """JSON files of shard results and file checksums in one directory."""
+
+    CHECKSUM_INDEX = "checksums.json"
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index_path = os.path.join(cache_dir, self.CHECKSUM_INDEX)
+        self._checksums: dict[str, list] = self._read_json(self._index_path) or {}
+
+    @staticmethod
+    def _read_json(path: str) -> dict | None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _shard_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"shard-{key}.json")
+
+    def get(self, key: str) -> dict | None:
+        return self._read_json(self._shard_path(key))
+
+    def set(self, key: str, result: dict) -> None:
+        # Write-then-rename so an interrupted run never leaves a partial entry
+        path = self._shard_path(key)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(path + ".tmp", path)
+
+    def known_checksum(self, file_path: str) -> str | None:
+        """Stored checksum of a file if its size and mtime are unchanged."""
+        entry = self._checksums.get(os.path.abspath(file_path))
+        st = os.stat(file_path)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def remember_checksum(self, file_path: str, checksum: str) -> None:
+        st = os.stat(file_path)
+        self._checksums[os.path.abspath(file_path)] = [st.st_size, st.st_mtime_ns, checksum]
+
+    def save(self) -> None:
+        with open(self._index_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self._checksums, f)
+        os.replace(self._index_path + ".tmp", self._index_path)
+
+
+def _checksums(
+    paths: list[str],
+    cache: ShardCache | None,
+    pool: ProcessPoolExecutor | None,
+) -> dict[str, str]:
+    result: dict[str, str] = {}
+    todo = []
+    for path in paths:
+        known = cache.known_checksum(path) if cache else None
+        if known:
+            result[path] = known
+        else:
+            todo.append(path)
+
+    digests = pool.map(file_checksum, todo) if pool else map(file_checksum, todo)
+    for path, checksum in zip(todo, digests):
+        result[path] = checksum
+        if cache:
+            cache.remember_checksum(path, checksum)
+    return result
+
+
+def _merge_shard(
+    capacity: dict[str, CapacityStats],
+    counts: dict[str, UnitCounts],
+    stats: dict[str, int],
+    shard: dict,
+) -> None:
+    for dno_nr, values in shard["dnos"].items():
+        merge_capacity(
+            capacity[dno_nr],
+            CapacityStats(**{name: Decimal(v) for name, v in values["capacity_mw"].items()}),
+        )
+        merge_unit_counts(counts[dno_nr], UnitCounts(**values["units"]))
+    for name, value in shard["stats"].items():
+        stats[name] += value
+
+
+def aggregate_energy_units(
+    data_dir: str,
+    loc_to_dno: dict[str, str],
+    workers: int | None = None,
+    cache_dir: str | None = None,
+    include_inactive: bool = False,
+) -> tuple[dict[str, CapacityStats], dict[str, UnitCounts]]:
+    """
+    Aggregate installed capacity and unit counts per DNO from all unit files.
+
+    Args:
+        data_dir: Path to MaStR data directory
+        loc_to_dno: Mapping from Location MaStR number to DNO MaStR number
+        workers: Worker processes (default: CPU count, 1 = parse in-process)
+        cache_dir: Directory for cached shard results (None = no caching)
+        include_inactive: Whether to include inactive/in planning units
+
+    Returns:
+        - Dict mapping DNO MaStR number to CapacityStats
+        - Dict mapping DNO MaStR number to UnitCounts
+    """
+    unit_files = find_unit_files(data_dir)
+    workers = workers or os.cpu_count() or 1
+    cache = ShardCache(cache_dir) if cache_dir else None
+
+    capacity: dict[str, CapacityStats] = defaultdict(CapacityStats)
+    counts: dict[str, UnitCounts] = defaultdict(UnitCounts)
+    stats: dict[str, int] = defaultdict(int)
+
+    pool = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(loc_to_dno,)
+        )
+    else:
+        _init_worker(loc_to_dno)
+
+    try:
+        keys: dict[str, str] = {}
+        pending = []
+        if cache:
+            linkage_files = sorted(
+                path
+                for pattern in LINKAGE_PATTERNS
+                for path in glob.glob(os.path.join(data_dir, pattern))
+            )
+            checksums = _checksums(
+                [path for path, _, _ in unit_files] + linkage_files, cache, pool
+            )
+            cache.save()
+            linkage = hashlib.sha256(
+                "".join(checksums[path] for path in linkage_files).encode()
+            ).hexdigest()
+
+            for file_path, unit_type, tag in unit_files:
+                key = hashlib.sha256(
+                    f"{CACHE_VERSION}:{checksums[file_path]}:{unit_type}:{tag}:"
+                    f"{include_inactive}:{linkage}".encode()
+                ).hexdigest()
+                cached = cache.get(key)
+                if cached is not None:
+                    _merge_shard(capacity, counts, stats, cached)
+                    stats["cached_files"] += 1
+                else:
+                    keys[file_path] = key
+                    pending.append((file_path, unit_type, tag, include_inactive))
+        else:
+            pending = [
+                (path, unit_type, tag, include_inactive) for path, unit_type, tag in unit_files
+            ]
+
+        print(f"  {len(unit_files)} unit files, {len(pending)} to parse with {workers} workers")
+
+        # Largest files first keeps all workers busy until the end
+        pending.sort(key=lambda args: os.path.getsize(args[0]), reverse=True)
+
+        if pool:
+            futures = {pool.submit(_run_shard, args): args[0] for args in pending}
+            results = ((futures[future], future.result()) for future in as_completed(futures))
+        else:
+            results = ((args[0], _run_shard(args)) for args in pending)
+
+        for file_path, shard in results:
+            print(f"  Parsed {os.path.basename(file_path)}")
+            _merge_shard(capacity, counts, stats, shard)
+            if cache:
+                cache.set(keys[file_path], shard)
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+    print(f"  Unit stats: {dict(stats)}")
+    return dict(capacity), dict(counts)
+
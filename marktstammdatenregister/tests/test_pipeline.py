@@ -0,0 +1,209 @@
+"""Tests for the parallel, cached energy unit pipeline on a synthetic MaStR export."""
+
+import os
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from mastr import pipeline
+from mastr.aggregators import aggregate_capacity, aggregate_unit_counts
+from mastr.parsers import (
+    build_location_to_dno_map,
+    parse_connection_points,
+    parse_energy_units,
+    parse_locations,
+)
+from mastr.pipeline import ShardCache, aggregate_energy_units
+
+
+def _xml(root: str, tag: str, records: list[dict[str, str]]) -> str:
+    body = "".join(
+        f"<{tag}>" + "".join(f"<{k}>{v}</{k}>" for k, v in record.items()) + f"</{tag}>"
+        for record in records
+    )
+    return f'<?xml version="1.0" encoding="utf-8"?><{root}>{body}</{root}>'
+
+
+def _unit(nr: str, loc: str, source: str, kw: str, status: str = "35") -> dict[str, str]:
+    return {
+        "EinheitMastrNummer": nr,
+        "LokationMaStRNummer": loc,
+        "Energietraeger": source,
+        "Bruttoleistung": kw,
+        "EinheitBetriebsstatus": status,
+    }
+
+
+def _write_linkage(data_dir: Path, loc_2_cp: str = "CP2") -> None:
+    (data_dir / "Netzanschlusspunkte_1.xml").write_text(
+        _xml(
+            "Netzanschlusspunkte",
+            "Netzanschlusspunkt",
+            [
+                {"NetzanschlusspunktMastrNummer": "CP1", "NetzbetreiberMaStRNummer": "SNB1"},
+                {"NetzanschlusspunktMastrNummer": "CP2", "NetzbetreiberMaStRNummer": "SNB2"},
+            ],
+        ),
+        encoding="utf-8",
+    )
+    (data_dir / "Lokationen_1.xml").write_text(
+        _xml(
+            "Lokationen",
+            "Lokation",
+            [
+                {"MastrNummer": "SEL1", "NetzanschlusspunkteMaStRNummern": "CP1"},
+                {"MastrNummer": "SEL2", "NetzanschlusspunkteMaStRNummern": loc_2_cp},
+            ],
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def export(tmp_path: Path) -> Path:
+    data_dir = tmp_path / "export"
+    data_dir.mkdir()
+    _write_linkage(data_dir)
+    (data_dir / "EinheitenSolar_1.xml").write_text(
+        _xml(
+            "EinheitenSolar",
+            "EinheitSolar",
+            [
+                _unit("SEE1", "SEL1", "2495", "9.9"),
+                _unit("SEE2", "SEL2", "2495", "30.25"),
+                _unit("SEE3", "SEL1", "2495", "5", status="31"),  # In Planung
+            ],
+        ),
+        encoding="utf-8",
+    )
+    (data_dir / "EinheitenSolar_2.xml").write_text(
+        _xml("EinheitenSolar", "EinheitSolar", [_unit("SEE4", "SEL1", "2495", "100.5")]),
+        encoding="utf-8",
+    )
+    (data_dir / "EinheitenWind.xml").write_text(
+        _xml(
+            "EinheitenWind",
+            "EinheitWind",
+            [_unit("SEE5", "SEL2", "2497", "3000"), _unit("SEE6", "SEL9", "2497", "2000")],
+        ),
+        encoding="utf-8",
+    )
+    return data_dir
+
+
+def _loc_to_dno(data_dir: Path) -> dict[str, str]:
+    connection_points, _ = parse_connection_points(str(data_dir))
+    return build_location_to_dno_map(parse_locations(str(data_dir)), connection_points)
+
+
+def _count_shard_parses(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the shards parsed in-process (workers=1)."""
+    parsed: list[str] = []
+    parse = pipeline.parse_unit_shard
+
+    def counting_parse(file_path, *args):
+        parsed.append(Path(file_path).name)
+        return parse(file_path, *args)
+
+    monkeypatch.setattr(pipeline, "parse_unit_shard", counting_parse)
+    return parsed
+
+
+def test_parallel_aggregation_matches_serial_parse(export: Path) -> None:
+    loc_to_dno = _loc_to_dno(export)
+    dno_units = parse_energy_units(str(export), loc_to_dno)
+
+    capacity, counts = aggregate_energy_units(str(export), loc_to_dno, workers=2)
+
+    assert capacity == aggregate_capacity(dno_units)
+    assert counts == aggregate_unit_counts(dno_units)
+    assert capacity["SNB1"].solar_mw == Decimal("0.1104")
+    assert (counts["SNB2"].solar, counts["SNB2"].wind) == (1, 1)
+
+
+def test_unchanged_export_is_served_from_cache(
+    export: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loc_to_dno = _loc_to_dno(export)
+    cache_dir = str(tmp_path / "cache")
+    first = aggregate_energy_units(str(export), loc_to_dno, workers=1, cache_dir=cache_dir)
+
+    parsed = _count_shard_parses(monkeypatch)
+    second = aggregate_energy_units(str(export), loc_to_dno, workers=1, cache_dir=cache_dir)
+
+    assert parsed == []
+    assert second == first
+
+
+def test_changed_shard_or_linkage_is_parsed_again(
+    export: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_dir = str(tmp_path / "cache")
+    aggregate_energy_units(str(export), _loc_to_dno(export), workers=1, cache_dir=cache_dir)
+    parsed = _count_shard_parses(monkeypatch)
+
+    # A changed shard: only that shard is parsed again
+    (export / "EinheitenSolar_2.xml").write_text(
+        _xml(
+            "EinheitenSolar",
+            "EinheitSolar",
+            [_unit("SEE4", "SEL1", "2495", "100.5"), _unit("SEE7", "SEL2", "2495", "7")],
+        ),
+        encoding="utf-8",
+    )
+    capacity, counts = aggregate_energy_units(
+        str(export), _loc_to_dno(export), workers=1, cache_dir=cache_dir
+    )
+    assert parsed == ["EinheitenSolar_2.xml"]
+    assert counts["SNB2"].solar == 2
+    assert capacity["SNB2"].solar_mw == Decimal("0.03725")
+
+    # A changed linkage (SEL2 now connects through CP1): every shard is parsed again
+    parsed.clear()
+    _write_linkage(export, loc_2_cp="CP1")
+    loc_to_dno = _loc_to_dno(export)
+    capacity, counts = aggregate_energy_units(
+        str(export), loc_to_dno, workers=1, cache_dir=cache_dir
+    )
+    assert sorted(parsed) == ["EinheitenSolar_1.xml", "EinheitenSolar_2.xml", "EinheitenWind.xml"]
+    assert "SNB2" not in counts
+    dno_units = parse_energy_units(str(export), loc_to_dno)
+    assert capacity == aggregate_capacity(dno_units)
+    assert counts == aggregate_unit_counts(dno_units)
+
+
+def test_checksums_are_remembered_by_size_and_mtime(
+    export: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache_dir = str(tmp_path / "cache")
+    aggregate_energy_units(str(export), _loc_to_dno(export), workers=1, cache_dir=cache_dir)
+
+    hashed: list[str] = []
+    checksum = pipeline.file_checksum
+
+    def counting_checksum(file_path: str) -> str:
+        hashed.append(Path(file_path).name)
+        return checksum(file_path)
+
+    monkeypatch.setattr(pipeline, "file_checksum", counting_checksum)
+
+    # The memo is persisted: a new run (new ShardCache) hashes nothing
+    aggregate_energy_units(str(export), _loc_to_dno(export), workers=1, cache_dir=cache_dir)
+    assert hashed == []
+
+    # Same size and mtime: the remembered checksum is trusted without reading the file
+    wind = export / "EinheitenWind.xml"
+    cache = ShardCache(cache_dir)
+    remembered = cache.known_checksum(str(wind))
+    assert remembered == checksum(str(wind))
+    stat = wind.stat()
+    wind.write_text(wind.read_text(encoding="utf-8").replace("3000", "4000"), encoding="utf-8")
+    os.utime(wind, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cache.known_checksum(str(wind)) == remembered
+
+    # A new mtime invalidates the memo and the file is hashed again
+    os.utime(wind, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.known_checksum(str(wind)) is None
+    aggregate_energy_units(str(export), _loc_to_dno(export), workers=1, cache_dir=cache_dir)
+    assert hashed == ["EinheitenWind.xml"]
@@ -7,6 +7,7 @@ Transforms Marktstammdatenregister XML exports into pre-computed DNO statistics.
 Usage:
     python transform_mastr.py --data-dir ./data --output dno_stats.json
     python transform_mastr.py --data-dir ./data --output dno_stats.json --quick  # Skip energy units (faster)
+    python transform_mastr.py --data-dir ./data --output dno_stats.json --workers 8 --no-cache
 
 The output JSON file can be:
 1. Embedded in the DNO seed parquet file
@@ -39,7 +40,6 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from mastr.parsers import (
     parse_connection_points,
-    parse_energy_units,
     parse_locations,
     parse_market_actors,
     parse_market_roles,
@@ -47,6 +47,7 @@ from mastr.parsers import (
     build_location_to_dno_map,
 )
 from mastr.aggregators import aggregate_dno_stats
+from mastr.pipeline import aggregate_energy_units
 
 
 def find_export_date(data_dir: str) -> str | None:
@@ -77,6 +78,8 @@ def transform_mastr(
     output_file: str,
     skip_energy_units: bool = False,
     verbose: bool = True,
+    workers: int | None = None,
+    cache_dir: str | None = None,
 ) -> dict:
     """
     Main transformation function.
@@ -86,6 +89,8 @@ def transform_mastr(
         output_file: Path to output JSON file
         skip_energy_units: If True, skip energy unit parsing (faster)
         verbose: Print progress messages
+        workers: Worker processes for energy unit files (default: CPU count)
+        cache_dir: Cache of per-file energy unit results (None = no caching)
     
     Returns:
         The output dictionary
@@ -127,13 +132,19 @@ def transform_mastr(
     loc_to_dno = build_location_to_dno_map(locations, connection_points)
     print(f"  Mapped {len(loc_to_dno)} locations to DNOs")
     
-    # Phase 6: Parse energy units (optional, slow)
-    dno_units = {}
+    # Phase 6: Aggregate energy units (optional, slow; parallel and cached per file)
+    capacity_stats = {}
+    unit_counts = {}
     if not skip_energy_units:
         print("\n[Phase 6/6] Parsing energy units...")
-        dno_units = parse_energy_units(data_dir, loc_to_dno)
-        total_units = sum(len(units) for units in dno_units.values())
-        print(f"  Found {total_units} units across {len(dno_units)} DNOs")
+        capacity_stats, unit_counts = aggregate_energy_units(
+            data_dir, loc_to_dno, workers=workers, cache_dir=cache_dir
+        )
+        total_units = sum(
+            counts.solar + counts.wind + counts.storage + counts.biomass + counts.hydro
+            for counts in unit_counts.values()
+        )
+        print(f"  Found {total_units} units across {len(unit_counts)} DNOs")
     else:
         print("\n[Phase 6/6] Skipping energy units (--quick mode)")
     
@@ -144,7 +155,8 @@ def transform_mastr(
         connection_points=connection_points,
         dno_to_cps=dno_to_cps,
         networks=networks,
-        dno_units=dno_units,
+        capacity_stats=capacity_stats,
+        unit_counts=unit_counts,
     )
     
     # Set export date
@@ -210,6 +222,22 @@ Output can be:
         action="store_true",
         help="Skip energy unit parsing (faster, but no capacity data)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for energy unit files (default: CPU count)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Cache of per-file energy unit results (default: <data-dir>/.cache)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse all energy unit files, ignoring and not writing the cache",
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -224,6 +252,10 @@ Output can be:
             output_file=args.output,
             skip_energy_units=args.quick,
             verbose=not args.quiet,
+            workers=args.workers,
+            cache_dir=None if args.no_cache else (
+                args.cache_dir or os.path.join(args.data_dir, ".cache")
+            ),
         )
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)